@@ -20,10 +20,12 @@ Dependency injection utilities for TravelStyle AI application.
 Provides authentication and user management dependencies.
 """
 
+import hmac
 import logging
 
-from fastapi import Depends, HTTPException, Request, status
+from fastapi import Depends, Header, HTTPException, Request, status
 
+from app.core.config import settings
 from app.core.security import supabase_auth
 from app.utils.cookies import get_access_token_from_cookie, get_refresh_token_from_cookie
 
@@ -82,3 +84,18 @@ async def get_current_active_user(current_user: dict = current_user_dependency)
     if not current_user.get("is_active"):
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Inactive user")
     return current_user
+
+
+async def verify_metrics_token(x_metrics_token: str | None = Header(None)) -> None:
+    """
+    Guard internal endpoints with the METRICS_TOKEN shared secret.
+
+    Without a configured token the endpoints are only served in development.
+    """
+    if not settings.METRICS_TOKEN:
+        if settings.TS_ENVIRONMENT != "development":
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+        return
+
+    if not hmac.compare_digest(x_metrics_token or "", settings.METRICS_TOKEN):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Invalid metrics token")
@@ -24,9 +24,11 @@ import logging
 import uuid
 
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 
 from app.api.deps import get_current_user
 from app.models.responses import ChatRequest, ChatResponse, ConversationContext
+from app.services.chat_stream import ChatStream, format_sse_event
 from app.services.database_helpers import db_helpers
 from app.services.orchestrator import orchestrator_service
 from app.utils.rate_limiter import rate_limit
@@ -56,7 +58,7 @@ async def chat(
         )
 
         # Get user profile
-        user_profile = await db_helpers.get_user_profile(current_user["id"])
+        user_profile = await db_helpers.get_user_profile(current_user["id"], "chat")
 
         # Generate response using backward-compatible method expected by tests
         response = await orchestrator_service.generate_travel_recommendations(
@@ -86,6 +88,82 @@ async def chat(
         raise HTTPException(status_code=500, detail="Failed to process chat request") from e
 
 
+@router.post("/stream")
+@rate_limit(calls=30, period=60)  # 30 calls per minute
+async def chat_stream(
+    request: ChatRequest,
+    background_tasks: BackgroundTasks,
+    current_user: dict = current_user_dependency,
+):
+    """
+    Streaming chat endpoint using Server-Sent Events
+
+    Emits "token" events as response text is generated and "quick_reply" events as
+    quick-reply markers complete, then a trailing "done" event with the full
+    ChatResponse (or an "error" event, after which any streamed text must be
+    discarded). The conversation is saved once the stream completes. Behind the
+    Lambda handler the events arrive as one buffered body.
+    """
+
+    try:
+        conversation_history = await db_helpers.get_conversation_history(
+            user_id=current_user["id"], conversation_id=request.conversation_id
+        )
+        user_profile = await db_helpers.get_user_profile(current_user["id"], "chat")
+    except Exception as e:
+        logger.error("Chat stream endpoint error: %s", type(e).__name__)
+        raise HTTPException(status_code=500, detail="Failed to process chat request") from e
+
+    stream = ChatStream()
+
+    async def event_stream():
+        try:
+            async for frame in stream.relay(
+                orchestrator_service.generate_travel_recommendations(
+                    user_message=request.message,
+                    context=request.context or ConversationContext(user_id=current_user["id"]),
+                    conversation_history=conversation_history,
+                    user_profile=user_profile,
+                )
+            ):
+                yield frame
+        except Exception as e:
+            logger.error("Chat stream error: %s", type(e).__name__)
+            yield format_sse_event("error", {"detail": "Failed to process chat request"})
+            return
+
+        if stream.interrupted:
+            yield format_sse_event("error", {"detail": "Response was interrupted"})
+            return
+
+        response = stream.response
+        response.message_id = str(uuid.uuid4())
+        response.conversation_id = request.conversation_id
+
+        # Handlers that answer without OpenAI have not streamed any text yet
+        if not stream.tokens_sent:
+            yield format_sse_event("token", {"text": response.message})
+        yield format_sse_event("done", response.model_dump())
+
+    async def save_completed_conversation():
+        if stream.response is not None and not stream.interrupted:
+            await db_helpers.save_conversation_message(
+                user_id=current_user["id"],
+                conversation_id=request.conversation_id,
+                user_message=request.message,
+                ai_response=stream.response.message,
+            )
+
+    # Runs after the last event has been sent
+    background_tasks.add_task(save_completed_conversation)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get("/dialog/{conversation_id}/history")
 async def get_conversation(conversation_id: str, current_user: dict = current_user_dependency):
     """Get conversation history"""
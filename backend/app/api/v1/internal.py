@@ -0,0 +1,61 @@
+# This file is part of TravelSytle AI.
+#
+# Copyright (C) 2025  Trailyn Ventures, LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Internal API endpoints for TravelStyle AI application.
+Exposes cache, connection pool and request coalescing metrics for tuning.
+"""
+
+from typing import Any
+
+from fastapi import APIRouter, Depends
+
+from app.api.deps import verify_metrics_token
+from app.api.v1.currency import currency_service
+from app.services.http_clients import http_clients
+from app.services.orchestrator import orchestrator_service
+from app.services.qloo import qloo_service
+from app.services.rate_limiter import db_rate_limiter
+from app.services.supabase import enhanced_supabase_cache, supabase_health_monitor
+from app.services.weather import weather_service
+from app.utils.executors import executors
+from app.utils.metrics import cache_metrics
+
+router = APIRouter()
+
+# Local dependency to avoid linter warnings
+metrics_token_dependency = Depends(verify_metrics_token)
+
+
+@router.get("/metrics", dependencies=[metrics_token_dependency])
+async def get_metrics() -> dict[str, Any]:
+    """Get cache hit/miss counters and latency histograms plus supporting statistics."""
+    return {
+        "caches": cache_metrics.snapshot(),
+        "cache_tiers": enhanced_supabase_cache.get_stats(),
+        "db_rate_limiter": db_rate_limiter.get_stats(),
+        "http_clients": http_clients.get_stats(),
+        "executors": executors.get_stats(),
+        "supabase_health": supabase_health_monitor.get_stats(),
+        "single_flight": {
+            "weather": weather_service.get_stats()["single_flight"],
+            "cultural": qloo_service.get_stats()["single_flight"],
+            "currency": currency_service.get_stats()["single_flight"],
+            "chat_currency": orchestrator_service.currency_service.get_stats()["single_flight"],
+        },
+        "classification": orchestrator_service.get_classification_stats(),
+    }
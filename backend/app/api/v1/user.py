@@ -31,6 +31,7 @@ from app.models.user import UserProfileBase, UserProfileResponse
 from app.services.cloudinary_service import CloudinaryService
 from app.services.database_helpers import db_helpers
 from app.services.system_settings_service import system_settings_service
+from app.utils.executors import executors
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -337,7 +338,7 @@ async def delete_profile_picture(current_user: dict = current_user_dependency):
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid user ID")
 
         # Get current profile to find existing picture URL
-        profile = await db_helpers.get_user_profile(user_id)
+        profile = await db_helpers.get_user_profile(user_id, "picture")
         if not profile:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="User profile not found"
@@ -387,7 +388,7 @@ async def get_initials_avatar(current_user: dict = current_user_dependency):
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid user ID")
 
         # Get user profile
-        profile = await db_helpers.get_user_profile(user_id)
+        profile = await db_helpers.get_user_profile(user_id, "names")
         if not profile:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="User profile not found"
@@ -397,7 +398,9 @@ async def get_initials_avatar(current_user: dict = current_user_dependency):
         last_name = profile.get("last_name", "")
 
         # Generate initials avatar
-        initials_avatar = cloudinary_service.generate_initials_avatar(first_name, last_name)
+        initials_avatar = await executors.run(
+            "media", cloudinary_service.generate_initials_avatar, first_name, last_name
+        )
 
         return JSONResponse(
             status_code=status.HTTP_200_OK,
@@ -72,6 +72,73 @@ class Settings(BaseSettings):
         "https://weather.visualcrossing.com/VisualCrossingWebServices/rest/services/timeline/"
     )
 
+    # Outbound HTTP connection pools (one pool per upstream API)
+    HTTP_MAX_CONNECTIONS: int = 20
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 10
+    HTTP_KEEPALIVE_EXPIRY: float = 30.0  # seconds an idle connection is kept open
+    HTTP2_ENABLED: bool = False
+
+    # Thread pools for blocking calls (one bounded pool per dependency class)
+    EXECUTOR_DB_WORKERS: int = 4  # SQLite cache backend
+    EXECUTOR_AUTH_WORKERS: int = 8  # Supabase auth client
+    EXECUTOR_MEDIA_WORKERS: int = 2  # Cloudinary uploads and avatar rendering
+    EXECUTOR_MAX_QUEUE: int = 64  # calls waiting per pool before new ones are rejected
+
+    # Cache storage backend: supabase, memory, sqlite or redis (any Redis-protocol server)
+    CACHE_BACKEND: str = "supabase"
+    CACHE_MEMORY_MAX_ENTRIES: int = 10000
+    CACHE_SQLITE_PATH: str = "/tmp/travelstyle-cache.sqlite3"  # /tmp is writable on Lambda
+    CACHE_REDIS_URL: str = "redis://localhost:6379/0"  # rediss:// for TLS
+    CACHE_REDIS_PREFIX: str = "travelstyle:cache:"
+    CACHE_REDIS_TIMEOUT_SECONDS: float = 1.0
+    CACHE_REDIS_MAX_CONNECTIONS: int = 20  # per event loop; needs the optional redis package
+
+    # In-process (L1) cache in front of the cache backend
+    CACHE_L1_ENABLED: bool = True
+    CACHE_L1_MAX_ENTRIES: int = 1024
+    CACHE_L1_MAX_BYTES: int = 16 * 1024 * 1024  # approximate, from payload JSON size
+    CACHE_L1_MAX_TTL_SECONDS: float = 300.0  # bounds staleness across instances
+
+    # Stale-while-revalidate and refresh-ahead for weather, cultural and currency caches
+    CACHE_STALE_GRACE_SECONDS: float = 900.0  # how long past expiry a stale entry is served
+    CACHE_REFRESH_AHEAD_FRACTION: float = 0.1  # refresh when this fraction of the TTL is left
+    CACHE_REFRESH_AHEAD_MIN_READS: int = 3  # ...and the entry was read this often recently
+
+    # Qloo style recommendation cache, keyed on the request inputs with weather in bands
+    CACHE_STYLE_TTL_HOURS: float = 12.0
+    CACHE_STYLE_TEMP_BAND_DEGREES: float = 10.0  # °F; temperatures in one band share entries
+    CACHE_STYLE_WET_PRECIPITATION_CHANCE: float = 50.0  # % at or above which a trip counts as wet
+
+    # Negative caching of failed weather, cultural and currency lookups (process-local)
+    CACHE_NEGATIVE_ENABLED: bool = True
+    CACHE_NEGATIVE_MAX_ENTRIES: int = 1024
+    CACHE_NEGATIVE_TTL_SECONDS: float = 300.0  # unknown keys and empty upstream answers
+    CACHE_NEGATIVE_TRANSIENT_TTL_SECONDS: float = 30.0  # timeouts and upstream errors
+
+    # Cache payload encoding: "json" (plain JSONB) or "zlib" (compressed envelope). Readers
+    # accept both, so switch to "zlib" once every instance runs a release that decodes it.
+    CACHE_PAYLOAD_ENCODING: str = "json"
+    CACHE_PAYLOAD_COMPRESS_MIN_BYTES: int = 1024  # smaller payloads stay plain JSON
+
+    # Write-behind population of the Supabase cache tables
+    CACHE_WRITE_BEHIND_ENABLED: bool = True
+    CACHE_WRITE_BEHIND_MAX_PENDING: int = 256  # rows held; further writes are dropped
+    CACHE_WRITE_BEHIND_BATCH_SIZE: int = 50  # rows per upsert; a full batch flushes at once
+    CACHE_WRITE_BEHIND_FLUSH_INTERVAL_SECONDS: float = 1.0
+
+    # Scheduled cache warming (python -m app.services.cache_warming or a scheduled Lambda event)
+    CACHE_WARM_TOP_DESTINATIONS: int = 20
+    CACHE_WARM_TOP_CURRENCIES: int = 5
+    CACHE_WARM_CONCURRENCY: int = 4  # concurrent calls per upstream API
+    CACHE_WARM_MAX_UPSTREAM_CALLS: int = 50  # calls per upstream API per run
+    CACHE_WARM_LOOKBACK_ROWS: int = 1000  # recent rows read per popularity source
+    CACHE_WARM_MIN_REMAINING_SECONDS: float = 900.0  # entries fresher than this are skipped
+    CACHE_WARM_TIMEOUT_SECONDS: float = 25.0  # stays inside the 30s Lambda timeout
+
+    # Observability
+    CACHE_METRICS_LOG_INTERVAL_SECONDS: float = 300.0  # JSON cache summary log; 0 disables
+    METRICS_TOKEN: str = ""  # X-Metrics-Token for the internal API; unset = development only
+
     # Environment
     TS_ENVIRONMENT: str = "production"  # development, staging, production
 
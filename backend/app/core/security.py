@@ -26,6 +26,7 @@ from typing import Any
 from jose import JWTError, jwt
 
 from app.core.config import settings
+from app.utils.executors import executors
 from app.utils.user_utils import extract_user_profile
 from supabase import Client, create_client
 
@@ -77,7 +78,7 @@ class SupabaseAuth:
     async def get_user_by_id(self, user_id: str) -> dict[str, Any] | None:
         """Get user data from Supabase by user ID"""
         try:
-            response = self.client.auth.admin.get_user_by_id(user_id)
+            response = await executors.run("auth", self.client.auth.admin.get_user_by_id, user_id)
             if response.user:
                 return extract_user_profile(response.user)
             return None
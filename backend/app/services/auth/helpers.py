@@ -20,7 +20,6 @@ Authentication helpers for TravelStyle AI application.
 Contains the core AuthService class and utility functions.
 """
 
-import asyncio
 import logging
 from datetime import UTC, datetime
 from typing import Any, NamedTuple
@@ -70,8 +69,15 @@ from app.services.auth.exceptions import (
     TokenError,
 )
 from app.services.auth.validators import validate_auth_request, validate_registration_data
+from app.services.http_clients import http_clients
 from app.services.rate_limiter import db_rate_limiter
-from app.services.supabase import get_supabase_client
+from app.services.supabase import (
+    SupabaseDataClient,
+    get_supabase_client,
+    get_supabase_data_client,
+    select_projection,
+)
+from app.utils.executors import executors
 from app.utils.user_utils import extract_user_profile
 from supabase import Client
 
@@ -90,8 +96,9 @@ class AuthService:
     """Supabase authentication service for user management."""
 
     def __init__(self):
-        """Initialize Supabase client."""
+        """Initialize the Supabase auth client and the async client for table queries."""
         self.client: Client | None = None
+        self.db: SupabaseDataClient = get_supabase_data_client()
         self._init_client()
 
     def _init_client(self):
@@ -128,10 +135,10 @@ class AuthService:
         validate_auth_request(login_data.email, login_data.password)
 
         try:
-            response = await asyncio.to_thread(
-                lambda: self.client.auth.sign_in_with_password(
-                    {"email": login_data.email, "password": login_data.password}
-                )
+            response = await executors.run(
+                "auth",
+                self.client.auth.sign_in_with_password,
+                {"email": login_data.email, "password": login_data.password},
             )
 
             # Log Supabase auth response for debugging
@@ -176,12 +183,7 @@ class AuthService:
                 logger.info(f"Update data: {update_data}")
 
                 # Update profiles table directly for last_login (simpler and more reliable)
-                await asyncio.to_thread(
-                    lambda: self.client.table("profiles")
-                    .update(update_data)
-                    .eq(ID_FIELD, user_id)
-                    .execute()
-                )
+                await self.db.table("profiles").update(update_data).eq(ID_FIELD, user_id).execute()
                 logger.info(
                     f"Successfully updated last_login via profiles table for user {user_id}"
                 )
@@ -207,14 +209,11 @@ class AuthService:
                 # Always ensure user preferences are included by fetching them separately
                 try:
                     logger.info("Fetching user preferences separately to ensure they're included")
-                    preferences_response = await asyncio.to_thread(
-                        lambda: (
-                            self.client.table("user_preferences")
-                            .select("*")
-                            .eq("user_id", user_id)
-                            .single()
-                            .execute()
-                        )
+                    preferences_response = await (
+                        select_projection(self.db, USER_PREFERENCES_TABLE, "profile")
+                        .eq("user_id", user_id)
+                        .single()
+                        .execute()
                     )
 
                     if preferences_response.data:
@@ -280,14 +279,11 @@ class AuthService:
                 # Always try to fetch preferences even in fallback
                 try:
                     logger.info("Attempting to fetch preferences in fallback mode")
-                    preferences_response = await asyncio.to_thread(
-                        lambda: (
-                            self.client.table("user_preferences")
-                            .select("*")
-                            .eq("user_id", user_id)
-                            .single()
-                            .execute()
-                        )
+                    preferences_response = await (
+                        select_projection(self.db, USER_PREFERENCES_TABLE, "profile")
+                        .eq("user_id", user_id)
+                        .single()
+                        .execute()
                     )
 
                     if preferences_response.data:
@@ -378,9 +374,9 @@ class AuthService:
 
         try:
             if refresh_token:
-                await asyncio.to_thread(lambda: self.client.auth.admin.sign_out(refresh_token))
+                await executors.run("auth", self.client.auth.admin.sign_out, refresh_token)
             else:
-                await asyncio.to_thread(lambda: self.client.auth.sign_out())
+                await executors.run("auth", self.client.auth.sign_out)
             return LogoutResponse(message="Successfully logged out", success=True)
         except Exception as e:  # pylint: disable=broad-except
             logger.error("Logout failed: %s", type(e).__name__)
@@ -392,7 +388,7 @@ class AuthService:
         await self._check_rate_limit("forgot_password")
 
         try:
-            await asyncio.to_thread(lambda: self.client.auth.reset_password_email(email))
+            await executors.run("auth", self.client.auth.reset_password_email, email)
             return ForgotPasswordResponse(
                 message="Password reset email sent successfully", success=True
             )
@@ -410,9 +406,7 @@ class AuthService:
         await self._check_rate_limit("reset_password")
 
         try:
-            await asyncio.to_thread(
-                lambda: self.client.auth.update_user({"password": new_password})
-            )
+            await executors.run("auth", self.client.auth.update_user, {"password": new_password})
             return ResetPasswordResponse(message="Password reset successfully", success=True)
         except Exception as e:  # pylint: disable=broad-except
             logger.error("Password reset failed: %s", type(e).__name__)
@@ -449,7 +443,7 @@ class AuthService:
             params = {"grant_type": "refresh_token"}
 
             # Make the HTTP POST request to Supabase
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with http_clients.session("supabase_auth") as client:
                 response = await client.post(
                     auth_url,
                     json=payload,
@@ -515,19 +509,19 @@ class AuthService:
         validate_registration_data(email, password, first_name, last_name)
 
         try:
-            response = await asyncio.to_thread(
-                lambda: self.client.auth.sign_up(
-                    {
-                        "email": email,
-                        "password": password,
-                        "options": {
-                            "data": {
-                                FIRST_NAME_FIELD: first_name,
-                                LAST_NAME_FIELD: last_name,
-                            }
-                        },
-                    }
-                )
+            response = await executors.run(
+                "auth",
+                self.client.auth.sign_up,
+                {
+                    "email": email,
+                    "password": password,
+                    "options": {
+                        "data": {
+                            FIRST_NAME_FIELD: first_name,
+                            LAST_NAME_FIELD: last_name,
+                        }
+                    },
+                },
             )
             if not response.user:
                 raise RegistrationError(FAILED_CREATE_USER_MSG)
@@ -535,16 +529,16 @@ class AuthService:
             # Clear any session that might have been set by sign_up to prevent
             # automatic token refresh attempts with invalid refresh tokens
             try:
-                await asyncio.to_thread(lambda: self.client.auth.sign_out())
+                await executors.run("auth", self.client.auth.sign_out)
             except Exception as sign_out_error:
                 # Log but don't fail if sign_out fails - it's just a cleanup step
                 logger.debug(f"Sign out after registration (cleanup) failed: {sign_out_error}")
 
             # Immediately sign in to get token after registration
-            login_response = await asyncio.to_thread(
-                lambda: self.client.auth.sign_in_with_password(
-                    {"email": email, "password": password}
-                )
+            login_response = await executors.run(
+                "auth",
+                self.client.auth.sign_in_with_password,
+                {"email": email, "password": password},
             )
             if not login_response.session:
                 raise RegistrationError(NO_SESSION_AFTER_REGISTRATION_MSG)
@@ -552,8 +546,8 @@ class AuthService:
             # Create user preferences record to ensure profile is available
             user_id = response.user.id
             try:
-                await asyncio.to_thread(
-                    lambda: self.client.table(USER_PREFERENCES_TABLE)
+                await (
+                    self.db.table(USER_PREFERENCES_TABLE)
                     .insert(
                         {
                             "user_id": user_id,
@@ -632,10 +626,10 @@ class AuthService:
 
         try:
             # Use the user_profile_view instead of auth admin
-            response = await asyncio.to_thread(
-                lambda: (
-                    self.client.table(USER_PROFILE_VIEW).select("*").eq(ID_FIELD, user_id).execute()
-                )
+            response = await (
+                select_projection(self.db, USER_PROFILE_VIEW, "profile")
+                .eq(ID_FIELD, user_id)
+                .execute()
             )
             if response.data and len(response.data) > 0:
                 return response.data[0]
@@ -666,8 +660,8 @@ class AuthService:
 
             # First check if the user exists in the profiles table
             try:
-                profile_check = await asyncio.to_thread(
-                    lambda: (self.client.table("profiles").select("id").eq("id", user_id).execute())
+                profile_check = await (
+                    self.db.table("profiles").select("id").eq("id", user_id).execute()
                 )
                 if not profile_check.data or len(profile_check.data) == 0:
                     logger.warning(
@@ -676,10 +670,8 @@ class AuthService:
                     # Try to create a profile for this user
                     await self._ensure_user_profile_exists(user_id)
                     # Check again after creation attempt
-                    profile_check = await asyncio.to_thread(
-                        lambda: (
-                            self.client.table("profiles").select("id").eq("id", user_id).execute()
-                        )
+                    profile_check = await (
+                        self.db.table("profiles").select("id").eq("id", user_id).execute()
                     )
 
                 logger.info(
@@ -693,14 +685,11 @@ class AuthService:
             # Try to get profile from the view first
             try:
                 logger.info(f"Querying {USER_PROFILE_VIEW} for user {user_id}")
-                response = await asyncio.to_thread(
-                    lambda: (
-                        self.client.table(USER_PROFILE_VIEW)
-                        .select("*")
-                        .eq(ID_FIELD, user_id)
-                        .single()
-                        .execute()
-                    )
+                response = await (
+                    select_projection(self.db, USER_PROFILE_VIEW, "profile")
+                    .eq(ID_FIELD, user_id)
+                    .single()
+                    .execute()
                 )
 
                 if response.data:
@@ -751,14 +740,11 @@ class AuthService:
             # Fallback to basic profile data if view fails
             try:
                 logger.info("Attempting fallback to basic profile data")
-                basic_profile = await asyncio.to_thread(
-                    lambda: (
-                        self.client.table("profiles")
-                        .select("*")
-                        .eq("id", user_id)
-                        .single()
-                        .execute()
-                    )
+                basic_profile = await (
+                    select_projection(self.db, "profiles", "profile")
+                    .eq("id", user_id)
+                    .single()
+                    .execute()
                 )
                 if basic_profile.data:
                     logger.info(f"Retrieved basic profile for user {user_id} via fallback")
@@ -767,14 +753,11 @@ class AuthService:
                     # Try to manually fetch user preferences if they're not in the basic profile
                     try:
                         logger.info("Attempting to manually fetch user preferences")
-                        preferences_response = await asyncio.to_thread(
-                            lambda: (
-                                self.client.table("user_preferences")
-                                .select("*")
-                                .eq("user_id", user_id)
-                                .single()
-                                .execute()
-                            )
+                        preferences_response = await (
+                            select_projection(self.db, USER_PREFERENCES_TABLE, "profile")
+                            .eq("user_id", user_id)
+                            .single()
+                            .execute()
                         )
 
                         if preferences_response.data:
@@ -867,9 +850,7 @@ class AuthService:
         """Ensure that a user profile exists in the profiles table."""
         try:
             # Try to get user data from auth.users (requires admin privileges)
-            auth_user = await asyncio.to_thread(
-                lambda: self.client.auth.admin.get_user_by_id(user_id)
-            )
+            auth_user = await executors.run("auth", self.client.auth.admin.get_user_by_id, user_id)
 
             if not auth_user.user:
                 logger.error(f"User {user_id} not found in auth.users")
@@ -894,13 +875,11 @@ class AuthService:
                 "updated_at": auth_user.user.updated_at,
             }
 
-            await asyncio.to_thread(
-                lambda: self.client.table("profiles").insert(profile_data).execute()
-            )
+            await self.db.table("profiles").insert(profile_data).execute()
 
             # Create user preferences record
-            await asyncio.to_thread(
-                lambda: self.client.table(USER_PREFERENCES_TABLE)
+            await (
+                self.db.table(USER_PREFERENCES_TABLE)
                 .insert(
                     {
                         "user_id": user_id,
@@ -934,10 +913,11 @@ class AuthService:
             return None
 
         try:
-            response = await asyncio.to_thread(
-                lambda: self.client.auth.admin.update_user_by_id(
-                    user_id, {"user_metadata": updates}
-                )
+            response = await executors.run(
+                "auth",
+                self.client.auth.admin.update_user_by_id,
+                user_id,
+                {"user_metadata": updates},
             )
             if response.user:
                 return extract_user_profile(response.user)
@@ -963,10 +943,11 @@ class AuthService:
 
         try:
             # Update Supabase auth user metadata
-            auth_response = await asyncio.to_thread(
-                lambda: self.client.auth.admin.update_user_by_id(
-                    user_id, {"user_metadata": updates}
-                )
+            auth_response = await executors.run(
+                "auth",
+                self.client.auth.admin.update_user_by_id,
+                user_id,
+                {"user_metadata": updates},
             )
 
             if not auth_response.user:
@@ -984,13 +965,8 @@ class AuthService:
                 updates[PROFILE_COMPLETED_FIELD] = bool(first_name and last_name)
 
             # Update the view directly - triggers will handle updating underlying tables
-            response = await asyncio.to_thread(
-                lambda: (
-                    self.client.table(USER_PROFILE_VIEW)
-                    .update(updates)
-                    .eq(ID_FIELD, user_id)
-                    .execute()
-                )
+            response = await (
+                self.db.table(USER_PROFILE_VIEW).update(updates).eq(ID_FIELD, user_id).execute()
             )
 
             if not response.data or len(response.data) == 0:
@@ -1019,13 +995,11 @@ class AuthService:
 
         try:
             # Update user_preferences table
-            await asyncio.to_thread(
-                lambda: (
-                    self.client.table(USER_PREFERENCES_TABLE)
-                    .update({**preferences, UPDATED_AT_FIELD: "now()"})
-                    .eq(USER_ID_FIELD, user_id)
-                    .execute()
-                )
+            await (
+                self.db.table(USER_PREFERENCES_TABLE)
+                .update({**preferences, UPDATED_AT_FIELD: "now()"})
+                .eq(USER_ID_FIELD, user_id)
+                .execute()
             )
 
             logger.info("User preferences updated successfully for %s", user_id)
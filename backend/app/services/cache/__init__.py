@@ -0,0 +1,33 @@
+# This file is part of TravelSytle AI.
+#
+# Copyright (C) 2025  Trailyn Ventures, LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Cache storage backends for TravelStyle AI application."""
+
+from .base import CacheBackend, CacheEntry, KeyValueCacheBackend, storage_key
+from .memory_backend import MemoryCacheBackend
+from .redis_backend import RedisCacheBackend
+from .sqlite_backend import SQLiteCacheBackend
+
+__all__ = [
+    "CacheBackend",
+    "CacheEntry",
+    "KeyValueCacheBackend",
+    "MemoryCacheBackend",
+    "RedisCacheBackend",
+    "SQLiteCacheBackend",
+    "storage_key",
+]
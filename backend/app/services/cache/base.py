@@ -0,0 +1,179 @@
+# This file is part of TravelSytle AI.
+#
+# Copyright (C) 2025  Trailyn Ventures, LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Cache storage backend interface for TravelStyle AI application.
+Defines the entry type and the operations EnhancedSupabaseCacheService needs from
+a store, plus a base class for stores that hold one record per key.
+"""
+
+import logging
+from abc import ABC, abstractmethod
+from datetime import UTC, datetime
+from typing import Any
+
+from app.services.destination import canonical_destination_key
+
+from .payload_codec import decode_payload
+
+logger = logging.getLogger(__name__)
+
+# Cache types keyed by destination; they share entries across spellings
+DESTINATION_CACHE_TYPES = frozenset({"weather", "cultural"})
+
+
+class CacheEntry:
+    """Represents a cache entry with metadata."""
+
+    def __init__(self, data: dict[str, Any], expires_at: datetime, created_at: datetime):
+        self.data = data
+        self.expires_at = expires_at
+        self.created_at = created_at
+
+    @classmethod
+    def from_dict(cls, record: dict[str, Any]) -> "CacheEntry":
+        """Create a CacheEntry from a database record."""
+        expires_at = datetime.fromisoformat(record.get("expires_at", "").replace("Z", "+00:00"))
+        created_at = datetime.fromisoformat(record.get("created_at", "").replace("Z", "+00:00"))
+        data = decode_payload(record.get("data", {}))
+        if isinstance(data, dict):
+            # Multi-column payloads (cultural_data, style_data) are encoded per column
+            data = {key: decode_payload(value) for key, value in data.items()}
+        return cls(data, expires_at, created_at)
+
+    def is_expired(self) -> bool:
+        """Check if the cache entry is expired."""
+        return datetime.now(UTC) > self.expires_at
+
+
+def storage_key(cache_type: str, key: str) -> str:
+    """Key an entry is stored under: the canonical destination for destination caches."""
+    if cache_type in DESTINATION_CACHE_TYPES:
+        return canonical_destination_key(key)
+    return key
+
+
+class CacheBackend(ABC):
+    """Store of cache entries addressed by cache type and lookup key.
+
+    Lookup keys are passed as callers give them (e.g. "Paris, France"); backends
+    store destination caches under storage_key() so spellings share entries.
+    Backends log and return None, 0 or False on failure instead of raising.
+    """
+
+    name = "base"
+
+    @abstractmethod
+    async def get_entry(
+        self, cache_type: str, key: str, grace_seconds: float = 0.0
+    ) -> CacheEntry | None:
+        """
+        Get the newest entry for a key.
+
+        Args:
+            cache_type: "weather", "cultural", "currency", "classification" or "style"
+            key: Lookup key
+            grace_seconds: Also return entries that expired less than this long ago
+
+        Returns:
+            The entry, or None if missing, expired or unreadable
+        """
+
+    @abstractmethod
+    def build_record(
+        self, cache_type: str, key: str, data: dict[str, Any], ttl_hours: float
+    ) -> dict[str, Any]:
+        """Build the record write_records stores to cache data under key for ttl_hours."""
+
+    @abstractmethod
+    async def write_records(self, cache_type: str, records: list[dict[str, Any]]) -> int:
+        """Store records built by build_record, returning how many were stored."""
+
+    async def set_entry(
+        self, cache_type: str, key: str, data: dict[str, Any], ttl_hours: float
+    ) -> bool:
+        """Store one entry immediately."""
+        try:
+            record = self.build_record(cache_type, key, data, ttl_hours)
+        except Exception as e:
+            logger.error(f"{self.name} cache record build error for {cache_type}:{key}: {e}")
+            return False
+        return await self.write_records(cache_type, [record]) == 1
+
+    async def close(self) -> None:
+        """Release connections or files held by the backend."""
+        return None
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get backend statistics."""
+        return {"backend": self.name}
+
+
+class KeyValueCacheBackend(CacheBackend):
+    """Backend holding one record per storage key, kept retain_seconds past expiry.
+
+    Records are dicts with the storage key, the raw payload and epoch-second
+    expires_at/created_at timestamps.
+    """
+
+    def __init__(self, retain_seconds: float = 0.0):
+        """
+        Initialize the backend.
+
+        Args:
+            retain_seconds: Seconds expired records are kept so stale reads can use them
+        """
+        self.retain_seconds = retain_seconds
+
+    @abstractmethod
+    async def _get_record(self, cache_type: str, key: str) -> dict[str, Any] | None:
+        """Read the record stored under a storage key."""
+
+    def build_record(
+        self, cache_type: str, key: str, data: dict[str, Any], ttl_hours: float
+    ) -> dict[str, Any]:
+        """Build the record for data under the storage key of key."""
+        now = datetime.now(UTC).timestamp()
+        return {
+            "key": storage_key(cache_type, key),
+            "data": data,
+            "expires_at": now + ttl_hours * 3600,
+            "created_at": now,
+        }
+
+    def _retention(self, record: dict[str, Any]) -> float:
+        """Seconds from now until a record may be discarded."""
+        return record["expires_at"] - datetime.now(UTC).timestamp() + self.retain_seconds
+
+    async def get_entry(
+        self, cache_type: str, key: str, grace_seconds: float = 0.0
+    ) -> CacheEntry | None:
+        """Get the entry stored for key (see CacheBackend.get_entry)."""
+        try:
+            record = await self._get_record(cache_type, storage_key(cache_type, key))
+        except Exception as e:
+            logger.error(f"{self.name} cache get error for {cache_type}:{key}: {e}")
+            return None
+        if record is None:
+            return None
+        if record["expires_at"] <= datetime.now(UTC).timestamp() - grace_seconds:
+            return None
+        return CacheEntry(
+            decode_payload(record["data"]),
+            datetime.fromtimestamp(record["expires_at"], UTC),
+            datetime.fromtimestamp(record["created_at"], UTC),
+        )
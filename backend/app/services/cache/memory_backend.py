@@ -0,0 +1,63 @@
+# This file is part of TravelSytle AI.
+#
+# Copyright (C) 2025  Trailyn Ventures, LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Process-local cache backend for TravelStyle AI application.
+Keeps cache records in a bounded in-memory LRU; useful for development, tests
+and single-process deployments without a shared store.
+"""
+
+from typing import Any
+
+from app.utils.ttl_cache import TTLCache
+
+from .base import KeyValueCacheBackend
+
+
+class MemoryCacheBackend(KeyValueCacheBackend):
+    """Cache backend storing records in this process only."""
+
+    name = "memory"
+
+    def __init__(self, max_entries: int = 10000, retain_seconds: float = 0.0):
+        """
+        Initialize an empty store.
+
+        Args:
+            max_entries: Records held before the least recently used is evicted
+            retain_seconds: Seconds expired records are kept for stale reads
+        """
+        super().__init__(retain_seconds)
+        self.records = TTLCache[dict[str, Any]](maxsize=max_entries)
+
+    async def _get_record(self, cache_type: str, key: str) -> dict[str, Any] | None:
+        """Read a record from memory."""
+        return self.records.get(f"{cache_type}:{key}")
+
+    async def write_records(self, cache_type: str, records: list[dict[str, Any]]) -> int:
+        """Store records in memory until their retention ends."""
+        stored = 0
+        for record in records:
+            retention = self._retention(record)
+            if retention > 0:
+                self.records.set(f"{cache_type}:{record['key']}", record, retention)
+                stored += 1
+        return stored
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get entry counts and hit/miss statistics."""
+        return {"backend": self.name, **self.records.get_stats()}
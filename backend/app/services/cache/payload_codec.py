@@ -0,0 +1,93 @@
+# This file is part of TravelSytle AI.
+#
+# Copyright (C) 2025  Trailyn Ventures, LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Compact payload encoding for cache backends.
+Large JSON payloads can be stored as a versioned envelope holding zlib-compressed
+JSON, so a backend transfers and stores a short string instead of the full
+document. Plain JSON payloads are read unchanged, so both forms can coexist.
+"""
+
+import base64
+import json
+import zlib
+from typing import Any
+
+from app.core.config import settings
+
+# Key marking an encoded envelope; never present in plain cache payloads
+CODEC_KEY = "__codec__"
+ZLIB_CODEC = "zlib"
+ZLIB_VERSION = 1
+ZLIB_LEVEL = 6
+
+
+def encode_payload(
+    data: Any,
+    encoding: str | None = None,
+    min_bytes: int | None = None,
+) -> Any:
+    """
+    Encode a payload for storage in a JSONB cache column.
+
+    Args:
+        data: JSON-serializable payload
+        encoding: "json" (store as is) or "zlib"; defaults to CACHE_PAYLOAD_ENCODING
+        min_bytes: Payloads smaller than this are stored as is; defaults to
+            CACHE_PAYLOAD_COMPRESS_MIN_BYTES
+
+    Returns:
+        The payload itself, or an envelope dict when it was compressed
+
+    Raises:
+        ValueError: If the encoding is unknown
+    """
+    encoding = encoding or settings.CACHE_PAYLOAD_ENCODING
+    if encoding == "json":
+        return data
+    if encoding != ZLIB_CODEC:
+        raise ValueError(f"Unknown cache payload encoding: {encoding}")
+
+    raw = json.dumps(data, separators=(",", ":"), default=str).encode("utf-8")
+    threshold = settings.CACHE_PAYLOAD_COMPRESS_MIN_BYTES if min_bytes is None else min_bytes
+    if len(raw) < threshold:
+        return data
+
+    compressed = base64.b64encode(zlib.compress(raw, ZLIB_LEVEL)).decode("ascii")
+    return {CODEC_KEY: ZLIB_CODEC, "v": ZLIB_VERSION, "data": compressed}
+
+
+def decode_payload(value: Any) -> Any:
+    """
+    Decode a stored payload, passing plain JSON through unchanged.
+
+    Args:
+        value: Column value as returned by PostgREST
+
+    Returns:
+        The original payload
+
+    Raises:
+        ValueError: If the envelope's codec or version is not supported
+    """
+    if not isinstance(value, dict) or CODEC_KEY not in value:
+        return value
+
+    codec, version = value[CODEC_KEY], value.get("v")
+    if codec == ZLIB_CODEC and version == ZLIB_VERSION:
+        return json.loads(zlib.decompress(base64.b64decode(value["data"])))
+    raise ValueError(f"Unsupported cache payload codec: {codec} v{version}")
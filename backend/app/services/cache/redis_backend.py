@@ -0,0 +1,157 @@
+# This file is part of TravelSytle AI.
+#
+# Copyright (C) 2025  Trailyn Ventures, LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+Redis-protocol cache backend for TravelStyle AI application.
+Stores cache records as expiring string keys in any server speaking RESP
+(Redis, Valkey, KeyDB, Dragonfly) through redis.asyncio. The redis package is
+an optional dependency, imported only when CACHE_BACKEND=redis.
+"""
+
+import asyncio
+import json
+import logging
+from typing import TYPE_CHECKING, Any
+
+from .base import KeyValueCacheBackend
+from .payload_codec import encode_payload
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+logger = logging.getLogger(__name__)
+
+# Retries of a command after a connection error or timeout, with exponential backoff
+RETRIES = 2
+
+
+class RedisCacheBackend(KeyValueCacheBackend):
+    """Cache backend storing one expiring key per record in a Redis-protocol server."""
+
+    name = "redis"
+
+    def __init__(
+        self,
+        url: str,
+        prefix: str = "travelstyle:cache:",
+        timeout: float = 1.0,
+        retain_seconds: float = 0.0,
+        max_connections: int = 20,
+    ):
+        """
+        Initialize the backend; connections are opened on first use per event loop.
+
+        Args:
+            url: Server URL, redis://[user:password@]host[:port][/db] (rediss:// for TLS)
+            prefix: Prefix of every key the backend writes
+            timeout: Seconds allowed for connecting and for each request
+            retain_seconds: Seconds expired records are kept for stale reads
+            max_connections: Connections in the pool of each event loop
+
+        Raises:
+            ImportError: If the redis package is not installed
+        """
+        try:
+            import redis.asyncio  # noqa: F401
+        except ImportError as e:
+            raise ImportError(
+                "CACHE_BACKEND=redis requires the redis package (pip install redis)"
+            ) from e
+
+        super().__init__(retain_seconds)
+        self.url = url
+        self.prefix = prefix
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self._client: tuple[asyncio.AbstractEventLoop, Redis] | None = None
+
+        # Statistics
+        self.clients = 0
+        self.errors = 0
+
+    def _key(self, cache_type: str, key: str) -> str:
+        """Server key of a record."""
+        return f"{self.prefix}{cache_type}:{key}"
+
+    def _get_client(self) -> "Redis":
+        """Get the client for the running event loop; redis.asyncio pools are bound to one."""
+        from redis.asyncio import Redis
+        from redis.asyncio.retry import Retry
+        from redis.backoff import ExponentialBackoff
+
+        loop = asyncio.get_running_loop()
+        if self._client is not None and self._client[0] is loop:
+            return self._client[1]
+
+        client = Redis.from_url(
+            self.url,
+            socket_timeout=self.timeout,
+            socket_connect_timeout=self.timeout,
+            retry=Retry(ExponentialBackoff(cap=self.timeout), RETRIES),
+            max_connections=self.max_connections,
+            health_check_interval=30,
+            protocol=2,  # RESP2 is spoken by every Redis-protocol server, old or new
+        )
+        self._client = (loop, client)
+        self.clients += 1
+        return client
+
+    async def _get_record(self, cache_type: str, key: str) -> dict[str, Any] | None:
+        """Read a record."""
+        try:
+            reply = await self._get_client().get(self._key(cache_type, key))
+        except Exception:
+            self.errors += 1
+            raise
+        return json.loads(reply) if reply is not None else None
+
+    async def write_records(self, cache_type: str, records: list[dict[str, Any]]) -> int:
+        """Write records in one pipeline, each expiring when its retention ends."""
+        pipeline = self._get_client().pipeline(transaction=False)
+        for record in records:
+            retention_ms = int(self._retention(record) * 1000)
+            if retention_ms <= 0:
+                continue
+            value = json.dumps(
+                {**record, "data": encode_payload(record["data"])},
+                separators=(",", ":"),
+                default=str,
+            )
+            pipeline.set(self._key(cache_type, record["key"]), value, px=retention_ms)
+        if not len(pipeline):
+            return 0
+        try:
+            replies = await pipeline.execute(raise_on_error=False)
+        except Exception as e:
+            self.errors += 1
+            logger.error(f"Redis cache write error for {cache_type}: {e}")
+            return 0
+        return sum(1 for reply in replies if reply is True)
+
+    async def close(self) -> None:
+        """Close the connection pool of the running event loop."""
+        client, self._client = self._client, None
+        if client is not None and client[0] is asyncio.get_running_loop():
+            await client[1].aclose()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get client and error counts."""
+        return {
+            "backend": self.name,
+            "connected": self._client is not None,
+            "clients": self.clients,
+            "errors": self.errors,
+        }
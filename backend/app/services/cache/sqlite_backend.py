@@ -0,0 +1,157 @@
+# This file is part of TravelSytle AI.
+#
+# Copyright (C) 2025  Trailyn Ventures, LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+SQLite cache backend for TravelStyle AI application.
+Stores cache records in a local SQLite file, shared by the processes of one
+host and kept across restarts. Queries run on the db executor's threads.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+from datetime import UTC, datetime
+from typing import Any
+
+from app.utils.executors import executors
+
+from .base import KeyValueCacheBackend
+from .payload_codec import encode_payload
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS cache_entries (
+        cache_type TEXT NOT NULL,
+        key TEXT NOT NULL,
+        data TEXT NOT NULL,
+        expires_at REAL NOT NULL,
+        created_at REAL NOT NULL,
+        PRIMARY KEY (cache_type, key)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_cache_entries_expires_at ON cache_entries (expires_at)",
+)
+
+UPSERT_SQL = """
+    INSERT INTO cache_entries (cache_type, key, data, expires_at, created_at)
+    VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT (cache_type, key) DO UPDATE SET
+        data = excluded.data,
+        expires_at = excluded.expires_at,
+        created_at = excluded.created_at
+"""
+
+
+class SQLiteCacheBackend(KeyValueCacheBackend):
+    """Cache backend storing records in one SQLite table."""
+
+    name = "sqlite"
+
+    def __init__(self, path: str, retain_seconds: float = 0.0, timeout: float = 5.0):
+        """
+        Initialize the backend; the file is opened on first use.
+
+        Args:
+            path: Database file path, or ":memory:"
+            retain_seconds: Seconds expired records are kept for stale reads
+            timeout: Seconds to wait for another process's write lock
+        """
+        super().__init__(retain_seconds)
+        self.path = path
+        self.timeout = timeout
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database and create the table (called with the lock held)."""
+        if self._connection is None:
+            connection = sqlite3.connect(self.path, timeout=self.timeout, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            for statement in SCHEMA:
+                connection.execute(statement)
+            connection.commit()
+            self._connection = connection
+        return self._connection
+
+    def _select(self, cache_type: str, key: str) -> dict[str, Any] | None:
+        """Read one record."""
+        with self._lock:
+            row = (
+                self._connect()
+                .execute(
+                    "SELECT data, expires_at, created_at FROM cache_entries "
+                    "WHERE cache_type = ? AND key = ?",
+                    (cache_type, key),
+                )
+                .fetchone()
+            )
+        if row is None:
+            return None
+        data, expires_at, created_at = row
+        return {
+            "key": key,
+            "data": json.loads(data),
+            "expires_at": expires_at,
+            "created_at": created_at,
+        }
+
+    def _upsert(self, cache_type: str, records: list[dict[str, Any]]) -> int:
+        """Write records in one transaction and purge records past their retention."""
+        params = [
+            (
+                cache_type,
+                record["key"],
+                json.dumps(encode_payload(record["data"]), separators=(",", ":"), default=str),
+                record["expires_at"],
+                record["created_at"],
+            )
+            for record in records
+        ]
+        cutoff = datetime.now(UTC).timestamp() - self.retain_seconds
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.executemany(UPSERT_SQL, params)
+                connection.execute("DELETE FROM cache_entries WHERE expires_at < ?", (cutoff,))
+        return len(params)
+
+    async def _get_record(self, cache_type: str, key: str) -> dict[str, Any] | None:
+        """Read a record on the db executor."""
+        return await executors.run("db", self._select, cache_type, key)
+
+    async def write_records(self, cache_type: str, records: list[dict[str, Any]]) -> int:
+        """Upsert records on the db executor."""
+        try:
+            return await executors.run("db", self._upsert, cache_type, records)
+        except Exception as e:
+            logger.error(f"SQLite cache write error for {cache_type}: {e}")
+            return 0
+
+    async def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get the backend name and database path."""
+        return {"backend": self.name, "path": self.path}
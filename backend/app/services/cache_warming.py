@@ -0,0 +1,320 @@
+# This file is part of TravelSytle AI.
+#
+# Copyright (C) 2025  Trailyn Ventures, LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Cache warming job for TravelStyle AI application.
+Finds the most popular destinations and currency bases and pre-populates their
+weather, cultural and exchange rate caches before users ask for them.
+
+Run it from the backend directory with ``python -m app.services.cache_warming``,
+or invoke the Lambda handler with a scheduled event (see DEPLOYMENT.md).
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import time
+from collections import Counter, defaultdict
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+from typing import Any
+
+from app.core.config import settings
+from app.services.currency.api import currency_api
+from app.services.currency.constants import DEFAULT_BASE_CURRENCY
+from app.services.currency.validators import validate_currency_code
+from app.services.destination.canonical import canonical_destination_key
+from app.services.http_clients import http_clients
+from app.services.qloo import qloo_service
+from app.services.supabase import enhanced_supabase_cache, get_supabase_data_client
+from app.services.weather import weather_service
+
+logger = logging.getLogger(__name__)
+
+# (table, column, newest-first order column) read when ranking popularity
+DESTINATION_SOURCES = (
+    ("saved_destinations", "destination_name", "created_at"),
+    ("conversations", "destination", "updated_at"),
+    ("weather_cache", "destination", "created_at"),
+    ("cultural_insights_cache", "destination", "created_at"),
+)
+CURRENCY_SOURCES = (
+    ("currency_favorites", "from_currency", "last_used"),
+    ("currency_rates_cache", "base_currency", "created_at"),
+)
+
+# Constant input the warming EventBridge rule must send to the API function; other
+# scheduled events aimed at the function (e.g. keep-warm pings) do not start a warm
+WARM_CACHE_TASK = "warm_cache"
+
+
+def is_cache_warming_event(event: Any) -> bool:
+    """Whether a Lambda event is the ``{"task": "warm_cache"}`` input of the warming rule."""
+    return isinstance(event, dict) and event.get("task") == WARM_CACHE_TASK
+
+
+class CacheWarmer:
+    """Pre-populates destination and currency caches with bounded upstream usage."""
+
+    def __init__(
+        self,
+        top_destinations: int | None = None,
+        top_currencies: int | None = None,
+        concurrency: int | None = None,
+        max_upstream_calls: int | None = None,
+    ):
+        """
+        Initialize the warmer; unset arguments come from settings.
+
+        Args:
+            top_destinations: Number of destinations to warm
+            top_currencies: Number of base currencies to warm
+            concurrency: Maximum concurrent calls per upstream API
+            max_upstream_calls: Maximum calls per upstream API in one run
+        """
+        self.top_destinations = (
+            settings.CACHE_WARM_TOP_DESTINATIONS if top_destinations is None else top_destinations
+        )
+        self.top_currencies = (
+            settings.CACHE_WARM_TOP_CURRENCIES if top_currencies is None else top_currencies
+        )
+        self.concurrency = max(
+            1, settings.CACHE_WARM_CONCURRENCY if concurrency is None else concurrency
+        )
+        self.max_upstream_calls = (
+            settings.CACHE_WARM_MAX_UPSTREAM_CALLS
+            if max_upstream_calls is None
+            else max_upstream_calls
+        )
+        self.lookback_rows = settings.CACHE_WARM_LOOKBACK_ROWS
+        self.min_remaining_seconds = settings.CACHE_WARM_MIN_REMAINING_SECONDS
+        self.timeout_seconds = settings.CACHE_WARM_TIMEOUT_SECONDS
+        self.currency_api = currency_api
+
+    async def _recent_values(self, table: str, column: str, order_field: str) -> list[str]:
+        """Get the most recent non-empty values of one column, or [] if the query fails."""
+
+        try:
+            response = await (
+                get_supabase_data_client()
+                .table(table)
+                .select(column)
+                .order(order_field, desc=True)
+                .limit(self.lookback_rows)
+                .execute()
+            )
+        except Exception as e:  # pylint: disable=broad-except
+            logger.warning(f"Cache warming could not read {table}.{column}: {e}")
+            return []
+        values = (row.get(column) for row in response.data or [])
+        return [value.strip() for value in values if isinstance(value, str) and value.strip()]
+
+    async def find_destinations(self) -> list[str]:
+        """
+        Rank destinations by how often they appear across DESTINATION_SOURCES.
+
+        Spellings that share a canonical key are counted together and the most
+        common spelling is returned for each.
+
+        Returns:
+            Up to top_destinations destination names, most popular first
+        """
+        results = await asyncio.gather(
+            *(self._recent_values(*source) for source in DESTINATION_SOURCES)
+        )
+        counts: Counter[str] = Counter()
+        spellings: defaultdict[str, Counter[str]] = defaultdict(Counter)
+        for values in results:
+            for value in values:
+                key = canonical_destination_key(value)
+                if key:
+                    counts[key] += 1
+                    spellings[key][value] += 1
+        return [
+            spellings[key].most_common(1)[0][0]
+            for key, _count in counts.most_common(self.top_destinations)
+        ]
+
+    async def find_currencies(self) -> list[str]:
+        """
+        Rank supported base currencies by how often they appear across CURRENCY_SOURCES.
+
+        Returns:
+            Up to top_currencies currency codes, starting with the default base currency
+        """
+        results = await asyncio.gather(
+            *(self._recent_values(*source) for source in CURRENCY_SOURCES)
+        )
+        counts = Counter(
+            value.upper() for values in results for value in values if validate_currency_code(value)
+        )
+        ranked = [DEFAULT_BASE_CURRENCY]
+        ranked.extend(
+            code for code, _count in counts.most_common() if code != DEFAULT_BASE_CURRENCY
+        )
+        return ranked[: self.top_currencies]
+
+    def _is_fresh(self, expires_at: datetime) -> bool:
+        """Whether a cached entry outlives the warming threshold, so warming it wastes quota."""
+        remaining = (expires_at - datetime.now(UTC)).total_seconds()
+        return remaining >= self.min_remaining_seconds
+
+    async def _warm(
+        self,
+        cache_type: str,
+        targets: list[str],
+        fetch: Callable[[str], Awaitable[Any]],
+        report: Counter[str],
+    ) -> None:
+        """
+        Refresh each target whose cache entry is missing or about to expire.
+
+        Args:
+            cache_type: Cache the upstream API fills, e.g. "weather"
+            targets: Destinations or currency codes for one upstream API
+            fetch: Coroutine function forcing an upstream fetch; falsy on failure
+            report: Counter updated with warmed, fresh, failed and over_quota counts
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+        budget = self.max_upstream_calls
+
+        async def warm_one(target: str) -> None:
+            nonlocal budget
+            async with semaphore:
+                entry = await enhanced_supabase_cache.backend.get_entry(cache_type, target)
+                if entry is not None and self._is_fresh(entry.expires_at):
+                    report["fresh"] += 1
+                    return
+                if budget <= 0:
+                    report["over_quota"] += 1
+                    return
+                budget -= 1
+                try:
+                    result = await fetch(target)
+                except Exception as e:  # pylint: disable=broad-except
+                    logger.warning(f"Cache warming failed for {target}: {e}")
+                    result = None
+                report["warmed" if result else "failed"] += 1
+
+        await asyncio.gather(*(warm_one(target) for target in targets))
+
+    async def _fetch_cultural(self, destination: str) -> dict[str, Any] | None:
+        """Fetch cultural insights, treating the built-in fallback as a failure."""
+        result = await qloo_service.get_cultural_insights(destination, force_refresh=True)
+        if result and result.get("data_source") == "fallback":
+            return None
+        return result
+
+    async def run(self, dry_run: bool = False) -> dict[str, Any]:
+        """
+        Find popular destinations and currencies and warm their caches.
+
+        Each upstream API is warmed concurrently with the others, with at most
+        ``concurrency`` calls in flight and ``max_upstream_calls`` calls in total.
+        Queued cache writes are flushed before returning.
+
+        Args:
+            dry_run: Only report the targets, without calling any upstream API
+
+        Returns:
+            Report with the targets and per-cache outcome counts
+        """
+        started = time.perf_counter()
+        destinations, currencies = await asyncio.gather(
+            self.find_destinations(), self.find_currencies()
+        )
+        report: dict[str, Any] = {
+            "destinations": destinations,
+            "currencies": currencies,
+            "dry_run": dry_run,
+            "timed_out": False,
+        }
+        if not dry_run:
+            outcomes: dict[str, Counter[str]] = {
+                "weather": Counter(),
+                "cultural": Counter(),
+                "currency": Counter(),
+            }
+            try:
+                await asyncio.wait_for(
+                    asyncio.gather(
+                        self._warm(
+                            "weather",
+                            destinations,
+                            lambda d: weather_service.get_weather_data(d, force_refresh=True),
+                            outcomes["weather"],
+                        ),
+                        self._warm(
+                            "cultural",
+                            destinations,
+                            self._fetch_cultural,
+                            outcomes["cultural"],
+                        ),
+                        self._warm(
+                            "currency",
+                            currencies,
+                            lambda c: self.currency_api.get_exchange_rates(c, force_refresh=True),
+                            outcomes["currency"],
+                        ),
+                    ),
+                    timeout=self.timeout_seconds,
+                )
+            except TimeoutError:
+                report["timed_out"] = True
+                logger.warning("Cache warming stopped after %ss", self.timeout_seconds)
+            await enhanced_supabase_cache.flush_writes()
+            report.update({name: dict(counter) for name, counter in outcomes.items()})
+
+        report["duration_seconds"] = round(time.perf_counter() - started, 3)
+        logger.info(json.dumps({"event": "cache_warming", **report}))
+        return report
+
+
+async def _run_once(warmer: CacheWarmer, dry_run: bool) -> dict[str, Any]:
+    """Run the warmer and close the HTTP clients it opened on this event loop."""
+    try:
+        return await warmer.run(dry_run=dry_run)
+    finally:
+        await http_clients.aclose()
+
+
+def main() -> None:
+    """Run one cache warming pass and print its report as JSON."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--destinations", type=int, help="number of destinations to warm")
+    parser.add_argument("--currencies", type=int, help="number of base currencies to warm")
+    parser.add_argument("--concurrency", type=int, help="concurrent calls per upstream API")
+    parser.add_argument("--max-calls", type=int, help="maximum calls per upstream API")
+    parser.add_argument(
+        "--dry-run", action="store_true", help="list the targets without warming them"
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    warmer = CacheWarmer(
+        top_destinations=args.destinations,
+        top_currencies=args.currencies,
+        concurrency=args.concurrency,
+        max_upstream_calls=args.max_calls,
+    )
+    report = asyncio.run(_run_once(warmer, args.dry_run))
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
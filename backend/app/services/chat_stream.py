@@ -0,0 +1,192 @@
+# This file is part of TravelSytle AI.
+#
+# Copyright (C) 2025  Trailyn Ventures, LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Server-Sent Events streaming for TravelStyle AI chat responses.
+Relays OpenAI completion text to the client as it is generated, strips quick-reply
+markers incrementally and lets the caller finish with the complete ChatResponse.
+"""
+
+import asyncio
+import json
+import logging
+import re
+from collections.abc import AsyncIterator, Awaitable
+from contextvars import ContextVar
+from typing import Any
+
+from app.models.responses import ChatResponse, QuickReply
+
+logger = logging.getLogger(__name__)
+
+# Quick-reply marker the system prompt asks the model to emit, e.g. [QUICK: "Show layers"]
+QUICK_REPLY_PATTERN = re.compile(r'\[QUICK:\s*"([^"]+)"\]')
+
+# Any prefix of a quick-reply marker, i.e. text the next chunk may still complete
+_PARTIAL_QUICK_REPLY = re.compile(r'\[(?:Q(?:U(?:I(?:C(?:K(?::\s*(?:"(?:[^"]+"?)?)?)?)?)?)?)?)?')
+
+# Longest marker prefix held back before it is released as plain text
+_MAX_MARKER_LENGTH = 120
+
+
+def format_sse_event(event: str, data: dict[str, Any]) -> str:
+    """
+    Format a Server-Sent Events frame.
+
+    Args:
+        event: Event name
+        data: JSON-serializable payload
+
+    Returns:
+        The frame, terminated by a blank line
+    """
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+class QuickReplyStreamParser:
+    """Incrementally separates quick-reply markers from streamed completion text."""
+
+    def __init__(self):
+        """Initialize the parser with an empty buffer."""
+        self._buffer = ""
+
+    def feed(self, chunk: str) -> tuple[str, list[QuickReply]]:
+        """
+        Consume a completion chunk.
+
+        Text that may be the start of a marker split across chunks is held back
+        until the marker completes or can no longer match.
+
+        Args:
+            chunk: Next piece of completion text
+
+        Returns:
+            Tuple of (text safe to display, quick replies completed by this chunk)
+        """
+        buffer = self._buffer + chunk
+        text_parts: list[str] = []
+        quick_replies: list[QuickReply] = []
+
+        while buffer:
+            start = buffer.find("[")
+            if start == -1:
+                text_parts.append(buffer)
+                buffer = ""
+                break
+
+            text_parts.append(buffer[:start])
+            buffer = buffer[start:]
+
+            match = QUICK_REPLY_PATTERN.match(buffer)
+            if match:
+                quick_replies.append(QuickReply(text=match.group(1)))
+                buffer = buffer[match.end() :]
+                continue
+
+            if len(buffer) <= _MAX_MARKER_LENGTH and _PARTIAL_QUICK_REPLY.fullmatch(buffer):
+                break
+
+            text_parts.append(buffer[0])
+            buffer = buffer[1:]
+
+        self._buffer = buffer
+        return "".join(text_parts), quick_replies
+
+    def flush(self) -> str:
+        """Release any held-back text once the completion has ended."""
+        text, self._buffer = self._buffer, ""
+        return text
+
+
+_active_stream: ContextVar["ChatStream | None"] = ContextVar("active_chat_stream", default=None)
+
+
+def get_active_stream() -> "ChatStream | None":
+    """Get the chat stream of the current request, if the client asked for one."""
+    return _active_stream.get()
+
+
+class ChatStream:
+    """Relays events from a running chat response to a streaming client."""
+
+    def __init__(self):
+        """Initialize an empty stream."""
+        self._queue: asyncio.Queue[tuple[str, dict[str, Any]] | None] = asyncio.Queue()
+        self._parser = QuickReplyStreamParser()
+        self.tokens_sent = 0
+        self.quick_replies_sent = 0
+        # Set when the completion failed after the client was shown part of it
+        self.interrupted = False
+        self.response: ChatResponse | None = None
+
+    def _send_token(self, text: str) -> None:
+        """Queue a token event if there is text to show."""
+        if text:
+            self.tokens_sent += 1
+            self._queue.put_nowait(("token", {"text": text}))
+
+    def send_text(self, chunk: str) -> None:
+        """
+        Forward a completion chunk to the client.
+
+        Args:
+            chunk: Raw completion text, possibly containing quick-reply markers
+        """
+        text, quick_replies = self._parser.feed(chunk)
+        self._send_token(text)
+        for quick_reply in quick_replies:
+            self.quick_replies_sent += 1
+            self._queue.put_nowait(("quick_reply", quick_reply.model_dump()))
+
+    def end_text(self) -> None:
+        """Forward text held back by the quick-reply parser."""
+        self._send_token(self._parser.flush())
+
+    def interrupt(self) -> None:
+        """Record that the completion failed, if the client already received part of it."""
+        if self.tokens_sent or self.quick_replies_sent:
+            self.interrupted = True
+
+    async def relay(self, response: Awaitable[ChatResponse]) -> AsyncIterator[str]:
+        """
+        Produce a chat response with this stream active, yielding frames as they arrive.
+
+        The completed response is stored on ``self.response``; exceptions raised while
+        producing it propagate to the caller after the queued frames are yielded.
+
+        Args:
+            response: Awaitable producing the final ChatResponse
+
+        Returns:
+            Async iterator of Server-Sent Events frames
+        """
+        token = _active_stream.set(self)
+        try:
+            # The task copies the current context, so the stream is visible to it
+            task = asyncio.ensure_future(response)
+        finally:
+            _active_stream.reset(token)
+        task.add_done_callback(lambda _: self._queue.put_nowait(None))
+
+        try:
+            while (event := await self._queue.get()) is not None:
+                yield format_sse_event(*event)
+            self.response = task.result()
+        finally:
+            if not task.done():
+                logger.info("Chat stream closed before the response completed")
+                task.cancel()
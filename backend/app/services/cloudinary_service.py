@@ -28,6 +28,7 @@ import cloudinary.api
 import cloudinary.uploader
 
 from app.core.config import settings
+from app.utils.executors import executors
 
 logger = logging.getLogger(__name__)
 
@@ -62,7 +63,9 @@ class CloudinaryService:
             public_id = f"travelstyle/profile_pictures/{user_id}/{uuid.uuid4()}"
 
             # Upload to Cloudinary with transformations
-            result = cloudinary.uploader.upload(
+            result = await executors.run(
+                "media",
+                cloudinary.uploader.upload,
                 file_content,
                 public_id=public_id,
                 transformation=[
@@ -122,7 +125,7 @@ class CloudinaryService:
             public_id = "/".join(public_id_parts).split(".")[0]  # Remove file extension
 
             # Delete from Cloudinary
-            result = cloudinary.uploader.destroy(public_id)
+            result = await executors.run("media", cloudinary.uploader.destroy, public_id)
 
             if result and result.get("result") == "ok":
                 logger.info(f"Profile picture deleted successfully: {public_id}")
@@ -202,7 +205,7 @@ class CloudinaryService:
         """
         try:
             # Try to get account info
-            result = cloudinary.api.ping()
+            result = await executors.run("media", cloudinary.api.ping)
             if result and result.get("status") == "ok":
                 logger.info("Cloudinary connection successful")
                 return True
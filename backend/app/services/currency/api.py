@@ -28,11 +28,14 @@ from app.core.config import settings
 from app.services.currency.constants import (
     CACHE_DURATION_HOURS,
     DEFAULT_BASE_CURRENCY,
-    DEFAULT_TIMEOUT,
 )
 from app.services.currency.exceptions import CurrencyAPIError, CurrencyValidationError
 from app.services.currency.validators import normalize_currency_code
+from app.services.http_clients import http_clients
 from app.services.supabase import enhanced_supabase_cache
+from app.utils.metrics import cache_metrics
+from app.utils.negative_cache import classify_failure
+from app.utils.single_flight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
@@ -44,7 +47,12 @@ class CurrencyAPI:
         """Initialize the currency API service."""
         self.base_url = settings.EXCHANGE_BASE_URL
         self.api_key = settings.EXCHANGE_API_KEY
-        self.timeout = DEFAULT_TIMEOUT
+        self._single_flight = SingleFlight[dict[str, Any] | None]()
+        # Expired cache entries are served while this renews them
+        enhanced_supabase_cache.register_refresher(
+            "currency",
+            lambda base_currency: self.get_exchange_rates(base_currency, force_refresh=True),
+        )
 
     async def get_exchange_rates(
         self, base_currency: str = DEFAULT_BASE_CURRENCY, force_refresh: bool = False
@@ -53,10 +61,22 @@ class CurrencyAPI:
 
         Args:
             base_currency: The base currency code (default: USD)
+            force_refresh: Skip the cache and fetch fresh rates
 
         Returns:
             Dictionary containing exchange rates or None if error
         """
+        # Concurrent requests for the same base currency share one fetch
+        key = (str(base_currency).strip().upper(), force_refresh)
+        return await self._single_flight.do(
+            key, lambda: self._fetch_exchange_rates(base_currency, force_refresh)
+        )
+
+    async def _fetch_exchange_rates(
+        self, base_currency: str, force_refresh: bool
+    ) -> dict[str, Any] | None:
+        """Fetch exchange rates from the cache or the exchange rate API."""
+        normalized_currency: str | None = None
         try:
             # Normalize and validate currency code
             normalized_currency = normalize_currency_code(base_currency)
@@ -68,21 +88,30 @@ class CurrencyAPI:
                     logger.info(f"Using cached data for {normalized_currency}: {cached_data}")
                     return cached_data
 
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            # Currencies whose lookup just failed fail fast
+            failure = enhanced_supabase_cache.get_failure("currency", normalized_currency)
+            if failure is not None:
+                logger.info(f"Skipping rates fetch for {normalized_currency}: recent {failure}")
+                return None
+
+            async with http_clients.session("currency") as client:
                 # Ensure no double slashes
                 latest_url = f"{self.base_url}{self.api_key}/latest/{normalized_currency}"
-                response = await client.get(latest_url)
-                response.raise_for_status()
+                with cache_metrics.track("currency", "upstream"):
+                    response = await client.get(latest_url)
+                    response.raise_for_status()
 
                 try:
                     data = response.json()
                 except Exception as e:
                     logger.error("Failed to parse JSON: %s, content: %s", e, response.content)
+                    self._record_failure(normalized_currency, "error")
                     return None
 
                 logger.debug("Currency exchange rate API response: %s", data)
                 logger.info(f"API Response for {normalized_currency}: {data}")
                 if not isinstance(data, dict):
+                    self._record_failure(normalized_currency, "no_data")
                     return None
 
                 # Some providers include result="success"; tests mock without it.
@@ -98,6 +127,10 @@ class CurrencyAPI:
                 )
                 if data.get("result") not in (None, "success") and not has_required:
                     logger.error(f"API returned error: {data}")
+                    unsupported = data.get("error-type") == "unsupported-code"
+                    self._record_failure(
+                        normalized_currency, "not_found" if unsupported else "error"
+                    )
                     return None
 
                 rates_data = {
@@ -118,17 +151,26 @@ class CurrencyAPI:
             raise
         except httpx.RequestError as e:
             logger.error("Currency service request error: %s", type(e).__name__)
+            self._record_failure(normalized_currency, classify_failure(e))
             return None
         except httpx.HTTPError as e:
             logger.error("Currency service HTTP error: %s", type(e).__name__)
+            self._record_failure(normalized_currency, classify_failure(e))
             return None
         except ValueError as e:
             logger.error("Currency service JSON decode error: %s", type(e).__name__)
+            self._record_failure(normalized_currency, "error")
             return None
         except Exception as e:
             logger.error("Unexpected error in get_exchange_rates: %s", e)
+            self._record_failure(normalized_currency, "error")
             return None
 
+    def _record_failure(self, currency: str | None, failure: str) -> None:
+        """Remember a failed rates lookup; invalid codes never reach the API and are skipped."""
+        if currency is not None:
+            enhanced_supabase_cache.set_failure("currency", currency, failure)
+
     async def convert_currency(
         self, amount: float, from_currency: str, to_currency: str
     ) -> dict[str, Any] | None:
@@ -240,3 +282,11 @@ class CurrencyAPI:
         except Exception as e:
             logger.error(f"Error getting pair exchange rate: {e}")
             return None
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get request coalescing statistics."""
+        return {"single_flight": self._single_flight.get_stats()}
+
+
+# Singleton instance, shared so every caller coalesces onto the same in-flight fetches
+currency_api = CurrencyAPI()
@@ -23,7 +23,7 @@ Provides a unified interface for all currency operations.
 import logging
 from typing import Any
 
-from app.services.currency.api import CurrencyAPI
+from app.services.currency.api import currency_api
 from app.services.currency.exceptions import (
     CurrencyAPIError,
     CurrencyConversionError,
@@ -41,7 +41,7 @@ class CurrencyService:
 
     def __init__(self):
         """Initialize the currency service."""
-        self.api = CurrencyAPI()
+        self.api = currency_api
         self.parser = CurrencyParser()
         self.formatter = CurrencyFormatter()
 
@@ -62,6 +62,10 @@ class CurrencyService:
         """Get exchange rate for a specific currency pair."""
         return await self.api.get_pair_exchange_rate(base_currency, target_currency)
 
+    def get_stats(self) -> dict[str, Any]:
+        """Get request coalescing statistics."""
+        return self.api.get_stats()
+
     # Parser operations - delegate to CurrencyParser
     def is_currency_request(self, user_input: str) -> bool:
         """Check if a user message is a currency conversion request."""
@@ -19,7 +19,6 @@
 Conversation-related database operations for TravelStyle AI application.
 """
 
-import asyncio
 import logging
 import uuid
 from datetime import UTC, datetime
@@ -32,6 +31,7 @@ from app.services.database.validators import (
     validate_user_id,
 )
 from app.services.rate_limiter import db_rate_limiter
+from app.services.supabase import select_projection
 
 logger = logging.getLogger(__name__)
 
@@ -63,29 +63,24 @@ class ConversationOperations:
         try:
             if conversation_id:
                 # Get messages for a specific conversation
-                response = await asyncio.to_thread(
-                    lambda: (
-                        self.client.table(DatabaseTables.CONVERSATION_MESSAGES)
-                        .select("*")
-                        .eq("conversation_id", conversation_id)
-                        .order("created_at", desc=False)
-                        .execute()
-                    )
+                response = await (
+                    self.client.table(DatabaseTables.CONVERSATION_MESSAGES)
+                    .select("*")
+                    .eq("conversation_id", conversation_id)
+                    .order("created_at", desc=False)
+                    .execute()
                 )
 
                 return response.data if response.data else []
             else:
                 # Get recent conversations for the user
-                conversations_response = await asyncio.to_thread(
-                    lambda: (
-                        self.client.table(DatabaseTables.CONVERSATIONS)
-                        .select("id, title, messages, created_at, updated_at")
-                        .eq("user_id", user_id)
-                        .eq("is_archived", False)
-                        .order("updated_at", desc=True)
-                        .limit(10)
-                        .execute()
-                    )
+                conversations_response = await (
+                    select_projection(self.client, DatabaseTables.CONVERSATIONS, "recent")
+                    .eq("user_id", user_id)
+                    .eq("is_archived", False)
+                    .order("updated_at", desc=True)
+                    .limit(10)
+                    .execute()
                 )
 
                 return conversations_response.data if conversations_response.data else []
@@ -140,40 +135,34 @@ class ConversationOperations:
                     "updated_at": datetime.now(UTC).isoformat(),
                 }
 
-                await asyncio.to_thread(
-                    lambda: (
-                        self.client.table(DatabaseTables.CONVERSATIONS)
-                        .insert(conversation_data)
-                        .execute()
-                    )
+                await (
+                    self.client.table(DatabaseTables.CONVERSATIONS)
+                    .insert(conversation_data)
+                    .execute()
                 )
             else:
                 # Update existing conversation with atomic increment
-                current_response = await asyncio.to_thread(
-                    lambda: (
-                        self.client.table(DatabaseTables.CONVERSATIONS)
-                        .select("messages")
-                        .eq("id", conversation_id)
-                        .execute()
-                    )
+                current_response = await (
+                    self.client.table(DatabaseTables.CONVERSATIONS)
+                    .select("messages")
+                    .eq("id", conversation_id)
+                    .execute()
                 )
 
                 current_count = (
                     current_response.data[0].get("messages", 0) if current_response.data else 0
                 )
 
-                await asyncio.to_thread(
-                    lambda: (
-                        self.client.table(DatabaseTables.CONVERSATIONS)
-                        .update(
-                            {
-                                "messages": current_count + 1,
-                                "updated_at": datetime.now(UTC).isoformat(),
-                            }
-                        )
-                        .eq("id", conversation_id)
-                        .execute()
+                await (
+                    self.client.table(DatabaseTables.CONVERSATIONS)
+                    .update(
+                        {
+                            "messages": current_count + 1,
+                            "updated_at": datetime.now(UTC).isoformat(),
+                        }
                     )
+                    .eq("id", conversation_id)
+                    .execute()
                 )
 
             # Save the user message
@@ -186,12 +175,10 @@ class ConversationOperations:
                 "created_at": datetime.now(UTC).isoformat(),
             }
 
-            await asyncio.to_thread(
-                lambda: (
-                    self.client.table(DatabaseTables.CONVERSATION_MESSAGES)
-                    .insert(user_message_data)
-                    .execute()
-                )
+            await (
+                self.client.table(DatabaseTables.CONVERSATION_MESSAGES)
+                .insert(user_message_data)
+                .execute()
             )
 
             # Save the AI response message
@@ -204,12 +191,10 @@ class ConversationOperations:
                 "created_at": datetime.now(UTC).isoformat(),
             }
 
-            await asyncio.to_thread(
-                lambda: (
-                    self.client.table(DatabaseTables.CONVERSATION_MESSAGES)
-                    .insert(ai_message_data)
-                    .execute()
-                )
+            await (
+                self.client.table(DatabaseTables.CONVERSATION_MESSAGES)
+                .insert(ai_message_data)
+                .execute()
             )
 
             logger.info(f"Saved message for conversation {conversation_id}")
@@ -231,16 +216,13 @@ class ConversationOperations:
             return []
 
         try:
-            response = await asyncio.to_thread(
-                lambda: (
-                    self.client.table(DatabaseTables.CONVERSATIONS)
-                    .select("*")
-                    .eq("user_id", user_id)
-                    .eq("is_archived", False)
-                    .order("updated_at", desc=True)
-                    .limit(limit)
-                    .execute()
-                )
+            response = await (
+                select_projection(self.client, DatabaseTables.CONVERSATIONS, "summary")
+                .eq("user_id", user_id)
+                .eq("is_archived", False)
+                .order("updated_at", desc=True)
+                .limit(limit)
+                .execute()
             )
 
             return response.data if response.data else []
@@ -260,14 +242,12 @@ class ConversationOperations:
             return False
 
         try:
-            await asyncio.to_thread(
-                lambda: (
-                    self.client.table(DatabaseTables.CONVERSATIONS)
-                    .update({"is_archived": True, "updated_at": datetime.now(UTC).isoformat()})
-                    .eq("id", conversation_id)
-                    .eq("user_id", user_id)
-                    .execute()
-                )
+            await (
+                self.client.table(DatabaseTables.CONVERSATIONS)
+                .update({"is_archived": True, "updated_at": datetime.now(UTC).isoformat()})
+                .eq("id", conversation_id)
+                .eq("user_id", user_id)
+                .execute()
             )
 
             logger.info(f"Archived conversation {conversation_id}")
@@ -289,24 +269,20 @@ class ConversationOperations:
 
         try:
             # Delete all messages in the conversation
-            await asyncio.to_thread(
-                lambda: (
-                    self.client.table(DatabaseTables.CONVERSATION_MESSAGES)
-                    .delete()
-                    .eq("conversation_id", conversation_id)
-                    .execute()
-                )
+            await (
+                self.client.table(DatabaseTables.CONVERSATION_MESSAGES)
+                .delete()
+                .eq("conversation_id", conversation_id)
+                .execute()
             )
 
             # Delete the conversation
-            await asyncio.to_thread(
-                lambda: (
-                    self.client.table(DatabaseTables.CONVERSATIONS)
-                    .delete()
-                    .eq("id", conversation_id)
-                    .eq("user_id", user_id)
-                    .execute()
-                )
+            await (
+                self.client.table(DatabaseTables.CONVERSATIONS)
+                .delete()
+                .eq("id", conversation_id)
+                .eq("user_id", user_id)
+                .execute()
             )
 
             logger.info(f"Deleted conversation {conversation_id}")
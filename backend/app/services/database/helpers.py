@@ -20,7 +20,6 @@ Main database helpers for TravelStyle AI application.
 Provides a unified interface for all database operations.
 """
 
-import asyncio
 import logging
 from datetime import UTC, datetime
 from typing import Any
@@ -28,8 +27,7 @@ from typing import Any
 from app.services.database.constants import DatabaseTables
 from app.services.database.conversations import ConversationOperations
 from app.services.database.users import UserOperations
-from app.services.supabase import get_supabase_client
-from supabase import Client
+from app.services.supabase import SupabaseDataClient, get_supabase_data_client
 
 logger = logging.getLogger(__name__)
 
@@ -37,13 +35,12 @@ logger = logging.getLogger(__name__)
 class DatabaseHelpers:
     """Main database helper class that provides unified access to all database operations."""
 
-    def __init__(self, supabase_client: Client | None = None):
-        # Use the provided client, shared client, or create a new one
+    def __init__(self, supabase_client: SupabaseDataClient | None = None):
+        # Use the provided async PostgREST client or the shared pooled one
         if supabase_client:
             self.client = supabase_client
         else:
-            # Use the shared client for better connection pooling
-            self.client = get_supabase_client()
+            self.client = get_supabase_data_client()
 
         # Initialize operation classes
         self.conversations = ConversationOperations(self.client)
@@ -83,9 +80,9 @@ class DatabaseHelpers:
         return await self.conversations.delete_conversation(user_id, conversation_id)
 
     # User operations - delegate to UserOperations
-    async def get_user_profile(self, user_id: str) -> dict:
-        """Retrieve user profile from user_profile_view."""
-        return await self.users.get_user_profile(user_id)
+    async def get_user_profile(self, user_id: str, projection: str = "profile") -> dict:
+        """Retrieve the columns of a user_profile_view projection for a user."""
+        return await self.users.get_user_profile(user_id, projection)
 
     async def save_user_profile(self, user_id: str, profile_data: dict) -> dict | None:
         """Save user profile data."""
@@ -147,10 +144,8 @@ class DatabaseHelpers:
                 "updated_at": datetime.now(UTC),
             }
 
-            response = await asyncio.to_thread(
-                lambda: (
-                    self.client.table(DatabaseTables.CONVERSATIONS).insert(session_data).execute()
-                )
+            response = await (
+                self.client.table(DatabaseTables.CONVERSATIONS).insert(session_data).execute()
             )
 
             # Return a clean session object without datetime objects
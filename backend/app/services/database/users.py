@@ -19,7 +19,6 @@
 User-related database operations for TravelStyle AI application.
 """
 
-import asyncio
 import logging
 from datetime import UTC, datetime
 
@@ -29,6 +28,7 @@ from app.services.database.validators import (
     validate_user_id,
 )
 from app.services.rate_limiter import db_rate_limiter
+from app.services.supabase import BatchLoader, SupabaseConfig, select_projection
 
 logger = logging.getLogger(__name__)
 
@@ -38,9 +38,21 @@ class UserOperations:
 
     def __init__(self, client):
         self.client = client
-
-    async def get_user_profile(self, user_id: str) -> dict:
-        """Retrieve user profile from user_profile_view."""
+        # Profile reads by user ID from concurrent requests share one query per table
+        self.profile_loader = BatchLoader(client, DatabaseTables.USER_PROFILE_VIEW)
+        self.user_loader = BatchLoader(client, DatabaseTables.USERS)
+        self.preferences_loader = BatchLoader(client, DatabaseTables.USER_PREFERENCES)
+
+    async def get_user_profile(self, user_id: str, projection: str = "profile") -> dict:
+        """
+        Retrieve user profile from user_profile_view.
+
+        Args:
+            user_id: User ID
+            projection: user_profile_view projection in SupabaseConfig.VIEWS naming the
+                columns the caller reads; the fallback to the underlying tables always
+                returns the full profile
+        """
         if not validate_user_id(user_id):
             logger.error(f"Invalid user_id format: {user_id}")
             return {}
@@ -51,17 +63,12 @@ class UserOperations:
 
         try:
             # First try to get from user_profile_view
-            response = await asyncio.to_thread(
-                lambda: (
-                    self.client.table(DatabaseTables.USER_PROFILE_VIEW)
-                    .select("*")
-                    .eq("id", user_id)
-                    .execute()
-                )
+            profiles = await self.profile_loader.load(
+                "id", user_id, SupabaseConfig.columns(DatabaseTables.USER_PROFILE_VIEW, projection)
             )
 
-            if response.data:
-                return response.data[0]
+            if profiles:
+                return profiles[0]
 
             # If user_profile_view returns no data, fall back to basic user data
             logger.info(
@@ -69,29 +76,24 @@ class UserOperations:
             )
 
             # Get basic user data from users table
-            user_response = await asyncio.to_thread(
-                lambda: (
-                    self.client.table(DatabaseTables.USERS).select("*").eq("id", user_id).execute()
-                )
+            users = await self.user_loader.load(
+                "id", user_id, SupabaseConfig.columns(DatabaseTables.USERS, "profile")
             )
 
-            if not user_response.data:
+            if not users:
                 logger.error(f"User {user_id} not found in users table")
                 return {}
 
-            user_data = user_response.data[0]
+            user_data = users[0]
 
             # Get user preferences if they exist
-            prefs_response = await asyncio.to_thread(
-                lambda: (
-                    self.client.table(DatabaseTables.USER_PREFERENCES)
-                    .select("*")
-                    .eq("user_id", user_id)
-                    .execute()
-                )
+            preferences = await self.preferences_loader.load(
+                "user_id",
+                user_id,
+                SupabaseConfig.columns(DatabaseTables.USER_PREFERENCES, "profile"),
             )
 
-            preferences_data = prefs_response.data[0] if prefs_response.data else {}
+            preferences_data = preferences[0] if preferences else {}
 
             # Combine user data with preferences
             profile_data = {
@@ -129,10 +131,8 @@ class UserOperations:
 
         try:
             # Check if user exists
-            user_response = await asyncio.to_thread(
-                lambda: (
-                    self.client.table(DatabaseTables.USERS).select("id").eq("id", user_id).execute()
-                )
+            user_response = await (
+                self.client.table(DatabaseTables.USERS).select("id").eq("id", user_id).execute()
             )
 
             if not user_response.data:
@@ -168,13 +168,11 @@ class UserOperations:
 
             # Update profiles table if we have profile data
             if profiles_data:
-                profiles_response = await asyncio.to_thread(
-                    lambda: (
-                        self.client.table(DatabaseTables.USERS)
-                        .update(profiles_data)
-                        .eq("id", user_id)
-                        .execute()
-                    )
+                profiles_response = await (
+                    self.client.table(DatabaseTables.USERS)
+                    .update(profiles_data)
+                    .eq("id", user_id)
+                    .execute()
                 )
                 if not profiles_response.data:
                     logger.error(f"Failed to update profiles table for user {user_id}")
@@ -183,34 +181,28 @@ class UserOperations:
             # Update user_preferences table if we have preference data
             if preferences_data:
                 # Check if preferences record exists
-                existing_prefs = await asyncio.to_thread(
-                    lambda: (
-                        self.client.table(DatabaseTables.USER_PREFERENCES)
-                        .select("id")
-                        .eq("user_id", user_id)
-                        .execute()
-                    )
+                existing_prefs = await (
+                    self.client.table(DatabaseTables.USER_PREFERENCES)
+                    .select("id")
+                    .eq("user_id", user_id)
+                    .execute()
                 )
 
                 if existing_prefs.data:
                     # Update existing preferences
-                    prefs_response = await asyncio.to_thread(
-                        lambda: (
-                            self.client.table(DatabaseTables.USER_PREFERENCES)
-                            .update(preferences_data)
-                            .eq("user_id", user_id)
-                            .execute()
-                        )
+                    prefs_response = await (
+                        self.client.table(DatabaseTables.USER_PREFERENCES)
+                        .update(preferences_data)
+                        .eq("user_id", user_id)
+                        .execute()
                     )
                 else:
                     # Insert new preferences
                     preferences_data["user_id"] = user_id
-                    prefs_response = await asyncio.to_thread(
-                        lambda: (
-                            self.client.table(DatabaseTables.USER_PREFERENCES)
-                            .insert(preferences_data)
-                            .execute()
-                        )
+                    prefs_response = await (
+                        self.client.table(DatabaseTables.USER_PREFERENCES)
+                        .insert(preferences_data)
+                        .execute()
                     )
 
                 if not prefs_response.data:
@@ -218,13 +210,10 @@ class UserOperations:
                     return None
 
             # Get the updated profile to return
-            response = await asyncio.to_thread(
-                lambda: (
-                    self.client.table(DatabaseTables.USER_PROFILE_VIEW)
-                    .select("*")
-                    .eq("id", user_id)
-                    .execute()
-                )
+            response = await (
+                select_projection(self.client, DatabaseTables.USER_PROFILE_VIEW, "profile")
+                .eq("id", user_id)
+                .execute()
             )
 
             if response.data:
@@ -250,13 +239,11 @@ class UserOperations:
 
         try:
             # Check if preferences exist
-            existing_response = await asyncio.to_thread(
-                lambda: (
-                    self.client.table(DatabaseTables.USER_PREFERENCES)
-                    .select("id")
-                    .eq("user_id", user_id)
-                    .execute()
-                )
+            existing_response = await (
+                self.client.table(DatabaseTables.USER_PREFERENCES)
+                .select("id")
+                .eq("user_id", user_id)
+                .execute()
             )
 
             # Prepare the update data with proper field names
@@ -280,13 +267,11 @@ class UserOperations:
 
             if existing_response.data:
                 # Update existing preferences
-                await asyncio.to_thread(
-                    lambda: (
-                        self.client.table(DatabaseTables.USER_PREFERENCES)
-                        .update(update_data)
-                        .eq("user_id", user_id)
-                        .execute()
-                    )
+                await (
+                    self.client.table(DatabaseTables.USER_PREFERENCES)
+                    .update(update_data)
+                    .eq("user_id", user_id)
+                    .execute()
                 )
             else:
                 # Create new preferences with default values
@@ -303,12 +288,8 @@ class UserOperations:
                     "created_at": datetime.now(UTC).isoformat(),
                     "updated_at": datetime.now(UTC).isoformat(),
                 }
-                await asyncio.to_thread(
-                    lambda: (
-                        self.client.table(DatabaseTables.USER_PREFERENCES)
-                        .insert(insert_data)
-                        .execute()
-                    )
+                await (
+                    self.client.table(DatabaseTables.USER_PREFERENCES).insert(insert_data).execute()
                 )
 
             logger.info(f"Updated preferences for user {user_id}")
@@ -347,12 +328,8 @@ class UserOperations:
                 "created_at": datetime.now(UTC).isoformat(),
             }
 
-            await asyncio.to_thread(
-                lambda: (
-                    self.client.table(DatabaseTables.RESPONSE_FEEDBACK)
-                    .insert(feedback_data)
-                    .execute()
-                )
+            await (
+                self.client.table(DatabaseTables.RESPONSE_FEEDBACK).insert(feedback_data).execute()
             )
 
             logger.info(f"Saved feedback for message {message_id}")
@@ -376,48 +353,42 @@ class UserOperations:
 
         try:
             # Check if destination already exists
-            existing_response = await asyncio.to_thread(
-                lambda: (
-                    self.client.table(DatabaseTables.USER_DESTINATIONS)
-                    .select("id")
-                    .eq("user_id", user_id)
-                    .eq("destination_name", destination_name)
-                    .execute()
-                )
+            existing_response = await (
+                self.client.table(DatabaseTables.USER_DESTINATIONS)
+                .select("id")
+                .eq("user_id", user_id)
+                .eq("destination_name", destination_name)
+                .execute()
             )
 
             if existing_response.data:
                 # Update existing destination
-                await asyncio.to_thread(
-                    lambda: (
-                        self.client.table(DatabaseTables.USER_DESTINATIONS)
-                        .update(
-                            {
-                                "destination_data": destination_data or {},
-                                "updated_at": datetime.now(UTC).isoformat(),
-                            }
-                        )
-                        .eq("user_id", user_id)
-                        .eq("destination_name", destination_name)
-                        .execute()
+                await (
+                    self.client.table(DatabaseTables.USER_DESTINATIONS)
+                    .update(
+                        {
+                            "destination_data": destination_data or {},
+                            "updated_at": datetime.now(UTC).isoformat(),
+                        }
                     )
+                    .eq("user_id", user_id)
+                    .eq("destination_name", destination_name)
+                    .execute()
                 )
             else:
                 # Create new destination
-                await asyncio.to_thread(
-                    lambda: (
-                        self.client.table(DatabaseTables.USER_DESTINATIONS)
-                        .insert(
-                            {
-                                "user_id": user_id,
-                                "destination_name": destination_name,
-                                "destination_data": destination_data or {},
-                                "created_at": datetime.now(UTC).isoformat(),
-                                "updated_at": datetime.now(UTC).isoformat(),
-                            }
-                        )
-                        .execute()
+                await (
+                    self.client.table(DatabaseTables.USER_DESTINATIONS)
+                    .insert(
+                        {
+                            "user_id": user_id,
+                            "destination_name": destination_name,
+                            "destination_data": destination_data or {},
+                            "created_at": datetime.now(UTC).isoformat(),
+                            "updated_at": datetime.now(UTC).isoformat(),
+                        }
                     )
+                    .execute()
                 )
 
             logger.info(f"Saved destination {destination_name} for user {user_id}")
@@ -438,18 +409,16 @@ class UserOperations:
             return False
 
         try:
-            await asyncio.to_thread(
-                lambda: (
-                    self.client.table(DatabaseTables.USERS)
-                    .update(
-                        {
-                            "profile_picture_url": profile_picture_url,
-                            "updated_at": datetime.now(UTC).isoformat(),
-                        }
-                    )
-                    .eq("id", user_id)
-                    .execute()
+            await (
+                self.client.table(DatabaseTables.USERS)
+                .update(
+                    {
+                        "profile_picture_url": profile_picture_url,
+                        "updated_at": datetime.now(UTC).isoformat(),
+                    }
                 )
+                .eq("id", user_id)
+                .execute()
             )
 
             logger.info(f"Updated profile picture for user {user_id}")
@@ -0,0 +1,39 @@
+# This file is part of TravelSytle AI.
+#
+# Copyright (C) 2025  Trailyn Ventures, LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Destination extraction for TravelStyle AI application."""
+
+from .canonical import canonical_destination_key
+from .extractor import (
+    DestinationExtractor,
+    DestinationMatch,
+    Place,
+    destination_extractor,
+    fold_text,
+)
+from .gazetteer import CITIES, COUNTRIES
+
+__all__ = [
+    "CITIES",
+    "COUNTRIES",
+    "DestinationExtractor",
+    "DestinationMatch",
+    "Place",
+    "canonical_destination_key",
+    "destination_extractor",
+    "fold_text",
+]
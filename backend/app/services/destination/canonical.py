@@ -0,0 +1,97 @@
+# This file is part of TravelSytle AI.
+#
+# Copyright (C) 2025  Trailyn Ventures, LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Canonical destination keys for TravelStyle AI caches.
+Maps the many spellings of a destination ("Paris", "paris ", "Paris, France",
+"PARÍS") onto one key so destination-keyed caches share their entries.
+"""
+
+from functools import lru_cache
+
+from app.services.destination.extractor import Place, destination_extractor, fold_text
+from app.services.destination.gazetteer import COUNTRY_PARENTS
+
+# Longest trailing country name tried when a destination has no comma ("Paris France")
+_MAX_COUNTRY_WORDS = 3
+
+
+def _normalize(text: str) -> str:
+    """Trim, casefold, strip diacritics and punctuation, and collapse whitespace."""
+    return " ".join(fold_text(text).split())
+
+
+def _place_key(place: Place) -> str:
+    """Key of a gazetteer place: "city, country" for cities, the name for countries."""
+    if place.kind == "city":
+        return f"{_normalize(place.name)}, {_normalize(place.country)}"
+    return _normalize(place.name)
+
+
+def _country_name(text: str) -> str:
+    """Canonical country name for a country alias ("USA"), or the normalized text."""
+    place = destination_extractor.lookup(text)
+    if place is not None and place.kind == "country":
+        return _normalize(COUNTRY_PARENTS.get(place.name, place.name))
+    return _normalize(text)
+
+
+@lru_cache(maxsize=4096)
+def canonical_destination_key(destination: str) -> str:
+    """
+    Build the cache key for a destination.
+
+    Known places are keyed on their gazetteer entry, so aliases ("NYC") and
+    country qualifiers ("Paris, France", "Paris France") collapse onto the same
+    key. Unknown places are normalized and keep any country qualifier.
+
+    Args:
+        destination: Destination as given by the user or an upstream service
+
+    Returns:
+        Canonical key such as "paris, france", or "" for a blank destination
+    """
+    normalized = _normalize(destination)
+    if not normalized:
+        return ""
+
+    place = destination_extractor.lookup(normalized)
+    if place is not None:
+        return _place_key(place)
+
+    parts = [part for part in (_normalize(part) for part in destination.split(",")) if part]
+    if len(parts) > 1:
+        city, country = parts[0], _country_name(parts[-1])
+    else:
+        city, country = _split_trailing_country(normalized)
+
+    place = destination_extractor.lookup(city)
+    if place is not None and place.kind == "city":
+        if not country or _normalize(place.country) == country:
+            return _place_key(place)
+
+    return f"{city}, {country}" if country else city
+
+
+def _split_trailing_country(normalized: str) -> tuple[str, str]:
+    """Split "paris france" into ("paris", "france") when the tail names a country."""
+    words = normalized.split()
+    for size in range(min(_MAX_COUNTRY_WORDS, len(words) - 1), 0, -1):
+        place = destination_extractor.lookup(" ".join(words[-size:]))
+        if place is not None and place.kind == "country":
+            return " ".join(words[:-size]), _country_name(place.name)
+    return normalized, ""
@@ -0,0 +1,259 @@
+# This file is part of TravelSytle AI.
+#
+# Copyright (C) 2025  Trailyn Ventures, LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Gazetteer-based destination extractor for TravelStyle AI application.
+Scans a message once with an Aho-Corasick automaton built from the bundled
+gazetteer and returns canonical destination names rather than free-text captures.
+"""
+
+import re
+import unicodedata
+from dataclasses import dataclass
+from functools import lru_cache
+
+from app.services.destination.gazetteer import AMBIGUOUS_NAMES, CITIES, COUNTRIES
+from app.utils.aho_corasick import AhoCorasick
+
+# Words that introduce the place being travelled to
+DESTINATION_CUES = frozenset(
+    {"to", "in", "visiting", "visit", "at", "around", "for", "about", "explore", "exploring"}
+)
+
+# Words that introduce where the traveller is coming from
+ORIGIN_CUES = frozenset({"from", "leaving"})
+
+# Places missing from the gazetteer: one to three capitalized words after a cue.
+# Unlike the old patterns there is no leading ".*", so each attempt is linear.
+_UNLISTED_PATTERN = re.compile(
+    r"\b(?:[Tt]o|[Ii]n|[Vv]isiting)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+){0,2})"
+)
+
+# Capitalized words that follow a cue without naming a place
+_NON_PLACE_WORDS = frozenset(
+    {
+        "january",
+        "february",
+        "march",
+        "april",
+        "may",
+        "june",
+        "july",
+        "august",
+        "september",
+        "october",
+        "november",
+        "december",
+        "monday",
+        "tuesday",
+        "wednesday",
+        "thursday",
+        "friday",
+        "saturday",
+        "sunday",
+        "spring",
+        "summer",
+        "autumn",
+        "fall",
+        "winter",
+        "christmas",
+        "easter",
+        "the",
+        "my",
+        "our",
+        "english",
+    }
+)
+
+# ASCII fast path: lowercase and turn every non-alphanumeric character into a space
+_ASCII_FOLD = str.maketrans({chr(i): " " for i in range(128) if not chr(i).isalnum()})
+
+
+@lru_cache(maxsize=2048)
+def _fold_char(char: str) -> str:
+    """Fold one non-ASCII character to a single accent-free, casefolded character."""
+    decomposed = unicodedata.normalize("NFKD", char)
+    folded = "".join(c for c in decomposed if not unicodedata.combining(c)).casefold()
+    if len(folded) != 1:
+        # Keep positions aligned with the original text (e.g. "ß" casefolds to "ss")
+        folded = char.lower() if len(char.lower()) == 1 else " "
+    return folded if folded.isalnum() else " "
+
+
+def fold_text(text: str) -> str:
+    """
+    Fold text for gazetteer matching.
+
+    Args:
+        text: Raw text
+
+    Returns:
+        Casefolded text without diacritics in which every non-alphanumeric character
+        is a space; the result has the same length as the input
+    """
+    if text.isascii():
+        return text.lower().translate(_ASCII_FOLD)
+    return "".join(_fold_char(char) for char in text)
+
+
+@dataclass(frozen=True)
+class Place:
+    """A gazetteer entry."""
+
+    name: str
+    country: str
+    kind: str
+
+
+@dataclass
+class DestinationMatch:
+    """A gazetteer place found in a message."""
+
+    place: Place
+    start: int
+    end: int
+    cued: bool
+    origin: bool
+
+
+class DestinationExtractor:
+    """Single-pass destination extractor backed by the bundled gazetteer."""
+
+    def __init__(
+        self,
+        cities: dict[str, tuple[str, tuple[str, ...]]] = CITIES,
+        countries: dict[str, tuple[str, ...]] = COUNTRIES,
+        ambiguous_names: frozenset[str] = AMBIGUOUS_NAMES,
+    ):
+        """
+        Build the automaton from a gazetteer.
+
+        Args:
+            cities: Canonical city name -> (country, aliases)
+            countries: Canonical country name -> aliases
+            ambiguous_names: Aliases that are also everyday words
+        """
+        self._automaton = AhoCorasick[Place]()
+        self._places: dict[str, Place] = {}
+        for name, (country, aliases) in cities.items():
+            self._register(Place(name, country, "city"), aliases)
+        for name, aliases in countries.items():
+            self._register(Place(name, name, "country"), aliases)
+        self._ambiguous = frozenset(fold_text(name) for name in ambiguous_names)
+        self._automaton.build()
+
+    def _register(self, place: Place, aliases: tuple[str, ...]) -> None:
+        """Add a place under its canonical name and aliases; the first entry wins."""
+        for alias in (place.name, *aliases):
+            key = fold_text(alias)
+            if key not in self._places:
+                self._places[key] = place
+                self._automaton.add(key, place)
+
+    def lookup(self, name: str) -> Place | None:
+        """
+        Look up a place by canonical name or alias.
+
+        Args:
+            name: Place name in any case, with or without diacritics
+
+        Returns:
+            The gazetteer entry, or None if the name is unknown
+        """
+        return self._places.get(" ".join(fold_text(name).split()))
+
+    def find_all(self, text: str) -> list[DestinationMatch]:
+        """
+        Find every gazetteer place in a message.
+
+        Args:
+            text: Raw user message
+
+        Returns:
+            Leftmost-longest, non-overlapping matches in message order
+        """
+        folded = fold_text(text)
+        length = len(folded)
+        candidates = [
+            (start, end, place)
+            for start, end, place in self._automaton.iter_matches(folded)
+            if (start == 0 or folded[start - 1] == " ") and (end == length or folded[end] == " ")
+        ]
+        candidates.sort(key=lambda candidate: (candidate[0], -candidate[1]))
+
+        matches: list[DestinationMatch] = []
+        last_end = 0
+        for start, end, place in candidates:
+            if start < last_end:
+                continue
+            cue = self._preceding_word(folded, start)
+            cued = cue in DESTINATION_CUES
+            if folded[start:end] in self._ambiguous and not (cued and text[start].isupper()):
+                continue
+            matches.append(DestinationMatch(place, start, end, cued, cue in ORIGIN_CUES))
+            last_end = end
+
+        return matches
+
+    @staticmethod
+    def _preceding_word(folded: str, start: int) -> str:
+        """Get the word right before a match, if any."""
+        words = folded[max(0, start - 16) : start].split()
+        return words[-1] if words else ""
+
+    def extract(self, text: str) -> str | None:
+        """
+        Extract the destination of a message.
+
+        A place introduced by a destination cue ("to", "in", "visiting", ...) wins;
+        otherwise the first place that is not an origin ("from London") is used.
+        Places missing from the gazetteer are only accepted as capitalized words
+        right after a cue.
+
+        Args:
+            text: Raw user message
+
+        Returns:
+            Canonical destination name, or None if no destination is mentioned
+        """
+        first_place = None
+        for match in self.find_all(text):
+            if match.cued:
+                return match.place.name
+            if first_place is None and not match.origin:
+                first_place = match.place
+
+        if first_place is not None:
+            return first_place.name
+        return self._extract_unlisted(text)
+
+    @staticmethod
+    def _extract_unlisted(text: str) -> str | None:
+        """Extract a capitalized place name that follows a destination cue."""
+        for match in _UNLISTED_PATTERN.finditer(text):
+            words = []
+            for word in match.group(1).split():
+                if word.lower() in _NON_PLACE_WORDS:
+                    break
+                words.append(word)
+            if words:
+                return " ".join(words)
+        return None
+
+
+# Global extractor instance
+destination_extractor = DestinationExtractor()
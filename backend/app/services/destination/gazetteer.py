@@ -0,0 +1,238 @@
+# This file is part of TravelSytle AI.
+#
+# Copyright (C) 2025  Trailyn Ventures, LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Bundled destination gazetteer for TravelStyle AI application.
+Maps canonical city and country names to their country and common aliases.
+Aliases are matched case- and accent-insensitively, so only alternate spellings
+and names need to be listed here.
+"""
+
+# Canonical city name -> (country, aliases)
+CITIES: dict[str, tuple[str, tuple[str, ...]]] = {
+    # North America
+    "New York": ("United States", ("new york city", "nyc")),
+    "Los Angeles": ("United States", ()),
+    "San Francisco": ("United States", ()),
+    "Chicago": ("United States", ()),
+    "Miami": ("United States", ()),
+    "Las Vegas": ("United States", ("vegas",)),
+    "Boston": ("United States", ()),
+    "Seattle": ("United States", ()),
+    "Washington": ("United States", ("washington dc", "washington d c")),
+    "Honolulu": ("United States", ()),
+    "New Orleans": ("United States", ()),
+    "Orlando": ("United States", ()),
+    "Austin": ("United States", ()),
+    "Nashville": ("United States", ()),
+    "San Diego": ("United States", ()),
+    "Denver": ("United States", ()),
+    "Atlanta": ("United States", ()),
+    "Philadelphia": ("United States", ()),
+    "Toronto": ("Canada", ()),
+    "Vancouver": ("Canada", ()),
+    "Montreal": ("Canada", ()),
+    "Quebec City": ("Canada", ()),
+    "Mexico City": ("Mexico", ("cdmx",)),
+    "Cancun": ("Mexico", ()),
+    "Tulum": ("Mexico", ()),
+    "Havana": ("Cuba", ("la habana",)),
+    # South America
+    "Rio de Janeiro": ("Brazil", ("rio",)),
+    "Sao Paulo": ("Brazil", ()),
+    "Buenos Aires": ("Argentina", ()),
+    "Lima": ("Peru", ()),
+    "Cusco": ("Peru", ("cuzco",)),
+    "Bogota": ("Colombia", ()),
+    "Cartagena": ("Colombia", ()),
+    "Medellin": ("Colombia", ()),
+    "Santiago": ("Chile", ()),
+    # Asia
+    "Tokyo": ("Japan", ()),
+    "Kyoto": ("Japan", ()),
+    "Osaka": ("Japan", ()),
+    "Seoul": ("South Korea", ()),
+    "Beijing": ("China", ("peking",)),
+    "Shanghai": ("China", ()),
+    "Hong Kong": ("China", ()),
+    "Taipei": ("Taiwan", ()),
+    "Singapore": ("Singapore", ()),
+    "Bangkok": ("Thailand", ()),
+    "Phuket": ("Thailand", ()),
+    "Chiang Mai": ("Thailand", ()),
+    "Hanoi": ("Vietnam", ()),
+    "Ho Chi Minh City": ("Vietnam", ("saigon", "ho chi minh")),
+    "Bali": ("Indonesia", ()),
+    "Jakarta": ("Indonesia", ()),
+    "Kuala Lumpur": ("Malaysia", ()),
+    "Manila": ("Philippines", ()),
+    "Mumbai": ("India", ("bombay",)),
+    "Delhi": ("India", ("new delhi",)),
+    "Goa": ("India", ()),
+    "Jaipur": ("India", ()),
+    "Kathmandu": ("Nepal", ()),
+    # Middle East and Africa
+    "Dubai": ("United Arab Emirates", ()),
+    "Abu Dhabi": ("United Arab Emirates", ()),
+    "Doha": ("Qatar", ()),
+    "Istanbul": ("Turkey", ()),
+    "Tel Aviv": ("Israel", ()),
+    "Jerusalem": ("Israel", ()),
+    "Cairo": ("Egypt", ()),
+    "Marrakech": ("Morocco", ("marrakesh",)),
+    "Casablanca": ("Morocco", ()),
+    "Cape Town": ("South Africa", ()),
+    "Johannesburg": ("South Africa", ()),
+    "Nairobi": ("Kenya", ()),
+    "Zanzibar": ("Tanzania", ()),
+    # Oceania
+    "Sydney": ("Australia", ()),
+    "Melbourne": ("Australia", ()),
+    "Brisbane": ("Australia", ()),
+    "Perth": ("Australia", ()),
+    "Auckland": ("New Zealand", ()),
+    "Queenstown": ("New Zealand", ()),
+    # Europe
+    "Paris": ("France", ()),
+    "Nice": ("France", ()),
+    "Lyon": ("France", ()),
+    "Marseille": ("France", ("marseilles",)),
+    "London": ("United Kingdom", ()),
+    "Edinburgh": ("United Kingdom", ()),
+    "Manchester": ("United Kingdom", ()),
+    "Dublin": ("Ireland", ()),
+    "Rome": ("Italy", ("roma",)),
+    "Milan": ("Italy", ("milano",)),
+    "Florence": ("Italy", ("firenze",)),
+    "Venice": ("Italy", ("venezia",)),
+    "Naples": ("Italy", ("napoli",)),
+    "Amalfi": ("Italy", ("amalfi coast",)),
+    "Barcelona": ("Spain", ()),
+    "Madrid": ("Spain", ()),
+    "Seville": ("Spain", ("sevilla",)),
+    "Valencia": ("Spain", ()),
+    "Ibiza": ("Spain", ()),
+    "Lisbon": ("Portugal", ("lisboa",)),
+    "Porto": ("Portugal", ("oporto",)),
+    "Berlin": ("Germany", ()),
+    "Munich": ("Germany", ("munchen", "muenchen")),
+    "Frankfurt": ("Germany", ()),
+    "Hamburg": ("Germany", ()),
+    "Amsterdam": ("Netherlands", ()),
+    "Brussels": ("Belgium", ("bruxelles",)),
+    "Bruges": ("Belgium", ("brugge",)),
+    "Vienna": ("Austria", ("wien",)),
+    "Salzburg": ("Austria", ()),
+    "Zurich": ("Switzerland", ()),
+    "Geneva": ("Switzerland", ("geneve",)),
+    "Prague": ("Czech Republic", ("praha",)),
+    "Budapest": ("Hungary", ()),
+    "Warsaw": ("Poland", ()),
+    "Krakow": ("Poland", ("cracow",)),
+    "Copenhagen": ("Denmark", ()),
+    "Stockholm": ("Sweden", ()),
+    "Oslo": ("Norway", ()),
+    "Helsinki": ("Finland", ()),
+    "Reykjavik": ("Iceland", ()),
+    "Athens": ("Greece", ()),
+    "Santorini": ("Greece", ()),
+    "Mykonos": ("Greece", ()),
+    "Dubrovnik": ("Croatia", ()),
+    "Split": ("Croatia", ()),
+    "Moscow": ("Russia", ()),
+    "St Petersburg": ("Russia", ("saint petersburg",)),
+}
+
+# Canonical country name -> aliases
+COUNTRIES: dict[str, tuple[str, ...]] = {
+    "United States": ("usa", "united states of america"),
+    "Canada": (),
+    "Mexico": (),
+    "Cuba": (),
+    "Costa Rica": (),
+    "Brazil": ("brasil",),
+    "Argentina": (),
+    "Peru": (),
+    "Colombia": (),
+    "Chile": (),
+    "Japan": (),
+    "China": (),
+    "South Korea": ("korea",),
+    "Taiwan": (),
+    "Thailand": (),
+    "Vietnam": ("viet nam",),
+    "Cambodia": (),
+    "Indonesia": (),
+    "Malaysia": (),
+    "Philippines": ("the philippines",),
+    "India": (),
+    "Nepal": (),
+    "Sri Lanka": (),
+    "Maldives": ("the maldives",),
+    "United Arab Emirates": ("uae",),
+    "Qatar": (),
+    "Turkey": ("turkiye",),
+    "Israel": (),
+    "Jordan": (),
+    "Egypt": (),
+    "Morocco": (),
+    "South Africa": (),
+    "Kenya": (),
+    "Tanzania": (),
+    "Australia": (),
+    "New Zealand": (),
+    "Fiji": (),
+    "France": (),
+    "United Kingdom": ("uk", "great britain", "britain"),
+    "England": (),
+    "Scotland": (),
+    "Wales": (),
+    "Ireland": (),
+    "Italy": ("italia",),
+    "Spain": ("espana",),
+    "Portugal": (),
+    "Germany": ("deutschland",),
+    "Netherlands": ("the netherlands", "holland"),
+    "Belgium": (),
+    "Switzerland": (),
+    "Austria": (),
+    "Czech Republic": ("czechia",),
+    "Hungary": (),
+    "Poland": (),
+    "Denmark": (),
+    "Sweden": (),
+    "Norway": (),
+    "Finland": (),
+    "Iceland": (),
+    "Greece": (),
+    "Croatia": (),
+    "Russia": (),
+}
+
+# Countries listed above that are part of a sovereign state used as a city's country,
+# so "London, England" and "London, United Kingdom" name the same place
+COUNTRY_PARENTS: dict[str, str] = {
+    "England": "United Kingdom",
+    "Scotland": "United Kingdom",
+    "Wales": "United Kingdom",
+}
+
+# Names that are also everyday words ("nice weather", "split the bill"). They only
+# count as destinations when capitalized and introduced by a destination cue.
+AMBIGUOUS_NAMES: frozenset[str] = frozenset(
+    {"nice", "split", "turkey", "china", "chile", "jordan", "rio", "goa", "lima"}
+)
@@ -0,0 +1,222 @@
+# This file is part of TravelSytle AI.
+#
+# Copyright (C) 2025  Trailyn Ventures, LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Shared HTTP client registry for TravelStyle AI application.
+Keeps one keep-alive connection pool per upstream API so requests reuse open
+connections instead of paying DNS, TCP and TLS setup on every call.
+"""
+
+import asyncio
+import importlib.util
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class UpstreamConfig:
+    """Connection pool settings for one upstream API; None falls back to settings."""
+
+    timeout: float
+    max_connections: int | None = None
+    max_keepalive_connections: int | None = None
+    keepalive_expiry: float | None = None
+    http2: bool | None = None
+
+
+# Upstream APIs with their request timeouts in seconds
+UPSTREAMS: dict[str, UpstreamConfig] = {
+    "weather": UpstreamConfig(timeout=15.0),
+    "qloo": UpstreamConfig(timeout=30.0),
+    "currency": UpstreamConfig(timeout=10.0),
+    "supabase_auth": UpstreamConfig(timeout=30.0),
+}
+
+
+class UpstreamStats:
+    """Request and connection counters for one upstream pool."""
+
+    def __init__(self):
+        self.requests = 0
+        self.connections_opened = 0
+
+    async def on_request(self, request: httpx.Request) -> None:
+        """Count a request and trace whether it opens a new connection."""
+        self.requests += 1
+        request.extensions["trace"] = self._trace
+
+    async def _trace(self, event_name: str, info: dict[str, Any]) -> None:
+        """httpcore trace callback; only new TCP connections are counted."""
+        if event_name == "connection.connect_tcp.complete":
+            self.connections_opened += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Counters plus the share of requests served on a reused connection."""
+        reused = max(self.requests - self.connections_opened, 0)
+        return {
+            "requests": self.requests,
+            "connections_opened": self.connections_opened,
+            "reused_requests": reused,
+            "reuse_rate": round(reused / self.requests, 4) if self.requests else 0.0,
+        }
+
+
+class HTTPClientRegistry:
+    """Owns one pooled httpx.AsyncClient per upstream API."""
+
+    def __init__(self, upstreams: dict[str, UpstreamConfig] = UPSTREAMS):
+        """
+        Initialize the registry without opening any clients.
+
+        Args:
+            upstreams: Upstream name -> pool configuration
+        """
+        self.upstreams = dict(upstreams)
+        self._clients: dict[str, tuple[httpx.AsyncClient, asyncio.AbstractEventLoop]] = {}
+        self._stats: dict[str, UpstreamStats] = {name: UpstreamStats() for name in upstreams}
+
+    def register(self, name: str, config: UpstreamConfig) -> None:
+        """
+        Add an upstream whose pool settings live outside this module.
+
+        Args:
+            name: Upstream name used with get() and session()
+            config: Pool configuration for the upstream
+        """
+        self.upstreams[name] = config
+        self._stats.setdefault(name, UpstreamStats())
+
+    async def start(self) -> None:
+        """Open a client for every configured upstream (called from the app lifespan)."""
+        for name in self.upstreams:
+            self.get(name)
+        logger.info("HTTP client pools opened: %s", ", ".join(self.upstreams))
+
+    def get(self, name: str) -> httpx.AsyncClient:
+        """
+        Get the pooled client for an upstream, creating it on first use.
+
+        Clients are bound to the event loop that created them, so a client is
+        recreated when it is requested from a different loop.
+
+        Args:
+            name: Upstream name from the registry configuration
+
+        Returns:
+            The shared client; callers must not close it
+        """
+        if name not in self.upstreams:
+            raise ValueError(f"Unknown upstream: {name}")
+
+        loop = asyncio.get_running_loop()
+        entry = self._clients.get(name)
+        if entry is not None:
+            client, client_loop = entry
+            if client_loop is loop and not client.is_closed:
+                return client
+            logger.debug("Recreating HTTP client for %s", name)
+
+        client = self._create_client(name)
+        self._clients[name] = (client, loop)
+        return client
+
+    @asynccontextmanager
+    async def session(self, name: str) -> AsyncIterator[httpx.AsyncClient]:
+        """
+        Borrow the pooled client for an upstream in an ``async with`` block.
+
+        Unlike ``async with httpx.AsyncClient()``, leaving the block keeps the
+        client and its open connections for the next caller.
+
+        Args:
+            name: Upstream name from the registry configuration
+
+        Yields:
+            The shared client for the upstream
+        """
+        yield self.get(name)
+
+    def _create_client(self, name: str) -> httpx.AsyncClient:
+        """Create a pooled client from the upstream configuration."""
+        config = self.upstreams[name]
+        http2 = settings.HTTP2_ENABLED if config.http2 is None else config.http2
+        if http2 and importlib.util.find_spec("h2") is None:
+            logger.warning("HTTP/2 requested for %s but the h2 package is missing", name)
+            http2 = False
+
+        limits = httpx.Limits(
+            max_connections=config.max_connections or settings.HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=(
+                config.max_keepalive_connections or settings.HTTP_MAX_KEEPALIVE_CONNECTIONS
+            ),
+            keepalive_expiry=config.keepalive_expiry or settings.HTTP_KEEPALIVE_EXPIRY,
+        )
+        stats = self._stats.setdefault(name, UpstreamStats())
+        return httpx.AsyncClient(
+            timeout=config.timeout,
+            limits=limits,
+            http2=http2,
+            event_hooks={"request": [stats.on_request]},
+        )
+
+    async def reset(self, name: str) -> None:
+        """
+        Close an upstream's client so the next get() opens a fresh pool.
+
+        Used to recover from a pool whose connections stopped answering.
+
+        Args:
+            name: Upstream name from the registry configuration
+        """
+        entry = self._clients.pop(name, None)
+        if entry is None:
+            return
+        client, client_loop = entry
+        if client_loop is asyncio.get_running_loop():
+            try:
+                await client.aclose()
+            except Exception as e:  # pylint: disable=broad-except
+                logger.warning("Error closing HTTP client for %s: %s", name, e)
+        logger.info("HTTP client pool reset: %s", name)
+
+    async def aclose(self) -> None:
+        """Close every client (called from the app lifespan on shutdown)."""
+        clients, self._clients = self._clients, {}
+        for name, (client, _loop) in clients.items():
+            try:
+                await client.aclose()
+            except Exception as e:  # pylint: disable=broad-except
+                logger.warning("Error closing HTTP client for %s: %s", name, e)
+        if clients:
+            logger.info("HTTP client pools closed: %s", self.get_stats())
+
+    def get_stats(self) -> dict[str, dict[str, Any]]:
+        """Get per-upstream request, connection and reuse statistics."""
+        return {name: stats.as_dict() for name, stats in self._stats.items()}
+
+
+# Global registry instance
+http_clients = HTTPClientRegistry()
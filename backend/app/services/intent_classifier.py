@@ -0,0 +1,361 @@
+# This file is part of TravelSytle AI.
+#
+# Copyright (C) 2025  Trailyn Ventures, LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Local intent classifier for TravelStyle AI orchestration.
+Scores messages against weighted keyword tables so most chat turns can be routed
+without an OpenAI round trip; low-confidence messages are left to the LLM.
+Routing decisions are cached in-process and, for LLM decisions, in Supabase.
+"""
+
+import hashlib
+import logging
+import re
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any
+
+from app.services.supabase import enhanced_supabase_cache
+from app.utils.ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+VALID_CATEGORIES = [
+    "currency",
+    "weather",
+    "cultural",
+    "wardrobe",
+    "style",
+    "destination",
+    "logistics",
+    "general",
+]
+
+# Keyword tables: phrase -> weight. Weight 2 is a strong signal on its own,
+# weight 1 needs support from another keyword before it is trusted.
+INTENT_KEYWORDS: dict[str, dict[str, int]] = {
+    "currency": {
+        "currency": 2,
+        "convert": 2,
+        "conversion": 2,
+        "exchange rate": 2,
+        "exchange": 1,
+        "rate": 1,
+        "money": 1,
+        "usd": 1,
+        "eur": 1,
+        "gbp": 1,
+        "yen": 1,
+        "jpy": 1,
+        "dollar": 1,
+        "dollars": 1,
+        "euro": 1,
+        "euros": 1,
+        "pound": 1,
+        "pounds": 1,
+    },
+    "weather": {
+        "weather": 2,
+        "temperature": 2,
+        "forecast": 2,
+        "climate": 1,
+        "rain": 1,
+        "sunny": 1,
+        "snow": 1,
+        "humid": 1,
+    },
+    "cultural": {
+        "cultural": 2,
+        "culture": 2,
+        "customs": 2,
+        "traditions": 2,
+        "tipping": 1,
+        "etiquette": 1,
+    },
+    "wardrobe": {
+        "what should i pack": 2,
+        "packing": 2,
+        "pack": 2,
+        "outfit": 2,
+        "outfits": 2,
+        "wardrobe": 2,
+        "what to wear": 2,
+        "clothes": 1,
+        "clothing": 1,
+        "suitcase": 1,
+    },
+    "style": {
+        "dress code": 2,
+        "fashion": 2,
+        "style": 2,
+        "etiquette": 1,
+        "attire": 1,
+        "formal": 1,
+        "casual": 1,
+    },
+    "destination": {
+        "tell me about": 2,
+        "going to": 2,
+        "visiting": 2,
+        "trip to": 2,
+        "travel to": 1,
+        "go to": 1,
+    },
+    "logistics": {
+        "visa": 2,
+        "vaccination": 2,
+        "vaccinations": 2,
+        "itinerary": 2,
+        "logistics": 2,
+        "passport": 2,
+        "preparation": 1,
+    },
+}
+
+# Quick-reply actions sent back from the UI, e.g. "weather_paris" or "currency_convert"
+_ACTION_PATTERN = re.compile(
+    r"^(currency|weather|cultural|wardrobe|style|destination|logistics)_[a-z0-9_]+$"
+)
+
+# A full travel date range is a planning signal rather than a single-topic question
+_DATE_RANGE_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}\s+(?:until|to)\s+\d{4}-\d{2}-\d{2}")
+_DATE_RANGE_WEIGHT = 2
+
+# Score at which a single category is considered a strong match
+_STRONG_SCORE = 2.0
+
+
+@dataclass
+class IntentClassification:
+    """Result of a local intent classification."""
+
+    category: str
+    confidence: float
+    scores: dict[str, int]
+
+
+class IntentClassifier:
+    """Keyword-weighted intent classifier with fallback statistics."""
+
+    def __init__(self, confidence_threshold: float = 0.7):
+        """
+        Initialize the classifier.
+
+        Args:
+            confidence_threshold: Minimum confidence for a local decision; below it
+                the caller should defer to the LLM classifier.
+        """
+        self.confidence_threshold = confidence_threshold
+        self._patterns = {
+            category: self._compile(keywords) for category, keywords in INTENT_KEYWORDS.items()
+        }
+
+        # Statistics
+        self.total_classifications = 0
+        self.local_classifications = 0
+        self.llm_fallbacks = 0
+        self.llm_failures = 0
+        self.total_time_ms = 0.0
+        self.category_counts: dict[str, int] = defaultdict(int)
+
+    @staticmethod
+    def _compile(keywords: dict[str, int]) -> re.Pattern:
+        """Compile a keyword table into one word-bounded alternation, longest first."""
+        phrases = sorted(keywords, key=len, reverse=True)
+        return re.compile(r"\b(?:" + "|".join(re.escape(p) for p in phrases) + r")\b")
+
+    def classify(self, user_message: str, record_stats: bool = True) -> IntentClassification:
+        """
+        Classify a message using the local keyword tables.
+
+        Args:
+            user_message: Raw user message
+            record_stats: Count the call in the local classification statistics;
+                pass False for lookups that are not routing decisions
+
+        Returns:
+            IntentClassification with the best category and a confidence in [0, 1]
+        """
+        start = time.perf_counter()
+        text = user_message.lower().strip()
+
+        action_match = _ACTION_PATTERN.match(text)
+        if action_match:
+            category = action_match.group(1)
+            result = IntentClassification(category, 1.0, {category: int(_STRONG_SCORE)})
+        else:
+            result = self._score(text)
+
+        if not record_stats:
+            return result
+
+        self.total_classifications += 1
+        self.total_time_ms += (time.perf_counter() - start) * 1000
+        if self.is_confident(result):
+            self.local_classifications += 1
+            self.category_counts[result.category] += 1
+
+        return result
+
+    def _score(self, text: str) -> IntentClassification:
+        """Score every category and derive a confidence for the best one."""
+        scores: dict[str, int] = {}
+        for category, pattern in self._patterns.items():
+            weights = INTENT_KEYWORDS[category]
+            score = sum(weights[match] for match in pattern.findall(text))
+            if score:
+                scores[category] = score
+
+        if _DATE_RANGE_PATTERN.search(text):
+            scores["logistics"] = scores.get("logistics", 0) + _DATE_RANGE_WEIGHT
+
+        if not scores:
+            return IntentClassification("general", 0.0, scores)
+
+        category, top_score = max(scores.items(), key=lambda item: item[1])
+        share = top_score / sum(scores.values())
+        strength = min(1.0, top_score / _STRONG_SCORE)
+        return IntentClassification(category, round(share * strength, 3), scores)
+
+    def is_confident(self, result: IntentClassification) -> bool:
+        """Check whether a classification is confident enough to skip the LLM."""
+        return result.confidence >= self.confidence_threshold
+
+    def record_llm_fallback(self, category: str | None) -> None:
+        """Record the outcome of an LLM fallback classification."""
+        self.llm_fallbacks += 1
+        if category is None:
+            self.llm_failures += 1
+        else:
+            self.category_counts[category] += 1
+
+    def get_stats(self) -> dict[str, float | int | dict[str, int]]:
+        """Get classification statistics, including how often the LLM is used."""
+        total = self.total_classifications
+        return {
+            "total": total,
+            "local": self.local_classifications,
+            "llm_fallbacks": self.llm_fallbacks,
+            "llm_failures": self.llm_failures,
+            "llm_fallback_rate": round(self.llm_fallbacks / total, 4) if total else 0.0,
+            "avg_local_time_ms": round(self.total_time_ms / total, 4) if total else 0.0,
+            "categories": dict(self.category_counts),
+        }
+
+    def reset_stats(self) -> None:
+        """Reset all classification statistics."""
+        self.total_classifications = 0
+        self.local_classifications = 0
+        self.llm_fallbacks = 0
+        self.llm_failures = 0
+        self.total_time_ms = 0.0
+        self.category_counts.clear()
+
+
+class ClassificationCache:
+    """Two-tier cache of routing decisions keyed on normalized message text.
+
+    The in-process tier holds every decision. The shared Supabase tier only holds
+    LLM decisions: a local classification is cheaper than a PostgREST round trip.
+    """
+
+    # Long messages rarely repeat verbatim, so they are not worth caching
+    MAX_MESSAGE_LENGTH = 200
+
+    def __init__(self, maxsize: int = 2048, local_ttl_seconds: float = 3600.0):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of in-process entries
+            local_ttl_seconds: TTL of in-process entries in seconds
+        """
+        self.local = TTLCache[str](maxsize=maxsize, ttl_seconds=local_ttl_seconds)
+        self.shared_hits = 0
+        self.shared_misses = 0
+        self.shared_writes = 0
+
+    @classmethod
+    def normalize(cls, user_message: str) -> str | None:
+        """
+        Normalize a message into a cache key.
+
+        Args:
+            user_message: Raw user message
+
+        Returns:
+            Lowercased text without punctuation and repeated whitespace, or None if
+            the message is empty or too long to cache
+        """
+        text = re.sub(r"[^\w\s]", "", user_message.lower())
+        text = " ".join(text.split())
+        if not text or len(text) > cls.MAX_MESSAGE_LENGTH:
+            return None
+        return text
+
+    @staticmethod
+    def _hash(normalized: str) -> str:
+        """Hash a normalized message for the shared tier key."""
+        return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+    def get_local(self, normalized: str) -> str | None:
+        """Get a category from the in-process tier."""
+        return self.local.get(normalized)
+
+    def set_local(self, normalized: str, category: str) -> None:
+        """Store a category in the in-process tier."""
+        self.local.set(normalized, category)
+
+    async def get_shared(self, normalized: str) -> str | None:
+        """Get a category from the shared tier, promoting hits to the in-process tier."""
+        cached = await enhanced_supabase_cache.get_classification_cache(self._hash(normalized))
+        category = cached.get("category") if cached else None
+        if category in VALID_CATEGORIES:
+            self.shared_hits += 1
+            self.local.set(normalized, category)
+            return category
+
+        self.shared_misses += 1
+        return None
+
+    async def set_shared(self, normalized: str, category: str) -> None:
+        """Store a category in both tiers.
+
+        Only the hash of the message is shared, and the write is queued rather than
+        awaited (see EnhancedSupabaseCacheService.set_classification_cache).
+        """
+        self.local.set(normalized, category)
+        if await enhanced_supabase_cache.set_classification_cache(self._hash(normalized), category):
+            self.shared_writes += 1
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get hit rate and eviction statistics for both tiers."""
+        shared_lookups = self.shared_hits + self.shared_misses
+        return {
+            "local": self.local.get_stats(),
+            "shared": {
+                "hits": self.shared_hits,
+                "misses": self.shared_misses,
+                "hit_rate": round(self.shared_hits / shared_lookups, 4) if shared_lookups else 0.0,
+                "writes": self.shared_writes,
+            },
+        }
+
+
+# Global classifier instance
+intent_classifier = IntentClassifier()
@@ -19,11 +19,11 @@
 
 import json
 import logging
-import re
 from typing import Any, cast
 
 from app.core.config import settings
 from app.models.responses import ChatResponse, QuickReply
+from app.services.chat_stream import QUICK_REPLY_PATTERN, ChatStream, get_active_stream
 from openai import AsyncOpenAI
 from openai.types.chat import ChatCompletion
 from openai.types.chat.chat_completion_message_param import ChatCompletionMessageParam
@@ -73,17 +73,21 @@ class OpenAIService:
             messages.extend(cast(list[ChatCompletionMessageParam], conversation_history[-10:]))
             messages.append({"role": "user", "content": user_message})
 
-            # ---- Step 4: Call OpenAI ----
-            response: ChatCompletion = await self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                temperature=self.temperature,
-                max_tokens=self.max_tokens,
-                presence_penalty=0.1,
-                frequency_penalty=0.1,
-            )
+            # ---- Step 4: Call OpenAI, streaming tokens if the client asked for it ----
+            stream = get_active_stream()
+            if stream is not None:
+                ai_message = await self._stream_completion(messages, stream)
+            else:
+                response: ChatCompletion = await self.client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    temperature=self.temperature,
+                    max_tokens=self.max_tokens,
+                    presence_penalty=0.1,
+                    frequency_penalty=0.1,
+                )
+                ai_message = response.choices[0].message.content
 
-            ai_message = response.choices[0].message.content
             if not ai_message:
                 raise ValueError("No content in AI response")
 
@@ -99,6 +103,37 @@ class OpenAIService:
                 confidence_score=0.0,
             )
 
+    async def _stream_completion(
+        self, messages: list[ChatCompletionMessageParam], stream: ChatStream
+    ) -> str:
+        """Stream a completion to the client and return the full completion text."""
+        completion = await self.client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            temperature=self.temperature,
+            max_tokens=self.max_tokens,
+            presence_penalty=0.1,
+            frequency_penalty=0.1,
+            stream=True,
+        )
+
+        parts: list[str] = []
+        try:
+            async for chunk in completion:
+                if not chunk.choices:
+                    continue
+                content = chunk.choices[0].delta.content
+                if content:
+                    parts.append(content)
+                    stream.send_text(content)
+        except Exception:
+            # The fallback response must not be presented as the end of the partial text
+            stream.interrupt()
+            raise
+
+        stream.end_text()
+        return "".join(parts)
+
     async def get_completion(
         self, messages: list[dict[str, str]], temperature: float = 0.7, max_tokens: int = 1000
     ) -> str | None:
@@ -232,12 +267,11 @@ class OpenAIService:
     def _process_response(self, ai_message: str) -> ChatResponse:
         """Extract quick replies and clean up response."""
         quick_replies = []
-        quick_reply_pattern = r'\[QUICK:\s*"([^"]+)"\]'
-        matches = re.findall(quick_reply_pattern, ai_message)
+        matches = QUICK_REPLY_PATTERN.findall(ai_message)
         for match in matches:
             quick_replies.append(QuickReply(text=match))
         # Remove quick reply markers from message
-        cleaned_message = re.sub(quick_reply_pattern, "", ai_message).strip()
+        cleaned_message = QUICK_REPLY_PATTERN.sub("", ai_message).strip()
         # Extract suggestions (simple heuristic)
         suggestions = []
         if "would you like" in cleaned_message.lower():
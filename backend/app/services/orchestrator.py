@@ -20,19 +20,88 @@ This service acts as a router that takes messages from UI buttons and routes the
 appropriate specialized chat functions that return the correct response for display.
 """
 
+import asyncio
 import inspect
 import logging
 import re
+from collections.abc import Iterable
+from contextvars import ContextVar
 from typing import Any
 
 from app.models.responses import ChatResponse, ConversationContext, QuickReply
 from app.services.currency import CurrencyService
+from app.services.destination import destination_extractor
+from app.services.intent_classifier import (
+    VALID_CATEGORIES,
+    ClassificationCache,
+    intent_classifier,
+)
 from app.services.openai.openai_service import openai_service
 from app.services.qloo import qloo_service
 from app.services.weather import weather_service
 
 logger = logging.getLogger(__name__)
 
+# Context sources each message type consumes; anything else prefetched is cancelled
+PREFETCH_SOURCES: dict[str, frozenset[str]] = {
+    "currency": frozenset(),
+    "weather": frozenset({"weather"}),
+    "cultural": frozenset({"cultural"}),
+    "wardrobe": frozenset({"weather"}),
+    "style": frozenset({"cultural"}),
+    "destination": frozenset({"weather", "cultural"}),
+    "logistics": frozenset({"weather", "cultural"}),
+    "general": frozenset({"weather", "cultural"}),
+}
+
+# Local guesses that justify a prefetch; currency and general chat never start one
+PREFETCH_CATEGORIES = frozenset(
+    {"weather", "cultural", "wardrobe", "style", "destination", "logistics"}
+)
+
+
+class ContextPrefetch:
+    """Speculative context fetches started while a message is being classified."""
+
+    def __init__(self):
+        """Initialize an empty prefetch set."""
+        self._tasks: dict[str, tuple[tuple[Any, ...], asyncio.Task]] = {}
+
+    def start(self, source: str, api_func, *args) -> None:
+        """Start fetching a context source in the background."""
+        task = asyncio.create_task(api_func(*args))
+        # Retrieve the outcome so unclaimed failures are not reported as unhandled
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        self._tasks[source] = (args, task)
+
+    def claim(self, source: str, args: tuple[Any, ...]) -> asyncio.Task | None:
+        """Take the prefetched task for a source if it was started with the same args."""
+        entry = self._tasks.pop(source, None)
+        if entry is None:
+            return None
+
+        prefetched_args, task = entry
+        if prefetched_args == args:
+            return task
+
+        task.cancel()
+        return None
+
+    def retain(self, sources: Iterable[str]) -> None:
+        """Cancel prefetches for every source not in ``sources``."""
+        keep = set(sources)
+        for source in [s for s in self._tasks if s not in keep]:
+            _, task = self._tasks.pop(source)
+            task.cancel()
+
+    def cancel_all(self) -> None:
+        """Cancel all unclaimed prefetches."""
+        self.retain(())
+
+
+# Prefetch for the message currently being routed (one per request task)
+_context_prefetch: ContextVar[ContextPrefetch | None] = ContextVar("context_prefetch", default=None)
+
 
 class TravelOrchestratorService:
     """Main orchestration service that dispatches messages to specialized handlers."""
@@ -40,6 +109,10 @@ class TravelOrchestratorService:
     def __init__(self):
         """Initialize the orchestrator."""
         self.currency_service = CurrencyService()
+        self.intent_classifier = intent_classifier
+        self.classification_cache = ClassificationCache()
+        # Per-source timeouts (seconds) for context fetched alongside AI responses
+        self.context_timeouts = {"weather": 10.0, "cultural": 10.0}
 
     async def route_message(
         self,
@@ -52,9 +125,16 @@ class TravelOrchestratorService:
         Main routing function that dispatches messages to appropriate handlers.
         Acts as a case statement that routes based on message content or UI actions.
         """
+        prefetch = ContextPrefetch()
+        prefetch_token = _context_prefetch.set(prefetch)
         try:
-            # Use OpenAI to classify the message type
+            # Start the weather/cultural lookups the local guess needs while classifying
+            local_guess = self.intent_classifier.classify(user_message, record_stats=False)
+            self._start_context_prefetch(prefetch, local_guess.category, user_message, context)
+
+            # Classify locally, deferring to OpenAI only for ambiguous messages
             message_type = await self._classify_message(user_message)
+            prefetch.retain(PREFETCH_SOURCES.get(message_type, PREFETCH_SOURCES["general"]))
 
             # Route to appropriate handler based on message type
             if message_type == "currency":
@@ -98,8 +178,82 @@ class TravelOrchestratorService:
                 ),
                 confidence_score=0.0,
             )
+        finally:
+            prefetch.cancel_all()
+            _context_prefetch.reset(prefetch_token)
+
+    def _start_context_prefetch(
+        self,
+        prefetch: ContextPrefetch,
+        category: str,
+        user_message: str,
+        context: ConversationContext,
+    ) -> None:
+        """Speculatively fetch the context a category's handler needs, with its arguments."""
+        if category not in PREFETCH_CATEGORIES:
+            return
+        destination = context.destination or self._extract_destination(user_message)
+        if not destination:
+            return
+
+        sources = PREFETCH_SOURCES[category]
+        if "weather" in sources:
+            travel_dates = context.travel_dates
+            if category == "logistics":
+                travel_dates = travel_dates or self._extract_travel_dates(user_message)
+            prefetch.start("weather", weather_service.get_weather_data, destination, travel_dates)
+        if "cultural" in sources:
+            prefetch.start(
+                "cultural",
+                qloo_service.get_cultural_insights,
+                destination,
+                context.trip_purpose or "leisure",
+            )
+
+    async def _fetch_context(self, source: str, api_func, *args):
+        """Fetch a context source, reusing a matching prefetch when one is running."""
+        prefetch = _context_prefetch.get()
+        if prefetch is not None:
+            task = prefetch.claim(source, args)
+            if task is not None:
+                return await task
+        return await api_func(*args)
 
     async def _classify_message(self, user_message: str) -> str:
+        """Classify the message type locally, using OpenAI only when confidence is low.
+
+        Decisions are cached by normalized message text: every decision in-process,
+        and LLM decisions also in the shared Supabase tier.
+        """
+        cache_key = self.classification_cache.normalize(user_message)
+        if cache_key:
+            cached_category = self.classification_cache.get_local(cache_key)
+            if cached_category:
+                return cached_category
+
+        local_result = self.intent_classifier.classify(user_message)
+        if self.intent_classifier.is_confident(local_result):
+            if cache_key:
+                self.classification_cache.set_local(cache_key, local_result.category)
+            return local_result.category
+
+        if cache_key:
+            cached_category = await self.classification_cache.get_shared(cache_key)
+            if cached_category:
+                return cached_category
+
+        category = await self._classify_message_with_llm(user_message)
+        self.intent_classifier.record_llm_fallback(category)
+
+        if category is None:
+            # Fall back to the best local guess if the LLM could not decide (not cached)
+            return local_result.category
+
+        if cache_key:
+            await self.classification_cache.set_shared(cache_key, category)
+        return category
+
+    async def _classify_message_with_llm(self, user_message: str) -> str | None:
         """Use OpenAI to classify the message type."""
         try:
             classification_prompt = f"""
@@ -131,85 +285,24 @@ class TravelOrchestratorService:
             if response:
                 # Clean up the response and extract the category
                 category = response.strip().lower()
-                valid_categories = [
-                    "currency",
-                    "weather",
-                    "cultural",
-                    "wardrobe",
-                    "style",
-                    "destination",
-                    "logistics",
-                    "general",
-                ]
-
-                if category in valid_categories:
+                if category in VALID_CATEGORIES:
                     return category
 
-            # Fallback to general if classification fails
-            return "general"
+            return None
 
         except Exception as e:
             logger.error(f"Message classification error: {e}")
-            return "general"
+            return None
 
     def _determine_message_type(self, user_message: str) -> str:
         """Rule-based message type determination for quick routing and tests."""
-        text = user_message.lower().strip()
-
-        # Action-style hints
-        if any(
-            token in text
-            for token in [
-                "currency_convert",
-                "currency_rate",
-                "currency",
-            ]
-        ):
-            return "currency"
-        if any(token in text for token in ["weather_info", "weather"]):
-            return "weather"
-        if any(token in text for token in ["wardrobe_planning", "wardrobe"]):
-            return "wardrobe"
-        if any(token in text for token in ["style_etiquette", "style"]):
-            return "style"
-        if any(token in text for token in ["destination_info", "destination"]):
-            return "destination"
-
-        # Keyword heuristics
-        currency_keywords = [
-            "convert",
-            "exchange rate",
-            "rate",
-            "usd",
-            "eur",
-            "gbp",
-            "yen",
-            "jpy",
-        ]
-        if any(k in text for k in currency_keywords):
-            return "currency"
-
-        weather_keywords = ["weather", "temperature", "forecast", "rain", "sunny"]
-        if any(k in text for k in weather_keywords):
-            return "weather"
-
-        wardrobe_keywords = ["pack", "packing", "what should i pack", "outfit"]
-        if any(k in text for k in wardrobe_keywords):
-            return "wardrobe"
-
-        style_keywords = ["dress code", "fashion", "etiquette", "style"]
-        if any(k in text for k in style_keywords):
-            return "style"
-
-        destination_keywords = ["tell me about", "going to", "visiting", "trip to"]
-        if any(k in text for k in destination_keywords):
-            return "destination"
-
-        logistics_keywords = ["visa", "vaccination", "itinerary", "logistics", "preparation"]
-        if any(k in text for k in logistics_keywords):
-            return "logistics"
+        return self.intent_classifier.classify(user_message, record_stats=False).category
 
-        return "general"
+    def get_classification_stats(self) -> dict[str, Any]:
+        """Get local vs. LLM classification and classification cache statistics."""
+        stats = self.intent_classifier.get_stats()
+        stats["cache"] = self.classification_cache.get_stats()
+        return stats
 
     async def _handle_currency_request(
         self, user_message: str, context: ConversationContext
@@ -304,7 +397,9 @@ class TravelOrchestratorService:
                     ],
                 )
 
-            weather_data = await weather_service.get_weather_data(destination, context.travel_dates)
+            weather_data = await self._fetch_context(
+                "weather", weather_service.get_weather_data, destination, context.travel_dates
+            )
 
             if weather_data:
                 message = f"Weather for {destination}: {weather_data.get('description', 'Information available')}"
@@ -343,8 +438,11 @@ class TravelOrchestratorService:
                     ],
                 )
 
-            cultural_insights = await qloo_service.get_cultural_insights(
-                destination, context.trip_purpose or "leisure"
+            cultural_insights = await self._fetch_context(
+                "cultural",
+                qloo_service.get_cultural_insights,
+                destination,
+                context.trip_purpose or "leisure",
             )
 
             if cultural_insights:
@@ -379,8 +477,8 @@ class TravelOrchestratorService:
             destination = context.destination or self._extract_destination(user_message)
             weather_data = None
             if destination:
-                weather_data = await weather_service.get_weather_data(
-                    destination, context.travel_dates
+                weather_data = await self._fetch_context(
+                    "weather", weather_service.get_weather_data, destination, context.travel_dates
                 )
 
             # Generate AI response for wardrobe planning
@@ -425,8 +523,11 @@ class TravelOrchestratorService:
             destination = context.destination or self._extract_destination(user_message)
             cultural_insights = None
             if destination:
-                cultural_insights = await qloo_service.get_cultural_insights(
-                    destination, context.trip_purpose or "leisure"
+                cultural_insights = await self._fetch_context(
+                    "cultural",
+                    qloo_service.get_cultural_insights,
+                    destination,
+                    context.trip_purpose or "leisure",
                 )
 
             # Generate AI response for style advice
@@ -480,12 +581,9 @@ class TravelOrchestratorService:
                     ],
                 )
 
-            # Gather comprehensive destination data using safe wrappers
-            weather_data = await self._safe_api_call(
-                weather_service.get_weather_data, destination, context.travel_dates
-            )
-            cultural_insights = await self._safe_api_call(
-                qloo_service.get_cultural_insights, destination, context.trip_purpose or "leisure"
+            # Gather comprehensive destination data concurrently
+            weather_data, cultural_insights = await self._gather_destination_context(
+                destination, context.travel_dates, context.trip_purpose or "leisure"
             )
 
             # Generate AI response for destination
@@ -540,18 +638,9 @@ class TravelOrchestratorService:
             travel_dates = context.travel_dates or self._extract_travel_dates(user_message)
 
             # Gather comprehensive data for logistics planning
-            weather_data = None
-            cultural_insights = None
-
-            if destination:
-                weather_data = await self._safe_api_call(
-                    weather_service.get_weather_data, destination, travel_dates
-                )
-                cultural_insights = await self._safe_api_call(
-                    qloo_service.get_cultural_insights,
-                    destination,
-                    context.trip_purpose or "leisure",
-                )
+            weather_data, cultural_insights = await self._gather_destination_context(
+                destination, travel_dates, context.trip_purpose or "leisure"
+            )
 
             # Generate comprehensive logistics response
             ai_response = await openai_service.generate_response(
@@ -597,16 +686,10 @@ class TravelOrchestratorService:
             trip_context = self._parse_trip_context(user_message, context)
 
             # Gather data from external APIs
-            cultural_insights = await self._safe_api_call(
-                qloo_service.get_cultural_insights,
-                trip_context.get("destination"),
-                trip_context.get("trip_purpose", "leisure"),
-            )
-
-            weather_data = await self._safe_api_call(
-                weather_service.get_weather_data,
+            weather_data, cultural_insights = await self._gather_destination_context(
                 trip_context.get("destination"),
                 trip_context.get("travel_dates"),
+                trip_context.get("trip_purpose", "leisure"),
             )
 
             # Generate AI response with all context
@@ -631,22 +714,8 @@ class TravelOrchestratorService:
             )
 
     def _extract_destination(self, user_message: str) -> str | None:
-        """Extract destination from user message."""
-        destination_patterns = [
-            r".*going to\s+([A-Za-z\s]+?)(?:\s+for|\s+on|\s+in|\s+to|\s+with|\s+next|\s+this|\s+that|[.?!,]|$)",
-            r".*visiting\s+([A-Za-z\s]+?)(?:\s+for|\s+on|\s+in|\s+to|\s+with|\s+next|\s+this|\s+that|[.?!,]|$)",
-            r".*trip to\s+([A-Za-z\s]+?)(?:\s+for|\s+on|\s+in|\s+to|\s+with|\s+next|\s+this|\s+that|[.?!,]|$)",
-            r".*in\s+([A-Za-z\s]+?)(?:\s+for|\s+on|\s+to|\s+with|\s+next|\s+this|\s+that|[.?!,]|$)",
-            r".*to\s+([A-Za-z\s]+?)(?:\s+for|\s+on|\s+in|\s+to|\s+with|\s+next|\s+this|\s+that|[.?!,]|$)",
-            r".*I'm in\s+([A-Za-z\s]+?)(?:\s+for|\s+on|\s+to|\s+with|\s+next|\s+this|\s+that|[.?!,]|$)",
-        ]
-
-        for pattern in destination_patterns:
-            match = re.search(pattern, user_message, re.IGNORECASE)
-            if match:
-                return match.group(1).strip()
-
-        return None
+        """Extract a canonical destination name from user message."""
+        return destination_extractor.extract(user_message)
 
     def _extract_travel_dates(self, user_message: str) -> list[str] | None:
         """Extract travel dates from user message."""
@@ -672,6 +741,38 @@ class TravelOrchestratorService:
             logger.error("API call error: %s", type(e).__name__)
             return None
 
+    async def _timed_api_call(self, source: str, api_func, *args):
+        """Call an external API safely, giving up after the source's timeout."""
+        try:
+            return await asyncio.wait_for(
+                self._safe_api_call(self._fetch_context, source, api_func, *args),
+                timeout=self.context_timeouts[source],
+            )
+        except TimeoutError:
+            logger.warning("Context fetch timed out: %s", source)
+            return None
+
+    async def _gather_destination_context(
+        self, destination: str | None, travel_dates: list[str] | None, trip_purpose: str
+    ) -> tuple[dict[str, Any] | None, dict[str, Any] | None]:
+        """Fetch weather and cultural context concurrently.
+
+        Returns (weather_data, cultural_insights). A source that fails or times out is
+        None, so the handler waits for the slowest fetch rather than the sum of them.
+        """
+        if not destination:
+            return None, None
+
+        weather_data, cultural_insights = await asyncio.gather(
+            self._timed_api_call(
+                "weather", weather_service.get_weather_data, destination, travel_dates
+            ),
+            self._timed_api_call(
+                "cultural", qloo_service.get_cultural_insights, destination, trip_purpose
+            ),
+        )
+        return weather_data, cultural_insights
+
     async def _return_none(self):
         """Helper method to return None for failed API calls."""
         return None
@@ -17,28 +17,97 @@
 
 """Qloo service for TravelStyle AI: handles cultural insights and style recommendations."""
 
+import hashlib
+import json
 import logging
+import math
 from typing import Any
 
 import httpx
 
 from app.core.config import settings
+from app.services.destination import canonical_destination_key
+from app.services.http_clients import http_clients
 from app.services.supabase import enhanced_supabase_cache
+from app.utils.metrics import cache_metrics
+from app.utils.negative_cache import classify_failure
+from app.utils.single_flight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
 
+def weather_band(weather_data: dict[str, Any] | None) -> str:
+    """
+    Reduce weather data to a coarse band such as "70-80F/dry".
+
+    The temperature is the current one, else the middle of the forecast range,
+    bucketed by CACHE_STYLE_TEMP_BAND_DEGREES so small changes share a band.
+
+    Args:
+        weather_data: WeatherService data, or None
+
+    Returns:
+        The band, "none" without weather data or "unknown" without a temperature
+    """
+    if not weather_data:
+        return "none"
+    current = weather_data.get("current") or {}
+    forecast = weather_data.get("forecast") or {}
+    try:
+        temp = (current.get("main") or {}).get("temp")
+        if temp is None:
+            temp_range = forecast.get("temp_range") or {}
+            temp = (float(temp_range["min"]) + float(temp_range["max"])) / 2
+        width = settings.CACHE_STYLE_TEMP_BAND_DEGREES
+        low = math.floor(float(temp) / width) * width
+        precipitation = float(forecast.get("precipitation_chance") or 0)
+    except (KeyError, TypeError, ValueError):
+        return "unknown"
+    wet = precipitation >= settings.CACHE_STYLE_WET_PRECIPITATION_CHANCE
+    return f"{low:g}-{low + width:g}F/{'wet' if wet else 'dry'}"
+
+
+def style_cache_key(
+    destination: str,
+    user_preferences: dict[str, Any],
+    occasion: str,
+    weather_data: dict[str, Any] | None = None,
+) -> str:
+    """Hash the inputs a style recommendation depends on into a stable cache key."""
+    inputs = {
+        "destination": canonical_destination_key(destination),
+        "occasion": (occasion or "").strip().lower(),
+        "style": user_preferences.get("style", {}),
+        "body_type": user_preferences.get("body_type"),
+        "budget": user_preferences.get("budget"),
+        "weather": weather_band(weather_data),
+    }
+    encoded = json.dumps(inputs, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
 class QlooService:
     """Service for interacting with Qloo API for cultural insights and style recommendations."""
 
     def __init__(self):
-        """Initialize the QlooService with API credentials and timeout."""
+        """Initialize the QlooService with API credentials."""
         self.base_url = settings.QLOO_BASE_URL
         self.api_key = settings.QLOO_API_KEY
-        self.timeout = 30.0
+        self._single_flight = SingleFlight[dict[str, Any] | None]()
+        # Expired cache entries are served while this renews them
+        enhanced_supabase_cache.register_refresher(
+            "cultural",
+            lambda destination, context: self.get_cultural_insights(
+                destination, context, force_refresh=True
+            ),
+        )
 
     async def get_cultural_insights(
-        self, destination: str, context: str = "leisure", categories: list[str] | None = None
+        self,
+        destination: str,
+        context: str = "leisure",
+        categories: list[str] | None = None,
+        force_refresh: bool = False,
     ) -> dict[str, Any] | None:
         """Get cultural insights for destination.
 
@@ -46,6 +115,7 @@ class QlooService:
             destination: The destination location.
             context: The travel context (default: leisure).
             categories: List of categories to fetch (default: fashion, etiquette, social_norms).
+            force_refresh: Skip the cache and fetch fresh insights.
 
         Returns:
             Dictionary containing cultural insights or None if error.
@@ -53,13 +123,33 @@ class QlooService:
         if categories is None:
             categories = ["fashion", "etiquette", "social_norms"]
 
-        # Check cache first
-        cached_data = await enhanced_supabase_cache.get_cultural_cache(destination, context)
-        if cached_data:
-            return cached_data
+        # Concurrent requests for the same destination and context share one fetch,
+        # whatever spelling of the destination they use
+        key = (canonical_destination_key(destination), context, tuple(categories), force_refresh)
+        return await self._single_flight.do(
+            key,
+            lambda: self._fetch_cultural_insights(destination, context, categories, force_refresh),
+        )
+
+    async def _fetch_cultural_insights(
+        self, destination: str, context: str, categories: list[str], force_refresh: bool = False
+    ) -> dict[str, Any] | None:
+        """Fetch cultural insights from the cache or the Qloo API."""
+        # Check cache first (unless force refresh)
+        if not force_refresh:
+            cached_data = await enhanced_supabase_cache.get_cultural_cache(destination, context)
+            if cached_data:
+                return cached_data
+
+        # Destinations Qloo just failed on get the fallback without another call
+        failure = enhanced_supabase_cache.get_failure("cultural", destination)
+        if failure is not None:
+            logger.info("Skipping Qloo insights fetch after recent %s failure", failure)
+            cache_metrics.incr("cultural", "fallbacks")
+            return self._get_fallback_cultural_data(destination)
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with http_clients.session("qloo") as client:
                 qloo_headers = {
                     "X-Api-Key": "{self.api_key}",
                     "Content-Type": "application/json",
@@ -70,29 +160,36 @@ class QlooService:
                     "signal.location.query": destination,
                     "signal.weather": "sunny",
                 }
-                response = await client.get(
-                    f"{self.base_url}/insights",
-                    headers=qloo_headers,
-                    params=qloo_params,
-                )
-                response.raise_for_status()
+                with cache_metrics.track("cultural", "upstream"):
+                    response = await client.get(
+                        f"{self.base_url}/insights",
+                        headers=qloo_headers,
+                        params=qloo_params,
+                    )
+                    response.raise_for_status()
 
                 data = response.json()
                 processed_data = self._process_cultural_data(data, destination)
 
                 # Cache for 24 hours
-                await enhanced_supabase_cache.set_cultural_cache(destination, context, processed_data, 24)
+                await enhanced_supabase_cache.set_cultural_cache(
+                    destination, context, processed_data, 24
+                )
 
                 return processed_data
 
         except httpx.HTTPStatusError as e:
             logger.error("Qloo API HTTP error: %s - %s", e.response.status_code, e.response.text)
-        except httpx.TimeoutException:
+            enhanced_supabase_cache.set_failure("cultural", destination, classify_failure(e))
+        except httpx.TimeoutException as e:
             logger.error("Qloo API timeout")
+            enhanced_supabase_cache.set_failure("cultural", destination, classify_failure(e))
         except Exception as e:  # pylint: disable=broad-except
             logger.error("Qloo API error: %s", type(e).__name__)
+            enhanced_supabase_cache.set_failure("cultural", destination, classify_failure(e))
 
         # Return fallback data
+        cache_metrics.incr("cultural", "fallbacks")
         return self._get_fallback_cultural_data(destination)
 
     async def get_style_recommendations(
@@ -113,11 +210,14 @@ class QlooService:
         Returns:
             Dictionary containing style recommendations or None if error.
         """
-        # Note: Style recommendations not cached in MVP - could add to schema later
-        # For now, always fetch fresh data
+        # Requests with the same inputs and weather band share a cache entry
+        cache_key = style_cache_key(destination, user_preferences, occasion, weather_data)
+        cached_data = await enhanced_supabase_cache.get_style_cache(cache_key)
+        if cached_data:
+            return cached_data
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with http_clients.session("qloo") as client:
                 payload = {
                     "location": destination,
                     "user_profile": {
@@ -131,25 +231,29 @@ class QlooService:
                 if weather_data:
                     payload["weather_conditions"] = weather_data
 
-                response = await client.post(
-                    f"{self.base_url}/style-recommendations",
-                    headers={
-                        "X-Api-Key": "{self.api_key}",
-                        "Content-Type": "application/json",
-                    },
-                    json=payload,
-                )
-                response.raise_for_status()
+                with cache_metrics.track("style", "upstream"):
+                    response = await client.post(
+                        f"{self.base_url}/style-recommendations",
+                        headers={
+                            "X-Api-Key": "{self.api_key}",
+                            "Content-Type": "application/json",
+                        },
+                        json=payload,
+                    )
+                    response.raise_for_status()
 
                 data = response.json()
                 processed_data = self._process_style_data(data)
 
-                # Note: Style recommendations not cached in MVP
+                await enhanced_supabase_cache.set_style_cache(
+                    cache_key, destination, processed_data, settings.CACHE_STYLE_TTL_HOURS
+                )
 
                 return processed_data
 
         except Exception as e:  # pylint: disable=broad-except
             logger.error("Qloo style recommendations error: %s", type(e).__name__)
+            cache_metrics.incr("style", "fallbacks")
             return self._get_fallback_style_data(destination)
 
     def _process_cultural_data(self, qloo_response: dict, destination: str) -> dict[str, Any]:
@@ -244,6 +348,10 @@ class QlooService:
             "data_source": "fallback",
         }
 
+    def get_stats(self) -> dict[str, Any]:
+        """Get request coalescing statistics."""
+        return {"single_flight": self._single_flight.get_stats()}
+
 
 # Singleton instance
 qloo_service = QlooService()
@@ -19,14 +19,28 @@
 
 from .supabase_base import SupabaseBaseService
 from .supabase_cache_v2 import EnhancedSupabaseCacheService, enhanced_supabase_cache
-from .supabase_client import SupabaseClientManager, get_supabase_client
+from .supabase_client import (
+    SupabaseClientManager,
+    SupabaseDataClient,
+    get_supabase_client,
+    get_supabase_data_client,
+    select_projection,
+)
 from .supabase_config import SupabaseConfig
+from .supabase_health import SupabaseHealthMonitor, supabase_health_monitor
+from .supabase_loader import BatchLoader
 
 __all__ = [
+    "BatchLoader",
     "SupabaseBaseService",
     "EnhancedSupabaseCacheService",
     "enhanced_supabase_cache",
     "get_supabase_client",
+    "get_supabase_data_client",
+    "select_projection",
+    "SupabaseDataClient",
     "SupabaseClientManager",
     "SupabaseConfig",
+    "SupabaseHealthMonitor",
+    "supabase_health_monitor",
 ]
@@ -20,14 +20,14 @@ Base service class for Supabase operations.
 Provides common functionality for all Supabase-related services.
 """
 
-import asyncio
 import logging
 from abc import ABC, abstractmethod
+from datetime import UTC, datetime, timedelta
 from typing import Any, TypeVar
 
-from supabase import Client
-
-from .supabase_client import get_supabase_client
+from .supabase_client import SupabaseDataClient, get_supabase_data_client, select_projection
+from .supabase_config import SupabaseConfig
+from .supabase_loader import BatchLoader
 
 logger = logging.getLogger(__name__)
 
@@ -37,28 +37,75 @@ T = TypeVar("T")
 class SupabaseBaseService[T](ABC):
     """Base class for Supabase services with common operations."""
 
-    def __init__(self, table_name: str, client: Client = None):
-        """Initialize the service with a table name."""
+    def __init__(self, table_name: str, client: SupabaseDataClient | None = None):
+        """Initialize the service with a table name and an async PostgREST client."""
         self.table_name = table_name
-        self.client: Client = client if client is not None else get_supabase_client()
+        self.client = client if client is not None else get_supabase_data_client()
+        self.loader = BatchLoader(self.client, table_name)
 
     async def _execute_query(self, query_func) -> list[dict[str, Any]] | None:
-        """Execute a Supabase query with error handling."""
+        """Await a query built by query_func with error handling."""
         try:
-            response = await asyncio.to_thread(query_func)
+            response = await query_func()
             return response.data if response.data else []
         except Exception as e:
             logger.error(f"Error executing query on {self.table_name}: {e}")
             return None
 
-    async def get_by_id(self, record_id: str) -> T | None:
-        """Get a record by ID."""
+    async def _load(
+        self, field: str, value: Any, projection: str | None
+    ) -> list[dict[str, Any]] | None:
+        """Look up rows by field through the batching loader with error handling."""
+        try:
+            columns = SupabaseConfig.columns(self.table_name, projection)
+            return await self.loader.load(field, value, columns)
+        except Exception as e:
+            logger.error(f"Error loading {field}={value} from {self.table_name}: {e}")
+            return None
+
+    async def get_by_id(self, record_id: str, projection: str | None = None) -> T | None:
+        """Get a record by ID; concurrent lookups share one query.
+
+        Args:
+            record_id: Record ID
+            projection: Projection declared for the table in SupabaseConfig; None reads
+                every column
+        """
+        result = await self._load("id", record_id, projection)
+        return self._parse_record(result[0]) if result else None
+
+    async def get_by_field(self, field: str, value: Any, projection: str | None = None) -> list[T]:
+        """Get records by a specific field value; concurrent lookups share one query.
+
+        See get_by_id for the projection.
+        """
+        result = await self._load(field, value, projection)
+        return [self._parse_record(record) for record in result or []]
+
+    async def get_latest_unexpired(
+        self,
+        field: str,
+        value: Any,
+        columns: str = "*",
+        expires_field: str = "expires_at",
+        order_field: str = "created_at",
+        grace_seconds: float = 0.0,
+    ) -> T | None:
+        """Get the newest record for a field value whose expiry is still in the future.
+
+        Filtering, ordering and the limit run in PostgREST, so a single row is
+        transferred however many stale rows exist for the value. With
+        grace_seconds, records that expired up to that long ago also match.
+        """
+        now = (datetime.now(UTC) - timedelta(seconds=grace_seconds)).isoformat()
 
         def query_func():
             return (
                 self.client.table(self.table_name)
-                .select("*")
-                .eq("id", record_id)
+                .select(columns)
+                .eq(field, value)
+                .gt(expires_field, now)
+                .order(order_field, desc=True)
                 .limit(1)
                 .execute()
             )
@@ -66,20 +113,15 @@ class SupabaseBaseService[T](ABC):
         result = await self._execute_query(query_func)
         return self._parse_record(result[0]) if result else None
 
-    async def get_by_field(self, field: str, value: Any) -> list[T]:
-        """Get records by a specific field value."""
+    async def get_all(self, limit: int | None = None, projection: str | None = None) -> list[T]:
+        """Get all records with optional limit (see get_by_id for the projection)."""
 
         def query_func():
-            return self.client.table(self.table_name).select("*").eq(field, value).execute()
-
-        result = await self._execute_query(query_func)
-        return [self._parse_record(record) for record in result]
-
-    async def get_all(self, limit: int | None = None) -> list[T]:
-        """Get all records with optional limit."""
-
-        def query_func():
-            return self.client.table(self.table_name).select("*").limit(limit or 1000).execute()
+            return (
+                select_projection(self.client, self.table_name, projection)
+                .limit(limit or 1000)
+                .execute()
+            )
 
         result = await self._execute_query(query_func)
         return [self._parse_record(record) for record in result]
@@ -87,9 +129,7 @@ class SupabaseBaseService[T](ABC):
     async def create(self, data: dict[str, Any]) -> T | None:
         """Create a new record."""
         try:
-            response = await asyncio.to_thread(
-                lambda: self.client.table(self.table_name).insert(data).execute()
-            )
+            response = await self.client.table(self.table_name).insert(data).execute()
             if response.data:
                 return self._parse_record(response.data[0])
             return None
@@ -100,10 +140,8 @@ class SupabaseBaseService[T](ABC):
     async def update(self, record_id: str, data: dict[str, Any]) -> T | None:
         """Update a record by ID."""
         try:
-            response = await asyncio.to_thread(
-                lambda: (
-                    self.client.table(self.table_name).update(data).eq("id", record_id).execute()
-                )
+            response = (
+                await self.client.table(self.table_name).update(data).eq("id", record_id).execute()
             )
             if response.data:
                 return self._parse_record(response.data[0])
@@ -115,52 +153,40 @@ class SupabaseBaseService[T](ABC):
     async def delete(self, record_id: str) -> bool:
         """Delete a record by ID."""
         try:
-            await asyncio.to_thread(
-                lambda: (self.client.table(self.table_name).delete().eq("id", record_id).execute())
-            )
+            await self.client.table(self.table_name).delete().eq("id", record_id).execute()
             return True
         except Exception as e:
             logger.error(f"Error deleting record from {self.table_name}: {e}")
             return False
 
-    async def upsert(self, data: dict[str, Any], unique_fields: list[str]) -> T | None:
-        """Upsert a record based on unique fields."""
+    def _conflict_target(self, unique_fields: list[str] | None) -> str:
+        """Resolve the ON CONFLICT columns, defaulting to the table's unique constraint."""
+        if unique_fields is None:
+            table_config = SupabaseConfig.TABLES.get(self.table_name)
+            unique_fields = table_config.unique_constraints if table_config else []
+        # An empty target makes PostgREST fall back to the primary key
+        return ",".join(unique_fields)
+
+    async def upsert(
+        self, data: dict[str, Any], unique_fields: list[str] | None = None
+    ) -> T | None:
+        """Upsert a record in a single INSERT ... ON CONFLICT DO UPDATE request.
+
+        Args:
+            data: Record to insert or update
+            unique_fields: Conflict target columns; defaults to the table's
+                ``unique_constraints`` in SupabaseConfig.TABLES, then to the primary key
+
+        Returns:
+            The stored record, or None on failure
+        """
+        on_conflict = self._conflict_target(unique_fields)
         try:
-            # First try to find existing record with the unique fields
-            filter_conditions = {}
-            for field in unique_fields:
-                if field in data:
-                    filter_conditions[field] = data[field]
-
-            if filter_conditions:
-                # Try to find existing record
-                existing_records = await self._execute_query(
-                    lambda: self.client.table(self.table_name)
-                    .select("*")
-                    .match(filter_conditions)
-                    .execute()
-                )
-
-                if existing_records:
-                    # Update existing record
-                    record_id = existing_records[0]["id"]
-                    response = await asyncio.to_thread(
-                        lambda: self.client.table(self.table_name)
-                        .update(data)
-                        .eq("id", record_id)
-                        .execute()
-                    )
-                else:
-                    # Insert new record
-                    response = await asyncio.to_thread(
-                        lambda: self.client.table(self.table_name).insert(data).execute()
-                    )
-            else:
-                # Fallback to regular upsert if no unique fields provided
-                response = await asyncio.to_thread(
-                    lambda: self.client.table(self.table_name).upsert(data).execute()
-                )
-
+            response = (
+                await self.client.table(self.table_name)
+                .upsert(data, on_conflict=on_conflict)
+                .execute()
+            )
             if response.data:
                 return self._parse_record(response.data[0])
             return None
@@ -168,16 +194,39 @@ class SupabaseBaseService[T](ABC):
             logger.error(f"Error upserting record in {self.table_name}: {e}")
             return None
 
+    async def upsert_many(
+        self, rows: list[dict[str, Any]], unique_fields: list[str] | None = None
+    ) -> list[T]:
+        """Upsert many records in one request (see upsert for the conflict target).
+
+        Returns:
+            The stored records, or an empty list on failure
+        """
+        if not rows:
+            return []
+
+        on_conflict = self._conflict_target(unique_fields)
+        try:
+            response = (
+                await self.client.table(self.table_name)
+                .upsert(rows, on_conflict=on_conflict, default_to_null=False)
+                .execute()
+            )
+            return [self._parse_record(record) for record in response.data or []]
+        except Exception as e:
+            logger.error(f"Error bulk upserting {len(rows)} records in {self.table_name}: {e}")
+            return []
+
     @abstractmethod
     def _parse_record(self, record: dict[str, Any]) -> T:
         """Parse a database record into the appropriate model."""
         pass
 
-    def _validate_connection(self) -> bool:
+    async def _validate_connection(self) -> bool:
         """Validate that the Supabase connection is working."""
         try:
             # Simple test query
-            self.client.table(self.table_name).select("id").limit(1).execute()
+            await self.client.table(self.table_name).select("id").limit(1).execute()
             return True
         except Exception as e:
             logger.error(f"Supabase connection validation failed: {e}")
@@ -20,40 +20,54 @@ Enhanced Supabase cache service using the base service pattern.
 Provides improved caching functionality with better error handling and type safety.
 """
 
+import json
 import logging
+import time
+from collections.abc import Awaitable, Callable
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
+from app.core.config import settings
+from app.services.cache import (
+    CacheBackend,
+    CacheEntry,
+    MemoryCacheBackend,
+    RedisCacheBackend,
+    SQLiteCacheBackend,
+    storage_key,
+)
+from app.services.cache.payload_codec import encode_payload
+from app.services.destination import canonical_destination_key
 from app.services.rate_limiter import db_rate_limiter
+from app.utils.background_refresh import BackgroundRefresher
+from app.utils.metrics import cache_metrics
+from app.utils.negative_cache import NegativeCache
+from app.utils.ttl_cache import TTLCache
+from app.utils.write_behind import WriteBehindQueue
 
 from .supabase_base import SupabaseBaseService
+from .supabase_config import SupabaseConfig
 
 logger = logging.getLogger(__name__)
 
 
-class CacheEntry:
-    """Represents a cache entry with metadata."""
+def _payload_size(data: dict[str, Any]) -> int:
+    """Approximate the memory held by a cached payload from its JSON length."""
+    return len(json.dumps(data, default=str))
 
-    def __init__(self, data: dict[str, Any], expires_at: datetime, created_at: datetime):
-        self.data = data
-        self.expires_at = expires_at
-        self.created_at = created_at
 
-    @classmethod
-    def from_dict(cls, record: dict[str, Any]) -> "CacheEntry":
-        """Create a CacheEntry from a database record."""
-        expires_at = datetime.fromisoformat(record.get("expires_at", "").replace("Z", "+00:00"))
-        created_at = datetime.fromisoformat(record.get("created_at", "").replace("Z", "+00:00"))
-        return cls(record.get("data", {}), expires_at, created_at)
-
-    def is_expired(self) -> bool:
-        """Check if the cache entry is expired."""
-        return datetime.now(UTC) > self.expires_at
+def _new_entry(data: dict[str, Any], ttl_hours: float) -> CacheEntry:
+    """Build the entry a write creates, expiring ttl_hours from now."""
+    now = datetime.now(UTC)
+    return CacheEntry(data, now + timedelta(hours=ttl_hours), now)
 
 
 class WeatherCacheService(SupabaseBaseService[CacheEntry]):
     """Service for weather cache operations."""
 
+    # Payload plus the timestamps CacheEntry needs
+    CACHE_COLUMNS = SupabaseConfig.columns("weather_cache", "entry")
+
     def __init__(self):
         super().__init__("weather_cache")
 
@@ -69,42 +83,53 @@ class WeatherCacheService(SupabaseBaseService[CacheEntry]):
 
     async def get_cache(self, destination: str) -> dict[str, Any] | None:
         """Get cached weather data for destination."""
+        entry = await self.get_entry(destination)
+        return entry.data if entry else None
+
+    async def get_entry(self, destination: str, grace_seconds: float = 0.0) -> CacheEntry | None:
+        """Get the most recent weather cache entry for destination.
+
+        Entries that expired less than grace_seconds ago are included.
+        """
         if not await db_rate_limiter.acquire("cache"):
             logger.warning("Rate limited: get_weather_cache")
+            cache_metrics.incr("weather", "rate_limited_reads")
             return None
 
         try:
-            records = await self.get_by_field("destination", destination)
-            if not records:
-                return None
-
-            # Find the most recent non-expired record
-            for record in sorted(records, key=lambda r: r.created_at, reverse=True):
-                if not record.is_expired():
-                    return record.data
-
-            return None
+            return await self.get_latest_unexpired(
+                "destination_normalized",
+                canonical_destination_key(destination),
+                self.CACHE_COLUMNS,
+                grace_seconds=grace_seconds,
+            )
         except Exception as e:
             logger.error(f"Weather cache get error: {e}")
             return None
 
+    def build_row(
+        self, destination: str, data: dict[str, Any], ttl_hours: int = 1
+    ) -> dict[str, Any]:
+        """Build the weather_cache row that caches data for destination."""
+        expires_at = datetime.now(UTC) + timedelta(hours=ttl_hours)
+        return {
+            "destination": destination,
+            "destination_normalized": canonical_destination_key(destination),
+            "weather_data": encode_payload(data),
+            "expires_at": expires_at.isoformat(),
+            "created_at": datetime.now(UTC).isoformat(),
+            "api_source": "visualcrossing",  # Changed to visualcrossing
+        }
+
     async def set_cache(self, destination: str, data: dict[str, Any], ttl_hours: int = 1) -> bool:
         """Cache weather data for destination."""
         if not await db_rate_limiter.acquire("cache"):
             logger.warning("Rate limited: set_weather_cache")
+            cache_metrics.incr("weather", "rate_limited_writes")
             return False
 
         try:
-            expires_at = datetime.now(UTC) + timedelta(hours=ttl_hours)
-            cache_data = {
-                "destination": destination,
-                "destination_normalized": destination.lower(),
-                "weather_data": data,
-                "expires_at": expires_at.isoformat(),
-                "created_at": datetime.now(UTC).isoformat(),
-                "api_source": "visualcrossing",  # Changed to visualcrossing
-            }
-            result = await self.upsert(cache_data, ["destination", "api_source"])
+            result = await self.upsert(self.build_row(destination, data, ttl_hours))
             return result is not None
         except Exception as e:
             logger.error(f"Weather cache set error: {e}")
@@ -114,6 +139,8 @@ class WeatherCacheService(SupabaseBaseService[CacheEntry]):
 class CulturalCacheService(SupabaseBaseService[CacheEntry]):
     """Service for cultural cache operations."""
 
+    CACHE_COLUMNS = SupabaseConfig.columns("cultural_insights_cache", "entry")
+
     def __init__(self):
         super().__init__("cultural_insights_cache")
 
@@ -132,45 +159,55 @@ class CulturalCacheService(SupabaseBaseService[CacheEntry]):
 
     async def get_cache(self, destination: str, context: str = "leisure") -> dict[str, Any] | None:
         """Get cached cultural insights for destination."""
+        entry = await self.get_entry(destination, context)
+        return entry.data if entry else None
+
+    async def get_entry(
+        self, destination: str, context: str = "leisure", grace_seconds: float = 0.0
+    ) -> CacheEntry | None:
+        """Get the most recent cultural cache entry for destination (see WeatherCacheService)."""
         if not await db_rate_limiter.acquire("cache"):
             logger.warning("Rate limited: get_cultural_cache")
+            cache_metrics.incr("cultural", "rate_limited_reads")
             return None
 
         try:
-            records = await self.get_by_field("destination", destination)
-            if not records:
-                return None
-
-            # Find the most recent non-expired record
-            for record in sorted(records, key=lambda r: r.created_at, reverse=True):
-                if not record.is_expired():
-                    return record.data
-
-            return None
+            return await self.get_latest_unexpired(
+                "destination_normalized",
+                canonical_destination_key(destination),
+                self.CACHE_COLUMNS,
+                grace_seconds=grace_seconds,
+            )
         except Exception as e:
             logger.error(f"Cultural cache get error: {e}")
             return None
 
+    def build_row(
+        self, destination: str, data: dict[str, Any], ttl_hours: int = 24
+    ) -> dict[str, Any]:
+        """Build the cultural_insights_cache row that caches data for destination."""
+        expires_at = datetime.now(UTC) + timedelta(hours=ttl_hours)
+        return {
+            "destination": destination,
+            "destination_normalized": canonical_destination_key(destination),
+            "cultural_data": encode_payload(data.get("cultural_data", {})),
+            "style_data": encode_payload(data.get("style_data", {})),
+            "expires_at": expires_at.isoformat(),
+            "created_at": datetime.now(UTC).isoformat(),
+            "api_source": "qloo",  # Add API source for unique constraint
+        }
+
     async def set_cache(
         self, destination: str, data: dict[str, Any], ttl_hours: int = 24, context: str = "leisure"
     ) -> bool:
         """Cache cultural insights for destination."""
         if not await db_rate_limiter.acquire("cache"):
             logger.warning("Rate limited: set_cultural_cache")
+            cache_metrics.incr("cultural", "rate_limited_writes")
             return False
 
         try:
-            expires_at = datetime.now(UTC) + timedelta(hours=ttl_hours)
-            cache_data = {
-                "destination": destination,
-                "destination_normalized": destination.lower(),
-                "cultural_data": data.get("cultural_data", {}),
-                "style_data": data.get("style_data", {}),
-                "expires_at": expires_at.isoformat(),
-                "created_at": datetime.now(UTC).isoformat(),
-                "api_source": "qloo",  # Add API source for unique constraint
-            }
-            result = await self.upsert(cache_data, ["destination", "api_source"])
+            result = await self.upsert(self.build_row(destination, data, ttl_hours))
             return result is not None
         except Exception as e:
             logger.error(f"Cultural cache set error: {e}")
@@ -180,6 +217,8 @@ class CulturalCacheService(SupabaseBaseService[CacheEntry]):
 class CurrencyCacheService(SupabaseBaseService[CacheEntry]):
     """Service for currency cache operations."""
 
+    CACHE_COLUMNS = SupabaseConfig.columns("currency_rates_cache", "entry")
+
     def __init__(self):
         super().__init__("currency_rates_cache")
 
@@ -195,86 +234,609 @@ class CurrencyCacheService(SupabaseBaseService[CacheEntry]):
 
     async def get_cache(self, base_currency: str) -> dict[str, Any] | None:
         """Get cached currency rates."""
+        entry = await self.get_entry(base_currency)
+        return entry.data if entry else None
+
+    async def get_entry(self, base_currency: str, grace_seconds: float = 0.0) -> CacheEntry | None:
+        """Get the most recent currency cache entry (see WeatherCacheService)."""
         if not await db_rate_limiter.acquire("cache"):
             logger.warning("Rate limited: get_currency_cache")
+            cache_metrics.incr("currency", "rate_limited_reads")
             return None
 
         try:
-            records = await self.get_by_field("base_currency", base_currency)
-            if not records:
-                return None
-
-            # Find the most recent non-expired record
-            for record in sorted(records, key=lambda r: r.created_at, reverse=True):
-                if not record.is_expired():
-                    return record.data
-
-            return None
+            return await self.get_latest_unexpired(
+                "base_currency", base_currency, self.CACHE_COLUMNS, grace_seconds=grace_seconds
+            )
         except Exception as e:
             logger.error(f"Currency cache get error: {e}")
             return None
 
+    def build_row(
+        self, base_currency: str, data: dict[str, Any], ttl_hours: int = 1
+    ) -> dict[str, Any]:
+        """Build the currency_rates_cache row that caches rates for base_currency."""
+        expires_at = datetime.now(UTC) + timedelta(hours=ttl_hours)
+        return {
+            "base_currency": base_currency,
+            "rates_data": encode_payload(data),
+            "expires_at": expires_at.isoformat(),
+            "created_at": datetime.now(UTC).isoformat(),
+            "api_source": "exchangerate-api",
+        }
+
     async def set_cache(self, base_currency: str, data: dict[str, Any], ttl_hours: int = 1) -> bool:
         """Cache currency rates."""
         if not await db_rate_limiter.acquire("cache"):
             logger.warning("Rate limited: set_currency_cache")
+            cache_metrics.incr("currency", "rate_limited_writes")
             return False
 
         try:
-            expires_at = datetime.now(UTC) + timedelta(hours=ttl_hours)
-            cache_data = {
-                "base_currency": base_currency,
-                "rates_data": data,
-                "expires_at": expires_at.isoformat(),
-                "api_source": "exchangerate-api",
-            }
-            result = await self.upsert(cache_data, ["base_currency", "api_source"])
+            result = await self.upsert(self.build_row(base_currency, data, ttl_hours))
             return result is not None
         except Exception as e:
             logger.error(f"Currency cache set error: {e}")
             return False
 
 
+class ClassificationCacheService(SupabaseBaseService[CacheEntry]):
+    """Service for message classification cache operations."""
+
+    CACHE_COLUMNS = SupabaseConfig.columns("message_classification_cache", "entry")
+
+    def __init__(self):
+        super().__init__("message_classification_cache")
+
+    def _parse_record(self, record: dict[str, Any]) -> CacheEntry:
+        """Parse a message classification cache record."""
+        return CacheEntry.from_dict(
+            {
+                "data": {
+                    "category": record.get("category"),
+                    "classifier_source": record.get("classifier_source"),
+                },
+                "expires_at": record.get("expires_at"),
+                "created_at": record.get("created_at"),
+            }
+        )
+
+    async def get_cache(self, message_hash: str) -> dict[str, Any] | None:
+        """Get a cached classification for a normalized message hash."""
+        entry = await self.get_entry(message_hash)
+        return entry.data if entry else None
+
+    async def get_entry(self, message_hash: str, grace_seconds: float = 0.0) -> CacheEntry | None:
+        """Get the most recent classification cache entry (see WeatherCacheService)."""
+        if not await db_rate_limiter.acquire("cache"):
+            logger.warning("Rate limited: get_classification_cache")
+            cache_metrics.incr("classification", "rate_limited_reads")
+            return None
+
+        try:
+            return await self.get_latest_unexpired(
+                "message_hash", message_hash, self.CACHE_COLUMNS, grace_seconds=grace_seconds
+            )
+        except Exception as e:
+            logger.error(f"Classification cache get error: {e}")
+            return None
+
+    def build_row(
+        self, message_hash: str, data: dict[str, Any], ttl_hours: int = 168
+    ) -> dict[str, Any]:
+        """Build the message_classification_cache row for a message hash.
+
+        data holds "category" and optionally "classifier_source"; the message text
+        itself is never stored.
+        """
+        expires_at = datetime.now(UTC) + timedelta(hours=ttl_hours)
+        return {
+            "message_hash": message_hash,
+            "category": data["category"],
+            "classifier_source": data.get("classifier_source", "llm"),
+            "expires_at": expires_at.isoformat(),
+            "created_at": datetime.now(UTC).isoformat(),
+        }
+
+    async def set_cache(
+        self,
+        message_hash: str,
+        category: str,
+        ttl_hours: int = 168,
+        classifier_source: str = "llm",
+    ) -> bool:
+        """Cache a classification for a normalized message hash."""
+        if not await db_rate_limiter.acquire("cache"):
+            logger.warning("Rate limited: set_classification_cache")
+            cache_metrics.incr("classification", "rate_limited_writes")
+            return False
+
+        try:
+            data = {
+                "category": category,
+                "classifier_source": classifier_source,
+            }
+            result = await self.upsert(self.build_row(message_hash, data, ttl_hours))
+            return result is not None
+        except Exception as e:
+            logger.error(f"Classification cache set error: {e}")
+            return False
+
+
+class StyleCacheService(SupabaseBaseService[CacheEntry]):
+    """Service for style recommendation cache operations."""
+
+    CACHE_COLUMNS = SupabaseConfig.columns("style_recommendations_cache", "entry")
+
+    def __init__(self):
+        super().__init__("style_recommendations_cache")
+
+    def _parse_record(self, record: dict[str, Any]) -> CacheEntry:
+        """Parse a style recommendation cache record."""
+        return CacheEntry.from_dict(
+            {
+                "data": {
+                    "destination": record.get("destination"),
+                    "style_data": record.get("style_data", {}),
+                },
+                "expires_at": record.get("expires_at"),
+                "created_at": record.get("created_at"),
+            }
+        )
+
+    async def get_entry(self, cache_key: str, grace_seconds: float = 0.0) -> CacheEntry | None:
+        """Get the most recent style cache entry for a request hash (see WeatherCacheService)."""
+        if not await db_rate_limiter.acquire("cache"):
+            logger.warning("Rate limited: get_style_cache")
+            cache_metrics.incr("style", "rate_limited_reads")
+            return None
+
+        try:
+            return await self.get_latest_unexpired(
+                "cache_key", cache_key, self.CACHE_COLUMNS, grace_seconds=grace_seconds
+            )
+        except Exception as e:
+            logger.error(f"Style cache get error: {e}")
+            return None
+
+    def build_row(
+        self, cache_key: str, data: dict[str, Any], ttl_hours: float = 12
+    ) -> dict[str, Any]:
+        """Build the style_recommendations_cache row for a request hash.
+
+        data holds "destination" and the Qloo "style_data".
+        """
+        expires_at = datetime.now(UTC) + timedelta(hours=ttl_hours)
+        return {
+            "cache_key": cache_key,
+            "destination": data["destination"],
+            "style_data": encode_payload(data["style_data"]),
+            "expires_at": expires_at.isoformat(),
+            "created_at": datetime.now(UTC).isoformat(),
+            "api_source": "qloo",
+        }
+
+    async def set_cache(self, cache_key: str, data: dict[str, Any], ttl_hours: float = 12) -> bool:
+        """Cache style recommendations for a request hash."""
+        if not await db_rate_limiter.acquire("cache"):
+            logger.warning("Rate limited: set_style_cache")
+            cache_metrics.incr("style", "rate_limited_writes")
+            return False
+
+        try:
+            result = await self.upsert(self.build_row(cache_key, data, ttl_hours))
+            return result is not None
+        except Exception as e:
+            logger.error(f"Style cache set error: {e}")
+            return False
+
+
+class SupabaseCacheBackend(CacheBackend):
+    """Cache backend over the Supabase cache tables, one service per cache type."""
+
+    name = "supabase"
+
+    def __init__(
+        self,
+        weather: WeatherCacheService,
+        cultural: CulturalCacheService,
+        currency: CurrencyCacheService,
+        classification: ClassificationCacheService,
+        style: StyleCacheService,
+    ):
+        """Initialize the backend with the table services it delegates to."""
+        self.services: dict[str, SupabaseBaseService[CacheEntry]] = {
+            "weather": weather,
+            "cultural": cultural,
+            "currency": currency,
+            "classification": classification,
+            "style": style,
+        }
+
+    async def get_entry(
+        self, cache_type: str, key: str, grace_seconds: float = 0.0
+    ) -> CacheEntry | None:
+        """Get the newest unexpired row for key (each service applies the rate limiter)."""
+        return await self.services[cache_type].get_entry(key, grace_seconds=grace_seconds)
+
+    def build_record(
+        self, cache_type: str, key: str, data: dict[str, Any], ttl_hours: float
+    ) -> dict[str, Any]:
+        """Build the table row for key."""
+        return self.services[cache_type].build_row(key, data, ttl_hours)
+
+    async def write_records(self, cache_type: str, records: list[dict[str, Any]]) -> int:
+        """Upsert rows with one request and one rate limiter token."""
+        if not await db_rate_limiter.acquire("cache"):
+            logger.warning(f"Rate limited: dropping {len(records)} {cache_type} cache writes")
+            cache_metrics.incr(cache_type, "rate_limited_writes", len(records))
+            return 0
+        return len(await self.services[cache_type].upsert_many(records))
+
+    async def set_entry(
+        self, cache_type: str, key: str, data: dict[str, Any], ttl_hours: float
+    ) -> bool:
+        """Upsert one row through the service's set_cache."""
+        service = self.services[cache_type]
+        if cache_type == "classification":
+            return await service.set_cache(
+                key,
+                data["category"],
+                ttl_hours,
+                data.get("classifier_source", "llm"),
+            )
+        return await service.set_cache(key, data, ttl_hours)
+
+
 class EnhancedSupabaseCacheService:
-    """Enhanced cache service using the base service pattern."""
+    """Enhanced cache service using the base service pattern.
+
+    Entries are stored by a CacheBackend chosen with CACHE_BACKEND: the Supabase
+    cache tables (default), a process-local store, a SQLite file or a
+    Redis-protocol server.
+
+    Weather, cultural and currency lookups are fronted by an in-process TTL/LRU
+    cache (L1), keyed like the backend (destinations by canonical_destination_key()).
+    ``set_*_cache`` updates L1 at once and queues the backend record on a
+    write-behind queue that writes in batches (CACHE_WRITE_BEHIND_ENABLED).
+
+    Upstream failures can be recorded with set_failure(); get_failure() then
+    reports them for a short time so callers skip the upstream call
+    (CACHE_NEGATIVE_ENABLED).
+
+    Services that register a refresher get stale-while-revalidate: an entry that
+    expired less than CACHE_STALE_GRACE_SECONDS ago is still served while a
+    background task refreshes it, and often-read entries are refreshed ahead of
+    expiry. Without a refresher, expired entries are misses.
+    """
 
     def __init__(self):
         """Initialize the enhanced cache service."""
         self.weather_service = WeatherCacheService()
         self.cultural_service = CulturalCacheService()
         self.currency_service = CurrencyCacheService()
+        self.classification_service = ClassificationCacheService()
+        self.style_service = StyleCacheService()
+        self.backend = self._create_backend(settings.CACHE_BACKEND)
+
+        self.local_enabled = settings.CACHE_L1_ENABLED
+        self.local = TTLCache[CacheEntry](
+            maxsize=settings.CACHE_L1_MAX_ENTRIES,
+            ttl_seconds=settings.CACHE_L1_MAX_TTL_SECONDS,
+            max_bytes=settings.CACHE_L1_MAX_BYTES,
+            sizeof=lambda entry: _payload_size(entry.data),
+        )
+
+        self.stale_grace_seconds = settings.CACHE_STALE_GRACE_SECONDS
+        self.refresh_ahead_fraction = settings.CACHE_REFRESH_AHEAD_FRACTION
+        self.refresh_ahead_min_reads = settings.CACHE_REFRESH_AHEAD_MIN_READS
+        self.refresher = BackgroundRefresher()
+        self._refreshers: dict[str, Callable[..., Awaitable[Any]]] = {}
+        # Recent reads per key, used to pick entries worth refreshing ahead of expiry
+        self._reads = TTLCache[int](
+            maxsize=settings.CACHE_L1_MAX_ENTRIES, ttl_seconds=settings.CACHE_L1_MAX_TTL_SECONDS
+        )
+
+        self.negative_enabled = settings.CACHE_NEGATIVE_ENABLED
+        self.negative = NegativeCache(
+            maxsize=settings.CACHE_NEGATIVE_MAX_ENTRIES,
+            ttl_seconds=settings.CACHE_NEGATIVE_TTL_SECONDS,
+            transient_ttl_seconds=settings.CACHE_NEGATIVE_TRANSIENT_TTL_SECONDS,
+        )
+
+        self.write_behind_enabled = settings.CACHE_WRITE_BEHIND_ENABLED
+        self.writes = WriteBehindQueue(
+            self._write_batch,
+            max_pending=settings.CACHE_WRITE_BEHIND_MAX_PENDING,
+            batch_size=settings.CACHE_WRITE_BEHIND_BATCH_SIZE,
+            flush_interval=settings.CACHE_WRITE_BEHIND_FLUSH_INTERVAL_SECONDS,
+        )
+
+    def _create_backend(self, name: str) -> CacheBackend:
+        """
+        Build the storage backend named by CACHE_BACKEND.
+
+        Raises:
+            ValueError: If the name is not a known backend
+        """
+        retain_seconds = settings.CACHE_STALE_GRACE_SECONDS
+        if name == "supabase":
+            return SupabaseCacheBackend(
+                self.weather_service,
+                self.cultural_service,
+                self.currency_service,
+                self.classification_service,
+                self.style_service,
+            )
+        if name == "memory":
+            return MemoryCacheBackend(settings.CACHE_MEMORY_MAX_ENTRIES, retain_seconds)
+        if name == "sqlite":
+            return SQLiteCacheBackend(settings.CACHE_SQLITE_PATH, retain_seconds)
+        if name == "redis":
+            return RedisCacheBackend(
+                settings.CACHE_REDIS_URL,
+                prefix=settings.CACHE_REDIS_PREFIX,
+                timeout=settings.CACHE_REDIS_TIMEOUT_SECONDS,
+                retain_seconds=retain_seconds,
+                max_connections=settings.CACHE_REDIS_MAX_CONNECTIONS,
+            )
+        raise ValueError(f"Unknown CACHE_BACKEND {name!r}: use supabase, memory, sqlite or redis")
+
+    async def _store(
+        self, cache_type: str, key: str, local_key: str, data: dict[str, Any], ttl_hours: float
+    ) -> bool:
+        """Write an entry to the backend, through the write-behind queue when enabled."""
+        if not self.write_behind_enabled:
+            return await self.backend.set_entry(cache_type, key, data, ttl_hours)
+        try:
+            record = self.backend.build_record(cache_type, key, data, ttl_hours)
+        except Exception as e:
+            logger.error(f"Cache record build error for {local_key}: {e}")
+            return False
+        return self.writes.put(cache_type, local_key, record)
+
+    async def _write_batch(self, cache_type: str, records: list[dict[str, Any]]) -> int:
+        """Write a batch of queued records to the backend."""
+        return await self.backend.write_records(cache_type, records)
+
+    def register_refresher(self, cache_type: str, refresh: Callable[..., Awaitable[Any]]) -> None:
+        """
+        Enable stale-while-revalidate for a cache type.
+
+        Args:
+            cache_type: "weather", "cultural" or "currency"
+            refresh: Coroutine function taking the same key arguments as the
+                get_*_cache method; it must fetch upstream and call set_*_cache
+        """
+        self._refreshers[cache_type] = refresh
+
+    def _refresh_call(self, cache_type: str, *args: Any) -> Callable[[], Awaitable[Any]] | None:
+        """Bind a registered refresher to the key arguments of one lookup."""
+        refresh = self._refreshers.get(cache_type)
+        if refresh is None:
+            return None
+        return lambda: refresh(*args)
+
+    def _set_local(self, local_key: str, entry: CacheEntry) -> None:
+        """Store an entry in the in-process tier until its grace period ends (capped at L1 TTL)."""
+        if not self.local_enabled:
+            return
+        remaining = (entry.expires_at - datetime.now(UTC)).total_seconds()
+        if local_key.split(":", 1)[0] in self._refreshers:
+            remaining += self.stale_grace_seconds
+        self.local.set(local_key, entry, min(remaining, self.local.ttl_seconds))
+
+    def _refresh_ahead_due(self, local_key: str, entry: CacheEntry) -> bool:
+        """Check whether a fresh entry is read often and close enough to expiry to renew."""
+        reads = (self._reads.get(local_key) or 0) + 1
+        self._reads.set(local_key, reads)
+
+        lifetime = (entry.expires_at - entry.created_at).total_seconds()
+        remaining = (entry.expires_at - datetime.now(UTC)).total_seconds()
+        return (
+            lifetime > 0
+            and remaining <= lifetime * self.refresh_ahead_fraction
+            and reads >= self.refresh_ahead_min_reads
+        )
+
+    async def _read_through(
+        self,
+        cache_type: str,
+        key: str,
+        fetch: Callable[[float], Awaitable[CacheEntry | None]],
+        refresh: Callable[[], Awaitable[Any]] | None = None,
+    ) -> dict[str, Any] | None:
+        """Serve from the in-process tier, falling back to the backend and promoting hits.
+
+        Args:
+            cache_type: Cache type, used as the in-process key prefix
+            key: Canonical lookup key
+            fetch: Reads the backend entry, given the stale grace period in seconds
+            refresh: Background refresh for this key, if the cache type has one
+
+        Returns:
+            Cached payload, possibly stale when a refresh is available, or None
+        """
+        started = time.perf_counter()
+        local_key = f"{cache_type}:{key}"
+        entry = None
+        if self.local_enabled:
+            entry = self.local.get(local_key)
+            cache_metrics.observe(cache_type, "local", time.perf_counter() - started)
+
+        outcome = "local_hits"
+        if entry is None:
+            outcome = "remote_hits"
+            fetch_started = time.perf_counter()
+            entry = await fetch(self.stale_grace_seconds if refresh else 0.0)
+            cache_metrics.observe(cache_type, "remote", time.perf_counter() - fetch_started)
+            if entry is None:
+                cache_metrics.record_lookup(
+                    cache_type, "misses", key, time.perf_counter() - started
+                )
+                return None
+            self._set_local(local_key, entry)
+
+        data: dict[str, Any] | None = entry.data
+        if refresh is None:
+            if entry.is_expired():
+                outcome, data = "expired", None
+        elif entry.is_expired():
+            outcome = "stale_hits"
+            self.refresher.schedule(local_key, refresh)
+        elif self._refresh_ahead_due(local_key, entry):
+            self.refresher.schedule(local_key, refresh)
+
+        cache_metrics.record_lookup(cache_type, outcome, key, time.perf_counter() - started)
+        return data
 
     async def get_weather_cache(self, destination: str) -> dict[str, Any] | None:
         """Get cached weather data for destination."""
-        return await self.weather_service.get_cache(destination)
+        return await self._read_through(
+            "weather",
+            canonical_destination_key(destination),
+            lambda grace: self.backend.get_entry("weather", destination, grace),
+            self._refresh_call("weather", destination),
+        )
 
     async def set_weather_cache(
         self, destination: str, data: dict[str, Any], ttl_hours: int = 1
     ) -> bool:
         """Cache weather data for destination."""
-        return await self.weather_service.set_cache(destination, data, ttl_hours)
+        local_key = f"weather:{canonical_destination_key(destination)}"
+        self.negative.delete(local_key)
+        self._set_local(local_key, _new_entry(data, ttl_hours))
+        return await self._store("weather", destination, local_key, data, ttl_hours)
 
     async def get_cultural_cache(
         self, destination: str, context: str = "leisure"
     ) -> dict[str, Any] | None:
         """Get cached cultural insights for destination."""
-        return await self.cultural_service.get_cache(destination, context)
+        return await self._read_through(
+            "cultural",
+            canonical_destination_key(destination),
+            lambda grace: self.backend.get_entry("cultural", destination, grace),
+            self._refresh_call("cultural", destination, context),
+        )
 
     async def set_cultural_cache(
         self, destination: str, context: str, data: dict[str, Any], ttl_hours: int = 24
     ) -> bool:
         """Cache cultural insights for destination."""
-        return await self.cultural_service.set_cache(destination, data, ttl_hours, context)
+        # Keep only the columns a Supabase read would return
+        stored = {
+            "cultural_data": data.get("cultural_data", {}),
+            "style_data": data.get("style_data", {}),
+        }
+        local_key = f"cultural:{canonical_destination_key(destination)}"
+        self.negative.delete(local_key)
+        self._set_local(local_key, _new_entry(stored, ttl_hours))
+        return await self._store("cultural", destination, local_key, stored, ttl_hours)
 
     async def get_currency_cache(self, base_currency: str) -> dict[str, Any] | None:
         """Get cached currency rates."""
-        return await self.currency_service.get_cache(base_currency)
+        return await self._read_through(
+            "currency",
+            base_currency,
+            lambda grace: self.backend.get_entry("currency", base_currency, grace),
+            self._refresh_call("currency", base_currency),
+        )
 
     async def set_currency_cache(
         self, base_currency: str, data: dict[str, Any], ttl_hours: int = 1
     ) -> bool:
         """Cache currency rates."""
-        return await self.currency_service.set_cache(base_currency, data, ttl_hours)
+        local_key = f"currency:{base_currency}"
+        self.negative.delete(local_key)
+        self._set_local(local_key, _new_entry(data, ttl_hours))
+        return await self._store("currency", base_currency, local_key, data, ttl_hours)
+
+    async def get_classification_cache(self, message_hash: str) -> dict[str, Any] | None:
+        """Get a cached message classification."""
+        return await self._read_through(
+            "classification",
+            message_hash,
+            lambda grace: self.backend.get_entry("classification", message_hash, grace),
+        )
+
+    async def set_classification_cache(
+        self, message_hash: str, category: str, ttl_hours: int = 168
+    ) -> bool:
+        """Cache a message classification, through the write-behind queue when enabled."""
+        local_key = f"classification:{message_hash}"
+        data = {"category": category}
+        self._set_local(local_key, _new_entry(data, ttl_hours))
+        return await self._store("classification", message_hash, local_key, data, ttl_hours)
+
+    def get_failure(self, cache_type: str, key: str) -> str | None:
+        """
+        Get the failure class recently recorded for a lookup key.
+
+        A returned failure means the caller can skip one upstream call; those are
+        counted as "negative_hits" in the cache metrics.
+
+        Args:
+            cache_type: "weather", "cultural" or "currency"
+            key: Lookup key as passed to the get_*_cache method
+
+        Returns:
+            The failure class (see classify_failure), or None to call upstream
+        """
+        if not self.negative_enabled:
+            return None
+        failure = self.negative.get(f"{cache_type}:{storage_key(cache_type, key)}")
+        if failure is not None:
+            cache_metrics.incr(cache_type, "negative_hits")
+        return failure
+
+    def set_failure(self, cache_type: str, key: str, failure: str) -> None:
+        """Record that the upstream lookup for key failed with a failure class."""
+        if not self.negative_enabled:
+            return
+        self.negative.set(f"{cache_type}:{storage_key(cache_type, key)}", failure)
+        cache_metrics.incr(cache_type, f"negative_stores_{failure}")
+
+    async def get_style_cache(self, cache_key: str) -> dict[str, Any] | None:
+        """Get cached style recommendations for a request hash."""
+        data = await self._read_through(
+            "style",
+            cache_key,
+            lambda grace: self.backend.get_entry("style", cache_key, grace),
+        )
+        return data.get("style_data") if data else None
+
+    async def set_style_cache(
+        self, cache_key: str, destination: str, data: dict[str, Any], ttl_hours: float = 12
+    ) -> bool:
+        """Cache style recommendations for a request hash."""
+        stored = {"destination": destination, "style_data": data}
+        local_key = f"style:{cache_key}"
+        self._set_local(local_key, _new_entry(stored, ttl_hours))
+        return await self._store("style", cache_key, local_key, stored, ttl_hours)
+
+    def clear_local(self) -> None:
+        """Drop every entry from the in-process tier, including recorded failures."""
+        self.local.clear()
+        self._reads.clear()
+        self.negative.clear()
+
+    async def drain_refreshes(self, timeout: float = 5.0) -> None:
+        """Wait for background refreshes to finish (called on shutdown)."""
+        await self.refresher.drain(timeout)
+
+    async def flush_writes(self, timeout: float = 5.0) -> None:
+        """Write every queued cache record to the backend (called on shutdown)."""
+        await self.writes.close(timeout)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get backend, in-process tier, negative cache, refresh and write-behind statistics."""
+        return {
+            "backend": self.backend.get_stats(),
+            "local": {"enabled": self.local_enabled, **self.local.get_stats()},
+            "negative": {"enabled": self.negative_enabled, **self.negative.get_stats()},
+            "refresh": self.refresher.get_stats(),
+            "write_behind": {"enabled": self.write_behind_enabled, **self.writes.get_stats()},
+        }
 
 
 # Singleton instance for the enhanced service
@@ -17,16 +17,22 @@
 
 """
 Shared Supabase client with connection pooling for TravelStyle AI application.
-Provides a singleton client instance to avoid creating multiple connections.
+Provides a singleton client instance to avoid creating multiple connections, and
+an async PostgREST client that table queries await on pooled connections.
 """
 
 import logging
 import threading
-import time
+
+from postgrest import AsyncPostgrestClient, AsyncRequestBuilder, AsyncSelectRequestBuilder
+from postgrest.constants import DEFAULT_POSTGREST_CLIENT_HEADERS
 
 from app.core.config import settings
+from app.services.http_clients import UpstreamConfig, http_clients
 from supabase import Client, create_client
 
+from .supabase_config import SupabaseConfig
+
 logger = logging.getLogger(__name__)
 
 
@@ -37,28 +43,29 @@ class SupabaseConnectionError(Exception):
 
 
 class SupabaseClientManager:
-    """Manages a singleton Supabase client instance with connection pooling."""
+    """
+    Manages a singleton Supabase client instance with connection pooling.
+
+    Reads never block: connectivity is probed off the request path by the
+    SupabaseHealthMonitor, which replaces a broken client with swap_client().
+    """
 
     _instance: Client | None = None
     _lock = threading.Lock()
     _initialized = False
-    _last_health_check = 0.0
-    _health_check_interval = 300.0  # 5 minutes
 
     @classmethod
     def get_client(cls) -> Client:
         """Get the singleton Supabase client instance."""
-        if cls._instance is None:
+        client = cls._instance
+        if client is None:
             with cls._lock:
                 if cls._instance is None:
                     cls._instance = cls._create_client()
                     cls._initialized = True
                     logger.info("Supabase client initialized successfully")
-        else:
-            # Perform periodic health check
-            cls._check_connection_health()
-
-        return cls._instance
+                client = cls._instance
+        return client
 
     @classmethod
     def _create_client(cls) -> Client:
@@ -75,31 +82,28 @@ class SupabaseClientManager:
             raise SupabaseConnectionError(f"Failed to create Supabase client: {e}") from e
 
     @classmethod
-    def _check_connection_health(cls) -> None:
-        """Perform periodic health check on the connection."""
-        current_time = time.time()
-        if current_time - cls._last_health_check > cls._health_check_interval:
-            try:
-                # Simple health check - try to access a user table that should exist
-                # Use a more reliable health check that doesn't depend on system tables
-                cls._instance.table("users").select("id").limit(1).execute()
-                cls._last_health_check = current_time
-                logger.debug("Supabase connection health check passed")
-            except Exception as e:
-                # Only log as warning if it's not a missing table error
-                if "does not exist" not in str(e):
-                    logger.warning(f"Supabase connection health check failed: {e}")
-                # Don't reset client for missing table errors - this is normal
-                if "does not exist" not in str(e):
-                    cls.reset_client()
+    def swap_client(cls) -> Client:
+        """
+        Replace the client with a freshly created one.
+
+        The new client is built before it is published with a single assignment,
+        so concurrent get_client() calls see either the old or the new client.
+
+        Raises:
+            SupabaseConnectionError: If the new client cannot be created; the old one stays
+        """
+        client = cls._create_client()
+        cls._instance = client
+        cls._initialized = True
+        logger.info("Supabase client swapped")
+        return client
 
     @classmethod
     def reset_client(cls) -> None:
-        """Reset the client instance (useful for testing or reconnection)."""
+        """Reset the client instance (useful for testing)."""
         with cls._lock:
             cls._instance = None
             cls._initialized = False
-            cls._last_health_check = 0.0
             logger.info("Supabase client reset")
 
     @classmethod
@@ -132,5 +136,86 @@ def test_supabase_connection() -> bool:
     return SupabaseClientManager.test_connection()
 
 
+# PostgREST table queries share one connection pool sized by SupabaseConfig
+SUPABASE_REST_UPSTREAM = "supabase_rest"
+http_clients.register(
+    SUPABASE_REST_UPSTREAM,
+    UpstreamConfig(
+        timeout=float(SupabaseConfig.CONNECTION_TIMEOUT),
+        max_connections=SupabaseConfig.MAX_CONNECTIONS,
+        max_keepalive_connections=SupabaseConfig.MAX_CONNECTIONS,
+    ),
+)
+
+
+class SupabaseDataClient:
+    """
+    Async PostgREST client for table queries.
+
+    Queries are awaited on the event loop rather than run in a worker thread, so
+    concurrency is bounded by SupabaseConfig.MAX_CONNECTIONS instead of the default
+    executor. Connections belong to the running event loop, which lets one instance
+    be created at import time and shared by every service.
+    """
+
+    def __init__(self):
+        """Initialize without opening any connections."""
+        self._client: AsyncPostgrestClient | None = None
+
+    def get_client(self) -> AsyncPostgrestClient:
+        """Get the PostgREST client bound to the running event loop's connection pool."""
+        session = http_clients.get(SUPABASE_REST_UPSTREAM)
+        client = self._client
+        if client is None or client.session is not session:
+            client = self._client = self._create_client(session)
+        return client
+
+    @staticmethod
+    def _create_client(session) -> AsyncPostgrestClient:
+        """Create a PostgREST client sending requests through session."""
+        if not settings.SUPABASE_URL or not settings.SUPABASE_KEY:
+            raise SupabaseConnectionError("Missing Supabase URL or key in configuration")
+
+        headers = {
+            **DEFAULT_POSTGREST_CLIENT_HEADERS,
+            "apikey": settings.SUPABASE_KEY,
+            "Authorization": f"Bearer {settings.SUPABASE_KEY}",
+        }
+        return AsyncPostgrestClient(
+            f"{settings.SUPABASE_URL.rstrip('/')}/rest/v1", headers=headers, http_client=session
+        )
+
+    def reset(self) -> None:
+        """Drop the PostgREST client so the next query builds one on the current pool."""
+        self._client = None
+
+    def table(self, table_name: str) -> AsyncRequestBuilder:
+        """Start a query on a table; the built query's ``execute()`` is awaited."""
+        return self.get_client().from_(table_name)
+
+    from_ = table
+
+
+# Global data client instance
+supabase_data = SupabaseDataClient()
+
+
+def get_supabase_data_client() -> SupabaseDataClient:
+    """Get the shared async PostgREST client for table queries."""
+    return supabase_data
+
+
+def select_projection(
+    client: SupabaseDataClient, table_name: str, projection: str | None = None
+) -> AsyncSelectRequestBuilder:
+    """
+    Start a select on a table or view with the columns of a declared projection.
+
+    Projections are declared per table in SupabaseConfig.TABLES and VIEWS, so a
+    read fetches only the columns its callers use instead of every JSONB column.
+    """
+    return client.table(table_name).select(SupabaseConfig.columns(table_name, projection))
+
+
 # Export the client for backward compatibility
 supabase_client = get_supabase_client()
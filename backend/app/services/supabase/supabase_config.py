@@ -27,19 +27,27 @@ from app.core.config import settings
 
 @dataclass
 class SupabaseTableConfig:
-    """Configuration for a Supabase table."""
+    """Configuration for a Supabase table.
+
+    ``unique_constraints`` lists the columns of the unique constraint that upserts
+    use as their ON CONFLICT target, so it must match a constraint in the schema.
+    ``projections`` names the column lists that reads select (see SupabaseConfig.columns).
+    """
 
     name: str
     primary_key: str = "id"
     unique_constraints: list[str] = None
     indexes: list[str] = None
     rls_enabled: bool = True
+    projections: dict[str, list[str]] = None
 
     def __post_init__(self):
         if self.unique_constraints is None:
             self.unique_constraints = []
         if self.indexes is None:
             self.indexes = []
+        if self.projections is None:
+            self.projections = {}
 
 
 @dataclass
@@ -49,6 +57,39 @@ class SupabaseViewConfig:
     name: str
     security_invoker: bool = False
     rls_enabled: bool = True
+    projections: dict[str, list[str]] = None
+
+    def __post_init__(self):
+        if self.projections is None:
+            self.projections = {}
+
+
+# Profile columns returned by the user profile endpoints (UserProfileResponse)
+PROFILE_COLUMNS = [
+    "id",
+    "email",
+    "first_name",
+    "last_name",
+    "profile_completed",
+    "profile_picture_url",
+    "default_location",
+    "max_bookmarks",
+    "max_conversations",
+    "subscription_tier",
+    "subscription_expires_at",
+    "is_premium",
+    "created_at",
+    "updated_at",
+    "last_login",
+]
+PREFERENCE_COLUMNS = [
+    "style_preferences",
+    "size_info",
+    "travel_patterns",
+    "quick_reply_preferences",
+    "packing_methods",
+    "currency_preferences",
+]
 
 
 class SupabaseConfig:
@@ -58,16 +99,26 @@ class SupabaseConfig:
     URL = settings.SUPABASE_URL
     KEY = settings.SUPABASE_KEY
 
-    # Connection pooling settings
+    # Connection pooling settings (the supabase_rest pool used for async table queries)
     MAX_CONNECTIONS = 10
-    CONNECTION_TIMEOUT = 30
-    HEALTH_CHECK_INTERVAL = 300  # 5 minutes
+    CONNECTION_TIMEOUT = 30  # seconds
+    HEALTH_CHECK_INTERVAL = 300  # 5 minutes between background connectivity probes
+    HEALTH_CHECK_TIMEOUT = 5  # seconds before a probe counts as failed
+    HEALTH_CHECK_TABLE = "system_settings"  # any PostgREST reply proves connectivity
+    HEALTH_CHECK_FAILURE_THRESHOLD = 2  # consecutive failed probes before the client is swapped
+    HEALTH_CHECK_WINDOW = 20  # recent probes the error rate is computed over
+
+    # Point lookup batching (BatchLoader): lookups issued in the same loop tick share one
+    # in_ query; while a query for the same lookups is in flight, new ones wait the window
+    BATCH_WINDOW_SECONDS = 0.002
+    BATCH_MAX_KEYS = 100  # keeps the in_ filter well inside URL length limits
 
     # Cache settings
     DEFAULT_CACHE_TTL = 3600  # 1 hour in seconds
     WEATHER_CACHE_TTL = 3600  # 1 hour
     CULTURAL_CACHE_TTL = 86400  # 24 hours
     CURRENCY_CACHE_TTL = 3600  # 1 hour
+    CLASSIFICATION_CACHE_TTL = 604800  # 7 days
 
     # Rate limiting settings
     CACHE_RATE_LIMIT = 100  # requests per minute
@@ -78,20 +129,40 @@ class SupabaseConfig:
         # Cache tables
         "weather_cache": SupabaseTableConfig(
             name="weather_cache",
-            unique_constraints=["destination"],
-            indexes=["destination", "expires_at"],
+            unique_constraints=["destination_normalized", "api_source"],
+            indexes=["destination_normalized", "expires_at"],
+            projections={"entry": ["weather_data", "expires_at", "created_at"]},
         ),
         "cultural_insights_cache": SupabaseTableConfig(
             name="cultural_insights_cache",
-            unique_constraints=["destination"],
-            indexes=["destination", "expires_at"],
+            unique_constraints=["destination_normalized", "api_source"],
+            indexes=["destination_normalized", "expires_at"],
+            projections={"entry": ["cultural_data", "style_data", "expires_at", "created_at"]},
         ),
         "currency_rates_cache": SupabaseTableConfig(
             name="currency_rates_cache",
-            unique_constraints=["base_currency"],
+            unique_constraints=["base_currency", "api_source"],
             indexes=["base_currency", "expires_at"],
+            projections={"entry": ["rates_data", "expires_at", "created_at"]},
+        ),
+        "message_classification_cache": SupabaseTableConfig(
+            name="message_classification_cache",
+            unique_constraints=["message_hash"],
+            indexes=["message_hash", "expires_at"],
+            projections={"entry": ["category", "classifier_source", "expires_at", "created_at"]},
+        ),
+        "style_recommendations_cache": SupabaseTableConfig(
+            name="style_recommendations_cache",
+            unique_constraints=["cache_key"],
+            indexes=["cache_key", "expires_at"],
+            projections={"entry": ["destination", "style_data", "expires_at", "created_at"]},
         ),
         # Core user tables
+        "profiles": SupabaseTableConfig(
+            name="profiles",
+            unique_constraints=["email"],
+            projections={"profile": PROFILE_COLUMNS},
+        ),
         "users": SupabaseTableConfig(
             name="users",
             unique_constraints=["email", "auth_id"],
@@ -101,6 +172,7 @@ class SupabaseConfig:
             name="user_preferences",
             unique_constraints=["user_id"],
             indexes=["user_id", "created_at"],
+            projections={"profile": PREFERENCE_COLUMNS},
         ),
         "user_auth_tokens": SupabaseTableConfig(
             name="user_auth_tokens",
@@ -115,6 +187,12 @@ class SupabaseConfig:
         "conversations": SupabaseTableConfig(
             name="conversations",
             indexes=["user_id", "created_at", "type", "destination"],
+            projections={
+                # Conversation lists leave out the messages, ui_interactions and
+                # trip_context JSONB columns
+                "summary": ["id", "type", "title", "destination", "created_at", "updated_at"],
+                "recent": ["id", "title", "messages", "created_at", "updated_at"],
+            },
         ),
         "chat_sessions": SupabaseTableConfig(
             name="chat_sessions",
@@ -180,6 +258,12 @@ class SupabaseConfig:
         "user_profile_view": SupabaseViewConfig(
             name="user_profile_view",
             security_invoker=True,
+            projections={
+                "profile": [*PROFILE_COLUMNS, *PREFERENCE_COLUMNS, "selected_style_names"],
+                "chat": ["id", "style_preferences", "packing_methods"],  # read by the AI prompt
+                "picture": ["id", "profile_picture_url"],
+                "names": ["id", "first_name", "last_name"],
+            },
         ),
         "user_style_preferences_summary": SupabaseViewConfig(
             name="user_style_preferences_summary",
@@ -215,6 +299,24 @@ class SupabaseConfig:
         """Get configuration for a specific view."""
         return cls.VIEWS.get(view_name, SupabaseViewConfig(name=view_name))
 
+    @classmethod
+    def columns(cls, name: str, projection: str | None = None) -> str:
+        """Get the select() columns of a projection declared for a table or view.
+
+        Args:
+            name: Table or view name
+            projection: Projection name; None selects every column
+
+        Raises:
+            ValueError: If the projection is not declared for the table or view
+        """
+        if projection is None:
+            return "*"
+        config = cls.TABLES.get(name) or cls.VIEWS.get(name)
+        if config is None or projection not in config.projections:
+            raise ValueError(f"No {projection!r} projection declared for {name}")
+        return ",".join(config.projections[projection])
+
     @classmethod
     def validate_connection_settings(cls) -> bool:
         """Validate that connection settings are properly configured."""
@@ -227,6 +329,7 @@ class SupabaseConfig:
             "weather": cls.WEATHER_CACHE_TTL,
             "cultural": cls.CULTURAL_CACHE_TTL,
             "currency": cls.CURRENCY_CACHE_TTL,
+            "classification": cls.CLASSIFICATION_CACHE_TTL,
         }
         return ttl_map.get(cache_type, cls.DEFAULT_CACHE_TTL)
 
@@ -0,0 +1,190 @@
+# This file is part of TravelSytle AI.
+#
+# Copyright (C) 2025  Trailyn Ventures, LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Background health monitor for the Supabase connection.
+Probes PostgREST on a timer instead of on the request path, tracks probe
+latency and error rate, and replaces the supabase_rest connection pool after
+repeated connectivity failures.
+"""
+
+import asyncio
+import contextlib
+import logging
+import time
+from collections import deque
+from typing import Any
+
+from postgrest import APIError
+
+from app.services.http_clients import http_clients
+from app.utils.metrics import LatencyHistogram
+
+from .supabase_client import (
+    SUPABASE_REST_UPSTREAM,
+    SupabaseClientManager,
+    SupabaseDataClient,
+    get_supabase_data_client,
+)
+from .supabase_config import SupabaseConfig
+
+logger = logging.getLogger(__name__)
+
+
+class SupabaseHealthMonitor:
+    """Periodically probes Supabase and replaces the clients when it stops answering."""
+
+    def __init__(
+        self,
+        data_client: SupabaseDataClient | None = None,
+        interval: float = SupabaseConfig.HEALTH_CHECK_INTERVAL,
+        timeout: float = SupabaseConfig.HEALTH_CHECK_TIMEOUT,
+        failure_threshold: int = SupabaseConfig.HEALTH_CHECK_FAILURE_THRESHOLD,
+        window: int = SupabaseConfig.HEALTH_CHECK_WINDOW,
+    ):
+        """
+        Initialize the monitor without starting it.
+
+        Args:
+            data_client: Client the probe query is sent with (default: the shared one)
+            interval: Seconds between probes
+            timeout: Seconds before a probe counts as failed
+            failure_threshold: Consecutive failed probes before the clients are replaced
+            window: Recent probes the error rate is computed over
+        """
+        self.data_client = data_client or get_supabase_data_client()
+        self.interval = interval
+        self.timeout = timeout
+        self.failure_threshold = failure_threshold
+        self._task: asyncio.Task | None = None
+        self._recent: deque[bool] = deque(maxlen=window)
+        self.latency = LatencyHistogram()
+        self.probes = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.swaps = 0
+        self.last_error: str | None = None
+        self.last_probe_at: float | None = None
+
+    @property
+    def healthy(self) -> bool:
+        """Whether the most recent probe succeeded (True before the first probe)."""
+        return self.consecutive_failures == 0
+
+    def start(self) -> None:
+        """Start probing on the running loop (called from the app lifespan on startup)."""
+        task = self._task
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop probing (called from the app lifespan on shutdown)."""
+        task, self._task = self._task, None
+        if task is not None and task.get_loop() is asyncio.get_running_loop():
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    async def _run(self) -> None:
+        """Probe once at start, then every interval.
+
+        The first probe runs in the background, so startup does not wait for it.
+        Under Lambda the lifespan runs per invocation and the process is frozen
+        between invocations, so that startup probe is usually the only one.
+        """
+        while True:
+            await self.probe()
+            await asyncio.sleep(self.interval)
+
+    async def probe(self) -> bool:
+        """
+        Run one probe query and update the health statistics.
+
+        Any PostgREST reply, including an error response, proves the connection
+        works; only timeouts and transport errors count as failures.
+
+        Returns:
+            True if Supabase answered
+        """
+        started = time.perf_counter()
+        error: str | None = None
+        try:
+            await asyncio.wait_for(
+                self.data_client.table(SupabaseConfig.HEALTH_CHECK_TABLE)
+                .select("id")
+                .limit(1)
+                .execute(),
+                self.timeout,
+            )
+        except APIError:
+            pass
+        except Exception as e:  # pylint: disable=broad-except
+            error = f"{type(e).__name__}: {e}"
+        self.latency.observe(time.perf_counter() - started)
+        self.last_probe_at = time.time()
+        self.probes += 1
+        self._recent.append(error is None)
+
+        if error is None:
+            if self.consecutive_failures:
+                logger.info("Supabase connection recovered")
+            self.consecutive_failures = 0
+            return True
+
+        self.failures += 1
+        self.consecutive_failures += 1
+        self.last_error = error
+        logger.warning(f"Supabase health check failed: {error}")
+        if self.consecutive_failures % self.failure_threshold == 0:
+            await self._replace_clients()
+        return False
+
+    async def _replace_clients(self) -> None:
+        """Recreate the probed data path, then swap the sync auth client as well."""
+        try:
+            await http_clients.reset(SUPABASE_REST_UPSTREAM)
+            self.data_client.reset()
+            self.swaps += 1
+            logger.warning("Supabase data connection pool replaced")
+        except Exception as e:  # pylint: disable=broad-except
+            logger.error(f"Supabase data client reset failed: {e}")
+
+        if not SupabaseClientManager.is_initialized():
+            return
+        try:
+            SupabaseClientManager.swap_client()
+        except Exception as e:  # pylint: disable=broad-except
+            logger.error(f"Supabase client swap failed: {e}")
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get probe counters, recent error rate and probe latency."""
+        recent = len(self._recent)
+        return {
+            "healthy": self.healthy,
+            "probes": self.probes,
+            "failures": self.failures,
+            "consecutive_failures": self.consecutive_failures,
+            "error_rate": (recent - sum(self._recent)) / recent if recent else 0.0,
+            "swaps": self.swaps,
+            "last_error": self.last_error,
+            "last_probe_at": self.last_probe_at,
+            "latency": self.latency.as_dict(),
+        }
+
+
+# Global monitor instance
+supabase_health_monitor = SupabaseHealthMonitor()
@@ -0,0 +1,177 @@
+# This file is part of TravelSytle AI.
+#
+# Copyright (C) 2025  Trailyn Ventures, LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Batching loader for point lookups in TravelStyle AI application.
+Lookups of one table column issued in the same event loop tick are deduplicated
+and sent as a single ``in_`` query on the next tick, and the matching rows are
+handed back to each caller. While a query for the same lookups is still in
+flight, new lookups are held for a short window so overlapping bursts coalesce.
+"""
+
+import asyncio
+import logging
+from collections import defaultdict
+from typing import Any
+
+from .supabase_client import SupabaseDataClient
+from .supabase_config import SupabaseConfig
+
+logger = logging.getLogger(__name__)
+
+# Pending keys of one batch: str(value) -> (value, future shared by its callers)
+Batch = dict[str, tuple[Any, asyncio.Future]]
+
+
+class BatchLoader:
+    """Coalesces concurrent ``eq(field, value)`` lookups on one table into ``in_`` queries."""
+
+    def __init__(
+        self,
+        client: SupabaseDataClient,
+        table_name: str,
+        window: float = SupabaseConfig.BATCH_WINDOW_SECONDS,
+        max_keys: int = SupabaseConfig.BATCH_MAX_KEYS,
+    ):
+        """
+        Initialize the loader.
+
+        Args:
+            client: Async PostgREST client the queries are sent with
+            table_name: Table (or view) the lookups read
+            window: Seconds a batch opened while another is in flight waits for others to join
+            max_keys: Distinct keys per query; a full batch is sent at once
+        """
+        self.client = client
+        self.table_name = table_name
+        self.window = window
+        self.max_keys = max_keys
+        # Batches are per event loop, since their futures belong to one loop
+        self._batches: dict[tuple[asyncio.AbstractEventLoop, str, str], Batch] = {}
+        # Queries in flight per batch key, to tell overlapping lookups from isolated ones
+        self._in_flight: defaultdict[tuple[asyncio.AbstractEventLoop, str, str], int] = defaultdict(
+            int
+        )
+        self._tasks: set[asyncio.Task] = set()
+        self.loads = 0
+        self.deduplicated = 0
+        self.queries = 0
+        self.keys = 0
+
+    async def load(self, field: str, value: Any, columns: str = "*") -> list[dict[str, Any]]:
+        """
+        Get the rows whose field equals value.
+
+        Args:
+            field: Column to match
+            value: Value to match; compared with the column as a string
+            columns: Columns to return
+
+        Returns:
+            Matching rows
+
+        Raises:
+            Exception: Whatever the batch query raised
+        """
+        loop = asyncio.get_running_loop()
+        batch_key = (loop, field, columns)
+        batch = self._batches.get(batch_key)
+        if batch is None:
+            batch = self._batches[batch_key] = {}
+            if self._in_flight[batch_key]:
+                loop.call_later(self.window, self._dispatch, batch_key, batch)
+            else:
+                loop.call_soon(self._dispatch, batch_key, batch)
+
+        self.loads += 1
+        key = str(value)
+        if key in batch:
+            self.deduplicated += 1
+            future = batch[key][1]
+        else:
+            future = loop.create_future()
+            batch[key] = (value, future)
+            if len(batch) >= self.max_keys:
+                self._dispatch(batch_key, batch)
+        # A cancelled caller must not cancel the lookup for the others sharing it;
+        # rows are copied so callers sharing a lookup cannot see each other's changes
+        rows = await asyncio.shield(future)
+        return [dict(row) for row in rows]
+
+    def _dispatch(
+        self, batch_key: tuple[asyncio.AbstractEventLoop, str, str], batch: Batch
+    ) -> None:
+        """Send a batch, unless it was already sent because it filled up."""
+        if self._batches.get(batch_key) is not batch:
+            return
+        del self._batches[batch_key]
+        loop, field, columns = batch_key
+        task = loop.create_task(self._fetch(field, columns, batch))
+        self._tasks.add(task)
+        self._in_flight[batch_key] += 1
+        task.add_done_callback(lambda done: self._finished(batch_key, done))
+
+    def _finished(
+        self, batch_key: tuple[asyncio.AbstractEventLoop, str, str], task: asyncio.Task
+    ) -> None:
+        """Forget a completed batch query."""
+        self._tasks.discard(task)
+        self._in_flight[batch_key] -= 1
+        if not self._in_flight[batch_key]:
+            del self._in_flight[batch_key]
+
+    async def _fetch(self, field: str, columns: str, batch: Batch) -> None:
+        """Run one query for every key in the batch and resolve each key's future."""
+        self.queries += 1
+        self.keys += len(batch)
+        try:
+            if len(batch) == 1:
+                ((value, _future),) = batch.values()
+                query = self.client.table(self.table_name).select(columns).eq(field, value)
+            else:
+                # Rows are grouped by field, so it must be among the returned columns
+                if columns != "*" and field not in columns.split(","):
+                    columns = f"{columns},{field}"
+                values = [value for value, _future in batch.values()]
+                query = self.client.table(self.table_name).select(columns).in_(field, values)
+            response = await query.execute()
+        except Exception as e:  # pylint: disable=broad-except
+            for _value, future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        rows = response.data or []
+        grouped: defaultdict[str, list[dict[str, Any]]] = defaultdict(list)
+        if len(batch) == 1:
+            grouped[next(iter(batch))] = rows
+        else:
+            for row in rows:
+                grouped[str(row.get(field))].append(row)
+        for key, (_value, future) in batch.items():
+            if not future.done():
+                future.set_result(grouped.get(key, []))
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get lookup, deduplication and query counters."""
+        return {
+            "table": self.table_name,
+            "loads": self.loads,
+            "deduplicated": self.deduplicated,
+            "queries": self.queries,
+            "avg_keys_per_query": round(self.keys / self.queries, 2) if self.queries else 0.0,
+        }
@@ -28,6 +28,7 @@ from typing import Any
 from app.services.database.constants import DatabaseTables
 from app.services.database_helpers import db_helpers
 from app.services.rate_limiter import db_rate_limiter
+from app.services.supabase import BatchLoader
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +39,8 @@ class SystemSettingsService:
     def __init__(self):
         """Initialize the system settings service."""
         self.client = db_helpers.client
+        # Concurrent get_setting calls share one query for all their keys
+        self.loader = BatchLoader(self.client, DatabaseTables.SYSTEM_SETTINGS)
 
     async def get_all_settings(self, public_only: bool = False) -> dict[str, Any]:
         """
@@ -56,7 +59,7 @@ class SystemSettingsService:
         try:
             query = self.client.table(DatabaseTables.SYSTEM_SETTINGS).select("*")
 
-            response = await asyncio.to_thread(lambda: query.execute())
+            response = await query.execute()
 
             if not response.data:
                 return {}
@@ -89,17 +92,10 @@ class SystemSettingsService:
             return None
 
         try:
-            response = await asyncio.to_thread(
-                lambda: (
-                    self.client.table(DatabaseTables.SYSTEM_SETTINGS)
-                    .select("setting_value")
-                    .eq("setting_key", setting_key)
-                    .execute()
-                )
-            )
-
-            if response.data and len(response.data) > 0:
-                return response.data[0]["setting_value"]
+            rows = await self.loader.load("setting_key", setting_key, "setting_value")
+
+            if rows:
+                return rows[0]["setting_value"]
 
             return None
 
@@ -107,6 +103,21 @@ class SystemSettingsService:
             logger.error(f"Error retrieving setting {setting_key}: {e}")
             return None
 
+    async def get_settings(self, setting_keys: list[str]) -> dict[str, Any]:
+        """
+        Get several system settings by key in one round trip.
+
+        Args:
+            setting_keys: The setting keys to retrieve
+
+        Returns:
+            Dictionary of setting_key -> setting_value for the keys that were found
+        """
+        values = await asyncio.gather(*(self.get_setting(key) for key in setting_keys))
+        return {
+            key: value for key, value in zip(setting_keys, values, strict=True) if value is not None
+        }
+
     async def get_public_settings(self) -> dict[str, Any]:
         """
         Get all public system settings.
@@ -123,8 +134,6 @@ class SystemSettingsService:
         Returns:
             Dictionary of profile-related settings
         """
-        profile_settings = {}
-
         # Get specific settings that are relevant for profiles
         profile_setting_keys = [
             "clothing_categories",
@@ -133,12 +142,7 @@ class SystemSettingsService:
             "default_packing_methods",
         ]
 
-        for key in profile_setting_keys:
-            value = await self.get_setting(key)
-            if value is not None:
-                profile_settings[key] = value
-
-        return profile_settings
+        return await self.get_settings(profile_setting_keys)
 
     async def get_limits_settings(self, include_enterprise: bool = False) -> dict[str, Any]:
         """
@@ -151,11 +155,13 @@ class SystemSettingsService:
         limits_settings = {"free": {}, "paid": {}, "premium": {}}
 
         # Get the unified tier definitions
-        free_tier = await self.get_setting("subscription_tier_free")
-        premium_tier = await self.get_setting("subscription_tier_premium")
-        enterprise_tier = (
-            await self.get_setting("subscription_tier_enterprise") if include_enterprise else None
-        )
+        tier_keys = ["subscription_tier_free", "subscription_tier_premium"]
+        if include_enterprise:
+            tier_keys.append("subscription_tier_enterprise")
+        tier_settings = await self.get_settings(tier_keys)
+        free_tier = tier_settings.get("subscription_tier_free")
+        premium_tier = tier_settings.get("subscription_tier_premium")
+        enterprise_tier = tier_settings.get("subscription_tier_enterprise")
 
         # Process free tier limits
         if free_tier:
@@ -241,8 +247,6 @@ class SystemSettingsService:
         Returns:
             Dictionary of feature flag settings
         """
-        feature_settings = {}
-
         # Get specific feature flag settings
         feature_setting_keys = [
             "style_recommendation_enabled",
@@ -250,12 +254,7 @@ class SystemSettingsService:
             "analytics_collection_enabled",
         ]
 
-        for key in feature_setting_keys:
-            value = await self.get_setting(key)
-            if value is not None:
-                feature_settings[key] = value
-
-        return feature_settings
+        return await self.get_settings(feature_setting_keys)
 
     async def get_cache_settings(self) -> dict[str, Any]:
         """
@@ -264,8 +263,6 @@ class SystemSettingsService:
         Returns:
             Dictionary of cache duration settings
         """
-        cache_settings = {}
-
         # Get specific cache settings
         cache_setting_keys = [
             "weather_cache_duration_hours",
@@ -274,12 +271,7 @@ class SystemSettingsService:
             "chat_session_timeout_hours",
         ]
 
-        for key in cache_setting_keys:
-            value = await self.get_setting(key)
-            if value is not None:
-                cache_settings[key] = value
-
-        return cache_settings
+        return await self.get_settings(cache_setting_keys)
 
     async def get_subscription_settings(self) -> dict[str, Any]:
         """
@@ -290,14 +282,21 @@ class SystemSettingsService:
         """
         subscription_settings = {}
 
-        # Get subscription tier constants
-        subscription_tiers = await self.get_setting("subscription_tiers")
-        subscription_tier_order = await self.get_setting("subscription_tier_order")
-
-        # Get the unified tier definitions
-        free_tier = await self.get_setting("subscription_tier_free")
-        premium_tier = await self.get_setting("subscription_tier_premium")
-        enterprise_tier = await self.get_setting("subscription_tier_enterprise")
+        # Get subscription tier constants and the unified tier definitions
+        tier_settings = await self.get_settings(
+            [
+                "subscription_tiers",
+                "subscription_tier_order",
+                "subscription_tier_free",
+                "subscription_tier_premium",
+                "subscription_tier_enterprise",
+            ]
+        )
+        subscription_tiers = tier_settings.get("subscription_tiers")
+        subscription_tier_order = tier_settings.get("subscription_tier_order")
+        free_tier = tier_settings.get("subscription_tier_free")
+        premium_tier = tier_settings.get("subscription_tier_premium")
+        enterprise_tier = tier_settings.get("subscription_tier_enterprise")
 
         # Process tier definitions
         tiers = {}
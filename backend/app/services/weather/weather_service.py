@@ -22,10 +22,13 @@ import logging
 from datetime import UTC, datetime
 from typing import Any
 
-import httpx
-
 from app.core.config import settings
+from app.services.destination import canonical_destination_key
+from app.services.http_clients import http_clients
 from app.services.supabase import enhanced_supabase_cache
+from app.utils.metrics import cache_metrics
+from app.utils.negative_cache import classify_failure
+from app.utils.single_flight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
@@ -36,10 +39,14 @@ class WeatherService:
     # pylint: disable=too-few-public-methods
 
     def __init__(self):
-        """Initialize the WeatherService with API credentials and timeout."""
+        """Initialize the WeatherService with API credentials."""
         self.base_url = settings.VISUALCROSSING_BASE_URL
         self.api_key = settings.VISUALCROSSING_API_KEY
-        self.timeout = 15.0
+        self._single_flight = SingleFlight[dict[str, Any] | None]()
+        # Expired cache entries are served while this renews them
+        enhanced_supabase_cache.register_refresher(
+            "weather", lambda destination: self.get_weather_data(destination, force_refresh=True)
+        )
 
     async def get_weather_data(
         self,
@@ -47,6 +54,7 @@ class WeatherService:
         dates: list[str] | None = None,
         state: str | None = None,
         country: str | None = None,
+        force_refresh: bool = False,
     ) -> dict[str, Any] | None:
         """Get comprehensive weather data for destination using Visual Crossing API.
 
@@ -55,14 +63,45 @@ class WeatherService:
             dates: Optional list of dates for date range queries.
             state: Optional state (used for building location string).
             country: Optional country (used for building location string).
+            force_refresh: Skip the cache and fetch fresh weather data.
 
         Returns:
             Weather data dictionary or None if error.
         """
-        # Check cache first
-        cached_data = await enhanced_supabase_cache.get_weather_cache(destination)
-        if cached_data:
-            return cached_data
+        # Concurrent requests for the same location and dates share one fetch, whatever
+        # spelling of the destination they use
+        key = (
+            canonical_destination_key(destination),
+            tuple(dates) if dates else None,
+            state,
+            country,
+            force_refresh,
+        )
+        return await self._single_flight.do(
+            key,
+            lambda: self._fetch_weather_data(destination, dates, state, country, force_refresh),
+        )
+
+    async def _fetch_weather_data(
+        self,
+        destination: str,
+        dates: list[str] | None,
+        state: str | None,
+        country: str | None,
+        force_refresh: bool = False,
+    ) -> dict[str, Any] | None:
+        """Fetch weather data from the cache or the Visual Crossing API."""
+        # Check cache first (unless force refresh)
+        if not force_refresh:
+            cached_data = await enhanced_supabase_cache.get_weather_cache(destination)
+            if cached_data:
+                return cached_data
+
+        # Destinations that just failed (e.g. unresolvable phrases) fail fast
+        failure = enhanced_supabase_cache.get_failure("weather", destination)
+        if failure is not None:
+            logger.info("Skipping weather fetch after recent %s failure", failure)
+            return None
 
         try:
             # Build location string - Visual Crossing accepts addresses directly
@@ -89,15 +128,17 @@ class WeatherService:
                 "include": "current,days",
             }
 
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url, params=params)
-                response.raise_for_status()
+            async with http_clients.session("weather") as client:
+                with cache_metrics.track("weather", "upstream"):
+                    response = await client.get(url, params=params)
+                    response.raise_for_status()
                 data = response.json()
 
                 current = data.get("currentConditions", {})
                 days = data.get("days", [])
 
                 if not current and not days:
+                    enhanced_supabase_cache.set_failure("weather", destination, "no_data")
                     return None
 
                 # Process current conditions
@@ -189,6 +230,7 @@ class WeatherService:
 
         except Exception as e:  # pylint: disable=broad-except
             logger.error("Weather service error: %s", type(e).__name__)
+            enhanced_supabase_cache.set_failure("weather", destination, classify_failure(e))
             return None
 
     def _map_conditions_to_icon(self, conditions: str) -> str:
@@ -229,6 +271,10 @@ class WeatherService:
         rain_count = sum(1 for condition in conditions if condition in rain_conditions)
         return int((rain_count / len(conditions)) * 100) if conditions else 0
 
+    def get_stats(self) -> dict[str, Any]:
+        """Get request coalescing statistics."""
+        return {"single_flight": self._single_flight.get_stats()}
+
 
 # Singleton instance
 weather_service = WeatherService()
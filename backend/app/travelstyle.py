@@ -20,6 +20,7 @@ TravelStyle AI FastAPI main application entrypoint.
 Initializes the FastAPI app, middleware, routers, and error handlers.
 """
 
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 
@@ -28,8 +29,11 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from mangum import Mangum
 
-from app.api.v1 import auth, chat, currency, recommendations, user
+from app.api.v1 import auth, chat, currency, internal, recommendations, user
 from app.core.config import settings
+from app.services.cache_warming import CacheWarmer, is_cache_warming_event
+from app.services.http_clients import http_clients
+from app.services.supabase import enhanced_supabase_cache, supabase_health_monitor
 from app.utils.error_handlers import custom_http_exception_handler
 
 # Logging configuration
@@ -44,9 +48,19 @@ async def lifespan(fastapi_app: FastAPI):  # pylint: disable=unused-argument
     """Application lifespan manager for startup and shutdown events."""
     # Startup
     logger.info("Starting TravelStyle AI application...")
+    await http_clients.start()
+    supabase_health_monitor.start()
     yield
     # Shutdown
     logger.info("Shutting down TravelStyle AI application...")
+    await supabase_health_monitor.stop()
+    # Let in-flight cache refreshes finish while their HTTP clients are open,
+    # then write every queued cache row before the process can be frozen
+    await enhanced_supabase_cache.drain_refreshes()
+    await enhanced_supabase_cache.flush_writes()
+    # Release backend connections bound to this event loop (Mangum runs one per invocation)
+    await enhanced_supabase_cache.backend.close()
+    await http_clients.aclose()
 
 
 # Create FastAPI application
@@ -126,6 +140,9 @@ travelstyle_app.include_router(user.router, prefix=f"{settings.API_V1_STR}/users
 travelstyle_app.include_router(
     currency.router, prefix=f"{settings.API_V1_STR}/currency", tags=["currency"]
 )
+travelstyle_app.include_router(
+    internal.router, prefix=f"{settings.API_V1_STR}/internal", tags=["internal"]
+)
 
 
 @travelstyle_app.get("/")
@@ -140,6 +157,18 @@ async def health_check():
     return {"status": "healthy", "cache": "supabase"}
 
 
+def _run_until_complete(coro):
+    """Run a coroutine on the invocation thread's event loop, creating one if needed."""
+    try:
+        loop = asyncio.get_event_loop()
+    except RuntimeError:
+        loop = None
+    if loop is None or loop.is_closed():
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+    return loop.run_until_complete(coro)
+
+
 def handler(event, context):
     logger.info(f"Lambda invoked with event: {event}")
     logger.info(f"Event path: {event.get('path', 'NO_PATH')}")
@@ -153,9 +182,19 @@ def handler(event, context):
         logger.info(f"SUPABASE_URL set: {bool(settings.SUPABASE_URL)}")
         logger.info(f"SUPABASE_KEY set: {bool(settings.SUPABASE_KEY)}")
 
+        # Scheduled events warm the caches instead of serving a request
+        if is_cache_warming_event(event):
+            report = _run_until_complete(CacheWarmer().run())
+            logger.info(f"Cache warming report: {report}")
+            return report
+
         # Use Mangum to handle the FastAPI app
         mangum_handler = Mangum(travelstyle_app)
         response = mangum_handler(event, context)
+
+        # The lifespan shutdown flushes queued cache writes; catch any queued after it
+        if enhanced_supabase_cache.writes.pending:
+            _run_until_complete(enhanced_supabase_cache.flush_writes())
         logger.info(f"Lambda response: {response}")
         print(f"Lambda response: {response}")
         return response
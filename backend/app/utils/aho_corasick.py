@@ -0,0 +1,106 @@
+# This file is part of TravelSytle AI.
+#
+# Copyright (C) 2025  Trailyn Ventures, LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Aho-Corasick multi-pattern matcher for TravelStyle AI application.
+Finds every occurrence of a fixed set of patterns in a single pass over the text.
+"""
+
+from collections import deque
+from collections.abc import Iterator
+
+
+class AhoCorasick[T]:
+    """Keyword automaton that reports all pattern matches in linear time."""
+
+    def __init__(self):
+        """Initialize an empty automaton."""
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._output: list[list[tuple[int, T]]] = [[]]
+        self._built = False
+
+    def __len__(self) -> int:
+        """Number of automaton states."""
+        return len(self._goto)
+
+    def add(self, pattern: str, value: T) -> None:
+        """
+        Add a pattern to the automaton.
+
+        Args:
+            pattern: Non-empty text to match
+            value: Value reported for every match of the pattern
+        """
+        if not pattern:
+            raise ValueError("Pattern must not be empty")
+
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+                self._goto[state][char] = next_state
+            state = next_state
+
+        self._output[state].append((len(pattern), value))
+        self._built = False
+
+    def build(self) -> None:
+        """Compute failure links breadth-first and merge outputs along them."""
+        # Depth-one states fail back to the root, which is already their default
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                self._output[next_state] = (
+                    self._output[next_state] + self._output[self._fail[next_state]]
+                )
+
+        self._built = True
+
+    def iter_matches(self, text: str) -> Iterator[tuple[int, int, T]]:
+        """
+        Scan text once and yield every pattern occurrence.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Iterator of (start, end, value) tuples ordered by end position
+        """
+        if not self._built:
+            self.build()
+
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for length, value in output[state]:
+                yield index - length + 1, index + 1, value
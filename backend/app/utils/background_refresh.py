@@ -0,0 +1,114 @@
+# This file is part of TravelSytle AI.
+#
+# Copyright (C) 2025  Trailyn Ventures, LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Background refresh scheduling for TravelStyle AI application.
+Runs at most one fire-and-forget refresh per key so callers can keep serving a
+cached value while it is renewed.
+"""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class BackgroundRefresher:
+    """Keyed, bounded scheduler of background refresh tasks."""
+
+    def __init__(self, max_pending: int = 32):
+        """
+        Initialize with no refreshes pending.
+
+        Args:
+            max_pending: Maximum refreshes in flight; further requests are dropped
+        """
+        self.max_pending = max_pending
+        self._tasks: dict[Hashable, asyncio.Task[Any]] = {}
+
+        # Statistics
+        self.scheduled = 0
+        self.deduplicated = 0
+        self.dropped = 0
+        self.failures = 0
+
+    def schedule(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> bool:
+        """
+        Start a background refresh for key unless one is already running.
+
+        Args:
+            key: Hashable key identifying the cached value
+            func: Zero-argument coroutine function performing the refresh
+
+        Returns:
+            True if a new refresh was started
+        """
+        task = self._tasks.get(key)
+        if task is not None and not task.done():
+            self.deduplicated += 1
+            return False
+        if len(self._tasks) >= self.max_pending:
+            self.dropped += 1
+            logger.debug("Background refresh dropped for %s: queue full", key)
+            return False
+
+        self.scheduled += 1
+        task = asyncio.ensure_future(self._run(key, func))
+        self._tasks[key] = task
+        task.add_done_callback(lambda done: self._finish(key, done))
+        return True
+
+    async def _run(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> None:
+        """Run one refresh, logging instead of raising on failure."""
+        try:
+            await func()
+        except Exception as e:  # pylint: disable=broad-except
+            self.failures += 1
+            logger.warning("Background refresh failed for %s: %s", key, e)
+
+    def _finish(self, key: Hashable, task: asyncio.Task[Any]) -> None:
+        """Forget a completed refresh."""
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+
+    async def drain(self, timeout: float = 5.0) -> None:
+        """
+        Wait for pending refreshes on the running loop (e.g. before shutdown).
+
+        Args:
+            timeout: Seconds to wait before cancelling what is still running
+        """
+        loop = asyncio.get_running_loop()
+        pending = [task for task in self._tasks.values() if task.get_loop() is loop]
+        if not pending:
+            return
+        _done, still_running = await asyncio.wait(pending, timeout=timeout)
+        for task in still_running:
+            task.cancel()
+        await asyncio.gather(*still_running, return_exceptions=True)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get scheduling statistics and the number of refreshes in flight."""
+        return {
+            "scheduled": self.scheduled,
+            "deduplicated": self.deduplicated,
+            "dropped": self.dropped,
+            "failures": self.failures,
+            "in_flight": len(self._tasks),
+        }
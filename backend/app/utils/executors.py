@@ -0,0 +1,203 @@
+# This file is part of TravelSytle AI.
+#
+# Copyright (C) 2025  Trailyn Ventures, LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Named thread pools for blocking calls in TravelStyle AI application.
+Each dependency class (db, auth, media) gets its own bounded pool, so a slow
+Cloudinary upload cannot occupy the threads that Supabase auth calls need, and
+each pool reports its queue depth, wait time and run time.
+"""
+
+import asyncio
+import atexit
+import contextvars
+import functools
+import logging
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
+from app.core.config import settings
+from app.utils.metrics import LatencyHistogram
+
+logger = logging.getLogger(__name__)
+
+
+class ExecutorSaturatedError(RuntimeError):
+    """Raised when a pool already has its maximum number of calls waiting."""
+
+    pass
+
+
+@dataclass(frozen=True)
+class ExecutorConfig:
+    """Size of one pool; None falls back to settings."""
+
+    max_workers: int
+    max_queue: int | None = None
+
+
+# Blocking dependency classes with their worker threads
+EXECUTORS: dict[str, ExecutorConfig] = {
+    "db": ExecutorConfig(max_workers=settings.EXECUTOR_DB_WORKERS),  # SQLite cache backend
+    "auth": ExecutorConfig(max_workers=settings.EXECUTOR_AUTH_WORKERS),  # Supabase auth client
+    "media": ExecutorConfig(max_workers=settings.EXECUTOR_MEDIA_WORKERS),  # Cloudinary uploader
+}
+
+
+class BoundedExecutor:
+    """Thread pool with a bounded wait queue and wait/run time histograms."""
+
+    def __init__(self, name: str, max_workers: int, max_queue: int):
+        """
+        Initialize the pool; threads start on first use.
+
+        Args:
+            name: Pool name, used as the thread name prefix
+            max_workers: Threads running calls at once
+            max_queue: Calls allowed to wait for a thread before run() rejects more
+        """
+        self.name = name
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._pool = ThreadPoolExecutor(max_workers, thread_name_prefix=f"{name}-executor")
+        self._lock = threading.Lock()
+        self.queued = 0
+        self.running = 0
+        self.completed = 0
+        self.errors = 0
+        self.rejected = 0
+        self.wait = LatencyHistogram()
+        self.run_time = LatencyHistogram()
+
+    async def run[R](self, func: Callable[..., R], /, *args: Any, **kwargs: Any) -> R:
+        """
+        Run a blocking call on the pool and await its result.
+
+        Context variables are copied into the worker thread, as asyncio.to_thread does.
+
+        Raises:
+            ExecutorSaturatedError: If max_queue calls are already waiting
+        """
+        with self._lock:
+            if self.queued >= self.max_queue:
+                self.rejected += 1
+                raise ExecutorSaturatedError(
+                    f"{self.name} executor has {self.queued} calls waiting"
+                )
+            self.queued += 1
+
+        call = functools.partial(contextvars.copy_context().run, func, *args, **kwargs)
+        future: Future[R] = self._pool.submit(self._call, call, time.perf_counter())
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            # A call cancelled before a thread picked it up never leaves the queue itself
+            if future.cancel():
+                with self._lock:
+                    self.queued -= 1
+            raise
+
+    def _call[R](self, call: Callable[[], R], submitted: float) -> R:
+        """Worker-thread wrapper that records wait and run times."""
+        started = time.perf_counter()
+        with self._lock:
+            self.queued -= 1
+            self.running += 1
+            self.wait.observe(started - submitted)
+        failed = False
+        try:
+            return call()
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            with self._lock:
+                self.running -= 1
+                self.completed += 1
+                self.errors += failed
+                self.run_time.observe(time.perf_counter() - started)
+
+    def shutdown(self) -> None:
+        """Stop accepting calls; calls already running finish in the background."""
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get queue depth, busy threads, call counters and wait/run time histograms."""
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "queued": self.queued,
+                "running": self.running,
+                "completed": self.completed,
+                "errors": self.errors,
+                "rejected": self.rejected,
+                "wait": self.wait.as_dict(),
+                "run": self.run_time.as_dict(),
+            }
+
+
+class ExecutorRegistry:
+    """Owns one BoundedExecutor per blocking dependency class."""
+
+    def __init__(self, executors: dict[str, ExecutorConfig] = EXECUTORS):
+        """
+        Initialize the registry without starting any threads.
+
+        Args:
+            executors: Pool name -> pool configuration
+        """
+        self.configs = dict(executors)
+        self._executors: dict[str, BoundedExecutor] = {}
+
+    def get(self, name: str) -> BoundedExecutor:
+        """Get the pool for a dependency class, creating it on first use."""
+        executor = self._executors.get(name)
+        if executor is None:
+            if name not in self.configs:
+                raise ValueError(f"Unknown executor: {name}")
+            config = self.configs[name]
+            executor = self._executors[name] = BoundedExecutor(
+                name, config.max_workers, config.max_queue or settings.EXECUTOR_MAX_QUEUE
+            )
+        return executor
+
+    async def run[R](self, name: str, func: Callable[..., R], /, *args: Any, **kwargs: Any) -> R:
+        """Run a blocking call on the named pool (see BoundedExecutor.run)."""
+        return await self.get(name).run(func, *args, **kwargs)
+
+    def shutdown(self) -> None:
+        """Shut every pool down (registered to run at process exit)."""
+        executors, self._executors = self._executors, {}
+        for executor in executors.values():
+            executor.shutdown()
+
+    def get_stats(self) -> dict[str, dict[str, Any]]:
+        """Get statistics for every pool that has been used."""
+        return {name: executor.get_stats() for name, executor in self._executors.items()}
+
+
+# Global registry instance
+executors = ExecutorRegistry()
+
+# Not part of the app lifespan: under Mangum that runs on every Lambda invocation,
+# which would rebuild the pools and reset their statistics each request
+atexit.register(executors.shutdown)
@@ -0,0 +1,227 @@
+# This file is part of TravelSytle AI.
+#
+# Copyright (C) 2025  Trailyn Ventures, LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Cache metrics for TravelStyle AI application.
+Counts lookup outcomes and records latency histograms per cache type, and
+periodically logs them as a single JSON line.
+"""
+
+import json
+import logging
+import time
+from bisect import bisect_left
+from collections import Counter, defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds in milliseconds; the last bucket catches everything slower
+LATENCY_BUCKETS_MS = (0.1, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+# Lookup outcomes that answer a get_*_cache call; each lookup records exactly one
+LOOKUP_OUTCOMES = ("local_hits", "remote_hits", "stale_hits", "misses", "expired")
+HIT_OUTCOMES = ("local_hits", "remote_hits", "stale_hits")
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram with approximate percentiles."""
+
+    def __init__(self, buckets_ms: tuple[float, ...] = LATENCY_BUCKETS_MS):
+        """
+        Initialize an empty histogram.
+
+        Args:
+            buckets_ms: Sorted bucket upper bounds in milliseconds
+        """
+        self.buckets_ms = buckets_ms
+        self.counts = [0] * (len(buckets_ms) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, seconds: float) -> None:
+        """Record one duration."""
+        ms = seconds * 1000
+        self.counts[bisect_left(self.buckets_ms, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    def percentile(self, fraction: float) -> float:
+        """
+        Estimate a percentile as the upper bound of the bucket that contains it.
+
+        Args:
+            fraction: Percentile as a fraction, e.g. 0.95
+
+        Returns:
+            Upper bound in milliseconds (the maximum seen for the last bucket)
+        """
+        if not self.count:
+            return 0.0
+        rank = fraction * self.count
+        seen = 0
+        for bound, bucket_count in zip(self.buckets_ms, self.counts, strict=False):
+            seen += bucket_count
+            if seen >= rank:
+                return min(bound, self.max_ms)
+        return self.max_ms
+
+    def as_dict(self) -> dict[str, Any]:
+        """Get count, mean, max, percentiles and per-bucket counts."""
+        buckets = {
+            f"le_{bound:g}ms": n for bound, n in zip(self.buckets_ms, self.counts, strict=False)
+        }
+        buckets["inf"] = self.counts[-1]
+        return {
+            "count": self.count,
+            "avg_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 3),
+            "p50_ms": self.percentile(0.5),
+            "p95_ms": self.percentile(0.95),
+            "p99_ms": self.percentile(0.99),
+            "buckets": buckets,
+        }
+
+
+class CacheMetrics:
+    """Per-cache-type counters and latency histograms."""
+
+    def __init__(self, log_interval_seconds: float = 300.0):
+        """
+        Initialize with no recorded events.
+
+        Args:
+            log_interval_seconds: Minimum seconds between summary log lines; 0 disables them
+        """
+        self.log_interval_seconds = log_interval_seconds
+        self._counters: defaultdict[str, Counter[str]] = defaultdict(Counter)
+        self._latency: defaultdict[str, dict[str, LatencyHistogram]] = defaultdict(dict)
+        self._last_log = time.monotonic()
+
+    def incr(self, cache_type: str, event: str, amount: int = 1) -> None:
+        """Increment an event counter such as "rate_limited_reads"."""
+        self._counters[cache_type][event] += amount
+
+    def observe(self, cache_type: str, stage: str, seconds: float) -> None:
+        """Record a duration for a stage ("local", "remote" or "upstream")."""
+        histogram = self._latency[cache_type].get(stage)
+        if histogram is None:
+            histogram = self._latency[cache_type][stage] = LatencyHistogram()
+        histogram.observe(seconds)
+
+    def record_lookup(self, cache_type: str, outcome: str, key: str, seconds: float) -> None:
+        """
+        Record the outcome and total latency of one get_*_cache call.
+
+        Args:
+            cache_type: Cache type, e.g. "weather"
+            outcome: One of LOOKUP_OUTCOMES
+            key: Canonical cache key, included in the debug log line
+            seconds: Time spent answering the lookup
+        """
+        self.incr(cache_type, outcome)
+        self.observe(cache_type, "lookup", seconds)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                json.dumps(
+                    {
+                        "event": "cache_lookup",
+                        "cache_type": cache_type,
+                        "key": key,
+                        "outcome": outcome,
+                        "latency_ms": round(seconds * 1000, 3),
+                    }
+                )
+            )
+        self.maybe_log_summary()
+
+    @contextmanager
+    def track(self, cache_type: str, stage: str) -> Iterator[None]:
+        """
+        Time a block, counting calls and errors for the stage.
+
+        Args:
+            cache_type: Cache type the block serves
+            stage: Stage name, e.g. "upstream"
+        """
+        started = time.perf_counter()
+        self.incr(cache_type, f"{stage}_calls")
+        try:
+            yield
+        except BaseException:
+            self.incr(cache_type, f"{stage}_errors")
+            raise
+        finally:
+            self.observe(cache_type, stage, time.perf_counter() - started)
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Get counters, hit rate and latency histograms for every cache type."""
+        result: dict[str, dict[str, Any]] = {}
+        for cache_type in sorted(self._counters.keys() | self._latency.keys()):
+            counters = self._counters[cache_type]
+            lookups = sum(counters[outcome] for outcome in LOOKUP_OUTCOMES)
+            hits = sum(counters[outcome] for outcome in HIT_OUTCOMES)
+            result[cache_type] = {
+                "counters": dict(counters),
+                "lookups": lookups,
+                "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+                "latency": {
+                    stage: histogram.as_dict()
+                    for stage, histogram in self._latency[cache_type].items()
+                },
+            }
+        return result
+
+    def maybe_log_summary(self) -> None:
+        """Log a JSON summary if the log interval has elapsed since the last one."""
+        if self.log_interval_seconds <= 0:
+            return
+        now = time.monotonic()
+        if now - self._last_log < self.log_interval_seconds:
+            return
+        self._last_log = now
+        self.log_summary()
+
+    def log_summary(self) -> None:
+        """Log counters and latency percentiles as one JSON line."""
+        summary = {
+            cache_type: {
+                "counters": stats["counters"],
+                "hit_rate": stats["hit_rate"],
+                "latency": {
+                    stage: {key: value for key, value in histogram.items() if key != "buckets"}
+                    for stage, histogram in stats["latency"].items()
+                },
+            }
+            for cache_type, stats in self.snapshot().items()
+        }
+        logger.info(json.dumps({"event": "cache_metrics", "caches": summary}))
+
+    def reset(self) -> None:
+        """Drop all counters and histograms."""
+        self._counters.clear()
+        self._latency.clear()
+
+
+# Global cache metrics instance
+cache_metrics = CacheMetrics(settings.CACHE_METRICS_LOG_INTERVAL_SECONDS)
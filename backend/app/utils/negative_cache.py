@@ -0,0 +1,97 @@
+# This file is part of TravelSytle AI.
+#
+# Copyright (C) 2025  Trailyn Ventures, LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Negative caching for TravelStyle AI application.
+Remembers recently failed upstream lookups for a short time, so repeated
+requests for a bad key fail fast instead of waiting on the upstream API again.
+"""
+
+from typing import Any
+
+import httpx
+
+from app.utils.ttl_cache import TTLCache
+
+# Failure classes where the upstream answered, so retrying soon gives the same answer
+DEFINITIVE_FAILURES = frozenset({"not_found", "no_data"})
+
+
+def classify_failure(error: BaseException) -> str:
+    """
+    Map an upstream call exception to a failure class.
+
+    Returns:
+        "not_found" for 400/404/422 replies (e.g. an unresolvable location),
+        "timeout", "unavailable" for 5xx and 429 replies or connection errors,
+        or "error" for anything else
+    """
+    if isinstance(error, httpx.TimeoutException):
+        return "timeout"
+    if isinstance(error, httpx.HTTPStatusError):
+        status = error.response.status_code if error.response is not None else 0
+        if status in (400, 404, 422):
+            return "not_found"
+        if status == 429 or status >= 500:
+            return "unavailable"
+        return "error"
+    if isinstance(error, httpx.RequestError):
+        return "unavailable"
+    return "error"
+
+
+class NegativeCache:
+    """Bounded store of failure classes for keys whose upstream lookup failed."""
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl_seconds: float = 300.0,
+        transient_ttl_seconds: float = 30.0,
+    ):
+        """
+        Initialize an empty cache.
+
+        Args:
+            maxsize: Keys held before the least recently used is evicted
+            ttl_seconds: How long definitive failures (DEFINITIVE_FAILURES) are remembered
+            transient_ttl_seconds: How long timeouts and upstream errors are remembered
+        """
+        self.ttl_seconds = ttl_seconds
+        self.transient_ttl_seconds = transient_ttl_seconds
+        self.failures = TTLCache[str](maxsize=maxsize, ttl_seconds=ttl_seconds)
+
+    def get(self, key: str) -> str | None:
+        """Get the failure class recorded for key, or None if it has none."""
+        return self.failures.get(key)
+
+    def set(self, key: str, failure: str) -> None:
+        """Record a failure class for key."""
+        ttl = self.ttl_seconds if failure in DEFINITIVE_FAILURES else self.transient_ttl_seconds
+        self.failures.set(key, failure, ttl)
+
+    def delete(self, key: str) -> None:
+        """Forget the failure recorded for key, e.g. after a successful fetch."""
+        self.failures.delete(key)
+
+    def clear(self) -> None:
+        """Forget every failure."""
+        self.failures.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get size and hit/miss statistics."""
+        return self.failures.get_stats()
@@ -0,0 +1,104 @@
+# This file is part of TravelSytle AI.
+#
+# Copyright (C) 2025  Trailyn Ventures, LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Single-flight request coalescing for TravelStyle AI application.
+Concurrent callers asking for the same key share one in-flight call instead of
+each hitting the upstream API.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+
+class _Flight[T]:
+    """One shared call and the number of callers awaiting it."""
+
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Task[T]):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight[T]:
+    """Keyed coalescing of concurrent async calls."""
+
+    def __init__(self):
+        """Initialize with no calls in flight."""
+        self._calls: dict[Hashable, _Flight[T]] = {}
+
+        # Statistics
+        self.calls = 0
+        self.coalesced = 0
+        self.abandoned = 0
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run func for key, or join the call already in flight for key.
+
+        The shared call runs in its own task, so a caller that is cancelled (for
+        example by a timeout) does not cancel it for the other callers. When the
+        last caller is cancelled the shared call is cancelled too, so abandoned
+        lookups (such as a discarded prefetch) stop their upstream request.
+
+        Args:
+            key: Hashable key identifying equivalent calls
+            func: Zero-argument coroutine function performing the call
+
+        Returns:
+            The result of the shared call; its exception is raised to every caller
+        """
+        flight = self._calls.get(key)
+        if flight is not None and flight.task.get_loop() is asyncio.get_running_loop():
+            self.coalesced += 1
+        else:
+            self.calls += 1
+            flight = _Flight(asyncio.ensure_future(func()))
+            self._calls[key] = flight
+            flight.task.add_done_callback(lambda done: self._finish(key, done))
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            if flight.waiters == 1 and not flight.task.done():
+                self.abandoned += 1
+                flight.task.cancel()
+            raise
+        finally:
+            flight.waiters -= 1
+
+    def _finish(self, key: Hashable, task: asyncio.Task[T]) -> None:
+        """Forget a completed call and mark its exception as retrieved."""
+        flight = self._calls.get(key)
+        if flight is not None and flight.task is task:
+            del self._calls[key]
+        if not task.cancelled():
+            task.exception()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get the number of calls made, coalesced, abandoned and in flight."""
+        total = self.calls + self.coalesced
+        return {
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+            "coalesced_rate": round(self.coalesced / total, 4) if total else 0.0,
+            "abandoned": self.abandoned,
+            "in_flight": len(self._calls),
+        }
@@ -0,0 +1,192 @@
+# This file is part of TravelSytle AI.
+#
+# Copyright (C) 2025  Trailyn Ventures, LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Write-behind buffering for TravelStyle AI application.
+Accepts rows immediately and writes them to storage later in batches, keeping
+only the newest row per key so repeated writes cost one upsert.
+"""
+
+import asyncio
+import contextlib
+import logging
+from collections import OrderedDict, defaultdict
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Writes rows for one table and returns how many were stored
+BatchWriter = Callable[[str, list[dict[str, Any]]], Awaitable[int]]
+
+
+class WriteBehindQueue:
+    """Bounded, coalescing queue of rows flushed in batches per table."""
+
+    def __init__(
+        self,
+        write: BatchWriter,
+        max_pending: int = 256,
+        batch_size: int = 50,
+        flush_interval: float = 1.0,
+    ):
+        """
+        Initialize an empty queue.
+
+        Args:
+            write: Coroutine function writing a batch of rows to a table
+            max_pending: Maximum distinct rows held; writes beyond it are dropped
+            batch_size: Rows per flush; reaching it triggers a flush right away
+            flush_interval: Seconds a row may wait before it is flushed
+        """
+        self.write = write
+        self.max_pending = max_pending
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._pending: OrderedDict[tuple[str, Hashable], dict[str, Any]] = OrderedDict()
+        self._flusher: asyncio.Task[None] | None = None
+        self._wake: asyncio.Event | None = None
+
+        # Statistics
+        self.queued = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self.written = 0
+        self.failed = 0
+        self.batches = 0
+
+    @property
+    def pending(self) -> int:
+        """Number of rows waiting to be written."""
+        return len(self._pending)
+
+    def put(self, table: str, key: Hashable, row: dict[str, Any]) -> bool:
+        """
+        Queue a row, replacing any pending row for the same key.
+
+        Args:
+            table: Destination table
+            key: Identity of the row within the table (its upsert conflict target)
+            row: Row to upsert
+
+        Returns:
+            True if the row was accepted, False if the queue is full
+        """
+        pending_key = (table, key)
+        if pending_key in self._pending:
+            self.coalesced += 1
+        elif len(self._pending) >= self.max_pending:
+            self.dropped += 1
+            logger.warning("Write-behind queue full, dropping write to %s", table)
+            return False
+
+        self._pending[pending_key] = row
+        self.queued += 1
+        self._ensure_flusher()
+        if len(self._pending) >= self.batch_size and self._wake is not None:
+            self._wake.set()
+        return True
+
+    def _ensure_flusher(self) -> None:
+        """Start the background flusher on the running loop if it is not running."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No loop (synchronous caller): rows wait for flush()
+            return
+        task = self._flusher
+        if task is None or task.done() or task.get_loop() is not loop:
+            self._wake = asyncio.Event()
+            self._flusher = loop.create_task(self._run_flusher(self._wake))
+
+    async def _run_flusher(self, wake: asyncio.Event) -> None:
+        """Flush pending rows every flush_interval, or sooner when a batch fills."""
+        while self._pending:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(wake.wait(), self.flush_interval)
+            wake.clear()
+            await self.flush()
+
+    def _take_batch(self) -> dict[str, list[dict[str, Any]]]:
+        """Remove up to batch_size of the oldest pending rows, grouped by table."""
+        batch: defaultdict[str, list[dict[str, Any]]] = defaultdict(list)
+        for _ in range(min(self.batch_size, len(self._pending))):
+            (table, _key), row = self._pending.popitem(last=False)
+            batch[table].append(row)
+        return batch
+
+    async def flush(self) -> int:
+        """
+        Write every pending row now.
+
+        Failed batches are logged and dropped; a cache can always be repopulated.
+
+        Returns:
+            Number of rows written
+        """
+        written = 0
+        while self._pending:
+            for table, rows in self._take_batch().items():
+                self.batches += 1
+                try:
+                    stored = await self.write(table, rows)
+                except Exception as e:  # pylint: disable=broad-except
+                    logger.warning("Write-behind flush to %s failed: %s", table, e)
+                    stored = 0
+                written += stored
+                self.failed += len(rows) - stored
+        self.written += written
+        return written
+
+    async def close(self, timeout: float = 5.0) -> None:
+        """
+        Flush pending rows and stop the flusher (e.g. before shutdown).
+
+        Args:
+            timeout: Seconds to spend flushing before giving up
+        """
+        task = self._flusher
+        if task is not None and not task.done() and task.get_loop() is asyncio.get_running_loop():
+            # Wake the flusher so it writes everything now, including any batch in progress
+            if self._wake is not None:
+                self._wake.set()
+            _done, still_running = await asyncio.wait([task], timeout=timeout)
+            for running in still_running:
+                running.cancel()
+        self._flusher = None
+
+        # Rows queued from another loop, or left by a cancelled flusher
+        try:
+            await asyncio.wait_for(self.flush(), timeout)
+        except TimeoutError:
+            logger.warning("Write-behind flush timed out with %d rows pending", self.pending)
+
+    def clear(self) -> None:
+        """Drop pending rows without writing them."""
+        self._pending.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get queue statistics and the number of rows pending."""
+        return {
+            "queued": self.queued,
+            "coalesced": self.coalesced,
+            "dropped": self.dropped,
+            "written": self.written,
+            "failed": self.failed,
+            "batches": self.batches,
+            "pending": self.pending,
+        }
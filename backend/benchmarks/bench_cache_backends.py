@@ -0,0 +1,147 @@
+# This file is part of TravelSytle AI.
+#
+# Copyright (C) 2025  Trailyn Ventures, LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Benchmark cache storage backends against each other.
+
+Writes and reads the same weather payloads through each CacheBackend and prints
+per-operation latency percentiles and throughput at a given concurrency. The
+memory and SQLite backends run by default; pass --redis-url to include a
+Redis-protocol server and --supabase to include the Supabase tables (uses the
+configured SUPABASE_URL and key).
+
+Run from the backend directory:
+    python -m benchmarks.bench_cache_backends [--redis-url redis://localhost:6379/15]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from collections.abc import Awaitable, Callable
+
+from app.services.cache import (
+    CacheBackend,
+    MemoryCacheBackend,
+    RedisCacheBackend,
+    SQLiteCacheBackend,
+)
+
+from .bench_cache_payload import weather_payload
+
+DESTINATIONS = [f"Benchmark City {i}" for i in range(200)]
+
+
+def supabase_backend() -> CacheBackend:
+    """The Supabase table backend, imported lazily since it needs credentials."""
+    from app.services.supabase.supabase_cache_v2 import (
+        ClassificationCacheService,
+        CulturalCacheService,
+        CurrencyCacheService,
+        StyleCacheService,
+        SupabaseCacheBackend,
+        WeatherCacheService,
+    )
+
+    return SupabaseCacheBackend(
+        WeatherCacheService(),
+        CulturalCacheService(),
+        CurrencyCacheService(),
+        ClassificationCacheService(),
+        StyleCacheService(),
+    )
+
+
+async def measure(
+    operation: Callable[[str], Awaitable[object]], operations: int, concurrency: int
+) -> tuple[list[float], float]:
+    """
+    Run operation over the benchmark destinations.
+
+    Returns:
+        Per-operation latencies in seconds and the wall-clock total
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+
+    async def run(index: int) -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            await operation(DESTINATIONS[index % len(DESTINATIONS)])
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(run(i) for i in range(operations)))
+    return latencies, time.perf_counter() - started
+
+
+def report(backend: str, name: str, latencies: list[float], total: float) -> None:
+    """Print one table row."""
+    cuts = statistics.quantiles(latencies, n=100)
+    print(
+        f"{backend:<10} {name:<6} {len(latencies) / total:>10.0f} "
+        f"{cuts[49] * 1e3:>9.3f} {cuts[94] * 1e3:>9.3f} {cuts[98] * 1e3:>9.3f}"
+    )
+
+
+async def bench(backend: CacheBackend, operations: int, concurrency: int) -> None:
+    """Benchmark set_entry then get_entry on one backend."""
+    payload = weather_payload()
+    try:
+        set_latencies, set_total = await measure(
+            lambda d: backend.set_entry("weather", d, payload, 1), operations, concurrency
+        )
+        get_latencies, get_total = await measure(
+            lambda d: backend.get_entry("weather", d), operations, concurrency
+        )
+        if await backend.get_entry("weather", DESTINATIONS[0]) is None:
+            print(f"{backend.name:<10} skipped: entries were not stored")
+            return
+        report(backend.name, "set", set_latencies, set_total)
+        report(backend.name, "get", get_latencies, get_total)
+    finally:
+        await backend.close()
+
+
+async def main() -> None:
+    """Run the benchmark and print a throughput and latency table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--operations", type=int, default=2000, help="gets and sets per backend")
+    parser.add_argument("--concurrency", type=int, default=16, help="operations in flight")
+    parser.add_argument("--redis-url", help="include a Redis-protocol server at this URL")
+    parser.add_argument("--supabase", action="store_true", help="include the Supabase tables")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        backends: list[CacheBackend] = [
+            MemoryCacheBackend(),
+            SQLiteCacheBackend(os.path.join(directory, "cache.sqlite3")),
+        ]
+        if args.redis_url:
+            backends.append(RedisCacheBackend(args.redis_url, prefix="travelstyle:bench:"))
+        if args.supabase:
+            backends.append(supabase_backend())
+
+        print(f"{'backend':<10} {'op':<6} {'ops/s':>10} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+        for backend in backends:
+            await bench(backend, args.operations, args.concurrency)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,143 @@
+# This file is part of TravelSytle AI.
+#
+# Copyright (C) 2025  Trailyn Ventures, LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Benchmark compressed cache payloads against plain JSONB rows.
+
+Measures the bytes PostgREST would send for a cache row and the time to parse
+the response and decode the payload, for representative weather and currency
+payloads.
+
+Run from the backend directory:
+    python -m benchmarks.bench_cache_payload
+"""
+
+import argparse
+import json
+import random
+import timeit
+from typing import Any
+
+from app.services.cache.payload_codec import decode_payload, encode_payload
+
+CONDITIONS = ["Clear", "Partially cloudy", "Rain, Partially cloudy", "Overcast", "Snow"]
+
+
+def weather_payload(days: int = 7) -> dict[str, Any]:
+    """A weather_data payload shaped like WeatherService output."""
+    rng = random.Random(1)
+    forecasts = [
+        {
+            "date": f"2025-07-{day + 1:02d}",
+            "temp_min": round(rng.uniform(50, 65), 1),
+            "temp_max": round(rng.uniform(65, 90), 1),
+            "humidity_min": round(rng.uniform(30, 60), 1),
+            "humidity_max": round(rng.uniform(60, 95), 1),
+            "weather_descriptions": [rng.choice(CONDITIONS)],
+            "conditions": rng.choice(CONDITIONS),
+            "precipitation_chance": rng.randint(0, 100),
+            "uvindex": rng.randint(0, 11),
+        }
+        for day in range(days)
+    ]
+    return {
+        "current": {
+            "coord": {"lon": 2.3522, "lat": 48.8566},
+            "weather": [{"main": "Clear", "description": "Clear", "icon": "01d"}],
+            "main": {"temp": 72.4, "feels_like": 72.4, "humidity": 48.2, "pressure": 1016.0},
+            "wind": {"speed": 8.1, "deg": 220.0},
+            "clouds": {"all": 12.0},
+            "visibility": 15.0,
+            "dt": 1751371200,
+            "timezone": "Europe/Paris",
+            "name": "Paris, Île-de-France, France",
+        },
+        "forecast": {
+            "city": {
+                "name": "Paris, Île-de-France, France",
+                "coord": {"lat": 48.8566, "lon": 2.3522},
+                "timezone": "Europe/Paris",
+            },
+            "daily_forecasts": forecasts,
+            "temp_range": {
+                "min": min(f["temp_min"] for f in forecasts),
+                "max": max(f["temp_max"] for f in forecasts),
+            },
+            "precipitation_chance": max(f["precipitation_chance"] for f in forecasts),
+        },
+        "destination": "Paris",
+        "retrieved_at": "2025-07-01T12:00:00+00:00",
+    }
+
+
+def rates_payload(currencies: int = 160) -> dict[str, Any]:
+    """A rates_data payload with one conversion rate per currency."""
+    rng = random.Random(2)
+    codes = sorted({f"{chr(65 + i // 26 % 26)}{chr(65 + i % 26)}X" for i in range(currencies)})
+    return {
+        "base_code": "USD",
+        "conversion_rates": {code: round(rng.uniform(0.01, 5000), 6) for code in codes},
+        "last_updated_unix": 1751328001,
+        "last_updated_utc": "Tue, 01 Jul 2025 00:00:01 +0000",
+    }
+
+
+def row_body(column: str, value: Any) -> str:
+    """JSON response body PostgREST returns for a one-row cache select."""
+    return json.dumps(
+        [
+            {
+                column: value,
+                "expires_at": "2025-07-01T13:00:00+00:00",
+                "created_at": "2025-07-01T12:00:00+00:00",
+            }
+        ]
+    )
+
+
+def read_row(body: str, column: str) -> Any:
+    """Parse a response body and decode its payload, as a cache read does."""
+    return decode_payload(json.loads(body)[0][column])
+
+
+def main() -> None:
+    """Run the benchmark and print a size and decode time table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--number", type=int, default=2000, help="decodes per measurement")
+    args = parser.parse_args()
+
+    cases = [
+        ("weather_data (7 days)", "weather_data", weather_payload()),
+        ("rates_data (160 rates)", "rates_data", rates_payload()),
+    ]
+    print(f"{'payload':<24} {'encoding':<8} {'bytes':>7} {'ratio':>6} {'decode us':>10}")
+    for label, column, payload in cases:
+        plain_bytes = None
+        for encoding in ("json", "zlib"):
+            body = row_body(column, encode_payload(payload, encoding, min_bytes=0))
+            assert read_row(body, column) == payload
+            size = len(body.encode("utf-8"))
+            plain_bytes = plain_bytes or size
+            seconds = timeit.timeit(lambda b=body, c=column: read_row(b, c), number=args.number)
+            print(
+                f"{label:<24} {encoding:<8} {size:>7} {size / plain_bytes:>6.2f} "
+                f"{seconds / args.number * 1e6:>10.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
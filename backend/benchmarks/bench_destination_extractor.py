@@ -0,0 +1,114 @@
+# This file is part of TravelSytle AI.
+#
+# Copyright (C) 2025  Trailyn Ventures, LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Benchmark the gazetteer destination extractor against the legacy regex chain.
+
+Run from the backend directory:
+    python -m benchmarks.bench_destination_extractor
+"""
+
+import argparse
+import re
+import timeit
+
+from app.services.destination import destination_extractor
+
+# The six patterns TravelOrchestratorService._extract_destination used to try in order
+LEGACY_PATTERNS = [
+    r".*going to\s+([A-Za-z\s]+?)(?:\s+for|\s+on|\s+in|\s+to|\s+with|\s+next|\s+this|\s+that|[.?!,]|$)",
+    r".*visiting\s+([A-Za-z\s]+?)(?:\s+for|\s+on|\s+in|\s+to|\s+with|\s+next|\s+this|\s+that|[.?!,]|$)",
+    r".*trip to\s+([A-Za-z\s]+?)(?:\s+for|\s+on|\s+in|\s+to|\s+with|\s+next|\s+this|\s+that|[.?!,]|$)",
+    r".*in\s+([A-Za-z\s]+?)(?:\s+for|\s+on|\s+to|\s+with|\s+next|\s+this|\s+that|[.?!,]|$)",
+    r".*to\s+([A-Za-z\s]+?)(?:\s+for|\s+on|\s+in|\s+to|\s+with|\s+next|\s+this|\s+that|[.?!,]|$)",
+    r".*I'm in\s+([A-Za-z\s]+?)(?:\s+for|\s+on|\s+to|\s+with|\s+next|\s+this|\s+that|[.?!,]|$)",
+]
+
+
+def legacy_extract(user_message: str) -> str | None:
+    """The regex chain the gazetteer extractor replaced."""
+    for pattern in LEGACY_PATTERNS:
+        match = re.search(pattern, user_message, re.IGNORECASE)
+        if match:
+            return match.group(1).strip()
+    return None
+
+
+# (message, expected destination)
+CORPUS: list[tuple[str, str | None]] = [
+    ("I'm going to Paris", "Paris"),
+    ("Visiting Tokyo next week", "Tokyo"),
+    ("Trip to New York", "New York"),
+    ("What's the weather like in London this weekend?", "London"),
+    ("What should I pack for my trip to Montréal?", "Montreal"),
+    ("I need to pack for a business meeting", None),
+    ("How do I convert 100 USD to EUR?", None),
+    ("Flying from London to Zürich next month", "Zurich"),
+    ("Tell me about São Paulo", "Sao Paulo"),
+    ("What's the dress code for dinner in Rome?", "Rome"),
+    ("Hello there", None),
+    ("Any tips on money for the trip?", None),
+    (
+        "We are a family of four with two kids and we would love some help planning "
+        "what to wear day to day, we like walking a lot and want comfortable shoes "
+        "that still look smart enough for restaurants in the evening, and we also "
+        "want to know about local customs so we do not offend anyone while we are in Kyoto",
+        "Kyoto",
+    ),
+    ("lots of words " * 40 + "and nothing else to say", None),
+]
+
+
+def _time(func, messages: list[str], number: int) -> float:
+    """Microseconds per message for func over messages."""
+    seconds = timeit.timeit(lambda: [func(m) for m in messages], number=number)
+    return seconds / (number * len(messages)) * 1e6
+
+
+def main() -> None:
+    """Run the benchmark and print timing and accuracy tables."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--number", type=int, default=200, help="iterations per message")
+    args = parser.parse_args()
+
+    print(f"{'message':<44} {'legacy us':>10} {'gazetteer us':>13}  legacy -> gazetteer")
+    for message, expected in CORPUS:
+        legacy_us = _time(legacy_extract, [message], args.number)
+        gazetteer_us = _time(destination_extractor.extract, [message], args.number)
+        label = message if len(message) <= 40 else f"{message[:37]}..."
+        legacy = legacy_extract(message)
+        gazetteer = destination_extractor.extract(message)
+        print(
+            f"{label!r:<44} {legacy_us:>10.1f} {gazetteer_us:>13.1f}  "
+            f"{legacy!r} -> {gazetteer!r} (expected {expected!r})"
+        )
+
+    messages = [message for message, _ in CORPUS]
+    legacy_total = _time(legacy_extract, messages, args.number)
+    gazetteer_total = _time(destination_extractor.extract, messages, args.number)
+    legacy_correct = sum(legacy_extract(m) == e for m, e in CORPUS)
+    gazetteer_correct = sum(destination_extractor.extract(m) == e for m, e in CORPUS)
+
+    print()
+    print(f"mean per message: legacy {legacy_total:.1f} us, gazetteer {gazetteer_total:.1f} us")
+    print(
+        f"correct: legacy {legacy_correct}/{len(CORPUS)}, gazetteer {gazetteer_correct}/{len(CORPUS)}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+# This file is part of TravelSytle AI.
+#
+# Copyright (C) 2025  Trailyn Ventures, LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Load benchmark for threaded versus native async PostgREST queries.
+
+Runs the same point lookup against a local stand-in for PostgREST, in its own
+process, that answers after a fixed latency. The threaded path is the sync client in asyncio.to_thread
+on a default-sized executor; the async path is SupabaseDataClient on the pooled
+supabase_rest connections. Threaded throughput stops growing once every worker is
+waiting on a reply, while the async path keeps scaling up to its connection limit
+(SupabaseConfig.MAX_CONNECTIONS unless --max-connections is given).
+
+Run from the backend directory:
+    python -m benchmarks.bench_supabase_async [--latency-ms 20 --max-connections 100]
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
+
+from app.core.config import settings
+from app.services.http_clients import UpstreamConfig, http_clients
+from app.services.supabase.supabase_client import SUPABASE_REST_UPSTREAM, SupabaseDataClient
+from app.services.supabase.supabase_config import SupabaseConfig
+from postgrest import SyncPostgrestClient
+
+ROW = json.dumps([{"id": "00000000-0000-0000-0000-000000000001", "setting_value": "x"}]).encode()
+
+
+async def handle(
+    reader: asyncio.StreamReader, writer: asyncio.StreamWriter, latency: float
+) -> None:
+    """Answer keep-alive HTTP/1.1 requests with ROW after latency seconds."""
+    try:
+        while True:
+            head = await reader.readuntil(b"\r\n\r\n")
+            length = 0
+            for line in head.split(b"\r\n"):
+                if line.lower().startswith(b"content-length:"):
+                    length = int(line.split(b":", 1)[1])
+            if length:
+                await reader.readexactly(length)
+            await asyncio.sleep(latency)
+            writer.write(
+                b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                b"Content-Length: %d\r\n\r\n%s" % (len(ROW), ROW)
+            )
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+def serve(latency: float, ports: multiprocessing.Queue) -> None:
+    """Run the stand-in PostgREST server; runs in its own process so it has its own loop."""
+
+    async def run() -> None:
+        server = await asyncio.start_server(
+            lambda reader, writer: handle(reader, writer, latency), "127.0.0.1", 0
+        )
+        ports.put(server.sockets[0].getsockname()[1])
+        await server.serve_forever()
+
+    asyncio.run(run())
+
+
+async def measure(
+    query: Callable[[], Awaitable[object]], requests: int, concurrency: int
+) -> tuple[float, list[float]]:
+    """
+    Run requests queries with at most concurrency in flight.
+
+    Returns:
+        Queries per second and per-query latencies in seconds
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+
+    async def run() -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            await query()
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(run() for _ in range(requests)))
+    return requests / (time.perf_counter() - started), latencies
+
+
+def report(path: str, concurrency: int, throughput: float, latencies: list[float]) -> None:
+    """Print one table row."""
+    cuts = statistics.quantiles(latencies, n=100)
+    print(
+        f"{path:<8} {concurrency:>11} {throughput:>10.0f} "
+        f"{cuts[49] * 1e3:>9.1f} {cuts[98] * 1e3:>9.1f}"
+    )
+
+
+async def main() -> None:
+    """Run both paths at increasing concurrency and print a throughput table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="server reply delay")
+    parser.add_argument("--requests", type=int, default=2000, help="queries per run")
+    parser.add_argument(
+        "--concurrency", type=int, nargs="+", default=[1, 8, 32, 64, 128], help="queries in flight"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=min(32, (os.cpu_count() or 1) + 4),
+        help="threads for the threaded path (default: asyncio's default executor size)",
+    )
+    parser.add_argument(
+        "--max-connections",
+        type=int,
+        default=SupabaseConfig.MAX_CONNECTIONS,
+        help="supabase_rest pool size for the async path",
+    )
+    args = parser.parse_args()
+
+    ports: multiprocessing.Queue = multiprocessing.Queue()
+    server = multiprocessing.Process(
+        target=serve, args=(args.latency_ms / 1000, ports), daemon=True
+    )
+    server.start()
+    url = f"http://127.0.0.1:{ports.get(timeout=10)}"
+    settings.SUPABASE_URL, settings.SUPABASE_KEY = url, "benchmark-key"
+    http_clients.register(
+        SUPABASE_REST_UPSTREAM,
+        UpstreamConfig(
+            timeout=float(SupabaseConfig.CONNECTION_TIMEOUT),
+            max_connections=args.max_connections,
+            max_keepalive_connections=args.max_connections,
+        ),
+    )
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(args.workers))
+
+    sync_client = SyncPostgrestClient(f"{url}/rest/v1", headers={"apikey": "benchmark-key"})
+    data_client = SupabaseDataClient()
+
+    def threaded():
+        return asyncio.to_thread(
+            lambda: (
+                sync_client.from_("system_settings").select("setting_value").eq("id", 1).execute()
+            )
+        )
+
+    def native():
+        return data_client.table("system_settings").select("setting_value").eq("id", 1).execute()
+
+    print(
+        f"latency {args.latency_ms:.0f} ms, {args.workers} threads, "
+        f"{args.max_connections} async connections"
+    )
+    print(f"{'path':<8} {'concurrency':>11} {'queries/s':>10} {'p50 ms':>9} {'p99 ms':>9}")
+    try:
+        for concurrency in args.concurrency:
+            for path, query in (("thread", threaded), ("async", native)):
+                await measure(query, min(args.requests, concurrency * 4), concurrency)  # warm-up
+                throughput, latencies = await measure(query, args.requests, concurrency)
+                report(path, concurrency, throughput, latencies)
+    finally:
+        sync_client.session.close()
+        await http_clients.aclose()
+        server.terminate()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -22,6 +22,7 @@ Pytest configuration and fixtures for TravelStyle AI backend tests.
 import warnings
 
 import pytest
+from app.services.supabase import enhanced_supabase_cache
 from app.travelstyle import travelstyle_app as app
 from fastapi.testclient import TestClient
 
@@ -54,6 +55,16 @@ async def override_get_current_user():
 app.dependency_overrides = {}
 
 
+@pytest.fixture(autouse=True)
+def clear_local_caches():
+    """Keep in-process cache entries and queued writes from leaking between tests."""
+    enhanced_supabase_cache.clear_local()
+    enhanced_supabase_cache.writes.clear()
+    yield
+    enhanced_supabase_cache.clear_local()
+    enhanced_supabase_cache.writes.clear()
+
+
 @pytest.fixture
 def client():
     """Test client for FastAPI application."""
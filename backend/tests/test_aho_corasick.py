@@ -0,0 +1,66 @@
+# This file is part of TravelSytle AI.
+#
+# Copyright (C) 2025  Trailyn Ventures, LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Tests for the Aho-Corasick multi-pattern matcher.
+"""
+
+import pytest
+from app.utils.aho_corasick import AhoCorasick
+
+
+class TestAhoCorasick:
+    """Test AhoCorasick matching."""
+
+    def test_reports_overlapping_matches(self):
+        """Test every occurrence is reported, including patterns inside other patterns."""
+        automaton = AhoCorasick[str]()
+        for pattern in ["he", "she", "his", "hers"]:
+            automaton.add(pattern, pattern)
+
+        matches = sorted(automaton.iter_matches("ushers"))
+
+        assert matches == [(1, 4, "she"), (2, 4, "he"), (2, 6, "hers")]
+
+    def test_follows_failure_links(self):
+        """Test a partial match falls back to the longest matching suffix."""
+        automaton = AhoCorasick[int]()
+        automaton.add("abcd", 1)
+        automaton.add("bce", 2)
+
+        assert list(automaton.iter_matches("xabce")) == [(2, 5, 2)]
+
+    def test_no_matches(self):
+        """Test text without patterns yields nothing."""
+        automaton = AhoCorasick[int]()
+        automaton.add("paris", 1)
+
+        assert list(automaton.iter_matches("hello there")) == []
+
+    def test_builds_lazily_after_add(self):
+        """Test patterns added after a scan are picked up by the next scan."""
+        automaton = AhoCorasick[str]()
+        automaton.add("rome", "rome")
+        assert list(automaton.iter_matches("rome oslo")) == [(0, 4, "rome")]
+
+        automaton.add("oslo", "oslo")
+        assert list(automaton.iter_matches("rome oslo")) == [(0, 4, "rome"), (5, 9, "oslo")]
+
+    def test_rejects_empty_pattern(self):
+        """Test empty patterns are rejected."""
+        with pytest.raises(ValueError):
+            AhoCorasick[str]().add("", "empty")
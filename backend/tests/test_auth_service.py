@@ -25,8 +25,11 @@ from app.services.auth_service import AuthService
 
 @pytest.fixture
 def mock_supabase_client():
-    """Mock Supabase client for testing."""
-    with patch("app.services.auth.helpers.get_supabase_client") as mock_get_client:
+    """Mock Supabase client for testing, with a mock async PostgREST client for tables."""
+    with (
+        patch("app.services.auth.helpers.get_supabase_client") as mock_get_client,
+        patch("app.services.auth.helpers.get_supabase_data_client", return_value=MagicMock()),
+    ):
         mock_client = MagicMock()
         mock_get_client.return_value = mock_client
         yield mock_client
@@ -62,10 +65,10 @@ async def test_login_success(mock_extract, auth_service):
         "first_name": "John",
         "last_name": "Doe",
     }
-    mock_table.select.return_value.eq.return_value.single.return_value.execute.return_value = (
-        mock_response
+    mock_table.select.return_value.eq.return_value.single.return_value.execute = AsyncMock(
+        return_value=mock_response
     )
-    auth_service.client.table = Mock(return_value=mock_table)
+    auth_service.db.table = Mock(return_value=mock_table)
 
     login_data = LoginRequest(email="test@example.com", password="password")
     login_response, token_pair = await auth_service.login(login_data)
@@ -181,7 +184,7 @@ async def test_refresh_token_success(auth_service):
     }
     mock_response.raise_for_status = MagicMock()
 
-    with patch("httpx.AsyncClient") as mock_client:
+    with patch("app.services.http_clients.http_clients.session") as mock_client:
         mock_client_instance = MagicMock()
         mock_client_instance.__aenter__.return_value.post = AsyncMock(return_value=mock_response)
         mock_client.return_value = mock_client_instance
@@ -199,7 +202,7 @@ async def test_refresh_token_no_session_original(auth_service):
     mock_response.json.return_value = {}  # Empty response
     mock_response.raise_for_status = MagicMock()
 
-    with patch("httpx.AsyncClient") as mock_client:
+    with patch("app.services.http_clients.http_clients.session") as mock_client:
         mock_client_instance = MagicMock()
         mock_client_instance.__aenter__.return_value.post = AsyncMock(return_value=mock_response)
         mock_client.return_value = mock_client_instance
@@ -229,10 +232,10 @@ async def test_register_success(auth_service):
         "first_name": "Jane",
         "last_name": "Doe",
     }
-    mock_table.select.return_value.eq.return_value.single.return_value.execute.return_value = (
-        mock_response
+    mock_table.select.return_value.eq.return_value.single.return_value.execute = AsyncMock(
+        return_value=mock_response
     )
-    auth_service.client.table = Mock(return_value=mock_table)
+    auth_service.db.table = Mock(return_value=mock_table)
 
     # Create a proper mock user profile that returns actual values
     mock_user_profile = {"id": "user-1", "email": "test@example.com"}
@@ -242,7 +245,9 @@ async def test_register_success(auth_service):
         "app.services.auth.helpers.extract_user_profile",
         return_value=mock_user_profile,
     ):
-        register_response, token_pair = await auth_service.register("test@example.com", "password", "Jane", "Doe")
+        register_response, token_pair = await auth_service.register(
+            "test@example.com", "password", "Jane", "Doe"
+        )
         assert token_pair.access_token == "token"
         assert token_pair.refresh_token == "refresh_token"
         assert register_response.user["id"] == "user-1"
@@ -274,9 +279,9 @@ async def test_get_user_profile_success(mock_extract, auth_service):
     mock_response.data = [{"id": "user-1", "email": "test@example.com"}]
 
     mock_table = MagicMock()
-    mock_table.select.return_value.eq.return_value.execute.return_value = mock_response
+    mock_table.select.return_value.eq.return_value.execute = AsyncMock(return_value=mock_response)
 
-    with patch.object(auth_service.client, "table", return_value=mock_table):
+    with patch.object(auth_service.db, "table", return_value=mock_table):
         result = await auth_service.get_user_profile("user-1")
         assert result["id"] == "user-1"
 
@@ -312,10 +317,10 @@ async def test_update_user_profile_sync_success(auth_service):
     mock_table = Mock()
     mock_table.update.return_value = mock_table
     mock_table.eq.return_value = mock_table
-    mock_table.execute.return_value = mock_view_response
+    mock_table.execute = AsyncMock(return_value=mock_view_response)
 
     auth_service.client.auth.admin = mock_admin
-    auth_service.client.table = Mock(return_value=mock_table)
+    auth_service.db.table = Mock(return_value=mock_table)
 
     result = await auth_service.update_user_profile_sync(
         "user-1", {"first_name": "Jane", "last_name": "Doe"}
@@ -337,8 +342,8 @@ async def test_update_user_preferences_success(auth_service):
     mock_table = Mock()
     mock_table.update.return_value = mock_table
     mock_table.eq.return_value = mock_table
-    mock_table.execute.return_value = None
-    auth_service.client.table = Mock(return_value=mock_table)
+    mock_table.execute = AsyncMock(return_value=None)
+    auth_service.db.table = Mock(return_value=mock_table)
     result = await auth_service.update_user_preferences(
         "user-1", {"style_preferences": {"color": "blue"}}
     )
@@ -408,10 +413,10 @@ async def test_login_no_user_profile(auth_service):
         "first_name": "John",
         "last_name": "Doe",
     }
-    mock_table.select.return_value.eq.return_value.single.return_value.execute.return_value = (
-        mock_db_response
+    mock_table.select.return_value.eq.return_value.single.return_value.execute = AsyncMock(
+        return_value=mock_db_response
     )
-    auth_service.client.table = Mock(return_value=mock_table)
+    auth_service.db.table = Mock(return_value=mock_table)
 
     with patch("app.services.auth.helpers.extract_user_profile", return_value=None):
         with patch.object(
@@ -475,7 +480,7 @@ async def test_refresh_token_no_session(auth_service):
     mock_response.json.return_value = {}  # Empty response
     mock_response.raise_for_status = MagicMock()
 
-    with patch("httpx.AsyncClient") as mock_client:
+    with patch("app.services.http_clients.http_clients.session") as mock_client:
         mock_client_instance = MagicMock()
         mock_client_instance.__aenter__.return_value.post = AsyncMock(return_value=mock_response)
         mock_client.return_value = mock_client_instance
@@ -491,7 +496,7 @@ async def test_refresh_token_exception(auth_service):
     """Test refresh_token when HTTP request raises an exception."""
     import httpx
 
-    with patch("httpx.AsyncClient") as mock_client:
+    with patch("app.services.http_clients.http_clients.session") as mock_client:
         mock_client_instance = MagicMock()
         mock_client_instance.__aenter__.return_value.post = AsyncMock(
             side_effect=httpx.HTTPStatusError(
@@ -631,9 +636,9 @@ async def test_get_user_profile_no_user(auth_service):
     mock_response.data = []
 
     mock_table = MagicMock()
-    mock_table.select.return_value.eq.return_value.execute.return_value = mock_response
+    mock_table.select.return_value.eq.return_value.execute = AsyncMock(return_value=mock_response)
 
-    with patch.object(auth_service.client, "table", return_value=mock_table):
+    with patch.object(auth_service.db, "table", return_value=mock_table):
         result = await auth_service.get_user_profile("user_id")
         assert result is None
 
@@ -642,9 +647,11 @@ async def test_get_user_profile_no_user(auth_service):
 async def test_get_user_profile_exception(auth_service):
     """Test get_user_profile when Supabase raises an exception."""
     mock_table = MagicMock()
-    mock_table.select.return_value.eq.return_value.execute.side_effect = Exception("Profile error")
+    mock_table.select.return_value.eq.return_value.execute = AsyncMock(
+        side_effect=Exception("Profile error")
+    )
 
-    with patch.object(auth_service.client, "table", return_value=mock_table):
+    with patch.object(auth_service.db, "table", return_value=mock_table):
         result = await auth_service.get_user_profile("user_id")
         assert result is None
 
@@ -707,13 +714,13 @@ async def test_update_user_profile_sync_with_style_preferences(auth_service):
     mock_table = MagicMock()
     mock_table.update.return_value = mock_table
     mock_table.eq.return_value = mock_table
-    mock_table.execute.return_value = mock_view_response
+    mock_table.execute = AsyncMock(return_value=mock_view_response)
 
     with (
         patch.object(
             auth_service.client.auth.admin, "update_user_by_id", return_value=mock_auth_response
         ),
-        patch.object(auth_service.client, "table", return_value=mock_table),
+        patch.object(auth_service.db, "table", return_value=mock_table),
     ):
         result = await auth_service.update_user_profile_sync(
             "user_id",
@@ -736,11 +743,11 @@ async def test_update_user_profile_sync_exception(auth_service):
 async def test_update_user_preferences_exception(auth_service):
     """Test update_user_preferences when Supabase raises an exception."""
     mock_table = MagicMock()
-    mock_table.update.return_value.eq.return_value.execute.side_effect = Exception(
-        "Preferences error"
+    mock_table.update.return_value.eq.return_value.execute = AsyncMock(
+        side_effect=Exception("Preferences error")
     )
 
-    with patch.object(auth_service.client, "table", return_value=mock_table):
+    with patch.object(auth_service.db, "table", return_value=mock_table):
         result = await auth_service.update_user_preferences("user_id", {"theme": "dark"})
         assert result is False
 
@@ -925,16 +932,16 @@ async def test_login_last_login_update_failure(auth_service):
 
     # Mock table operations
     mock_table = MagicMock()
-    mock_table.update.return_value.eq.return_value.execute.side_effect = update_exception
+    mock_table.update.return_value.eq.return_value.execute = AsyncMock(side_effect=update_exception)
     mock_profile_response = MagicMock()
     mock_profile_response.data = {
         "id": "user-1",
         "email": "test@example.com",
     }
-    mock_table.select.return_value.eq.return_value.single.return_value.execute.return_value = (
-        mock_profile_response
+    mock_table.select.return_value.eq.return_value.single.return_value.execute = AsyncMock(
+        return_value=mock_profile_response
     )
-    auth_service.client.table = Mock(return_value=mock_table)
+    auth_service.db.table = Mock(return_value=mock_table)
 
     # Mock get_complete_user_profile to return None
     with patch.object(auth_service, "get_complete_user_profile", return_value=None):
@@ -963,16 +970,16 @@ async def test_login_last_login_update_failure_with_message(auth_service):
 
     # Mock table operations
     mock_table = MagicMock()
-    mock_table.update.return_value.eq.return_value.execute.side_effect = update_exception
+    mock_table.update.return_value.eq.return_value.execute = AsyncMock(side_effect=update_exception)
     mock_profile_response = MagicMock()
     mock_profile_response.data = {
         "id": "user-1",
         "email": "test@example.com",
     }
-    mock_table.select.return_value.eq.return_value.single.return_value.execute.return_value = (
-        mock_profile_response
+    mock_table.select.return_value.eq.return_value.single.return_value.execute = AsyncMock(
+        return_value=mock_profile_response
     )
-    auth_service.client.table = Mock(return_value=mock_table)
+    auth_service.db.table = Mock(return_value=mock_table)
 
     with patch.object(auth_service, "get_complete_user_profile", return_value=None):
         with patch(
@@ -1000,16 +1007,16 @@ async def test_login_last_login_update_failure_with_details(auth_service):
 
     # Mock table operations
     mock_table = MagicMock()
-    mock_table.update.return_value.eq.return_value.execute.side_effect = update_exception
+    mock_table.update.return_value.eq.return_value.execute = AsyncMock(side_effect=update_exception)
     mock_profile_response = MagicMock()
     mock_profile_response.data = {
         "id": "user-1",
         "email": "test@example.com",
     }
-    mock_table.select.return_value.eq.return_value.single.return_value.execute.return_value = (
-        mock_profile_response
+    mock_table.select.return_value.eq.return_value.single.return_value.execute = AsyncMock(
+        return_value=mock_profile_response
     )
-    auth_service.client.table = Mock(return_value=mock_table)
+    auth_service.db.table = Mock(return_value=mock_table)
 
     with patch.object(auth_service, "get_complete_user_profile", return_value=None):
         with patch(
@@ -1033,15 +1040,15 @@ async def test_login_get_complete_profile_returns_none(auth_service):
 
     # Mock table operations
     mock_table = MagicMock()
-    mock_table.update.return_value.eq.return_value.execute.return_value = None
+    mock_table.update.return_value.eq.return_value.execute = AsyncMock(return_value=None)
     mock_preferences_response = MagicMock()
     mock_preferences_response.data = {
         "style_preferences": {"color": "blue"},
     }
-    mock_table.select.return_value.eq.return_value.single.return_value.execute.return_value = (
-        mock_preferences_response
+    mock_table.select.return_value.eq.return_value.single.return_value.execute = AsyncMock(
+        return_value=mock_preferences_response
     )
-    auth_service.client.table = Mock(return_value=mock_table)
+    auth_service.db.table = Mock(return_value=mock_table)
 
     with patch.object(auth_service, "get_complete_user_profile", return_value=None):
         with patch(
@@ -1066,13 +1073,13 @@ async def test_login_preferences_fetch_no_data(auth_service):
 
     # Mock table operations
     mock_table = MagicMock()
-    mock_table.update.return_value.eq.return_value.execute.return_value = None
+    mock_table.update.return_value.eq.return_value.execute = AsyncMock(return_value=None)
     mock_preferences_response = MagicMock()
     mock_preferences_response.data = None  # No preferences found
-    mock_table.select.return_value.eq.return_value.single.return_value.execute.return_value = (
-        mock_preferences_response
+    mock_table.select.return_value.eq.return_value.single.return_value.execute = AsyncMock(
+        return_value=mock_preferences_response
     )
-    auth_service.client.table = Mock(return_value=mock_table)
+    auth_service.db.table = Mock(return_value=mock_table)
 
     mock_profile_response = MagicMock()
     mock_profile_response.data = {
@@ -1104,11 +1111,11 @@ async def test_login_preferences_fetch_exception(auth_service):
 
     # Mock table operations
     mock_table = MagicMock()
-    mock_table.update.return_value.eq.return_value.execute.return_value = None
-    mock_table.select.return_value.eq.return_value.single.return_value.execute.side_effect = (
-        Exception("Preferences fetch failed")
+    mock_table.update.return_value.eq.return_value.execute = AsyncMock(return_value=None)
+    mock_table.select.return_value.eq.return_value.single.return_value.execute = AsyncMock(
+        side_effect=(Exception("Preferences fetch failed"))
     )
-    auth_service.client.table = Mock(return_value=mock_table)
+    auth_service.db.table = Mock(return_value=mock_table)
 
     mock_profile_response = MagicMock()
     mock_profile_response.data = {
@@ -1139,15 +1146,15 @@ async def test_login_get_complete_profile_exception(auth_service):
 
     # Mock table operations
     mock_table = MagicMock()
-    mock_table.update.return_value.eq.return_value.execute.return_value = None
+    mock_table.update.return_value.eq.return_value.execute = AsyncMock(return_value=None)
     mock_preferences_response = MagicMock()
     mock_preferences_response.data = {
         "style_preferences": {"color": "blue"},
     }
-    mock_table.select.return_value.eq.return_value.single.return_value.execute.return_value = (
-        mock_preferences_response
+    mock_table.select.return_value.eq.return_value.single.return_value.execute = AsyncMock(
+        return_value=mock_preferences_response
     )
-    auth_service.client.table = Mock(return_value=mock_table)
+    auth_service.db.table = Mock(return_value=mock_table)
 
     with patch.object(
         auth_service, "get_complete_user_profile", side_effect=Exception("Profile fetch failed")
@@ -1174,11 +1181,11 @@ async def test_login_preferences_fallback_exception(auth_service):
 
     # Mock table operations
     mock_table = MagicMock()
-    mock_table.update.return_value.eq.return_value.execute.return_value = None
-    mock_table.select.return_value.eq.return_value.single.return_value.execute.side_effect = (
-        Exception("Preferences fetch failed")
+    mock_table.update.return_value.eq.return_value.execute = AsyncMock(return_value=None)
+    mock_table.select.return_value.eq.return_value.single.return_value.execute = AsyncMock(
+        side_effect=(Exception("Preferences fetch failed"))
     )
-    auth_service.client.table = Mock(return_value=mock_table)
+    auth_service.db.table = Mock(return_value=mock_table)
 
     with patch.object(
         auth_service, "get_complete_user_profile", side_effect=Exception("Profile fetch failed")
@@ -1207,16 +1214,16 @@ async def test_login_missing_preference_fields(auth_service):
 
     # Mock table operations
     mock_table = MagicMock()
-    mock_table.update.return_value.eq.return_value.execute.return_value = None
+    mock_table.update.return_value.eq.return_value.execute = AsyncMock(return_value=None)
     mock_preferences_response = MagicMock()
     mock_preferences_response.data = {
         "style_preferences": {"color": "blue"},
         # Missing other preference fields
     }
-    mock_table.select.return_value.eq.return_value.single.return_value.execute.return_value = (
-        mock_preferences_response
+    mock_table.select.return_value.eq.return_value.single.return_value.execute = AsyncMock(
+        return_value=mock_preferences_response
     )
-    auth_service.client.table = Mock(return_value=mock_table)
+    auth_service.db.table = Mock(return_value=mock_table)
 
     # Profile missing some preference fields
     profile_data = {
@@ -1260,17 +1267,19 @@ async def test_get_complete_user_profile_success(auth_service):
     def table_side_effect(table_name):
         if table_name == "profiles":
             mock_profiles_table = MagicMock()
-            mock_profiles_table.select.return_value.eq.return_value.execute.return_value = (
-                mock_profile_check
+            mock_profiles_table.select.return_value.eq.return_value.execute = AsyncMock(
+                return_value=mock_profile_check
             )
             return mock_profiles_table
         elif table_name == "user_profile_view":
             mock_view_table = MagicMock()
-            mock_view_table.select.return_value.eq.return_value.single.return_value.execute.return_value = mock_view_response
+            mock_view_table.select.return_value.eq.return_value.single.return_value.execute = (
+                AsyncMock(return_value=mock_view_response)
+            )
             return mock_view_table
         return mock_table
 
-    with patch.object(auth_service.client, "table", side_effect=table_side_effect):
+    with patch.object(auth_service.db, "table", side_effect=table_side_effect):
         with patch("app.services.auth.helpers.db_rate_limiter.acquire", return_value=True):
             result = await auth_service.get_complete_user_profile("user-1")
             assert result["id"] == "user-1"
@@ -1298,22 +1307,24 @@ async def test_get_complete_user_profile_profile_not_exists(auth_service):
         if table_name == "profiles":
             mock_profiles_table = MagicMock()
             if call_count == 0:
-                mock_profiles_table.select.return_value.eq.return_value.execute.return_value = (
-                    mock_profile_check_empty
+                mock_profiles_table.select.return_value.eq.return_value.execute = AsyncMock(
+                    return_value=mock_profile_check_empty
                 )
             else:
-                mock_profiles_table.select.return_value.eq.return_value.execute.return_value = (
-                    mock_profile_check_after
+                mock_profiles_table.select.return_value.eq.return_value.execute = AsyncMock(
+                    return_value=mock_profile_check_after
                 )
             call_count += 1
             return mock_profiles_table
         elif table_name == "user_profile_view":
             mock_view_table = MagicMock()
-            mock_view_table.select.return_value.eq.return_value.single.return_value.execute.return_value = mock_view_response
+            mock_view_table.select.return_value.eq.return_value.single.return_value.execute = (
+                AsyncMock(return_value=mock_view_response)
+            )
             return mock_view_table
         return mock_table
 
-    with patch.object(auth_service.client, "table", side_effect=table_side_effect):
+    with patch.object(auth_service.db, "table", side_effect=table_side_effect):
         with patch.object(auth_service, "_ensure_user_profile_exists", return_value=True):
             with patch("app.services.auth.helpers.db_rate_limiter.acquire", return_value=True):
                 result = await auth_service.get_complete_user_profile("user-1")
@@ -1350,24 +1361,30 @@ async def test_get_complete_user_profile_view_error_with_response(auth_service):
             call_count["profiles"] += 1
             if call_count["profiles"] == 1:
                 # First call - profile check
-                mock_profiles_table.select.return_value.eq.return_value.execute.return_value = (
-                    mock_profile_check
+                mock_profiles_table.select.return_value.eq.return_value.execute = AsyncMock(
+                    return_value=mock_profile_check
                 )
             else:
                 # Second call - fallback to basic profile
-                mock_profiles_table.select.return_value.eq.return_value.single.return_value.execute.return_value = mock_basic_profile
+                mock_profiles_table.select.return_value.eq.return_value.single.return_value.execute = AsyncMock(
+                    return_value=mock_basic_profile
+                )
             return mock_profiles_table
         elif table_name == "user_profile_view":
             mock_view_table = MagicMock()
-            mock_view_table.select.return_value.eq.return_value.single.return_value.execute.side_effect = view_error
+            mock_view_table.select.return_value.eq.return_value.single.return_value.execute = (
+                AsyncMock(side_effect=view_error)
+            )
             return mock_view_table
         elif table_name == "user_preferences":
             mock_prefs_table = MagicMock()
-            mock_prefs_table.select.return_value.eq.return_value.single.return_value.execute.return_value = mock_preferences_response
+            mock_prefs_table.select.return_value.eq.return_value.single.return_value.execute = (
+                AsyncMock(return_value=mock_preferences_response)
+            )
             return mock_prefs_table
         return MagicMock()
 
-    with patch.object(auth_service.client, "table", side_effect=table_side_effect):
+    with patch.object(auth_service.db, "table", side_effect=table_side_effect):
         with patch("app.services.auth.helpers.db_rate_limiter.acquire", return_value=True):
             result = await auth_service.get_complete_user_profile("user-1")
             assert result is not None
@@ -1390,27 +1407,33 @@ async def test_get_complete_user_profile_view_error_with_all_attributes(auth_ser
     def table_side_effect(table_name):
         if table_name == "profiles":
             mock_profiles_table = MagicMock()
-            mock_profiles_table.select.return_value.eq.return_value.execute.return_value = (
-                mock_profile_check
+            mock_profiles_table.select.return_value.eq.return_value.execute = AsyncMock(
+                return_value=mock_profile_check
             )
             # Mock fallback call
             mock_basic_profile = MagicMock()
             mock_basic_profile.data = {"id": "user-1", "email": "test@example.com"}
-            mock_profiles_table.select.return_value.eq.return_value.single.return_value.execute.return_value = mock_basic_profile
+            mock_profiles_table.select.return_value.eq.return_value.single.return_value.execute = (
+                AsyncMock(return_value=mock_basic_profile)
+            )
             return mock_profiles_table
         elif table_name == "user_profile_view":
             mock_view_table = MagicMock()
-            mock_view_table.select.return_value.eq.return_value.single.return_value.execute.side_effect = view_error
+            mock_view_table.select.return_value.eq.return_value.single.return_value.execute = (
+                AsyncMock(side_effect=view_error)
+            )
             return mock_view_table
         elif table_name == "user_preferences":
             mock_prefs_table = MagicMock()
             mock_prefs_response = MagicMock()
             mock_prefs_response.data = None
-            mock_prefs_table.select.return_value.eq.return_value.single.return_value.execute.return_value = mock_prefs_response
+            mock_prefs_table.select.return_value.eq.return_value.single.return_value.execute = (
+                AsyncMock(return_value=mock_prefs_response)
+            )
             return mock_prefs_table
         return mock_table
 
-    with patch.object(auth_service.client, "table", side_effect=table_side_effect):
+    with patch.object(auth_service.db, "table", side_effect=table_side_effect):
         with patch("app.services.auth.helpers.db_rate_limiter.acquire", return_value=True):
             result = await auth_service.get_complete_user_profile("user-1")
             assert result is not None
@@ -1440,23 +1463,29 @@ async def test_get_complete_user_profile_fallback_basic_profile_success(auth_ser
     def table_side_effect(table_name):
         if table_name == "profiles":
             mock_profiles_table = MagicMock()
-            mock_profiles_table.select.return_value.eq.return_value.execute.return_value = (
-                mock_profile_check
+            mock_profiles_table.select.return_value.eq.return_value.execute = AsyncMock(
+                return_value=mock_profile_check
             )
             # Fallback call
-            mock_profiles_table.select.return_value.eq.return_value.single.return_value.execute.return_value = mock_basic_profile
+            mock_profiles_table.select.return_value.eq.return_value.single.return_value.execute = (
+                AsyncMock(return_value=mock_basic_profile)
+            )
             return mock_profiles_table
         elif table_name == "user_profile_view":
             mock_view_table = MagicMock()
-            mock_view_table.select.return_value.eq.return_value.single.return_value.execute.side_effect = view_error
+            mock_view_table.select.return_value.eq.return_value.single.return_value.execute = (
+                AsyncMock(side_effect=view_error)
+            )
             return mock_view_table
         elif table_name == "user_preferences":
             mock_prefs_table = MagicMock()
-            mock_prefs_table.select.return_value.eq.return_value.single.return_value.execute.return_value = mock_preferences_response
+            mock_prefs_table.select.return_value.eq.return_value.single.return_value.execute = (
+                AsyncMock(return_value=mock_preferences_response)
+            )
             return mock_prefs_table
         return mock_table
 
-    with patch.object(auth_service.client, "table", side_effect=table_side_effect):
+    with patch.object(auth_service.db, "table", side_effect=table_side_effect):
         with patch("app.services.auth.helpers.db_rate_limiter.acquire", return_value=True):
             result = await auth_service.get_complete_user_profile("user-1")
             assert result is not None
@@ -1485,22 +1514,28 @@ async def test_get_complete_user_profile_fallback_preferences_no_data(auth_servi
     def table_side_effect(table_name):
         if table_name == "profiles":
             mock_profiles_table = MagicMock()
-            mock_profiles_table.select.return_value.eq.return_value.execute.return_value = (
-                mock_profile_check
+            mock_profiles_table.select.return_value.eq.return_value.execute = AsyncMock(
+                return_value=mock_profile_check
+            )
+            mock_profiles_table.select.return_value.eq.return_value.single.return_value.execute = (
+                AsyncMock(return_value=mock_basic_profile)
             )
-            mock_profiles_table.select.return_value.eq.return_value.single.return_value.execute.return_value = mock_basic_profile
             return mock_profiles_table
         elif table_name == "user_profile_view":
             mock_view_table = MagicMock()
-            mock_view_table.select.return_value.eq.return_value.single.return_value.execute.side_effect = view_error
+            mock_view_table.select.return_value.eq.return_value.single.return_value.execute = (
+                AsyncMock(side_effect=view_error)
+            )
             return mock_view_table
         elif table_name == "user_preferences":
             mock_prefs_table = MagicMock()
-            mock_prefs_table.select.return_value.eq.return_value.single.return_value.execute.return_value = mock_preferences_response
+            mock_prefs_table.select.return_value.eq.return_value.single.return_value.execute = (
+                AsyncMock(return_value=mock_preferences_response)
+            )
             return mock_prefs_table
         return mock_table
 
-    with patch.object(auth_service.client, "table", side_effect=table_side_effect):
+    with patch.object(auth_service.db, "table", side_effect=table_side_effect):
         with patch("app.services.auth.helpers.db_rate_limiter.acquire", return_value=True):
             result = await auth_service.get_complete_user_profile("user-1")
             assert result is not None
@@ -1526,24 +1561,28 @@ async def test_get_complete_user_profile_fallback_preferences_exception(auth_ser
     def table_side_effect(table_name):
         if table_name == "profiles":
             mock_profiles_table = MagicMock()
-            mock_profiles_table.select.return_value.eq.return_value.execute.return_value = (
-                mock_profile_check
+            mock_profiles_table.select.return_value.eq.return_value.execute = AsyncMock(
+                return_value=mock_profile_check
+            )
+            mock_profiles_table.select.return_value.eq.return_value.single.return_value.execute = (
+                AsyncMock(return_value=mock_basic_profile)
             )
-            mock_profiles_table.select.return_value.eq.return_value.single.return_value.execute.return_value = mock_basic_profile
             return mock_profiles_table
         elif table_name == "user_profile_view":
             mock_view_table = MagicMock()
-            mock_view_table.select.return_value.eq.return_value.single.return_value.execute.side_effect = view_error
+            mock_view_table.select.return_value.eq.return_value.single.return_value.execute = (
+                AsyncMock(side_effect=view_error)
+            )
             return mock_view_table
         elif table_name == "user_preferences":
             mock_prefs_table = MagicMock()
-            mock_prefs_table.select.return_value.eq.return_value.single.return_value.execute.side_effect = Exception(
-                "Preferences error"
+            mock_prefs_table.select.return_value.eq.return_value.single.return_value.execute = (
+                AsyncMock(side_effect=Exception("Preferences error"))
             )
             return mock_prefs_table
         return mock_table
 
-    with patch.object(auth_service.client, "table", side_effect=table_side_effect):
+    with patch.object(auth_service.db, "table", side_effect=table_side_effect):
         with patch("app.services.auth.helpers.db_rate_limiter.acquire", return_value=True):
             result = await auth_service.get_complete_user_profile("user-1")
             assert result is not None
@@ -1563,19 +1602,23 @@ async def test_get_complete_user_profile_fallback_also_fails(auth_service):
     def table_side_effect(table_name):
         if table_name == "profiles":
             mock_profiles_table = MagicMock()
-            mock_profiles_table.select.return_value.eq.return_value.execute.return_value = (
-                mock_profile_check
+            mock_profiles_table.select.return_value.eq.return_value.execute = AsyncMock(
+                return_value=mock_profile_check
             )
             # Fallback call fails
-            mock_profiles_table.select.return_value.eq.return_value.single.return_value.execute.side_effect = fallback_error
+            mock_profiles_table.select.return_value.eq.return_value.single.return_value.execute = (
+                AsyncMock(side_effect=fallback_error)
+            )
             return mock_profiles_table
         elif table_name == "user_profile_view":
             mock_view_table = MagicMock()
-            mock_view_table.select.return_value.eq.return_value.single.return_value.execute.side_effect = view_error
+            mock_view_table.select.return_value.eq.return_value.single.return_value.execute = (
+                AsyncMock(side_effect=view_error)
+            )
             return mock_view_table
         return mock_table
 
-    with patch.object(auth_service.client, "table", side_effect=table_side_effect):
+    with patch.object(auth_service.db, "table", side_effect=table_side_effect):
         with patch("app.services.auth.helpers.db_rate_limiter.acquire", return_value=True):
             result = await auth_service.get_complete_user_profile("user-1")
             assert result is None
@@ -1608,21 +1651,25 @@ async def test_get_complete_user_profile_api_error(auth_service):
             call_count["profiles"] += 1
             if call_count["profiles"] == 1:
                 # First call - profile check succeeds
-                mock_profiles_table.select.return_value.eq.return_value.execute.return_value = (
-                    mock_profile_check
+                mock_profiles_table.select.return_value.eq.return_value.execute = AsyncMock(
+                    return_value=mock_profile_check
                 )
             else:
                 # Second call - fallback raises APIError, which will be caught by outer handler
-                mock_profiles_table.select.return_value.eq.return_value.single.return_value.execute.side_effect = api_error
+                mock_profiles_table.select.return_value.eq.return_value.single.return_value.execute = AsyncMock(
+                    side_effect=api_error
+                )
             return mock_profiles_table
         elif table_name == "user_profile_view":
             # View query also raises APIError (caught by inner handler, continues to fallback)
             mock_view_table = MagicMock()
-            mock_view_table.select.return_value.eq.return_value.single.return_value.execute.side_effect = api_error
+            mock_view_table.select.return_value.eq.return_value.single.return_value.execute = (
+                AsyncMock(side_effect=api_error)
+            )
             return mock_view_table
         return MagicMock()
 
-    with patch.object(auth_service.client, "table", side_effect=table_side_effect):
+    with patch.object(auth_service.db, "table", side_effect=table_side_effect):
         with patch("app.services.auth.helpers.db_rate_limiter.acquire", return_value=True):
             result = await auth_service.get_complete_user_profile("user-1")
             # The APIError from fallback should be caught by outer handler and return None
@@ -1643,17 +1690,19 @@ async def test_get_complete_user_profile_exception_with_cause(auth_service):
     def table_side_effect(table_name):
         if table_name == "profiles":
             mock_profiles_table = MagicMock()
-            mock_profiles_table.select.return_value.eq.return_value.execute.return_value = (
-                mock_profile_check
+            mock_profiles_table.select.return_value.eq.return_value.execute = AsyncMock(
+                return_value=mock_profile_check
             )
             return mock_profiles_table
         elif table_name == "user_profile_view":
             mock_view_table = MagicMock()
-            mock_view_table.select.return_value.eq.return_value.single.return_value.execute.side_effect = main_exception
+            mock_view_table.select.return_value.eq.return_value.single.return_value.execute = (
+                AsyncMock(side_effect=main_exception)
+            )
             return mock_view_table
         return mock_table
 
-    with patch.object(auth_service.client, "table", side_effect=table_side_effect):
+    with patch.object(auth_service.db, "table", side_effect=table_side_effect):
         with patch("app.services.auth.helpers.db_rate_limiter.acquire", return_value=True):
             result = await auth_service.get_complete_user_profile("user-1")
             # Should fallback and potentially return None
@@ -1683,24 +1732,30 @@ async def test_get_complete_user_profile_view_response_no_data(auth_service):
     def table_side_effect(table_name):
         if table_name == "profiles":
             mock_profiles_table = MagicMock()
-            mock_profiles_table.select.return_value.eq.return_value.execute.return_value = (
-                mock_profile_check
+            mock_profiles_table.select.return_value.eq.return_value.execute = AsyncMock(
+                return_value=mock_profile_check
+            )
+            mock_profiles_table.select.return_value.eq.return_value.single.return_value.execute = (
+                AsyncMock(return_value=mock_basic_profile)
             )
-            mock_profiles_table.select.return_value.eq.return_value.single.return_value.execute.return_value = mock_basic_profile
             return mock_profiles_table
         elif table_name == "user_profile_view":
             mock_view_table = MagicMock()
-            mock_view_table.select.return_value.eq.return_value.single.return_value.execute.return_value = mock_view_response
+            mock_view_table.select.return_value.eq.return_value.single.return_value.execute = (
+                AsyncMock(return_value=mock_view_response)
+            )
             return mock_view_table
         elif table_name == "user_preferences":
             mock_prefs_table = MagicMock()
             mock_prefs_response = MagicMock()
             mock_prefs_response.data = None
-            mock_prefs_table.select.return_value.eq.return_value.single.return_value.execute.return_value = mock_prefs_response
+            mock_prefs_table.select.return_value.eq.return_value.single.return_value.execute = (
+                AsyncMock(return_value=mock_prefs_response)
+            )
             return mock_prefs_table
         return mock_table
 
-    with patch.object(auth_service.client, "table", side_effect=table_side_effect):
+    with patch.object(auth_service.db, "table", side_effect=table_side_effect):
         with patch("app.services.auth.helpers.db_rate_limiter.acquire", return_value=True):
             result = await auth_service.get_complete_user_profile("user-1")
             assert result is not None
@@ -1730,8 +1785,8 @@ async def test_ensure_user_profile_exists_success(auth_service):
     auth_service.client.auth.admin = mock_admin
 
     mock_table = MagicMock()
-    mock_table.insert.return_value.execute.return_value = None
-    auth_service.client.table = Mock(return_value=mock_table)
+    mock_table.insert.return_value.execute = AsyncMock(return_value=None)
+    auth_service.db.table = Mock(return_value=mock_table)
 
     result = await auth_service._ensure_user_profile_exists("user-1")
     assert result is True
@@ -1770,9 +1825,9 @@ async def test_ensure_user_profile_exists_none_metadata(auth_service):
 
     mock_table = MagicMock()
     mock_insert_chain = MagicMock()
-    mock_insert_chain.execute.return_value = None
+    mock_insert_chain.execute = AsyncMock(return_value=None)
     mock_table.insert.return_value = mock_insert_chain
-    auth_service.client.table = Mock(return_value=mock_table)
+    auth_service.db.table = Mock(return_value=mock_table)
 
     result = await auth_service._ensure_user_profile_exists("user-1")
     assert result is True
@@ -1817,9 +1872,9 @@ async def test_ensure_user_profile_exists_partial_metadata(auth_service):
 
     mock_table = MagicMock()
     mock_insert_chain = MagicMock()
-    mock_insert_chain.execute.return_value = None
+    mock_insert_chain.execute = AsyncMock(return_value=None)
     mock_table.insert.return_value = mock_insert_chain
-    auth_service.client.table = Mock(return_value=mock_table)
+    auth_service.db.table = Mock(return_value=mock_table)
 
     result = await auth_service._ensure_user_profile_exists("user-1")
     assert result is True
@@ -1852,21 +1907,23 @@ async def test_register_sign_out_failure(auth_service):
 
     # Mock table operations
     mock_table = MagicMock()
-    mock_table.insert.return_value.execute.return_value = None
+    mock_table.insert.return_value.execute = AsyncMock(return_value=None)
     mock_profile_response = MagicMock()
     mock_profile_response.data = {
         "id": "user-1",
         "email": "test@example.com",
     }
-    mock_table.select.return_value.eq.return_value.single.return_value.execute.return_value = (
-        mock_profile_response
+    mock_table.select.return_value.eq.return_value.single.return_value.execute = AsyncMock(
+        return_value=mock_profile_response
     )
-    auth_service.client.table = Mock(return_value=mock_table)
+    auth_service.db.table = Mock(return_value=mock_table)
 
     with patch.object(
         auth_service, "get_complete_user_profile", return_value=mock_profile_response.data
     ):
-        register_response, token_pair = await auth_service.register("test@example.com", "password", "Jane", "Doe")
+        register_response, token_pair = await auth_service.register(
+            "test@example.com", "password", "Jane", "Doe"
+        )
         assert register_response.success is True
         assert token_pair.access_token == "token"
 
@@ -1884,21 +1941,25 @@ async def test_register_preferences_creation_failure(auth_service):
 
     # Mock table operations - preferences insert fails
     mock_table = MagicMock()
-    mock_table.insert.return_value.execute.side_effect = Exception("Preferences already exist")
+    mock_table.insert.return_value.execute = AsyncMock(
+        side_effect=Exception("Preferences already exist")
+    )
     mock_profile_response = MagicMock()
     mock_profile_response.data = {
         "id": "user-1",
         "email": "test@example.com",
     }
-    mock_table.select.return_value.eq.return_value.single.return_value.execute.return_value = (
-        mock_profile_response
+    mock_table.select.return_value.eq.return_value.single.return_value.execute = AsyncMock(
+        return_value=mock_profile_response
     )
-    auth_service.client.table = Mock(return_value=mock_table)
+    auth_service.db.table = Mock(return_value=mock_table)
 
     with patch.object(
         auth_service, "get_complete_user_profile", return_value=mock_profile_response.data
     ):
-        register_response, token_pair = await auth_service.register("test@example.com", "password", "Jane", "Doe")
+        register_response, token_pair = await auth_service.register(
+            "test@example.com", "password", "Jane", "Doe"
+        )
         assert register_response.success is True
         assert token_pair.access_token == "token"
 
@@ -1916,8 +1977,8 @@ async def test_register_get_complete_profile_failure(auth_service):
 
     # Mock table operations
     mock_table = MagicMock()
-    mock_table.insert.return_value.execute.return_value = None
-    auth_service.client.table = Mock(return_value=mock_table)
+    mock_table.insert.return_value.execute = AsyncMock(return_value=None)
+    auth_service.db.table = Mock(return_value=mock_table)
 
     with patch.object(
         auth_service, "get_complete_user_profile", side_effect=Exception("Profile fetch failed")
@@ -1926,7 +1987,9 @@ async def test_register_get_complete_profile_failure(auth_service):
             "app.services.auth.helpers.extract_user_profile",
             return_value={"id": "user-1", "email": "test@example.com"},
         ):
-            register_response, token_pair = await auth_service.register("test@example.com", "password", "Jane", "Doe")
+            register_response, token_pair = await auth_service.register(
+                "test@example.com", "password", "Jane", "Doe"
+            )
             assert register_response.success is True
             assert token_pair.access_token == "token"
             assert register_response.user["id"] == "user-1"
@@ -1945,15 +2008,17 @@ async def test_register_get_complete_profile_returns_none(auth_service):
 
     # Mock table operations
     mock_table = MagicMock()
-    mock_table.insert.return_value.execute.return_value = None
-    auth_service.client.table = Mock(return_value=mock_table)
+    mock_table.insert.return_value.execute = AsyncMock(return_value=None)
+    auth_service.db.table = Mock(return_value=mock_table)
 
     with patch.object(auth_service, "get_complete_user_profile", return_value=None):
         with patch(
             "app.services.auth.helpers.extract_user_profile",
             return_value={"id": "user-1", "email": "test@example.com"},
         ):
-            register_response, token_pair = await auth_service.register("test@example.com", "password", "Jane", "Doe")
+            register_response, token_pair = await auth_service.register(
+                "test@example.com", "password", "Jane", "Doe"
+            )
             assert register_response.success is True
             assert token_pair.access_token == "token"
             assert register_response.user["id"] == "user-1"
@@ -1987,8 +2052,8 @@ async def test_update_user_profile_sync_profile_completed_with_first_name(auth_s
     mock_table = Mock()
     mock_table.update.return_value = mock_table
     mock_table.eq.return_value = mock_table
-    mock_table.execute.return_value = mock_view_response
-    auth_service.client.table = Mock(return_value=mock_table)
+    mock_table.execute = AsyncMock(return_value=mock_view_response)
+    auth_service.db.table = Mock(return_value=mock_table)
 
     result = await auth_service.update_user_profile_sync("user-1", {"first_name": "Jane"})
     assert result is not None
@@ -2021,8 +2086,8 @@ async def test_update_user_profile_sync_profile_completed_with_last_name(auth_se
     mock_table = Mock()
     mock_table.update.return_value = mock_table
     mock_table.eq.return_value = mock_table
-    mock_table.execute.return_value = mock_view_response
-    auth_service.client.table = Mock(return_value=mock_table)
+    mock_table.execute = AsyncMock(return_value=mock_view_response)
+    auth_service.db.table = Mock(return_value=mock_table)
 
     result = await auth_service.update_user_profile_sync("user-1", {"last_name": "Smith"})
     assert result is not None
@@ -2051,8 +2116,8 @@ async def test_update_user_profile_sync_profile_completed_false_when_missing_nam
     mock_table = Mock()
     mock_table.update.return_value = mock_table
     mock_table.eq.return_value = mock_table
-    mock_table.execute.return_value = mock_view_response
-    auth_service.client.table = Mock(return_value=mock_table)
+    mock_table.execute = AsyncMock(return_value=mock_view_response)
+    auth_service.db.table = Mock(return_value=mock_table)
 
     result = await auth_service.update_user_profile_sync("user-1", {"first_name": "John"})
     assert result is not None
@@ -2076,8 +2141,8 @@ async def test_update_user_profile_sync_empty_data(auth_service):
     mock_table = Mock()
     mock_table.update.return_value = mock_table
     mock_table.eq.return_value = mock_table
-    mock_table.execute.return_value = mock_view_response
-    auth_service.client.table = Mock(return_value=mock_table)
+    mock_table.execute = AsyncMock(return_value=mock_view_response)
+    auth_service.db.table = Mock(return_value=mock_table)
 
     result = await auth_service.update_user_profile_sync("user-1", {"first_name": "John"})
     assert result is None
@@ -0,0 +1,104 @@
+# This file is part of TravelSytle AI.
+#
+# Copyright (C) 2025  Trailyn Ventures, LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Tests for the background refresh scheduler.
+"""
+
+import asyncio
+
+import pytest
+from app.utils.background_refresh import BackgroundRefresher
+
+
+class TestBackgroundRefresher:
+    """Test keyed scheduling, bounds and draining."""
+
+    @pytest.mark.asyncio
+    async def test_refresh_runs(self):
+        """Test a scheduled refresh runs and is forgotten afterwards."""
+        refresher = BackgroundRefresher()
+        calls = []
+
+        async def refresh():
+            calls.append(1)
+
+        assert refresher.schedule("a", refresh) is True
+        await refresher.drain()
+
+        assert calls == [1]
+        assert refresher.get_stats()["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_duplicate_key_deduplicated(self):
+        """Test a second request for a key already refreshing is skipped."""
+        refresher = BackgroundRefresher()
+        release = asyncio.Event()
+
+        async def refresh():
+            await release.wait()
+
+        assert refresher.schedule("a", refresh) is True
+        assert refresher.schedule("a", refresh) is False
+        release.set()
+        await refresher.drain()
+
+        stats = refresher.get_stats()
+        assert stats["scheduled"] == 1
+        assert stats["deduplicated"] == 1
+
+    @pytest.mark.asyncio
+    async def test_full_queue_drops(self):
+        """Test refreshes beyond max_pending are dropped."""
+        refresher = BackgroundRefresher(max_pending=1)
+        release = asyncio.Event()
+
+        async def refresh():
+            await release.wait()
+
+        assert refresher.schedule("a", refresh) is True
+        assert refresher.schedule("b", refresh) is False
+        release.set()
+        await refresher.drain()
+
+        assert refresher.get_stats()["dropped"] == 1
+
+    @pytest.mark.asyncio
+    async def test_failure_is_counted(self):
+        """Test a failing refresh is logged and counted, not raised."""
+        refresher = BackgroundRefresher()
+
+        async def refresh():
+            raise RuntimeError("upstream down")
+
+        refresher.schedule("a", refresh)
+        await refresher.drain()
+
+        assert refresher.get_stats()["failures"] == 1
+
+    @pytest.mark.asyncio
+    async def test_drain_cancels_after_timeout(self):
+        """Test drain cancels refreshes still running at the timeout."""
+        refresher = BackgroundRefresher()
+
+        async def refresh():
+            await asyncio.sleep(10)
+
+        refresher.schedule("a", refresh)
+        await refresher.drain(timeout=0.01)
+
+        assert refresher.get_stats()["in_flight"] == 0
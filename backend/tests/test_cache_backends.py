@@ -0,0 +1,301 @@
+# This file is part of TravelSytle AI.
+#
+# Copyright (C) 2025  Trailyn Ventures, LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Tests for the cache storage backends.
+"""
+
+import asyncio
+import sys
+from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+import pytest_asyncio
+from app.services.cache import MemoryCacheBackend, RedisCacheBackend, SQLiteCacheBackend
+from app.services.supabase.supabase_cache_v2 import EnhancedSupabaseCacheService
+
+
+async def read_command(reader: asyncio.StreamReader) -> list[bytes]:
+    """Read one command sent by a client as a RESP array of bulk strings."""
+    count = int((await reader.readuntil(b"\r\n"))[1:-2])
+    command = []
+    for _ in range(count):
+        length = int((await reader.readuntil(b"\r\n"))[1:-2])
+        command.append((await reader.readexactly(length + 2))[:-2])
+    return command
+
+
+class FakeRedisServer:
+    """Minimal RESP server supporting AUTH, CLIENT, PING, SELECT, GET and SET ... PX."""
+
+    def __init__(self, password: str | None = None):
+        self.password = password
+        self.data: dict[bytes, bytes] = {}
+        self.expiry_ms: dict[bytes, int] = {}
+        self.commands: list[list[bytes]] = []
+        self.server: asyncio.Server | None = None
+
+    async def start(self) -> int:
+        self.server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        return self.server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def _handle(self, reader, writer):
+        try:
+            while True:
+                command = await read_command(reader)
+                self.commands.append(command)
+                writer.write(self._reply(command))
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            writer.close()
+
+    def _reply(self, command: list[bytes]) -> bytes:
+        name = command[0].upper()
+        if name == b"AUTH":
+            return b"+OK\r\n" if command[-1].decode() == self.password else b"-WRONGPASS\r\n"
+        if name in (b"SELECT", b"CLIENT"):
+            return b"+OK\r\n"
+        if name == b"PING":
+            return b"+PONG\r\n"
+        if name == b"SET":
+            self.data[command[1]] = command[2]
+            self.expiry_ms[command[1]] = int(command[4])
+            return b"+OK\r\n"
+        if name == b"GET":
+            value = self.data.get(command[1])
+            return b"$-1\r\n" if value is None else b"$%d\r\n%s\r\n" % (len(value), value)
+        return b"-ERR unknown command\r\n"
+
+
+@pytest_asyncio.fixture(params=["memory", "sqlite", "redis"])
+async def backend(request, tmp_path):
+    """Each key-value backend, retaining records 60 seconds past expiry."""
+    server = None
+    if request.param == "memory":
+        backend = MemoryCacheBackend(retain_seconds=60)
+    elif request.param == "sqlite":
+        backend = SQLiteCacheBackend(str(tmp_path / "cache.sqlite3"), retain_seconds=60)
+    else:
+        pytest.importorskip("redis")
+        server = FakeRedisServer()
+        port = await server.start()
+        backend = RedisCacheBackend(f"redis://127.0.0.1:{port}/0", retain_seconds=60)
+    yield backend
+    await backend.close()
+    if server is not None:
+        await server.stop()
+
+
+class TestKeyValueBackends:
+    """Behaviour shared by the memory, SQLite and Redis-protocol backends."""
+
+    @pytest.mark.asyncio
+    async def test_round_trip(self, backend):
+        """Test an entry reads back with its data and timestamps."""
+        assert await backend.set_entry("currency", "USD", {"EUR": 0.85}, 1) is True
+
+        entry = await backend.get_entry("currency", "USD")
+
+        assert entry.data == {"EUR": 0.85}
+        assert timedelta(minutes=59) < entry.expires_at - datetime.now(UTC) <= timedelta(hours=1)
+        assert await backend.get_entry("currency", "GBP") is None
+
+    @pytest.mark.asyncio
+    async def test_destination_spellings_share_entries(self, backend):
+        """Test destination caches are stored under the canonical destination."""
+        await backend.set_entry("weather", "Paris", {"temp": 20}, 1)
+
+        entry = await backend.get_entry("weather", "Paris, France")
+
+        assert entry.data == {"temp": 20}
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_needs_grace(self, backend):
+        """Test an expired entry is only returned within the grace period."""
+        await backend.set_entry("weather", "Paris", {"temp": 20}, -10 / 3600)
+
+        assert await backend.get_entry("weather", "Paris") is None
+        entry = await backend.get_entry("weather", "Paris", grace_seconds=30)
+        assert entry.data == {"temp": 20}
+
+    @pytest.mark.asyncio
+    async def test_batch_write_overwrites(self, backend):
+        """Test write_records stores every record and replaces older ones."""
+        records = [
+            backend.build_record("weather", "Paris", {"temp": 20}, 1),
+            backend.build_record("weather", "Tokyo", {"temp": 25}, 1),
+        ]
+        assert await backend.write_records("weather", records) == 2
+        await backend.set_entry("weather", "Paris", {"temp": 21}, 1)
+
+        assert (await backend.get_entry("weather", "Paris")).data == {"temp": 21}
+        assert (await backend.get_entry("weather", "Tokyo")).data == {"temp": 25}
+
+    @pytest.mark.asyncio
+    async def test_entries_survive_close(self, backend):
+        """Test closing at lifespan shutdown only releases connections, not entries."""
+        await backend.set_entry("currency", "USD", {"EUR": 0.85}, 1)
+        await backend.close()
+
+        assert (await backend.get_entry("currency", "USD")).data == {"EUR": 0.85}
+
+    @pytest.mark.asyncio
+    async def test_compressed_payloads(self, backend):
+        """Test payloads survive zlib encoding where the backend serializes them."""
+        data = {"forecast": ["sunny"] * 500}
+        with patch("app.services.cache.payload_codec.settings.CACHE_PAYLOAD_ENCODING", "zlib"):
+            await backend.set_entry("weather", "Paris", data, 1)
+
+        assert (await backend.get_entry("weather", "Paris")).data == data
+
+
+class TestSQLiteBackend:
+    """SQLite-specific behaviour."""
+
+    @pytest.mark.asyncio
+    async def test_entries_persist_across_instances(self, tmp_path):
+        """Test a second backend on the same file sees the first one's writes."""
+        path = str(tmp_path / "cache.sqlite3")
+        first = SQLiteCacheBackend(path)
+        await first.set_entry("currency", "USD", {"EUR": 0.85}, 1)
+        await first.close()
+
+        second = SQLiteCacheBackend(path)
+        assert (await second.get_entry("currency", "USD")).data == {"EUR": 0.85}
+        await second.close()
+
+    @pytest.mark.asyncio
+    async def test_write_error_returns_zero(self, tmp_path):
+        """Test an unwritable database is logged and reported as nothing stored."""
+        backend = SQLiteCacheBackend(str(tmp_path / "missing" / "cache.sqlite3"))
+
+        assert await backend.set_entry("currency", "USD", {"EUR": 0.85}, 1) is False
+        assert await backend.get_entry("currency", "USD") is None
+
+
+class TestRedisBackend:
+    """Redis-protocol backend behaviour over redis.asyncio."""
+
+    @pytest.fixture(autouse=True)
+    def require_redis(self):
+        """Skip when the optional redis package is not installed."""
+        pytest.importorskip("redis")
+
+    @pytest.mark.asyncio
+    async def test_authenticates_and_sets_expiry(self):
+        """Test AUTH and SELECT are sent once and keys expire after their retention."""
+        server = FakeRedisServer(password="secret")
+        port = await server.start()
+        backend = RedisCacheBackend(f"redis://:secret@127.0.0.1:{port}/2", retain_seconds=60)
+        try:
+            await backend.set_entry("currency", "USD", {"EUR": 0.85}, 1)
+            await backend.get_entry("currency", "USD")
+        finally:
+            await backend.close()
+            await server.stop()
+
+        names = [
+            command[0] for command in server.commands if command[0] not in (b"CLIENT", b"PING")
+        ]
+        assert names == [b"AUTH", b"SELECT", b"SET", b"GET"]
+        assert [c[1] for c in server.commands if c[0] == b"SELECT"] == [b"2"]
+        assert 3_600_000 < server.expiry_ms[b"travelstyle:cache:currency:USD"] <= 3_660_000
+        assert backend.get_stats()["clients"] == 1
+
+    @pytest.mark.asyncio
+    async def test_unreachable_server_is_a_miss(self):
+        """Test connection failures are logged and treated as misses and failed writes."""
+        backend = RedisCacheBackend("redis://127.0.0.1:1/0", timeout=0.5)
+
+        assert await backend.get_entry("currency", "USD") is None
+        assert await backend.set_entry("currency", "USD", {"EUR": 0.85}, 1) is False
+
+
+class TestBackendSelection:
+    """Test EnhancedSupabaseCacheService with configured backends."""
+
+    def test_default_backend_is_supabase(self):
+        """Test the Supabase tables back the cache by default."""
+        assert EnhancedSupabaseCacheService().backend.name == "supabase"
+
+    def test_redis_backend_needs_redis_package(self):
+        """Test CACHE_BACKEND=redis fails at startup with a hint when redis is missing."""
+        with patch.dict(sys.modules, {"redis": None, "redis.asyncio": None}):
+            with pytest.raises(ImportError, match="pip install redis"):
+                RedisCacheBackend("redis://localhost:6379/0")
+
+    def test_unknown_backend_rejected(self):
+        """Test a misspelled CACHE_BACKEND fails at startup."""
+        with patch("app.services.supabase.supabase_cache_v2.settings.CACHE_BACKEND", "mongo"):
+            with pytest.raises(ValueError, match="mongo"):
+                EnhancedSupabaseCacheService()
+
+    @pytest.mark.asyncio
+    async def test_memory_backend_serves_all_cache_types(self):
+        """Test every get_*/set_* pair works without Supabase."""
+        with patch("app.services.supabase.supabase_cache_v2.settings.CACHE_BACKEND", "memory"):
+            service = EnhancedSupabaseCacheService()
+        service.local_enabled = False
+        service.write_behind_enabled = False
+
+        await service.set_weather_cache("Paris", {"temp": 20})
+        await service.set_cultural_cache("Paris", "leisure", {"cultural_data": {"a": 1}})
+        await service.set_currency_cache("USD", {"EUR": 0.85})
+        await service.set_classification_cache("abc", "general")
+        await service.set_style_cache("f00d", "Paris", {"confidence_score": 0.9})
+
+        assert await service.get_weather_cache("paris") == {"temp": 20}
+        assert (await service.get_cultural_cache("Paris"))["cultural_data"] == {"a": 1}
+        assert await service.get_currency_cache("USD") == {"EUR": 0.85}
+        assert (await service.get_classification_cache("abc"))["category"] == "general"
+        assert await service.get_style_cache("f00d") == {"confidence_score": 0.9}
+        assert service.get_stats()["backend"]["backend"] == "memory"
+
+    @pytest.mark.asyncio
+    async def test_write_behind_flushes_to_backend(self):
+        """Test queued writes reach a key-value backend in batches."""
+        with patch("app.services.supabase.supabase_cache_v2.settings.CACHE_BACKEND", "memory"):
+            service = EnhancedSupabaseCacheService()
+        service.write_behind_enabled = True
+
+        await service.set_weather_cache("Paris", {"temp": 20})
+        await service.set_weather_cache("Tokyo", {"temp": 25})
+        await service.flush_writes()
+
+        assert (await service.backend.get_entry("weather", "Tokyo")).data == {"temp": 25}
+        assert service.get_stats()["write_behind"]["written"] == 2
+
+    @pytest.mark.asyncio
+    async def test_classification_write_is_queued(self):
+        """Test classification writes go through write-behind and store no message text."""
+        with patch("app.services.supabase.supabase_cache_v2.settings.CACHE_BACKEND", "memory"):
+            service = EnhancedSupabaseCacheService()
+        service.write_behind_enabled = True
+
+        assert await service.set_classification_cache("abc", "general") is True
+        assert await service.backend.get_entry("classification", "abc") is None
+        assert await service.get_classification_cache("abc") == {"category": "general"}
+
+        await service.flush_writes()
+        assert (await service.backend.get_entry("classification", "abc")).data == {
+            "category": "general"
+        }
@@ -3,7 +3,7 @@ Test cache improvements to ensure proper handling of duplicate entries.
 """
 
 from datetime import UTC, datetime, timedelta
-from unittest.mock import patch
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
 import pytest
 from app.services.supabase.supabase_cache_v2 import (
@@ -13,6 +13,12 @@ from app.services.supabase.supabase_cache_v2 import (
 )
 
 
+def _fresh_entry(data):
+    """Build an unexpired cache entry wrapping data."""
+    now = datetime.now(UTC)
+    return CacheEntry(data, now + timedelta(hours=1), now)
+
+
 class TestCacheImprovements:
     """Test cache improvements for preventing duplicate entries."""
 
@@ -34,62 +40,52 @@ class TestCacheImprovements:
         # Should be expired
         assert expired_entry.is_expired()
 
+    @staticmethod
+    def _mock_query(service, rows):
+        """Point a service at a fake PostgREST query builder returning rows."""
+        service.client = MagicMock()
+        query = service.client.table.return_value
+        for method in ("select", "eq", "gt", "order", "limit"):
+            getattr(query, method).return_value = query
+        query.execute = AsyncMock(return_value=MagicMock(data=rows))
+        return query
+
     @pytest.mark.asyncio
     async def test_weather_cache_service_get_most_recent_non_expired(self):
-        """Test that the cache service returns the most recent non-expired entry."""
-        # Mock the base service methods
-        with patch.object(WeatherCacheService, "get_by_field") as mock_get_by_field:
-            # Create multiple cache entries with different timestamps
-            now = datetime.now(UTC)
-            entry1 = CacheEntry(
-                data={"temp": 20, "source": "old"},
-                expires_at=now + timedelta(hours=1),
-                created_at=now - timedelta(hours=2),
-            )
-            entry2 = CacheEntry(
-                data={"temp": 25, "source": "new"},
-                expires_at=now + timedelta(hours=1),
-                created_at=now - timedelta(hours=1),
-            )
-            entry3 = CacheEntry(
-                data={"temp": 30, "source": "expired"},
-                expires_at=now - timedelta(hours=1),  # Expired
-                created_at=now - timedelta(hours=3),
-            )
-
-            # Mock the service to return multiple entries
-            mock_get_by_field.return_value = [entry1, entry2, entry3]
-
-            service = WeatherCacheService()
+        """Test the newest unexpired row is selected by the query, not in Python."""
+        now = datetime.now(UTC)
+        service = WeatherCacheService()
+        query = self._mock_query(
+            service,
+            [
+                {
+                    "weather_data": {"temp": 25, "source": "new"},
+                    "expires_at": (now + timedelta(hours=1)).isoformat(),
+                    "created_at": (now - timedelta(hours=1)).isoformat(),
+                }
+            ],
+        )
+
+        with patch("app.services.rate_limiter.db_rate_limiter.acquire", return_value=True):
             result = await service.get_cache("Paris")
 
-            # Should return the most recent non-expired entry (entry2)
-            assert result == {"temp": 25, "source": "new"}
+        assert result == {"temp": 25, "source": "new"}
+        gt_field, gt_value = query.gt.call_args.args
+        assert gt_field == "expires_at"
+        assert datetime.fromisoformat(gt_value) <= datetime.now(UTC)
+        query.order.assert_called_once_with("created_at", desc=True)
+        query.limit.assert_called_once_with(1)
 
     @pytest.mark.asyncio
     async def test_weather_cache_service_get_all_expired(self):
-        """Test that the cache service returns None when all entries are expired."""
-        with patch.object(WeatherCacheService, "get_by_field") as mock_get_by_field:
-            # Create expired cache entries
-            now = datetime.now(UTC)
-            entry1 = CacheEntry(
-                data={"temp": 20},
-                expires_at=now - timedelta(hours=1),  # Expired
-                created_at=now - timedelta(hours=2),
-            )
-            entry2 = CacheEntry(
-                data={"temp": 25},
-                expires_at=now - timedelta(hours=30),  # Expired
-                created_at=now - timedelta(hours=3),
-            )
-
-            mock_get_by_field.return_value = [entry1, entry2]
+        """Test that the cache service returns None when no unexpired row matches."""
+        service = WeatherCacheService()
+        self._mock_query(service, [])
 
-            service = WeatherCacheService()
+        with patch("app.services.rate_limiter.db_rate_limiter.acquire", return_value=True):
             result = await service.get_cache("Paris")
 
-            # Should return None when all entries are expired
-            assert result is None
+        assert result is None
 
     @pytest.mark.asyncio
     async def test_weather_cache_service_set_with_api_source(self):
@@ -108,6 +104,7 @@ class TestCacheImprovements:
             mock_upsert.assert_called_once()
             call_args = mock_upsert.call_args[0][0]  # First argument is the data dict
             assert call_args["destination"] == "Paris"
+            assert call_args["destination_normalized"] == "paris, france"
             assert call_args["api_source"] == "visualcrossing"
             assert call_args["weather_data"] == {"temp": 20}
             assert result is True
@@ -115,14 +112,17 @@ class TestCacheImprovements:
     @pytest.mark.asyncio
     async def test_enhanced_cache_service_integration(self):
         """Test the enhanced cache service integration."""
-        with patch.object(enhanced_supabase_cache.weather_service, "get_cache") as mock_get:
-            mock_get.return_value = {"temp": 20}
+        with patch.object(enhanced_supabase_cache.weather_service, "get_entry") as mock_get:
+            mock_get.return_value = _fresh_entry({"temp": 20})
 
             result = await enhanced_supabase_cache.get_weather_cache("Paris")
             assert result == {"temp": 20}
-            mock_get.assert_called_once_with("Paris")
+            mock_get.assert_called_once_with("Paris", grace_seconds=ANY)
 
-        with patch.object(enhanced_supabase_cache.weather_service, "set_cache") as mock_set:
+        with (
+            patch.object(enhanced_supabase_cache.weather_service, "set_cache") as mock_set,
+            patch.object(enhanced_supabase_cache, "write_behind_enabled", False),
+        ):
             mock_set.return_value = True
 
             result = await enhanced_supabase_cache.set_weather_cache("Paris", {"temp": 20}, 1)
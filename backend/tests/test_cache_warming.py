@@ -0,0 +1,201 @@
+# This file is part of TravelSytle AI.
+#
+# Copyright (C) 2025  Trailyn Ventures, LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Tests for the cache warming job.
+"""
+
+from collections import Counter
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from app.services.cache_warming import CacheWarmer, is_cache_warming_event
+from app.services.supabase.supabase_cache_v2 import CacheEntry
+
+
+def fake_client(rows_by_table: dict[str, list[dict]]) -> MagicMock:
+    """Async PostgREST client whose queries return the given rows for each table."""
+    client = MagicMock()
+
+    def table(name):
+        query = MagicMock()
+        query.select.return_value.order.return_value.limit.return_value.execute = AsyncMock(
+            return_value=MagicMock(data=rows_by_table.get(name, []))
+        )
+        return query
+
+    client.table.side_effect = table
+    return client
+
+
+def entry(expires_in: timedelta) -> CacheEntry:
+    """Cache entry expiring after expires_in."""
+    now = datetime.now(UTC)
+    return CacheEntry({"ok": True}, now + expires_in, now)
+
+
+@pytest.fixture
+def warmer():
+    """Warmer with small limits and a mocked currency API."""
+    with patch("app.services.cache_warming.currency_api") as currency_api:
+        currency_api.get_exchange_rates = AsyncMock(return_value={"rates": {}})
+        warmer = CacheWarmer(top_destinations=2, top_currencies=2, concurrency=2)
+    return warmer
+
+
+class TestTargets:
+    """Test popularity ranking of destinations and currencies."""
+
+    @pytest.mark.asyncio
+    async def test_destinations_ranked_across_sources(self, warmer):
+        """Test spellings of one destination are counted together across tables."""
+        client = fake_client(
+            {
+                "saved_destinations": [
+                    {"destination_name": "Paris"},
+                    {"destination_name": "Tokyo"},
+                ],
+                "conversations": [
+                    {"destination": "paris, france"},
+                    {"destination": None},
+                    {"destination": "Rome"},
+                ],
+                "weather_cache": [{"destination": "Paris"}, {"destination": "Tokyo"}],
+            }
+        )
+        with patch("app.services.cache_warming.get_supabase_data_client", return_value=client):
+            destinations = await warmer.find_destinations()
+
+        assert destinations == ["Paris", "Tokyo"]
+
+    @pytest.mark.asyncio
+    async def test_failed_source_is_skipped(self, warmer):
+        """Test a source that cannot be read does not stop the ranking."""
+        client = fake_client({"weather_cache": [{"destination": "Rome"}]})
+        original = client.table.side_effect
+
+        def table(name):
+            if name == "conversations":
+                raise RuntimeError("permission denied")
+            return original(name)
+
+        client.table.side_effect = table
+        with patch("app.services.cache_warming.get_supabase_data_client", return_value=client):
+            destinations = await warmer.find_destinations()
+
+        assert destinations == ["Rome"]
+
+    @pytest.mark.asyncio
+    async def test_currencies_start_with_default_base(self, warmer):
+        """Test the default base currency leads and unsupported codes are ignored."""
+        client = fake_client(
+            {
+                "currency_favorites": [
+                    {"from_currency": "eur"},
+                    {"from_currency": "EUR"},
+                    {"from_currency": "XXX"},
+                ],
+                "currency_rates_cache": [{"base_currency": "GBP"}],
+            }
+        )
+        with patch("app.services.cache_warming.get_supabase_data_client", return_value=client):
+            currencies = await warmer.find_currencies()
+
+        assert currencies == ["USD", "EUR"]
+
+
+class TestWarming:
+    """Test quota, freshness and failure handling while warming."""
+
+    @pytest.fixture(autouse=True)
+    def cache(self):
+        """Cache whose backend has no entries."""
+        cache = MagicMock()
+        cache.backend.get_entry = AsyncMock(return_value=None)
+        cache.flush_writes = AsyncMock()
+        with patch("app.services.cache_warming.enhanced_supabase_cache", cache):
+            yield cache
+
+    @pytest.mark.asyncio
+    async def test_skips_fresh_entries(self, warmer, cache):
+        """Test entries that outlive the warming threshold are not fetched again."""
+        cache.backend.get_entry.side_effect = [
+            entry(timedelta(hours=1)),
+            entry(timedelta(seconds=5)),
+        ]
+        fetch = AsyncMock(return_value={"ok": True})
+        report = Counter()
+        await warmer._warm("weather", ["Paris", "Rome"], fetch, report)
+
+        cache.backend.get_entry.assert_any_await("weather", "Paris")
+        assert report == {"fresh": 1, "warmed": 1}
+        fetch.assert_awaited_once_with("Rome")
+
+    @pytest.mark.asyncio
+    async def test_respects_upstream_quota(self, warmer):
+        """Test no more than max_upstream_calls fetches are made per upstream."""
+        warmer.max_upstream_calls = 2
+        fetch = AsyncMock(side_effect=[{"ok": True}, None])
+        report = Counter()
+        await warmer._warm("currency", ["A", "B", "C"], fetch, report)
+
+        assert fetch.await_count == 2
+        assert report == {"warmed": 1, "failed": 1, "over_quota": 1}
+
+    @pytest.mark.asyncio
+    async def test_run_warms_every_cache_and_flushes(self, warmer, cache):
+        """Test a run fetches each target once per upstream and flushes queued writes."""
+        warmer.find_destinations = AsyncMock(return_value=["Paris"])
+        warmer.find_currencies = AsyncMock(return_value=["USD"])
+
+        with (
+            patch("app.services.cache_warming.weather_service") as weather,
+            patch("app.services.cache_warming.qloo_service") as qloo,
+        ):
+            weather.get_weather_data = AsyncMock(return_value={"temperature": 20})
+            qloo.get_cultural_insights = AsyncMock(return_value={"data_source": "fallback"})
+            report = await warmer.run()
+
+        weather.get_weather_data.assert_awaited_once_with("Paris", force_refresh=True)
+        warmer.currency_api.get_exchange_rates.assert_awaited_once_with("USD", force_refresh=True)
+        cache.flush_writes.assert_awaited_once()
+        assert report["weather"] == {"warmed": 1}
+        assert report["cultural"] == {"failed": 1}
+        assert report["currency"] == {"warmed": 1}
+
+    @pytest.mark.asyncio
+    async def test_dry_run_makes_no_upstream_calls(self, warmer):
+        """Test a dry run only reports its targets."""
+        warmer.find_destinations = AsyncMock(return_value=["Paris"])
+        warmer.find_currencies = AsyncMock(return_value=["USD"])
+
+        with patch("app.services.cache_warming.weather_service") as weather:
+            weather.get_weather_data = AsyncMock()
+            report = await warmer.run(dry_run=True)
+
+        weather.get_weather_data.assert_not_called()
+        assert report["destinations"] == ["Paris"]
+        assert "weather" not in report
+
+
+def test_is_cache_warming_event():
+    """Test only the warming rule's explicit input counts as a warming event."""
+    assert is_cache_warming_event({"task": "warm_cache"})
+    assert not is_cache_warming_event({"source": "aws.events", "detail-type": "Scheduled Event"})
+    assert not is_cache_warming_event({"path": "/", "httpMethod": "GET"})
+    assert not is_cache_warming_event(None)
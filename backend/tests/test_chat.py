@@ -19,10 +19,13 @@
 Tests for chat endpoints and OpenAI service.
 """
 
-from unittest.mock import patch
+import base64
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from app.models.responses import ChatResponse
+from app.models.responses import ChatResponse, QuickReply
+from app.services.chat_stream import get_active_stream
 from app.services.openai.openai_service import OpenAIService
 from fastapi import status
 
@@ -359,6 +362,170 @@ class TestChatEndpoints:
             assert "Internal error" in response.json()["detail"]
 
 
+def parse_sse(body: str) -> list[tuple[str, dict]]:
+    """Parse a Server-Sent Events body into (event, data) pairs."""
+    events = []
+    for frame in body.strip().split("\n\n"):
+        event_line, data_line = frame.split("\n")
+        events.append((event_line.removeprefix("event: "), json.loads(data_line[6:])))
+    return events
+
+
+async def streaming_recommendations(**kwargs):
+    """Orchestrator stand-in that streams like OpenAIService.generate_response."""
+    stream = get_active_stream()
+    stream.send_text("Pack layers ")
+    stream.send_text('[QUICK: "Show layers"]')
+    stream.end_text()
+    return ChatResponse(
+        message="Pack layers",
+        quick_replies=[QuickReply(text="Packing checklist", action="wardrobe_checklist")],
+    )
+
+
+class TestChatStreamEndpoint:
+    """Test cases for the streaming chat endpoint."""
+
+    @pytest.fixture(autouse=True)
+    def db(self):
+        """Patch the database helpers used by the endpoint."""
+        with (
+            patch(
+                "app.api.v1.chat.db_helpers.get_conversation_history",
+                new=AsyncMock(return_value=[]),
+            ),
+            patch("app.api.v1.chat.db_helpers.get_user_profile", new=AsyncMock(return_value={})),
+            patch(
+                "app.api.v1.chat.db_helpers.save_conversation_message", new=AsyncMock()
+            ) as mock_save,
+        ):
+            yield mock_save
+
+    def test_stream_success(self, authenticated_client, mock_chat_request, db):
+        """Test tokens and quick replies stream before the final response."""
+        with patch(
+            "app.services.orchestrator.orchestrator_service.generate_travel_recommendations",
+            new=streaming_recommendations,
+        ):
+            response = authenticated_client.post("/api/v1/chat/stream", json=mock_chat_request)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = parse_sse(response.text)
+        assert [name for name, _ in events] == ["token", "quick_reply", "done"]
+        assert events[0][1] == {"text": "Pack layers "}
+        assert events[1][1]["text"] == "Show layers"
+
+        final = events[2][1]
+        assert final["message"] == "Pack layers"
+        assert final["conversation_id"] == "test-conversation-123"
+        assert final["message_id"]
+        assert final["quick_replies"][0]["action"] == "wardrobe_checklist"
+
+        db.assert_awaited_once_with(
+            user_id="test-user-123",
+            conversation_id="test-conversation-123",
+            user_message=mock_chat_request["message"],
+            ai_response="Pack layers",
+        )
+
+    def test_stream_without_tokens(self, authenticated_client, mock_chat_request, db):
+        """Test a handler that does not call OpenAI still sends its message as a token."""
+        with patch(
+            "app.services.orchestrator.orchestrator_service.generate_travel_recommendations",
+            new=AsyncMock(return_value=ChatResponse(message="1 USD = 0.9 EUR")),
+        ):
+            response = authenticated_client.post("/api/v1/chat/stream", json=mock_chat_request)
+
+        events = parse_sse(response.text)
+        assert events == [("token", {"text": "1 USD = 0.9 EUR"}), ("done", events[1][1])]
+        db.assert_awaited_once()
+
+    def test_stream_orchestrator_error(self, authenticated_client, mock_chat_request, db):
+        """Test an orchestrator failure ends the stream with an error event."""
+        with patch(
+            "app.services.orchestrator.orchestrator_service.generate_travel_recommendations",
+            new=AsyncMock(side_effect=Exception("Orchestrator error")),
+        ):
+            response = authenticated_client.post("/api/v1/chat/stream", json=mock_chat_request)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert parse_sse(response.text) == [("error", {"detail": "Failed to process chat request"})]
+        db.assert_not_awaited()
+
+    def test_stream_interrupted(self, authenticated_client, mock_chat_request, db):
+        """Test a completion cut off mid-stream ends with an error, not a fallback message."""
+
+        async def interrupted_recommendations(**kwargs):
+            stream = get_active_stream()
+            stream.send_text("Pack lay")
+            stream.interrupt()
+            return ChatResponse(message="I apologize, please try again.", confidence_score=0.0)
+
+        with patch(
+            "app.services.orchestrator.orchestrator_service.generate_travel_recommendations",
+            new=interrupted_recommendations,
+        ):
+            response = authenticated_client.post("/api/v1/chat/stream", json=mock_chat_request)
+
+        assert parse_sse(response.text) == [
+            ("token", {"text": "Pack lay"}),
+            ("error", {"detail": "Response was interrupted"}),
+        ]
+        db.assert_not_awaited()
+
+    def test_stream_database_error(self, authenticated_client, mock_chat_request):
+        """Test a failure before streaming starts is a regular 500."""
+        with patch(
+            "app.api.v1.chat.db_helpers.get_conversation_history",
+            new=AsyncMock(side_effect=Exception("Database error")),
+        ):
+            response = authenticated_client.post("/api/v1/chat/stream", json=mock_chat_request)
+
+        assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+
+    def test_stream_no_auth(self, client, mock_chat_request):
+        """Test streaming requires authentication."""
+        response = client.post("/api/v1/chat/stream", json=mock_chat_request)
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_stream_behind_lambda_handler(self, authenticated_client, mock_chat_request, db):
+        """Test the stream is returned as one buffered body through Mangum."""
+        from app.travelstyle import handler
+
+        event = {
+            "resource": "/{proxy+}",
+            "path": "/api/v1/chat/stream",
+            "httpMethod": "POST",
+            "headers": {"content-type": "application/json", "host": "example.com"},
+            "multiValueHeaders": {},
+            "queryStringParameters": None,
+            "multiValueQueryStringParameters": None,
+            "requestContext": {
+                "resourcePath": "/{proxy+}",
+                "httpMethod": "POST",
+                "path": "/api/v1/chat/stream",
+                "stage": "prod",
+                "identity": {"sourceIp": "127.0.0.1"},
+            },
+            "body": json.dumps(mock_chat_request),
+            "isBase64Encoded": False,
+        }
+
+        with patch(
+            "app.services.orchestrator.orchestrator_service.generate_travel_recommendations",
+            new=streaming_recommendations,
+        ):
+            response = handler(event, MagicMock())
+
+        assert response["statusCode"] == 200
+        body = response["body"]
+        if response.get("isBase64Encoded"):
+            body = base64.b64decode(body).decode()
+        assert [name for name, _ in parse_sse(body)] == ["token", "quick_reply", "done"]
+        db.assert_awaited_once()
+
+
 @pytest.mark.asyncio
 async def test_generate_response_success():
     """Test successful response generation."""
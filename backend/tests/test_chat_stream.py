@@ -0,0 +1,166 @@
+# This file is part of TravelSytle AI.
+#
+# Copyright (C) 2025  Trailyn Ventures, LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Tests for Server-Sent Events chat streaming.
+"""
+
+import asyncio
+
+import pytest
+from app.models.responses import ChatResponse
+from app.services.chat_stream import (
+    ChatStream,
+    QuickReplyStreamParser,
+    format_sse_event,
+    get_active_stream,
+)
+
+
+def parse_frames(frames: list[str]) -> list[tuple[str, str]]:
+    """Split SSE frames into (event, data) pairs."""
+    events = []
+    for frame in frames:
+        event_line, data_line = frame.strip().split("\n")
+        events.append((event_line.removeprefix("event: "), data_line.removeprefix("data: ")))
+    return events
+
+
+class TestQuickReplyStreamParser:
+    """Test incremental quick-reply marker parsing."""
+
+    def test_plain_text_passes_through(self):
+        """Test text without markers is released immediately."""
+        parser = QuickReplyStreamParser()
+
+        assert parser.feed("Pack light layers.") == ("Pack light layers.", [])
+        assert parser.flush() == ""
+
+    def test_marker_split_across_chunks(self):
+        """Test a marker is held back until complete, then emitted as a quick reply."""
+        parser = QuickReplyStreamParser()
+
+        assert parser.feed("Done! [QU") == ("Done! ", [])
+        assert parser.feed('ICK: "Show ') == ("", [])
+        text, quick_replies = parser.feed('layers"] More')
+
+        assert text == " More"
+        assert [qr.text for qr in quick_replies] == ["Show layers"]
+
+    def test_non_marker_brackets_are_released(self):
+        """Test brackets that cannot start a marker are not held back."""
+        parser = QuickReplyStreamParser()
+
+        assert parser.feed("[Note] wear [Q") == ("[Note] wear ", [])
+        assert parser.feed("uiet] shoes") == ("[Quiet] shoes", [])
+
+    def test_unterminated_marker_flushed(self):
+        """Test an unterminated marker is released when the completion ends."""
+        parser = QuickReplyStreamParser()
+
+        assert parser.feed('Tip [QUICK: "Open') == ("Tip ", [])
+        assert parser.flush() == '[QUICK: "Open'
+
+    def test_overlong_marker_released(self):
+        """Test a marker prefix longer than any real marker is released as text."""
+        parser = QuickReplyStreamParser()
+        text, quick_replies = parser.feed('[QUICK: "' + "x" * 200)
+
+        assert text.startswith('[QUICK: "')
+        assert quick_replies == []
+
+
+class TestChatStream:
+    """Test ChatStream relaying."""
+
+    def test_format_sse_event(self):
+        """Test frames are single-line JSON terminated by a blank line."""
+        assert format_sse_event("token", {"text": "a\nb"}) == (
+            'event: token\ndata: {"text": "a\\nb"}\n\n'
+        )
+
+    @pytest.mark.asyncio
+    async def test_relay_yields_events_then_stores_response(self):
+        """Test events sent by the producer are relayed before it completes."""
+        stream = ChatStream()
+
+        async def produce():
+            active = get_active_stream()
+            active.send_text('Hello [QUICK: "Hi"]')
+            await asyncio.sleep(0)
+            active.send_text(" there")
+            active.end_text()
+            return ChatResponse(message="Hello there")
+
+        frames = [frame async for frame in stream.relay(produce())]
+
+        assert parse_frames(frames) == [
+            ("token", '{"text": "Hello "}'),
+            ("quick_reply", '{"text": "Hi", "action": null}'),
+            ("token", '{"text": " there"}'),
+        ]
+        assert stream.tokens_sent == 2
+        assert stream.response.message == "Hello there"
+        assert get_active_stream() is None
+
+    def test_interrupt_needs_streamed_output(self):
+        """Test a stream is only interrupted once the client has been sent something."""
+        stream = ChatStream()
+        stream.interrupt()
+        assert not stream.interrupted
+
+        stream.send_text("partial")
+        stream.interrupt()
+        assert stream.interrupted
+
+    @pytest.mark.asyncio
+    async def test_relay_propagates_errors(self):
+        """Test producer errors surface after queued events."""
+        stream = ChatStream()
+
+        async def produce():
+            get_active_stream().send_text("partial")
+            raise RuntimeError("boom")
+
+        frames = []
+        with pytest.raises(RuntimeError):
+            async for frame in stream.relay(produce()):
+                frames.append(frame)
+
+        assert parse_frames(frames) == [("token", '{"text": "partial"}')]
+        assert stream.response is None
+
+    @pytest.mark.asyncio
+    async def test_closing_relay_cancels_producer(self):
+        """Test the producer is cancelled when the client goes away."""
+        stream = ChatStream()
+        cancelled = asyncio.Event()
+
+        async def produce():
+            get_active_stream().send_text("first")
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        relay = stream.relay(produce())
+        assert await anext(relay) == format_sse_event("token", {"text": "first"})
+        await relay.aclose()
+        await asyncio.sleep(0)
+
+        assert cancelled.is_set()
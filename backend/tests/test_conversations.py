@@ -19,7 +19,7 @@
 Tests for ConversationOperations class.
 """
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from app.services.database.conversations import ConversationOperations
@@ -30,8 +30,13 @@ class TestConversationOperations:
 
     @pytest.fixture
     def mock_client(self):
-        """Create a mock Supabase client."""
-        return MagicMock()
+        """Create a mock async PostgREST client whose queries share one execute mock."""
+        client = MagicMock()
+        query = client.table.return_value
+        for method in ("select", "insert", "update", "delete", "eq", "order", "limit"):
+            getattr(query, method).return_value = query
+        query.execute = AsyncMock()
+        return client
 
     @pytest.fixture
     def conversation_operations(self, mock_client):
@@ -52,17 +57,15 @@ class TestConversationOperations:
         with patch("app.services.rate_limiter.db_rate_limiter.acquire") as mock_rate_limit:
             mock_rate_limit.return_value = True
 
-            with patch("asyncio.to_thread") as mock_to_thread:
-                mock_to_thread.return_value = mock_response
+            mock_execute = mock_client.table.return_value.execute
+            mock_execute.return_value = mock_response
 
-                result = await conversation_operations.get_conversation_history(
-                    "test-user", "conv-1"
-                )
+            result = await conversation_operations.get_conversation_history("test-user", "conv-1")
 
-                assert result == [
-                    {"id": "msg-1", "content": "Hello", "role": "user"},
-                    {"id": "msg-2", "content": "Hi there!", "role": "assistant"},
-                ]
+            assert result == [
+                {"id": "msg-1", "content": "Hello", "role": "user"},
+                {"id": "msg-2", "content": "Hi there!", "role": "assistant"},
+            ]
 
     @pytest.mark.asyncio
     async def test_get_conversation_history_without_conversation_id_success(
@@ -78,15 +81,15 @@ class TestConversationOperations:
         with patch("app.services.rate_limiter.db_rate_limiter.acquire") as mock_rate_limit:
             mock_rate_limit.return_value = True
 
-            with patch("asyncio.to_thread") as mock_to_thread:
-                mock_to_thread.return_value = mock_response
+            mock_execute = mock_client.table.return_value.execute
+            mock_execute.return_value = mock_response
 
-                result = await conversation_operations.get_conversation_history("test-user", None)
+            result = await conversation_operations.get_conversation_history("test-user", None)
 
-                assert result == [
-                    {"id": "conv-1", "title": "First conversation", "messages": 5},
-                    {"id": "conv-2", "title": "Second conversation", "messages": 3},
-                ]
+            assert result == [
+                {"id": "conv-1", "title": "First conversation", "messages": 5},
+                {"id": "conv-2", "title": "Second conversation", "messages": 3},
+            ]
 
     @pytest.mark.asyncio
     async def test_get_conversation_history_invalid_user_id(self, conversation_operations):
@@ -118,13 +121,11 @@ class TestConversationOperations:
         with patch("app.services.rate_limiter.db_rate_limiter.acquire") as mock_rate_limit:
             mock_rate_limit.return_value = True
 
-            with patch("asyncio.to_thread") as mock_to_thread:
-                mock_to_thread.return_value = mock_response
+            mock_execute = mock_client.table.return_value.execute
+            mock_execute.return_value = mock_response
 
-                result = await conversation_operations.get_conversation_history(
-                    "test-user", "conv-1"
-                )
-                assert result == []
+            result = await conversation_operations.get_conversation_history("test-user", "conv-1")
+            assert result == []
 
     @pytest.mark.asyncio
     async def test_get_conversation_history_exception(self, conversation_operations, mock_client):
@@ -132,13 +133,11 @@ class TestConversationOperations:
         with patch("app.services.rate_limiter.db_rate_limiter.acquire") as mock_rate_limit:
             mock_rate_limit.return_value = True
 
-            with patch("asyncio.to_thread") as mock_to_thread:
-                mock_to_thread.side_effect = Exception("Database error")
+            mock_execute = mock_client.table.return_value.execute
+            mock_execute.side_effect = Exception("Database error")
 
-                result = await conversation_operations.get_conversation_history(
-                    "test-user", "conv-1"
-                )
-                assert result == []
+            result = await conversation_operations.get_conversation_history("test-user", "conv-1")
+            assert result == []
 
     @pytest.mark.asyncio
     async def test_save_conversation_message_new_conversation_success(
@@ -148,15 +147,15 @@ class TestConversationOperations:
         with patch("app.services.rate_limiter.db_rate_limiter.acquire") as mock_rate_limit:
             mock_rate_limit.return_value = True
 
-            with patch("asyncio.to_thread") as mock_to_thread:
-                mock_to_thread.return_value = None
+            mock_execute = mock_client.table.return_value.execute
+            mock_execute.return_value = None
 
-                result = await conversation_operations.save_conversation_message(
-                    "test-user", None, "Hello", "Hi there!", "mixed", {"key": "value"}
-                )
+            result = await conversation_operations.save_conversation_message(
+                "test-user", None, "Hello", "Hi there!", "mixed", {"key": "value"}
+            )
 
-                assert result is not None
-                assert isinstance(result, str)
+            assert result is not None
+            assert isinstance(result, str)
 
     @pytest.mark.asyncio
     async def test_save_conversation_message_existing_conversation_success(
@@ -169,15 +168,15 @@ class TestConversationOperations:
         with patch("app.services.rate_limiter.db_rate_limiter.acquire") as mock_rate_limit:
             mock_rate_limit.return_value = True
 
-            with patch("asyncio.to_thread") as mock_to_thread:
-                # Mock the three database operations: get current count, update conversation, insert user message, insert ai message
-                mock_to_thread.side_effect = [current_response, None, None, None]
+            mock_execute = mock_client.table.return_value.execute
+            # Mock the three database operations: get current count, update conversation, insert user message, insert ai message
+            mock_execute.side_effect = [current_response, None, None, None]
 
-                result = await conversation_operations.save_conversation_message(
-                    "test-user", "conv-1", "Hello", "Hi there!"
-                )
+            result = await conversation_operations.save_conversation_message(
+                "test-user", "conv-1", "Hello", "Hi there!"
+            )
 
-                assert result == "conv-1"
+            assert result == "conv-1"
 
     @pytest.mark.asyncio
     async def test_save_conversation_message_invalid_user_id(self, conversation_operations):
@@ -228,13 +227,13 @@ class TestConversationOperations:
         with patch("app.services.rate_limiter.db_rate_limiter.acquire") as mock_rate_limit:
             mock_rate_limit.return_value = True
 
-            with patch("asyncio.to_thread") as mock_to_thread:
-                mock_to_thread.side_effect = Exception("Database error")
+            mock_execute = mock_client.table.return_value.execute
+            mock_execute.side_effect = Exception("Database error")
 
-                result = await conversation_operations.save_conversation_message(
-                    "test-user", "conv-1", "Hello", "Hi there!"
-                )
-                assert result is None
+            result = await conversation_operations.save_conversation_message(
+                "test-user", "conv-1", "Hello", "Hi there!"
+            )
+            assert result is None
 
     @pytest.mark.asyncio
     async def test_get_user_conversations_success(self, conversation_operations, mock_client):
@@ -248,15 +247,15 @@ class TestConversationOperations:
         with patch("app.services.rate_limiter.db_rate_limiter.acquire") as mock_rate_limit:
             mock_rate_limit.return_value = True
 
-            with patch("asyncio.to_thread") as mock_to_thread:
-                mock_to_thread.return_value = mock_response
+            mock_execute = mock_client.table.return_value.execute
+            mock_execute.return_value = mock_response
 
-                result = await conversation_operations.get_user_conversations("test-user", 10)
+            result = await conversation_operations.get_user_conversations("test-user", 10)
 
-                assert result == [
-                    {"id": "conv-1", "title": "First conversation", "messages": 5},
-                    {"id": "conv-2", "title": "Second conversation", "messages": 3},
-                ]
+            assert result == [
+                {"id": "conv-1", "title": "First conversation", "messages": 5},
+                {"id": "conv-2", "title": "Second conversation", "messages": 3},
+            ]
 
     @pytest.mark.asyncio
     async def test_get_user_conversations_invalid_user_id(self, conversation_operations):
@@ -282,11 +281,11 @@ class TestConversationOperations:
         with patch("app.services.rate_limiter.db_rate_limiter.acquire") as mock_rate_limit:
             mock_rate_limit.return_value = True
 
-            with patch("asyncio.to_thread") as mock_to_thread:
-                mock_to_thread.return_value = mock_response
+            mock_execute = mock_client.table.return_value.execute
+            mock_execute.return_value = mock_response
 
-                result = await conversation_operations.get_user_conversations("test-user")
-                assert result == []
+            result = await conversation_operations.get_user_conversations("test-user")
+            assert result == []
 
     @pytest.mark.asyncio
     async def test_get_user_conversations_exception(self, conversation_operations, mock_client):
@@ -294,11 +293,11 @@ class TestConversationOperations:
         with patch("app.services.rate_limiter.db_rate_limiter.acquire") as mock_rate_limit:
             mock_rate_limit.return_value = True
 
-            with patch("asyncio.to_thread") as mock_to_thread:
-                mock_to_thread.side_effect = Exception("Database error")
+            mock_execute = mock_client.table.return_value.execute
+            mock_execute.side_effect = Exception("Database error")
 
-                result = await conversation_operations.get_user_conversations("test-user")
-                assert result == []
+            result = await conversation_operations.get_user_conversations("test-user")
+            assert result == []
 
     @pytest.mark.asyncio
     async def test_archive_conversation_success(self, conversation_operations, mock_client):
@@ -306,11 +305,11 @@ class TestConversationOperations:
         with patch("app.services.rate_limiter.db_rate_limiter.acquire") as mock_rate_limit:
             mock_rate_limit.return_value = True
 
-            with patch("asyncio.to_thread") as mock_to_thread:
-                mock_to_thread.return_value = None
+            mock_execute = mock_client.table.return_value.execute
+            mock_execute.return_value = None
 
-                result = await conversation_operations.archive_conversation("test-user", "conv-1")
-                assert result is True
+            result = await conversation_operations.archive_conversation("test-user", "conv-1")
+            assert result is True
 
     @pytest.mark.asyncio
     async def test_archive_conversation_invalid_user_id(self, conversation_operations):
@@ -339,11 +338,11 @@ class TestConversationOperations:
         with patch("app.services.rate_limiter.db_rate_limiter.acquire") as mock_rate_limit:
             mock_rate_limit.return_value = True
 
-            with patch("asyncio.to_thread") as mock_to_thread:
-                mock_to_thread.side_effect = Exception("Database error")
+            mock_execute = mock_client.table.return_value.execute
+            mock_execute.side_effect = Exception("Database error")
 
-                result = await conversation_operations.archive_conversation("test-user", "conv-1")
-                assert result is False
+            result = await conversation_operations.archive_conversation("test-user", "conv-1")
+            assert result is False
 
     @pytest.mark.asyncio
     async def test_delete_conversation_success(self, conversation_operations, mock_client):
@@ -351,11 +350,11 @@ class TestConversationOperations:
         with patch("app.services.rate_limiter.db_rate_limiter.acquire") as mock_rate_limit:
             mock_rate_limit.return_value = True
 
-            with patch("asyncio.to_thread") as mock_to_thread:
-                mock_to_thread.return_value = None
+            mock_execute = mock_client.table.return_value.execute
+            mock_execute.return_value = None
 
-                result = await conversation_operations.delete_conversation("test-user", "conv-1")
-                assert result is True
+            result = await conversation_operations.delete_conversation("test-user", "conv-1")
+            assert result is True
 
     @pytest.mark.asyncio
     async def test_delete_conversation_invalid_user_id(self, conversation_operations):
@@ -384,11 +383,11 @@ class TestConversationOperations:
         with patch("app.services.rate_limiter.db_rate_limiter.acquire") as mock_rate_limit:
             mock_rate_limit.return_value = True
 
-            with patch("asyncio.to_thread") as mock_to_thread:
-                mock_to_thread.side_effect = Exception("Database error")
+            mock_execute = mock_client.table.return_value.execute
+            mock_execute.side_effect = Exception("Database error")
 
-                result = await conversation_operations.delete_conversation("test-user", "conv-1")
-                assert result is False
+            result = await conversation_operations.delete_conversation("test-user", "conv-1")
+            assert result is False
 
     def test_conversation_operations_init(self, mock_client):
         """Test ConversationOperations initialization."""
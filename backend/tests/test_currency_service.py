@@ -17,11 +17,14 @@
 
 """Unit tests for CurrencyAPI implementation in app.services.currency.api."""
 
+import asyncio
 from unittest.mock import AsyncMock, patch
 
 import httpx
 import pytest
-from app.services.currency.api import CurrencyAPI
+from app.services.cache_warming import CacheWarmer
+from app.services.currency import CurrencyService
+from app.services.currency.api import CurrencyAPI, currency_api
 from app.services.currency.exceptions import CurrencyAPIError, CurrencyValidationError
 
 
@@ -39,7 +42,7 @@ def mock_settings():
 
 
 def _mock_async_client(response_obj):
-    """Create a patched AsyncClient context manager returning a client with get()."""
+    """Create a patched pooled-client session returning a client with get()."""
     client = AsyncMock()
     client.get.return_value = response_obj
     cm = AsyncMock()
@@ -79,7 +82,7 @@ async def test_get_exchange_rates_uses_cache(api: CurrencyAPI):
         patch(
             "app.services.currency.api.enhanced_supabase_cache.set_currency_cache", new=AsyncMock()
         ) as mock_set,
-        patch("app.services.currency.api.httpx.AsyncClient") as mock_client,
+        patch("app.services.currency.api.http_clients.session") as mock_client,
     ):
         mock_client.return_value = _mock_async_client(_make_response())[0]
         result = await api.get_exchange_rates("USD")
@@ -89,6 +92,38 @@ async def test_get_exchange_rates_uses_cache(api: CurrencyAPI):
         mock_client.assert_not_called()
 
 
+@pytest.mark.asyncio
+async def test_get_exchange_rates_coalesces_concurrent_requests(api: CurrencyAPI):
+    data = {
+        "base_code": "USD",
+        "conversion_rates": {"EUR": 0.85},
+        "time_last_update_unix": 1,
+        "time_last_update_utc": "t",
+    }
+    cm, client = _mock_async_client(_make_response(data=data))
+    with (
+        patch(
+            "app.services.currency.api.enhanced_supabase_cache.get_currency_cache",
+            new=AsyncMock(return_value=None),
+        ),
+        patch(
+            "app.services.currency.api.enhanced_supabase_cache.set_currency_cache", new=AsyncMock()
+        ),
+        patch("app.services.currency.api.http_clients.session", return_value=cm),
+    ):
+        results = await asyncio.gather(api.get_exchange_rates("USD"), api.get_exchange_rates("usd"))
+
+    assert results[0] == results[1]
+    assert results[0]["base_code"] == "USD"
+    client.get.assert_awaited_once()
+
+
+def test_callers_share_one_currency_api():
+    """Test the chat and cache warming paths coalesce onto the same in-flight fetches."""
+    assert CurrencyService().api is currency_api
+    assert CacheWarmer().currency_api is currency_api
+
+
 @pytest.mark.asyncio
 async def test_get_exchange_rates_http_success_caches_and_returns(api: CurrencyAPI):
     data = {
@@ -107,7 +142,7 @@ async def test_get_exchange_rates_http_success_caches_and_returns(api: CurrencyA
         patch(
             "app.services.currency.api.enhanced_supabase_cache.set_currency_cache", new=AsyncMock()
         ) as mock_set,
-        patch("app.services.currency.api.httpx.AsyncClient", return_value=cm) as mock_client,
+        patch("app.services.currency.api.http_clients.session", return_value=cm) as mock_client,
     ):
         result = await api.get_exchange_rates("usd")
         assert result["base_code"] == "USD"
@@ -126,7 +161,7 @@ async def test_get_exchange_rates_json_parse_error_returns_none(api: CurrencyAPI
             "app.services.currency.api.enhanced_supabase_cache.get_currency_cache",
             new=AsyncMock(return_value=None),
         ),
-        patch("app.services.currency.api.httpx.AsyncClient", return_value=cm),
+        patch("app.services.currency.api.http_clients.session", return_value=cm),
     ):
         result = await api.get_exchange_rates("USD")
         assert result is None
@@ -141,7 +176,7 @@ async def test_get_exchange_rates_non_dict_json_returns_none(api: CurrencyAPI):
             "app.services.currency.api.enhanced_supabase_cache.get_currency_cache",
             new=AsyncMock(return_value=None),
         ),
-        patch("app.services.currency.api.httpx.AsyncClient", return_value=cm),
+        patch("app.services.currency.api.http_clients.session", return_value=cm),
     ):
         assert await api.get_exchange_rates("USD") is None
 
@@ -156,7 +191,7 @@ async def test_get_exchange_rates_api_error_object_returns_none(api: CurrencyAPI
             "app.services.currency.api.enhanced_supabase_cache.get_currency_cache",
             new=AsyncMock(return_value=None),
         ),
-        patch("app.services.currency.api.httpx.AsyncClient", return_value=cm),
+        patch("app.services.currency.api.http_clients.session", return_value=cm),
     ):
         assert await api.get_exchange_rates("USD") is None
 
@@ -170,7 +205,7 @@ async def test_get_exchange_rates_request_error(api: CurrencyAPI):
             "app.services.currency.api.enhanced_supabase_cache.get_currency_cache",
             new=AsyncMock(return_value=None),
         ),
-        patch("app.services.currency.api.httpx.AsyncClient", return_value=cm),
+        patch("app.services.currency.api.http_clients.session", return_value=cm),
     ):
         assert await api.get_exchange_rates("USD") is None
 
@@ -184,7 +219,7 @@ async def test_get_exchange_rates_http_error(api: CurrencyAPI):
             "app.services.currency.api.enhanced_supabase_cache.get_currency_cache",
             new=AsyncMock(return_value=None),
         ),
-        patch("app.services.currency.api.httpx.AsyncClient", return_value=cm),
+        patch("app.services.currency.api.http_clients.session", return_value=cm),
     ):
         assert await api.get_exchange_rates("USD") is None
 
@@ -198,7 +233,7 @@ async def test_get_exchange_rates_value_error(api: CurrencyAPI):
             "app.services.currency.api.enhanced_supabase_cache.get_currency_cache",
             new=AsyncMock(return_value=None),
         ),
-        patch("app.services.currency.api.httpx.AsyncClient", return_value=cm),
+        patch("app.services.currency.api.http_clients.session", return_value=cm),
     ):
         assert await api.get_exchange_rates("USD") is None
 
@@ -222,7 +257,7 @@ async def test_get_exchange_rates_generic_exception(api: CurrencyAPI):
             "app.services.currency.api.enhanced_supabase_cache.set_currency_cache",
             new=AsyncMock(side_effect=Exception("cache fail")),
         ),
-        patch("app.services.currency.api.httpx.AsyncClient", return_value=cm),
+        patch("app.services.currency.api.http_clients.session", return_value=cm),
     ):
         assert await api.get_exchange_rates("USD") is None
 
@@ -256,7 +291,7 @@ async def test_get_exchange_rates_api_error_result_returns_none(api: CurrencyAPI
             "app.services.currency.api.enhanced_supabase_cache.get_currency_cache",
             new=AsyncMock(return_value=None),
         ),
-        patch("app.services.currency.api.httpx.AsyncClient", return_value=cm),
+        patch("app.services.currency.api.http_clients.session", return_value=cm),
     ):
         result = await api.get_exchange_rates("USD")
         assert result is None
@@ -276,7 +311,7 @@ async def test_get_exchange_rates_missing_required_fields_returns_none(api: Curr
             "app.services.currency.api.enhanced_supabase_cache.get_currency_cache",
             new=AsyncMock(return_value=None),
         ),
-        patch("app.services.currency.api.httpx.AsyncClient", return_value=cm),
+        patch("app.services.currency.api.http_clients.session", return_value=cm),
     ):
         result = await api.get_exchange_rates("USD")
         assert result is None
@@ -291,7 +326,7 @@ async def test_get_exchange_rates_value_error_returns_none(api: CurrencyAPI):
             "app.services.currency.api.enhanced_supabase_cache.get_currency_cache",
             new=AsyncMock(return_value=None),
         ),
-        patch("app.services.currency.api.httpx.AsyncClient", return_value=cm),
+        patch("app.services.currency.api.http_clients.session", return_value=cm),
     ):
         assert await api.get_exchange_rates("USD") is None
 
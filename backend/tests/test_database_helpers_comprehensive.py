@@ -57,8 +57,8 @@ class TestDatabaseHelpersComprehensive:
 
         # Setup the mock chain for conversation messages
         table_mock = MagicMock()
-        table_mock.select.return_value.eq.return_value.order.return_value.execute.return_value = (
-            mock_response
+        table_mock.select.return_value.eq.return_value.order.return_value.execute = AsyncMock(
+            return_value=mock_response
         )
         mock_client.table.return_value = table_mock
 
@@ -90,7 +90,9 @@ class TestDatabaseHelpersComprehensive:
 
         # Setup the mock chain for conversations
         table_mock = MagicMock()
-        table_mock.select.return_value.eq.return_value.eq.return_value.order.return_value.limit.return_value.execute.return_value = mock_response
+        table_mock.select.return_value.eq.return_value.eq.return_value.order.return_value.limit.return_value.execute = AsyncMock(
+            return_value=mock_response
+        )
         mock_client.table.return_value = table_mock
 
         result = await db.get_conversation_history("test-user", None)
@@ -148,7 +150,9 @@ class TestDatabaseHelpersComprehensive:
 
         # Setup table mock to return view data
         mock_table = MagicMock()
-        mock_table.select.return_value.eq.return_value.execute.return_value = view_response
+        mock_table.select.return_value.eq.return_value.execute = AsyncMock(
+            return_value=view_response
+        )
         mock_client.table.return_value = mock_table
 
         result = await db.get_user_profile("test-user")
@@ -176,8 +180,13 @@ class TestDatabaseHelpersComprehensive:
         insert_response = MagicMock()
         update_response = MagicMock()
         table_mock = MagicMock()
-        table_mock.insert.return_value.execute.return_value = insert_response
-        table_mock.update.return_value.eq.return_value.execute.return_value = update_response
+        table_mock.insert.return_value.execute = AsyncMock(return_value=insert_response)
+        table_mock.select.return_value.eq.return_value.execute = AsyncMock(
+            return_value=MagicMock(data=[{"messages": 1}])
+        )
+        table_mock.update.return_value.eq.return_value.execute = AsyncMock(
+            return_value=update_response
+        )
         mock_client.table.return_value = table_mock
 
         result = await db.save_conversation_message(
@@ -221,8 +230,10 @@ class TestDatabaseHelpersComprehensive:
 
         # Setup mocks
         table_mock = MagicMock()
-        table_mock.select.return_value.eq.return_value.execute.return_value = existing_response
-        table_mock.update.return_value.eq.return_value.execute.return_value = MagicMock()
+        table_mock.select.return_value.eq.return_value.execute = AsyncMock(
+            return_value=existing_response
+        )
+        table_mock.update.return_value.eq.return_value.execute = AsyncMock(return_value=MagicMock())
         mock_client.table.return_value = table_mock
 
         result = await db.update_user_preferences(
@@ -244,7 +255,7 @@ class TestDatabaseHelpersComprehensive:
         # Setup mocks
         insert_response = MagicMock()
         table_mock = MagicMock()
-        table_mock.insert.return_value.execute.return_value = insert_response
+        table_mock.insert.return_value.execute = AsyncMock(return_value=insert_response)
         mock_client.table.return_value = table_mock
 
         result = await db.save_recommendation_feedback(
@@ -291,10 +302,10 @@ class TestDatabaseHelpersComprehensive:
 
         # Setup mocks
         table_mock = MagicMock()
-        table_mock.select.return_value.eq.return_value.eq.return_value.execute.return_value = (
-            existing_response
+        table_mock.select.return_value.eq.return_value.eq.return_value.execute = AsyncMock(
+            return_value=existing_response
         )
-        table_mock.insert.return_value.execute.return_value = MagicMock()
+        table_mock.insert.return_value.execute = AsyncMock(return_value=MagicMock())
         mock_client.table.return_value = table_mock
 
         result = await db.save_destination(
@@ -319,10 +330,12 @@ class TestDatabaseHelpersComprehensive:
 
         # Setup mocks
         table_mock = MagicMock()
-        table_mock.select.return_value.eq.return_value.eq.return_value.execute.return_value = (
-            existing_response
+        table_mock.select.return_value.eq.return_value.eq.return_value.execute = AsyncMock(
+            return_value=existing_response
+        )
+        table_mock.update.return_value.eq.return_value.eq.return_value.execute = AsyncMock(
+            return_value=MagicMock()
         )
-        table_mock.update.return_value.eq.return_value.execute.return_value = MagicMock()
         mock_client.table.return_value = table_mock
 
         result = await db.save_destination(
@@ -376,7 +389,9 @@ class TestDatabaseHelpersComprehensive:
 
         # Setup mocks
         table_mock = MagicMock()
-        table_mock.select.return_value.eq.return_value.eq.return_value.order.return_value.limit.return_value.execute.return_value = mock_response
+        table_mock.select.return_value.eq.return_value.eq.return_value.order.return_value.limit.return_value.execute = AsyncMock(
+            return_value=mock_response
+        )
         mock_client.table.return_value = table_mock
 
         result = await db.get_user_conversations("test-user", limit=10)
@@ -409,8 +424,8 @@ class TestDatabaseHelpersComprehensive:
         # Setup mocks
         update_response = MagicMock()
         table_mock = MagicMock()
-        table_mock.update.return_value.eq.return_value.eq.return_value.execute.return_value = (
-            update_response
+        table_mock.update.return_value.eq.return_value.eq.return_value.execute = AsyncMock(
+            return_value=update_response
         )
         mock_client.table.return_value = table_mock
 
@@ -442,7 +457,12 @@ class TestDatabaseHelpersComprehensive:
         # Setup mocks
         delete_response = MagicMock()
         table_mock = MagicMock()
-        table_mock.delete.return_value.eq.return_value.execute.return_value = delete_response
+        table_mock.delete.return_value.eq.return_value.execute = AsyncMock(
+            return_value=delete_response
+        )
+        table_mock.delete.return_value.eq.return_value.eq.return_value.execute = AsyncMock(
+            return_value=delete_response
+        )
         mock_client.table.return_value = table_mock
 
         result = await db.delete_conversation("test-user", "conv-1")
@@ -478,7 +498,7 @@ class TestDatabaseHelpersComprehensive:
 
         # Setup mocks
         table_mock = MagicMock()
-        table_mock.insert.return_value.execute.return_value = mock_response
+        table_mock.insert.return_value.execute = AsyncMock(return_value=mock_response)
         mock_client.table.return_value = table_mock
 
         result = await db.create_chat_session("test-user", "conv-1", "Paris")
@@ -513,7 +533,7 @@ class TestDatabaseHelpersComprehensive:
 
         # Setup mocks
         table_mock = MagicMock()
-        table_mock.insert.return_value.execute.return_value = mock_response
+        table_mock.insert.return_value.execute = AsyncMock(return_value=mock_response)
         mock_client.table.return_value = table_mock
 
         result = await db.create_chat_session("test-user", "conv-1")
@@ -613,25 +633,30 @@ class TestDatabaseHelpersComprehensive:
 
         # Mock the users table query
         users_table_mock = MagicMock()
-        users_table_mock.select.return_value.eq.return_value.execute.return_value = users_response
+        users_table_mock.select.return_value.eq.return_value.execute = AsyncMock(
+            return_value=users_response
+        )
 
         # Mock the profiles table update
         profiles_table_mock = MagicMock()
-        profiles_table_mock.update.return_value.eq.return_value.execute.return_value = (
-            profiles_response
+        profiles_table_mock.select.return_value.eq.return_value.execute = AsyncMock(
+            return_value=users_response
+        )
+        profiles_table_mock.update.return_value.eq.return_value.execute = AsyncMock(
+            return_value=profiles_response
         )
 
         # Mock the user_preferences table operations
         prefs_table_mock = MagicMock()
-        prefs_table_mock.select.return_value.eq.return_value.execute.return_value = MagicMock(
-            data=[]
+        prefs_table_mock.select.return_value.eq.return_value.execute = AsyncMock(
+            return_value=MagicMock(data=[])
         )
-        prefs_table_mock.insert.return_value.execute.return_value = preferences_response
+        prefs_table_mock.insert.return_value.execute = AsyncMock(return_value=preferences_response)
 
         # Mock the user_profile_view final query
         profile_view_table_mock = MagicMock()
-        profile_view_table_mock.select.return_value.eq.return_value.execute.return_value = (
-            profile_view_response
+        profile_view_table_mock.select.return_value.eq.return_value.execute = AsyncMock(
+            return_value=profile_view_response
         )
 
         # Configure table mock to return different mocks based on table name
@@ -674,8 +699,12 @@ class TestDatabaseHelpersComprehensive:
 
         # Setup table mock
         mock_table = MagicMock()
-        mock_table.select.return_value.eq.return_value.execute.return_value = users_response
-        mock_table.update.return_value.eq.return_value.execute.return_value = mock_response
+        mock_table.select.return_value.eq.return_value.execute = AsyncMock(
+            return_value=users_response
+        )
+        mock_table.update.return_value.eq.return_value.execute = AsyncMock(
+            return_value=mock_response
+        )
         mock_client.table.return_value = mock_table
 
         profile_data = {"first_name": "John", "last_name": "Doe"}
@@ -725,25 +754,30 @@ class TestDatabaseHelpersComprehensive:
 
         # Mock the users table query
         users_table_mock = MagicMock()
-        users_table_mock.select.return_value.eq.return_value.execute.return_value = users_response
+        users_table_mock.select.return_value.eq.return_value.execute = AsyncMock(
+            return_value=users_response
+        )
 
         # Mock the profiles table update
         profiles_table_mock = MagicMock()
-        profiles_table_mock.update.return_value.eq.return_value.execute.return_value = (
-            profiles_response
+        profiles_table_mock.select.return_value.eq.return_value.execute = AsyncMock(
+            return_value=users_response
+        )
+        profiles_table_mock.update.return_value.eq.return_value.execute = AsyncMock(
+            return_value=profiles_response
         )
 
         # Mock the user_preferences table operations
         prefs_table_mock = MagicMock()
-        prefs_table_mock.select.return_value.eq.return_value.execute.return_value = (
-            prefs_select_response
+        prefs_table_mock.select.return_value.eq.return_value.execute = AsyncMock(
+            return_value=prefs_select_response
         )
-        prefs_table_mock.insert.return_value.execute.return_value = prefs_insert_response
+        prefs_table_mock.insert.return_value.execute = AsyncMock(return_value=prefs_insert_response)
 
         # Mock the user_profile_view final query
         profile_view_table_mock = MagicMock()
-        profile_view_table_mock.select.return_value.eq.return_value.execute.return_value = (
-            profile_view_response
+        profile_view_table_mock.select.return_value.eq.return_value.execute = AsyncMock(
+            return_value=profile_view_response
         )
 
         # Configure table mock to return different mocks based on table name
@@ -801,7 +835,9 @@ class TestDatabaseHelpersComprehensive:
 
         # Setup table mock
         table_mock = MagicMock()
-        table_mock.select.return_value.eq.return_value.execute.return_value = users_response
+        table_mock.select.return_value.eq.return_value.execute = AsyncMock(
+            return_value=users_response
+        )
         mock_client.table.return_value = table_mock
 
         profile_data = {"first_name": "John", "last_name": "Doe"}
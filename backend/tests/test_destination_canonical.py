@@ -0,0 +1,62 @@
+# This file is part of TravelSytle AI.
+#
+# Copyright (C) 2025  Trailyn Ventures, LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Tests for canonical destination cache keys.
+"""
+
+import pytest
+from app.services.destination import canonical_destination_key
+
+
+class TestCanonicalDestinationKey:
+    """Test destination spellings collapse onto one key."""
+
+    @pytest.mark.parametrize(
+        "destination",
+        ["Paris", "paris", "Paris ", "  PARIS", "Paris, France", "Paris France", "PARÍS"],
+    )
+    def test_paris_spellings(self, destination):
+        """Test case, whitespace, diacritics and country qualifiers are ignored."""
+        assert canonical_destination_key(destination) == "paris, france"
+
+    @pytest.mark.parametrize("destination", ["NYC", "New York City", "new york", "New York, USA"])
+    def test_aliases_map_to_canonical_city(self, destination):
+        """Test gazetteer aliases and country aliases are resolved."""
+        assert canonical_destination_key(destination) == "new york, united states"
+
+    def test_constituent_country_qualifier(self):
+        """Test "London, England" matches the United Kingdom entry."""
+        assert canonical_destination_key("London, England") == "london, united kingdom"
+        assert canonical_destination_key("London, UK") == "london, united kingdom"
+
+    def test_mismatched_qualifier_is_kept(self):
+        """Test a qualifier naming somewhere else keeps the places apart."""
+        assert canonical_destination_key("Paris, Texas") == "paris, texas"
+
+    def test_unknown_places_are_normalized(self):
+        """Test places missing from the gazetteer still get a stable key."""
+        assert canonical_destination_key(" Springfield,  IL ") == "springfield, il"
+        assert canonical_destination_key("Springfield") == "springfield"
+
+    def test_countries(self):
+        """Test countries are keyed on their canonical name."""
+        assert canonical_destination_key("Italia") == "italy"
+
+    def test_blank(self):
+        """Test a blank destination has an empty key."""
+        assert canonical_destination_key("   ") == ""
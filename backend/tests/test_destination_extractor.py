@@ -0,0 +1,138 @@
+# This file is part of TravelSytle AI.
+#
+# Copyright (C) 2025  Trailyn Ventures, LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Tests for the gazetteer-based destination extractor.
+"""
+
+import pytest
+from app.services.destination import DestinationExtractor, destination_extractor, fold_text
+
+
+class TestFoldText:
+    """Test text folding for gazetteer matching."""
+
+    @pytest.mark.parametrize(
+        "text,expected",
+        [
+            ("New York!", "new york "),
+            ("Zürich", "zurich"),
+            ("São Paulo", "sao paulo"),
+            ("weather_paris", "weather paris"),
+            ("Straße", "straße"),
+        ],
+    )
+    def test_fold_text(self, text, expected):
+        """Test folding keeps positions aligned with the original text."""
+        folded = fold_text(text)
+
+        assert folded == expected
+        assert len(folded) == len(text)
+
+
+class TestDestinationExtractor:
+    """Test DestinationExtractor matching and selection rules."""
+
+    @pytest.mark.parametrize(
+        "message,expected",
+        [
+            ("I'm going to Paris", "Paris"),
+            ("Trip to New York", "New York"),
+            ("What's the weather like in NYC?", "New York"),
+            ("What should I pack for my trip to Montréal?", "Montreal"),
+            ("Tell me about São Paulo", "Sao Paulo"),
+            ("weather_paris", "Paris"),
+            ("Mexico City or Mexico?", "Mexico City"),
+            ("Hello there", None),
+        ],
+    )
+    def test_extract(self, message, expected):
+        """Test canonical names are returned for gazetteer places."""
+        assert destination_extractor.extract(message) == expected
+
+    def test_ignores_junk_after_cues(self):
+        """Test phrases such as "to pack for" are not mistaken for destinations."""
+        assert destination_extractor.extract("I need to pack for a week") is None
+        assert destination_extractor.extract("Any tips on money for the trip?") is None
+        assert destination_extractor.extract("Planning a trip in May") is None
+
+    def test_prefers_cued_place_over_origin(self):
+        """Test the place after a destination cue wins over the origin."""
+        assert destination_extractor.extract("Flying from London to Zürich") == "Zurich"
+        assert destination_extractor.extract("Leaving London tomorrow") is None
+
+    def test_uncued_place(self):
+        """Test a place without a cue is still used when it is not an origin."""
+        assert destination_extractor.extract("Lisbon weather this weekend?") == "Lisbon"
+
+    def test_ambiguous_names_need_cue_and_capital(self):
+        """Test names that are also everyday words only match as destinations."""
+        assert destination_extractor.extract("Nice weather in Lisbon") == "Lisbon"
+        assert destination_extractor.extract("I'm going to nice places") is None
+        assert destination_extractor.extract("I'm going to Nice in June") == "Nice"
+
+    def test_word_boundaries(self):
+        """Test places are not matched inside longer words."""
+        assert destination_extractor.extract("Romeo and Juliet") is None
+
+    def test_unlisted_place_after_cue(self):
+        """Test capitalized places missing from the gazetteer are kept after a cue."""
+        assert destination_extractor.extract("Going to Ljubljana in March") == "Ljubljana"
+
+    @pytest.mark.parametrize(
+        "message",
+        [
+            "What should I wear to dinner tonight?",
+            "what to wear in cold weather",
+            "Whats the exchange rate to euros",
+            "shoes to walk in",
+            "what should I wear to church?",
+        ],
+    )
+    def test_lowercase_words_after_cue_are_not_places(self, message):
+        """Test lowercase text only yields gazetteer places, never free-text names."""
+        assert destination_extractor.extract(message) is None
+
+    def test_find_all(self):
+        """Test match positions and cue flags."""
+        message = "From Rome to Florence"
+        matches = destination_extractor.find_all(message)
+
+        assert [m.place.name for m in matches] == ["Rome", "Florence"]
+        assert matches[0].origin and not matches[0].cued
+        assert matches[1].cued and not matches[1].origin
+        assert message[matches[1].start : matches[1].end] == "Florence"
+
+    def test_lookup(self):
+        """Test canonical lookup by alias, case and accents."""
+        place = destination_extractor.lookup("MÜNCHEN")
+
+        assert place.name == "Munich"
+        assert place.country == "Germany"
+        assert place.kind == "city"
+        assert destination_extractor.lookup("Atlantis") is None
+
+    def test_custom_gazetteer(self):
+        """Test the extractor can be built from a custom gazetteer."""
+        extractor = DestinationExtractor(
+            cities={"Ljubljana": ("Slovenia", ("lubiana",))},
+            countries={"Slovenia": ()},
+            ambiguous_names=frozenset(),
+        )
+
+        assert extractor.extract("Trip to Lubiana") == "Ljubljana"
+        assert extractor.lookup("slovenia").kind == "country"
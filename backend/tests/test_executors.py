@@ -0,0 +1,152 @@
+# This file is part of TravelSytle AI.
+#
+# Copyright (C) 2025  Trailyn Ventures, LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Tests for the named thread pools used for blocking calls.
+"""
+
+import asyncio
+import contextvars
+import threading
+
+import pytest
+from app.utils.executors import (
+    BoundedExecutor,
+    ExecutorConfig,
+    ExecutorRegistry,
+    ExecutorSaturatedError,
+)
+
+request_id: contextvars.ContextVar[str] = contextvars.ContextVar("request_id", default="")
+
+
+@pytest.fixture
+def registry():
+    """Registry with two single-thread pools holding at most one waiting call."""
+    registry = ExecutorRegistry(
+        {
+            "media": ExecutorConfig(max_workers=1, max_queue=1),
+            "auth": ExecutorConfig(max_workers=1, max_queue=1),
+        }
+    )
+    yield registry
+    registry.shutdown()
+
+
+class TestBoundedExecutor:
+    """Test running calls and the pool statistics."""
+
+    @pytest.mark.asyncio
+    async def test_runs_in_named_thread_with_context(self):
+        """Test calls run on the pool's threads and see the caller's context variables."""
+        executor = BoundedExecutor("db", max_workers=2, max_queue=4)
+        request_id.set("abc")
+
+        name, value = await executor.run(
+            lambda suffix: (threading.current_thread().name, request_id.get() + suffix), "!"
+        )
+
+        assert name.startswith("db-executor")
+        assert value == "abc!"
+        stats = executor.get_stats()
+        assert stats["completed"] == 1
+        assert stats["queued"] == stats["running"] == 0
+        assert stats["wait"]["count"] == stats["run"]["count"] == 1
+        executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_errors_propagate_and_are_counted(self):
+        """Test an exception in the call reaches the caller and the error counter."""
+        executor = BoundedExecutor("db", max_workers=1, max_queue=1)
+
+        def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            await executor.run(fail)
+
+        assert executor.get_stats()["errors"] == 1
+        executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_full_queue_rejects(self, registry):
+        """Test calls beyond max_queue waiting calls are rejected, not queued."""
+        release = threading.Event()
+        running = asyncio.create_task(registry.run("media", release.wait))
+        await asyncio.sleep(0.05)
+        waiting = asyncio.create_task(registry.run("media", lambda: "done"))
+        await asyncio.sleep(0.05)
+
+        stats = registry.get_stats()["media"]
+        assert (stats["running"], stats["queued"]) == (1, 1)
+        with pytest.raises(ExecutorSaturatedError):
+            await registry.run("media", lambda: "rejected")
+
+        release.set()
+        assert await waiting == "done"
+        await running
+        stats = registry.get_stats()["media"]
+        assert stats["rejected"] == 1
+        assert stats["wait"]["max_ms"] >= 40
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiting_call_leaves_queue(self, registry):
+        """Test cancelling a call that never started frees its queue slot."""
+        release = threading.Event()
+        running = asyncio.create_task(registry.run("media", release.wait))
+        await asyncio.sleep(0.05)
+        waiting = asyncio.create_task(registry.run("media", lambda: "never"))
+        await asyncio.sleep(0.05)
+
+        waiting.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiting
+
+        assert registry.get_stats()["media"]["queued"] == 0
+        release.set()
+        await running
+
+
+class TestExecutorRegistry:
+    """Test pool isolation and lifecycle."""
+
+    @pytest.mark.asyncio
+    async def test_busy_pool_does_not_block_others(self, registry):
+        """Test a stuck media call leaves the auth pool free."""
+        release = threading.Event()
+        upload = asyncio.create_task(registry.run("media", release.wait))
+        await asyncio.sleep(0.05)
+
+        assert await asyncio.wait_for(registry.run("auth", lambda: "signed in"), 1) == "signed in"
+
+        release.set()
+        await upload
+
+    def test_unknown_executor(self, registry):
+        """Test an unknown pool name is rejected."""
+        with pytest.raises(ValueError):
+            registry.get("missing")
+
+    @pytest.mark.asyncio
+    async def test_shutdown_recreates_pools(self, registry):
+        """Test pools are recreated on use after shutdown."""
+        first = registry.get("auth")
+        registry.shutdown()
+
+        assert registry.get_stats() == {}
+        assert registry.get("auth") is not first
+        assert await registry.run("auth", lambda: 1) == 1
@@ -0,0 +1,151 @@
+# This file is part of TravelSytle AI.
+#
+# Copyright (C) 2025  Trailyn Ventures, LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Tests for the shared HTTP client registry.
+"""
+
+import asyncio
+from unittest.mock import patch
+
+import httpx
+import pytest
+from app.services.http_clients import HTTPClientRegistry, UpstreamConfig, UpstreamStats
+
+
+@pytest.fixture
+def registry():
+    """Registry with a single test upstream."""
+    return HTTPClientRegistry({"test": UpstreamConfig(timeout=5.0, max_connections=3)})
+
+
+class TestHTTPClientRegistry:
+    """Test pooled client lifecycle and statistics."""
+
+    @pytest.mark.asyncio
+    async def test_session_reuses_client(self, registry):
+        """Test sessions share one client and leave it open."""
+        async with registry.session("test") as first:
+            pass
+        async with registry.session("test") as second:
+            pass
+
+        assert first is second
+        assert not first.is_closed
+        assert first.timeout.read == 5.0
+        await registry.aclose()
+        assert first.is_closed
+
+    @pytest.mark.asyncio
+    async def test_unknown_upstream(self, registry):
+        """Test an unknown upstream name is rejected."""
+        with pytest.raises(ValueError):
+            registry.get("missing")
+
+    def test_client_recreated_for_new_loop(self, registry):
+        """Test a client is not shared across event loops."""
+
+        async def get_client():
+            return registry.get("test")
+
+        first = asyncio.run(get_client())
+        second = asyncio.run(get_client())
+
+        assert first is not second
+
+    @pytest.mark.asyncio
+    async def test_closed_client_is_recreated(self, registry):
+        """Test a client closed by mistake is replaced."""
+        client = registry.get("test")
+        await client.aclose()
+
+        assert registry.get("test") is not client
+        await registry.aclose()
+
+    @pytest.mark.asyncio
+    async def test_reset_replaces_pool(self, registry):
+        """Test reset closes the client and the next get opens a new one."""
+        client = registry.get("test")
+
+        await registry.reset("test")
+        await registry.reset("test")  # nothing open: no-op
+
+        assert client.is_closed
+        assert registry.get("test") is not client
+        await registry.aclose()
+
+    @pytest.mark.asyncio
+    async def test_start_opens_all_upstreams(self):
+        """Test start() creates a client for every upstream."""
+        registry = HTTPClientRegistry(
+            {"a": UpstreamConfig(timeout=1.0), "b": UpstreamConfig(timeout=2.0)}
+        )
+        await registry.start()
+
+        assert set(registry._clients) == {"a", "b"}
+        await registry.aclose()
+        assert registry._clients == {}
+
+    @pytest.mark.asyncio
+    async def test_http2_falls_back_without_h2(self):
+        """Test HTTP/2 is disabled when the h2 package is missing."""
+        registry = HTTPClientRegistry({"test": UpstreamConfig(timeout=1.0, http2=True)})
+        with (
+            patch("app.services.http_clients.importlib.util.find_spec", return_value=None),
+            patch("app.services.http_clients.httpx.AsyncClient") as mock_client,
+        ):
+            registry.get("test")
+
+        assert mock_client.call_args.kwargs["http2"] is False
+
+    @pytest.mark.asyncio
+    async def test_request_hook_counts_requests(self, registry):
+        """Test requests through the pool are counted."""
+        client = registry.get("test")
+        client._transport = httpx.MockTransport(lambda request: httpx.Response(200))
+
+        await client.get("https://example.com/a")
+        await client.get("https://example.com/b")
+
+        stats = registry.get_stats()["test"]
+        assert stats["requests"] == 2
+        await registry.aclose()
+
+
+class TestUpstreamStats:
+    """Test connection reuse accounting."""
+
+    @pytest.mark.asyncio
+    async def test_reuse_rate(self):
+        """Test only new TCP connections count against reuse."""
+        stats = UpstreamStats()
+        for _ in range(4):
+            request = httpx.Request("GET", "https://example.com")
+            await stats.on_request(request)
+        await stats._trace("connection.connect_tcp.complete", {})
+        await stats._trace("http11.send_request_headers.complete", {})
+
+        assert stats.as_dict() == {
+            "requests": 4,
+            "connections_opened": 1,
+            "reused_requests": 3,
+            "reuse_rate": 0.75,
+        }
+
+    def test_empty_stats(self):
+        """Test statistics before any request."""
+        assert UpstreamStats().as_dict()["reuse_rate"] == 0.0
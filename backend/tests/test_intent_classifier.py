@@ -0,0 +1,164 @@
+# This file is part of TravelSytle AI.
+#
+# Copyright (C) 2025  Trailyn Ventures, LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Tests for the local intent classifier.
+"""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from app.services.intent_classifier import ClassificationCache, IntentClassifier
+
+
+@pytest.fixture
+def classifier() -> IntentClassifier:
+    return IntentClassifier()
+
+
+class TestIntentClassifier:
+    """Test local keyword-based classification."""
+
+    @pytest.mark.parametrize(
+        "message,expected",
+        [
+            ("Convert 100 USD to EUR", "currency"),
+            ("What's the exchange rate?", "currency"),
+            ("What's the weather like in Paris?", "weather"),
+            ("What should I pack for my trip?", "wardrobe"),
+            ("What's the dress code for restaurants?", "style"),
+            ("Tell me about Tokyo", "destination"),
+            ("Do I need a visa for Japan?", "logistics"),
+            ("What are the local customs in Morocco?", "cultural"),
+        ],
+    )
+    def test_confident_local_classification(self, classifier, message, expected):
+        """Test unambiguous messages are classified locally with high confidence."""
+        result = classifier.classify(message)
+
+        assert result.category == expected
+        assert classifier.is_confident(result)
+
+    def test_quick_reply_action(self, classifier):
+        """Test UI quick-reply actions are classified with full confidence."""
+        result = classifier.classify("weather_tokyo")
+
+        assert result.category == "weather"
+        assert result.confidence == 1.0
+
+    def test_no_keywords_is_low_confidence(self, classifier):
+        """Test messages without keywords defer to the LLM."""
+        result = classifier.classify("Hello, how are you?")
+
+        assert result.category == "general"
+        assert result.confidence == 0.0
+        assert not classifier.is_confident(result)
+
+    def test_mixed_signals_are_low_confidence(self, classifier):
+        """Test messages spanning several categories defer to the LLM."""
+        result = classifier.classify(
+            "I would like to go to London from 2025-09-02 until 2025-09-09 "
+            "and manage the currency exchange for the British Pound"
+        )
+
+        assert not classifier.is_confident(result)
+
+    def test_word_boundaries(self, classifier):
+        """Test keywords do not match inside other words."""
+        result = classifier.classify("Is Europe accurate?")
+
+        assert "currency" not in result.scores
+
+    def test_stats(self, classifier):
+        """Test local and LLM fallback statistics."""
+        classifier.classify("Convert 100 USD to EUR")
+        classifier.classify("Hello")
+        classifier.record_llm_fallback("general")
+        classifier.classify("Hi there")
+        classifier.record_llm_fallback(None)
+
+        stats = classifier.get_stats()
+
+        assert stats["total"] == 3
+        assert stats["local"] == 1
+        assert stats["llm_fallbacks"] == 2
+        assert stats["llm_failures"] == 1
+        assert stats["llm_fallback_rate"] == pytest.approx(2 / 3, abs=1e-3)
+        assert stats["categories"] == {"currency": 1, "general": 1}
+
+        classifier.reset_stats()
+        assert classifier.get_stats()["total"] == 0
+
+    def test_classify_without_stats(self, classifier):
+        """Test lookups outside routing leave the statistics untouched."""
+        result = classifier.classify("Convert 100 USD to EUR", record_stats=False)
+
+        assert result.category == "currency"
+        assert classifier.get_stats()["total"] == 0
+
+
+class TestClassificationCache:
+    """Test the two-tier classification cache."""
+
+    @pytest.fixture
+    def cache(self) -> ClassificationCache:
+        return ClassificationCache(maxsize=10)
+
+    def test_normalize(self):
+        """Test near-identical messages share a cache key."""
+        assert ClassificationCache.normalize("Weather for  Tokyo!") == "weather for tokyo"
+        assert ClassificationCache.normalize(" weather for tokyo ") == "weather for tokyo"
+        assert ClassificationCache.normalize("?!") is None
+        assert ClassificationCache.normalize("a" * 500) is None
+
+    @pytest.mark.asyncio
+    async def test_shared_hit_promotes_to_local(self, cache):
+        """Test shared-tier hits are promoted to the in-process tier."""
+        with patch(
+            "app.services.intent_classifier.enhanced_supabase_cache.get_classification_cache",
+            new=AsyncMock(return_value={"category": "weather"}),
+        ) as mock_get:
+            assert await cache.get_shared("weather for tokyo") == "weather"
+
+            mock_get.assert_called_once()
+            assert len(mock_get.call_args[0][0]) == 64
+        assert cache.get_local("weather for tokyo") == "weather"
+        assert cache.get_stats()["shared"]["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_shared_invalid_category_is_miss(self, cache):
+        """Test unknown categories from the shared tier are ignored."""
+        with patch(
+            "app.services.intent_classifier.enhanced_supabase_cache.get_classification_cache",
+            new=AsyncMock(return_value={"category": "bogus"}),
+        ):
+            assert await cache.get_shared("hello") is None
+        assert cache.get_stats()["shared"]["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_set_shared_writes_both_tiers(self, cache):
+        """Test set_shared stores in-process and in Supabase."""
+        with patch(
+            "app.services.intent_classifier.enhanced_supabase_cache.set_classification_cache",
+            new=AsyncMock(return_value=True),
+        ) as mock_set:
+            await cache.set_shared("hello", "general")
+
+            mock_set.assert_called_once()
+            assert mock_set.call_args[0] == (cache._hash("hello"), "general")
+        assert cache.get_local("hello") == "general"
+        assert cache.get_stats()["shared"]["writes"] == 1
@@ -19,7 +19,7 @@
 Tests for main FastAPI app endpoints.
 """
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from fastapi import status
 
@@ -64,7 +64,17 @@ def test_lifespan_startup_and_shutdown():
     from app.travelstyle import lifespan
 
     # Mock logger to capture log messages
-    with patch("app.travelstyle.logger") as mock_logger:
+    with (
+        patch("app.travelstyle.logger") as mock_logger,
+        patch("app.travelstyle.http_clients") as mock_http_clients,
+        patch("app.travelstyle.enhanced_supabase_cache") as mock_cache,
+    ):
+        mock_http_clients.start = AsyncMock()
+        mock_http_clients.aclose = AsyncMock()
+        mock_cache.drain_refreshes = AsyncMock()
+        mock_cache.flush_writes = AsyncMock()
+        mock_cache.backend.close = AsyncMock()
+
         # Test the lifespan context manager
         async def test_lifespan():
             async with lifespan(None):
@@ -80,6 +90,40 @@ def test_lifespan_startup_and_shutdown():
         assert mock_logger.info.call_count == 2
         mock_logger.info.assert_any_call("Starting TravelStyle AI application...")
         mock_logger.info.assert_any_call("Shutting down TravelStyle AI application...")
+        mock_http_clients.start.assert_awaited_once()
+        mock_http_clients.aclose.assert_awaited_once()
+        mock_cache.drain_refreshes.assert_awaited_once()
+        mock_cache.flush_writes.assert_awaited_once()
+        mock_cache.backend.close.assert_awaited_once()
+
+
+def test_lifespan_keeps_executors():
+    """Test the lifespan leaves the blocking-call pools and their statistics intact."""
+    from app.travelstyle import lifespan
+    from app.utils.executors import executors
+
+    pool = executors.get("db")
+
+    async def run_lifespan():
+        async with lifespan(None):
+            pass
+
+    with (
+        patch("app.travelstyle.http_clients") as mock_http_clients,
+        patch("app.travelstyle.enhanced_supabase_cache") as mock_cache,
+        patch("app.travelstyle.supabase_health_monitor") as mock_monitor,
+    ):
+        mock_http_clients.start = AsyncMock()
+        mock_http_clients.aclose = AsyncMock()
+        mock_cache.drain_refreshes = AsyncMock()
+        mock_cache.flush_writes = AsyncMock()
+        mock_cache.backend.close = AsyncMock()
+        mock_monitor.stop = AsyncMock()
+        import asyncio
+
+        asyncio.run(run_lifespan())
+
+    assert executors.get("db") is pool
 
 
 def test_main_block_exists():
@@ -122,7 +166,13 @@ def test_handler_success():
     context = MagicMock()
 
     # Mock logger to capture log messages
-    with patch("app.travelstyle.logger") as mock_logger:
+    with (
+        patch("app.travelstyle.logger") as mock_logger,
+        patch("app.travelstyle.http_clients") as mock_http_clients,
+    ):
+        mock_http_clients.start = AsyncMock()
+        mock_http_clients.aclose = AsyncMock()
+
         # Mock Mangum to return a successful response
         with patch("app.travelstyle.Mangum") as mock_mangum:
             mock_mangum_instance = MagicMock()
@@ -166,7 +216,13 @@ def test_handler_with_query_parameters():
     context = MagicMock()
 
     # Mock logger to capture log messages
-    with patch("app.travelstyle.logger") as mock_logger:
+    with (
+        patch("app.travelstyle.logger") as mock_logger,
+        patch("app.travelstyle.http_clients") as mock_http_clients,
+    ):
+        mock_http_clients.start = AsyncMock()
+        mock_http_clients.aclose = AsyncMock()
+
         # Mock Mangum to return a successful response
         with patch("app.travelstyle.Mangum") as mock_mangum:
             mock_mangum_instance = MagicMock()
@@ -204,7 +260,13 @@ def test_handler_with_missing_path():
     context = MagicMock()
 
     # Mock logger to capture log messages
-    with patch("app.travelstyle.logger") as mock_logger:
+    with (
+        patch("app.travelstyle.logger") as mock_logger,
+        patch("app.travelstyle.http_clients") as mock_http_clients,
+    ):
+        mock_http_clients.start = AsyncMock()
+        mock_http_clients.aclose = AsyncMock()
+
         # Mock Mangum to return a successful response
         with patch("app.travelstyle.Mangum") as mock_mangum:
             mock_mangum_instance = MagicMock()
@@ -240,7 +302,13 @@ def test_handler_with_missing_http_method():
     context = MagicMock()
 
     # Mock logger to capture log messages
-    with patch("app.travelstyle.logger") as mock_logger:
+    with (
+        patch("app.travelstyle.logger") as mock_logger,
+        patch("app.travelstyle.http_clients") as mock_http_clients,
+    ):
+        mock_http_clients.start = AsyncMock()
+        mock_http_clients.aclose = AsyncMock()
+
         # Mock Mangum to return a successful response
         with patch("app.travelstyle.Mangum") as mock_mangum:
             mock_mangum_instance = MagicMock()
@@ -276,7 +344,13 @@ def test_handler_with_missing_query_parameters():
     context = MagicMock()
 
     # Mock logger to capture log messages
-    with patch("app.travelstyle.logger") as mock_logger:
+    with (
+        patch("app.travelstyle.logger") as mock_logger,
+        patch("app.travelstyle.http_clients") as mock_http_clients,
+    ):
+        mock_http_clients.start = AsyncMock()
+        mock_http_clients.aclose = AsyncMock()
+
         # Mock Mangum to return a successful response
         with patch("app.travelstyle.Mangum") as mock_mangum:
             mock_mangum_instance = MagicMock()
@@ -313,7 +387,13 @@ def test_handler_exception():
     context = MagicMock()
 
     # Mock logger to capture log messages
-    with patch("app.travelstyle.logger") as mock_logger:
+    with (
+        patch("app.travelstyle.logger") as mock_logger,
+        patch("app.travelstyle.http_clients") as mock_http_clients,
+    ):
+        mock_http_clients.start = AsyncMock()
+        mock_http_clients.aclose = AsyncMock()
+
         # Mock Mangum to raise an exception
         with patch("app.travelstyle.Mangum") as mock_mangum:
             mock_mangum_instance = MagicMock()
@@ -366,7 +446,13 @@ def test_handler_with_post_request():
     context = MagicMock()
 
     # Mock logger to capture log messages
-    with patch("app.travelstyle.logger") as mock_logger:
+    with (
+        patch("app.travelstyle.logger") as mock_logger,
+        patch("app.travelstyle.http_clients") as mock_http_clients,
+    ):
+        mock_http_clients.start = AsyncMock()
+        mock_http_clients.aclose = AsyncMock()
+
         # Mock Mangum to return a successful response
         with patch("app.travelstyle.Mangum") as mock_mangum:
             mock_mangum_instance = MagicMock()
@@ -405,7 +491,13 @@ def test_handler_with_base64_encoded_body():
     context = MagicMock()
 
     # Mock logger to capture log messages
-    with patch("app.travelstyle.logger") as mock_logger:
+    with (
+        patch("app.travelstyle.logger") as mock_logger,
+        patch("app.travelstyle.http_clients") as mock_http_clients,
+    ):
+        mock_http_clients.start = AsyncMock()
+        mock_http_clients.aclose = AsyncMock()
+
         # Mock Mangum to return a successful response
         with patch("app.travelstyle.Mangum") as mock_mangum:
             mock_mangum_instance = MagicMock()
@@ -465,3 +557,41 @@ def test_handler_logging_and_print():
 
                 # Verify the response is returned
                 assert response == mock_response
+
+
+def test_handler_scheduled_event_warms_caches():
+    """Test that the warming rule's input runs the cache warmer instead of Mangum."""
+    from app.travelstyle import handler
+
+    event = {"task": "warm_cache"}
+    report = {"destinations": ["Paris"], "currencies": ["USD"]}
+
+    with (
+        patch("app.travelstyle.CacheWarmer") as mock_warmer,
+        patch("app.travelstyle.Mangum") as mock_mangum,
+    ):
+        mock_warmer.return_value.run = AsyncMock(return_value=report)
+
+        response = handler(event, MagicMock())
+
+    assert response == report
+    mock_warmer.return_value.run.assert_awaited_once()
+    mock_mangum.assert_not_called()
+
+
+def test_handler_other_scheduled_event_does_not_warm():
+    """Test a scheduled event without the warming input (e.g. keep-warm) skips the warmer."""
+    from app.travelstyle import handler
+
+    event = {"source": "aws.events", "detail-type": "Scheduled Event", "detail": {}}
+
+    with (
+        patch("app.travelstyle.CacheWarmer") as mock_warmer,
+        patch("app.travelstyle.Mangum") as mock_mangum,
+    ):
+        mock_mangum.return_value.return_value = {"statusCode": 200}
+
+        handler(event, MagicMock())
+
+    mock_warmer.assert_not_called()
+    mock_mangum.return_value.assert_called_once()
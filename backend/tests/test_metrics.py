@@ -0,0 +1,143 @@
+# This file is part of TravelSytle AI.
+#
+# Copyright (C) 2025  Trailyn Ventures, LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Tests for cache metrics and the internal metrics endpoint.
+"""
+
+import json
+import logging
+from unittest.mock import patch
+
+import pytest
+from app.utils.metrics import CacheMetrics, LatencyHistogram
+from fastapi import status
+
+
+class TestLatencyHistogram:
+    """Test bucketing and percentile estimates."""
+
+    def test_observe_buckets(self):
+        """Test durations land in the bucket of their upper bound."""
+        histogram = LatencyHistogram((1, 10, 100))
+        for seconds in (0.0005, 0.005, 0.05, 5.0):
+            histogram.observe(seconds)
+
+        stats = histogram.as_dict()
+        assert stats["count"] == 4
+        assert stats["buckets"] == {"le_1ms": 1, "le_10ms": 1, "le_100ms": 1, "inf": 1}
+        assert stats["max_ms"] == 5000.0
+
+    def test_percentiles(self):
+        """Test percentiles report bucket upper bounds, capped by the maximum."""
+        histogram = LatencyHistogram((1, 10, 100))
+        for _ in range(95):
+            histogram.observe(0.0005)
+        for _ in range(5):
+            histogram.observe(0.05)
+
+        assert histogram.percentile(0.5) == 1
+        assert histogram.percentile(0.99) == 50.0
+
+    def test_empty(self):
+        """Test an empty histogram reports zeros."""
+        stats = LatencyHistogram().as_dict()
+        assert stats["count"] == 0
+        assert stats["p95_ms"] == 0.0
+
+
+class TestCacheMetrics:
+    """Test per-cache-type counters and summaries."""
+
+    def test_snapshot_hit_rate(self):
+        """Test the hit rate counts every hit outcome over every lookup."""
+        metrics = CacheMetrics(log_interval_seconds=0)
+        for outcome in ("local_hits", "remote_hits", "stale_hits", "misses"):
+            metrics.record_lookup("weather", outcome, "paris, france", 0.001)
+        metrics.incr("weather", "rate_limited_reads")
+
+        stats = metrics.snapshot()["weather"]
+        assert stats["lookups"] == 4
+        assert stats["hit_rate"] == 0.75
+        assert stats["counters"]["rate_limited_reads"] == 1
+        assert stats["latency"]["lookup"]["count"] == 4
+
+    def test_track_counts_errors(self):
+        """Test track() times the block and counts failures."""
+        metrics = CacheMetrics(log_interval_seconds=0)
+        with metrics.track("currency", "upstream"):
+            pass
+        with pytest.raises(RuntimeError), metrics.track("currency", "upstream"):
+            raise RuntimeError("boom")
+
+        stats = metrics.snapshot()["currency"]
+        assert stats["counters"] == {"upstream_calls": 2, "upstream_errors": 1}
+        assert stats["latency"]["upstream"]["count"] == 2
+
+    def test_summary_logged_as_json(self, caplog):
+        """Test the periodic summary is one JSON log line."""
+        metrics = CacheMetrics(log_interval_seconds=0.000001)
+        with caplog.at_level(logging.INFO, logger="app.utils.metrics"):
+            metrics.record_lookup("cultural", "misses", "paris, france", 0.002)
+
+        summary = json.loads(caplog.records[-1].getMessage())
+        assert summary["event"] == "cache_metrics"
+        assert summary["caches"]["cultural"]["counters"] == {"misses": 1}
+        assert "buckets" not in summary["caches"]["cultural"]["latency"]["lookup"]
+
+    def test_reset(self):
+        """Test reset() drops all recorded data."""
+        metrics = CacheMetrics(log_interval_seconds=0)
+        metrics.incr("weather", "misses")
+        metrics.reset()
+
+        assert metrics.snapshot() == {}
+
+
+class TestMetricsEndpoint:
+    """Test the internal metrics endpoint and its token guard."""
+
+    def test_development_without_token(self, client):
+        """Test the endpoint is open in development when no token is configured."""
+        with (
+            patch("app.api.deps.settings.METRICS_TOKEN", ""),
+            patch("app.api.deps.settings.TS_ENVIRONMENT", "development"),
+        ):
+            response = client.get("/api/v1/internal/metrics")
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert {"caches", "cache_tiers", "http_clients", "single_flight"} <= data.keys()
+
+    def test_hidden_in_production_without_token(self, client):
+        """Test the endpoint does not exist in production without a token."""
+        with (
+            patch("app.api.deps.settings.METRICS_TOKEN", ""),
+            patch("app.api.deps.settings.TS_ENVIRONMENT", "production"),
+        ):
+            response = client.get("/api/v1/internal/metrics")
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_token_required(self, client):
+        """Test a configured token must be presented."""
+        with patch("app.api.deps.settings.METRICS_TOKEN", "secret"):
+            denied = client.get("/api/v1/internal/metrics", headers={"X-Metrics-Token": "x"})
+            allowed = client.get("/api/v1/internal/metrics", headers={"X-Metrics-Token": "secret"})
+
+        assert denied.status_code == status.HTTP_403_FORBIDDEN
+        assert allowed.status_code == status.HTTP_200_OK
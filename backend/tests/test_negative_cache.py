@@ -0,0 +1,121 @@
+# This file is part of TravelSytle AI.
+#
+# Copyright (C) 2025  Trailyn Ventures, LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Tests for negative caching of failed upstream lookups.
+"""
+
+from unittest.mock import patch
+
+import httpx
+import pytest
+from app.services.supabase.supabase_cache_v2 import EnhancedSupabaseCacheService
+from app.utils.metrics import cache_metrics
+from app.utils.negative_cache import NegativeCache, classify_failure
+
+REQUEST = httpx.Request("GET", "https://upstream.example/")
+
+
+def status_error(status: int) -> httpx.HTTPStatusError:
+    """An HTTPStatusError for a reply with the given status."""
+    return httpx.HTTPStatusError(
+        "error", request=REQUEST, response=httpx.Response(status, request=REQUEST)
+    )
+
+
+class TestClassifyFailure:
+    """Test mapping exceptions to failure classes."""
+
+    @pytest.mark.parametrize(
+        ("error", "failure"),
+        [
+            (status_error(400), "not_found"),
+            (status_error(404), "not_found"),
+            (status_error(429), "unavailable"),
+            (status_error(503), "unavailable"),
+            (status_error(401), "error"),
+            (httpx.ReadTimeout("slow", request=REQUEST), "timeout"),
+            (httpx.ConnectError("refused", request=REQUEST), "unavailable"),
+            (ValueError("bad json"), "error"),
+        ],
+    )
+    def test_failure_classes(self, error, failure):
+        """Test each exception type maps to its failure class."""
+        assert classify_failure(error) == failure
+
+
+class TestNegativeCache:
+    """Test NegativeCache TTLs."""
+
+    def test_definitive_failures_use_long_ttl(self):
+        """Test not_found and no_data outlive transient failures."""
+        cache = NegativeCache(ttl_seconds=300, transient_ttl_seconds=30)
+        with patch("app.utils.ttl_cache.time.monotonic", return_value=1000.0):
+            cache.set("weather:nowhere", "not_found")
+            cache.set("weather:paris", "timeout")
+
+        with patch("app.utils.ttl_cache.time.monotonic", return_value=1100.0):
+            assert cache.get("weather:nowhere") == "not_found"
+            assert cache.get("weather:paris") is None
+
+    def test_delete(self):
+        """Test a success can clear a recorded failure."""
+        cache = NegativeCache()
+        cache.set("currency:USD", "unavailable")
+        cache.delete("currency:USD")
+
+        assert cache.get("currency:USD") is None
+
+
+class TestCacheServiceFailures:
+    """Test failure recording on EnhancedSupabaseCacheService."""
+
+    @pytest.fixture
+    def service(self):
+        cache_metrics.reset()
+        service = EnhancedSupabaseCacheService()
+        service.write_behind_enabled = True
+        yield service
+        service.writes.clear()
+        cache_metrics.reset()
+
+    def test_destination_spellings_share_failures(self, service):
+        """Test failures are keyed by canonical destination and counted in metrics."""
+        service.set_failure("weather", "Paris, France", "not_found")
+
+        assert service.get_failure("weather", "paris") == "not_found"
+        assert service.get_failure("cultural", "paris") is None
+        counters = cache_metrics.snapshot()["weather"]["counters"]
+        assert counters["negative_hits"] == 1
+        assert counters["negative_stores_not_found"] == 1
+
+    @pytest.mark.asyncio
+    async def test_successful_write_clears_failure(self, service):
+        """Test caching fresh data forgets an earlier failure for the key."""
+        service.set_failure("currency", "USD", "timeout")
+
+        await service.set_currency_cache("USD", {"EUR": 0.85})
+
+        assert service.get_failure("currency", "USD") is None
+
+    def test_disabled(self, service):
+        """Test nothing is recorded when negative caching is disabled."""
+        service.negative_enabled = False
+        service.set_failure("currency", "USD", "timeout")
+
+        assert service.get_failure("currency", "USD") is None
+        assert len(service.negative.failures) == 0
@@ -4,6 +4,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from app.models.responses import ChatResponse
+from app.services.chat_stream import ChatStream, _active_stream
 from app.services.openai.openai_service import OpenAIService
 from openai.types.chat import ChatCompletion
 from openai.types.chat.chat_completion import Choice
@@ -97,6 +98,57 @@ class TestOpenAIService:
         assert "I apologize, but I'm having trouble" in result.message
         assert result.confidence_score == 0.0
 
+    @pytest.mark.asyncio
+    async def test_generate_response_streams_to_active_stream(self):
+        """Test completion chunks are relayed when a chat stream is active."""
+
+        async def chunks():
+            for content in ["Pack ", "layers [QUI", 'CK: "Show layers"]', None]:
+                yield MagicMock(choices=[MagicMock(delta=MagicMock(content=content))])
+
+        self.service.client.chat.completions.create.return_value = chunks()
+        stream = ChatStream()
+        token = _active_stream.set(stream)
+        try:
+            result = await self.service.generate_response(
+                user_message="What should I pack?", conversation_history=[]
+            )
+        finally:
+            _active_stream.reset(token)
+
+        assert self.service.client.chat.completions.create.call_args.kwargs["stream"] is True
+        assert result.message == "Pack layers"
+        assert [qr.text for qr in result.quick_replies] == ["Show layers"]
+        events = []
+        while not stream._queue.empty():
+            events.append(stream._queue.get_nowait())
+        assert events == [
+            ("token", {"text": "Pack "}),
+            ("token", {"text": "layers "}),
+            ("quick_reply", {"text": "Show layers", "action": None}),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_generate_response_stream_failure_interrupts(self):
+        """Test a completion failing after streamed text marks the stream interrupted."""
+
+        async def chunks():
+            yield MagicMock(choices=[MagicMock(delta=MagicMock(content="Pack "))])
+            raise RuntimeError("connection reset")
+
+        self.service.client.chat.completions.create.return_value = chunks()
+        stream = ChatStream()
+        token = _active_stream.set(stream)
+        try:
+            result = await self.service.generate_response(
+                user_message="What should I pack?", conversation_history=[]
+            )
+        finally:
+            _active_stream.reset(token)
+
+        assert result.confidence_score == 0.0
+        assert stream.interrupted
+
     @pytest.mark.asyncio
     async def test_get_completion_success(self):
         """Test successful completion retrieval."""
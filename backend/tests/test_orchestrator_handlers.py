@@ -19,12 +19,13 @@
 Additional tests for TravelOrchestratorService handlers, routing, and AI classification functionality.
 """
 
+import asyncio
 from unittest.mock import AsyncMock, patch
 
 import pytest
 from app.models.responses import ChatResponse, ConversationContext
 from app.services.openai.openai_service import openai_service
-from app.services.orchestrator import TravelOrchestratorService
+from app.services.orchestrator import ContextPrefetch, TravelOrchestratorService
 from app.services.qloo import qloo_service
 from app.services.weather import weather_service
 
@@ -439,6 +440,13 @@ class TestOrchestratorRouting:
         assert orchestrator._determine_message_type("Hello") == "general"
         assert orchestrator._determine_message_type("How are you?") == "general"
 
+    def test_determine_message_type_is_not_counted(self, orchestrator):
+        """Test the rule-based helper does not inflate routing statistics."""
+        total = orchestrator.get_classification_stats()["total"]
+        orchestrator._determine_message_type("Convert USD to EUR")
+
+        assert orchestrator.get_classification_stats()["total"] == total
+
     def test_extract_destination(self, orchestrator):
         """Test destination extraction from messages."""
         assert orchestrator._extract_destination("I'm going to Paris") == "Paris"
@@ -532,27 +540,42 @@ class TestOrchestratorRouting:
 class TestOrchestratorAIClassification:
     """Test the AI-based message classification functionality."""
 
+    @pytest.fixture(autouse=True)
+    def shared_classification_cache(self):
+        """Keep the shared classification cache tier off the network."""
+        with (
+            patch(
+                "app.services.intent_classifier.enhanced_supabase_cache.get_classification_cache",
+                new=AsyncMock(return_value=None),
+            ) as mock_get,
+            patch(
+                "app.services.intent_classifier.enhanced_supabase_cache.set_classification_cache",
+                new=AsyncMock(return_value=True),
+            ) as mock_set,
+        ):
+            yield mock_get, mock_set
+
     @pytest.mark.asyncio
     async def test_classify_currency_message(self, orchestrator):
-        """Test classification of currency-related messages."""
+        """Test unambiguous currency messages are classified locally without OpenAI."""
         with patch("app.services.orchestrator.openai_service") as mock_openai:
-            mock_openai.get_completion.return_value = "currency"
+            mock_openai.get_completion.return_value = "general"
 
             result = await orchestrator._classify_message("I want to convert USD to EUR")
 
             assert result == "currency"
-            mock_openai.get_completion.assert_called_once()
+            mock_openai.get_completion.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_classify_weather_message(self, orchestrator):
-        """Test classification of weather-related messages."""
+        """Test unambiguous weather messages are classified locally without OpenAI."""
         with patch("app.services.orchestrator.openai_service") as mock_openai:
-            mock_openai.get_completion.return_value = "weather"
+            mock_openai.get_completion.return_value = "general"
 
             result = await orchestrator._classify_message("What's the weather like in Paris?")
 
             assert result == "weather"
-            mock_openai.get_completion.assert_called_once()
+            mock_openai.get_completion.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_classify_logistics_message(self, orchestrator):
@@ -588,6 +611,42 @@ class TestOrchestratorAIClassification:
 
             assert result == "general"
 
+    @pytest.mark.asyncio
+    async def test_classify_fallback_uses_local_guess(self, orchestrator):
+        """Test that a failed LLM fallback keeps the best local guess."""
+        with patch("app.services.orchestrator.openai_service") as mock_openai:
+            mock_openai.get_completion.side_effect = Exception("API Error")
+
+            result = await orchestrator._classify_message("Any tips on money for the trip?")
+
+            assert result == "currency"
+            mock_openai.get_completion.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_classify_llm_decision_is_cached(self, orchestrator, shared_classification_cache):
+        """Test LLM decisions are cached in both tiers and reused for similar messages."""
+        _, mock_set = shared_classification_cache
+        with patch("app.services.orchestrator.openai_service") as mock_openai:
+            mock_openai.get_completion.return_value = "general"
+
+            first = await orchestrator._classify_message("Hello, how are you?")
+            second = await orchestrator._classify_message("hello how are you")
+
+            assert first == second == "general"
+            mock_openai.get_completion.assert_called_once()
+            mock_set.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_classify_uses_shared_cache(self, orchestrator, shared_classification_cache):
+        """Test a shared-tier hit skips the LLM call."""
+        mock_get, _ = shared_classification_cache
+        mock_get.return_value = {"category": "cultural"}
+        with patch("app.services.orchestrator.openai_service") as mock_openai:
+            result = await orchestrator._classify_message("Anything I should know?")
+
+            assert result == "cultural"
+            mock_openai.get_completion.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_classify_invalid_response(self, orchestrator):
         """Test classification handles invalid responses."""
@@ -631,3 +690,223 @@ class TestOrchestratorAIClassification:
         # Test no dates
         dates = orchestrator._extract_travel_dates("Hello there")
         assert dates is None
+
+
+# ---- concurrent context fetching ----
+
+
+@pytest.mark.asyncio
+async def test_gather_destination_context_runs_concurrently(
+    orchestrator: TravelOrchestratorService,
+):
+    """Test weather and cultural fetches overlap instead of running back to back."""
+    started: list[str] = []
+    both_started = asyncio.Event()
+
+    async def fetch(name, result):
+        started.append(name)
+        if len(started) == 2:
+            both_started.set()
+        await asyncio.wait_for(both_started.wait(), timeout=1.0)
+        return result
+
+    async def fetch_weather(*args):
+        return await fetch("weather", {"description": "Mild"})
+
+    async def fetch_cultural(*args):
+        return await fetch("cultural", {"summary": "Tips"})
+
+    with (
+        patch.object(weather_service, "get_weather_data", new=fetch_weather),
+        patch.object(qloo_service, "get_cultural_insights", new=fetch_cultural),
+    ):
+        weather, cultural = await orchestrator._gather_destination_context(
+            "Lisbon", None, "leisure"
+        )
+
+    assert weather == {"description": "Mild"}
+    assert cultural == {"summary": "Tips"}
+    assert sorted(started) == ["cultural", "weather"]
+
+
+@pytest.mark.asyncio
+async def test_gather_destination_context_partial_on_timeout(
+    orchestrator: TravelOrchestratorService,
+):
+    """Test a slow source times out without discarding the other source."""
+
+    async def slow(*args):
+        await asyncio.sleep(5)
+        return {"description": "late"}
+
+    orchestrator.context_timeouts = {"weather": 0.01, "cultural": 1.0}
+    with (
+        patch.object(weather_service, "get_weather_data", new=slow),
+        patch.object(
+            qloo_service,
+            "get_cultural_insights",
+            new=AsyncMock(return_value={"summary": "Tips"}),
+        ),
+    ):
+        weather, cultural = await orchestrator._gather_destination_context(
+            "Lisbon", None, "leisure"
+        )
+
+    assert weather is None
+    assert cultural == {"summary": "Tips"}
+
+
+@pytest.mark.asyncio
+async def test_gather_destination_context_without_destination(
+    orchestrator: TravelOrchestratorService,
+):
+    """Test no upstream calls are made without a destination."""
+    with (
+        patch.object(weather_service, "get_weather_data", new=AsyncMock()) as mock_weather,
+        patch.object(qloo_service, "get_cultural_insights", new=AsyncMock()) as mock_cultural,
+    ):
+        assert await orchestrator._gather_destination_context(None, None, "leisure") == (
+            None,
+            None,
+        )
+
+    mock_weather.assert_not_called()
+    mock_cultural.assert_not_called()
+
+
+# ---- speculative context prefetch ----
+
+
+@pytest.mark.asyncio
+async def test_route_message_prefetches_during_classification(
+    orchestrator: TravelOrchestratorService,
+):
+    """Test weather is fetched while classifying and reused by the wardrobe handler."""
+    calls: list[str] = []
+
+    async def fetch_weather(destination, dates):
+        calls.append(destination)
+        return {"description": "Mild"}
+
+    async def slow_classify(message):
+        await asyncio.sleep(0.01)
+        # The prefetch has already started before classification finished
+        assert calls == ["Lisbon"]
+        return "wardrobe"
+
+    ctx = ConversationContext(user_id="u1", destination="Lisbon")
+    generate = AsyncMock(return_value=ChatResponse(message="pack", confidence_score=0.9))
+    with (
+        patch.object(orchestrator, "_classify_message", new=slow_classify),
+        patch.object(weather_service, "get_weather_data", new=fetch_weather),
+        patch.object(qloo_service, "get_cultural_insights", new=AsyncMock(return_value=None)),
+        patch.object(openai_service, "generate_response", new=generate),
+    ):
+        res = await orchestrator.route_message("What should I pack?", ctx, [], None)
+
+    assert res.message == "pack"
+    assert calls == ["Lisbon"]
+    assert generate.call_args.kwargs["weather_context"] == {"description": "Mild"}
+
+
+@pytest.mark.asyncio
+async def test_logistics_prefetch_uses_handler_arguments(
+    orchestrator: TravelOrchestratorService,
+):
+    """Test a logistics prefetch takes message dates like the handler and is reused."""
+    weather = AsyncMock(return_value={"description": "Mild"})
+    cultural = AsyncMock(return_value={"summary": "Formal"})
+
+    async def slow_classify(message):
+        await asyncio.sleep(0.01)
+        return "logistics"
+
+    ctx = ConversationContext(user_id="u1", destination="Lisbon")
+    generate = AsyncMock(return_value=ChatResponse(message="plan", confidence_score=0.9))
+    with (
+        patch.object(orchestrator, "_classify_message", new=slow_classify),
+        patch.object(weather_service, "get_weather_data", new=weather),
+        patch.object(qloo_service, "get_cultural_insights", new=cultural),
+        patch.object(openai_service, "generate_response", new=generate),
+    ):
+        await orchestrator.route_message(
+            "Plan my business trip from 2025-09-02 to 2025-09-09", ctx, [], None
+        )
+
+    weather.assert_called_once_with("Lisbon", ["2025-09-02", "2025-09-09"])
+    cultural.assert_called_once_with("Lisbon", "leisure")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("message", ["What's the exchange rate to euros?", "Hello, how are you?"])
+async def test_no_prefetch_for_currency_or_general_guess(
+    orchestrator: TravelOrchestratorService, message: str
+):
+    """Test messages the local classifier sees as currency or chat spend no upstream calls."""
+    weather = AsyncMock(return_value=None)
+    cultural = AsyncMock(return_value=None)
+
+    async def slow_classify(message):
+        await asyncio.sleep(0.01)
+        return "currency"
+
+    ctx = ConversationContext(user_id="u1", destination="Tokyo")
+    with (
+        patch.object(orchestrator, "_classify_message", new=slow_classify),
+        patch.object(weather_service, "get_weather_data", new=weather),
+        patch.object(qloo_service, "get_cultural_insights", new=cultural),
+        patch.object(
+            orchestrator, "_handle_currency_request", new=AsyncMock(return_value="currency")
+        ),
+    ):
+        await orchestrator.route_message(message, ctx, [], None)
+
+    weather.assert_not_called()
+    cultural.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_route_message_cancels_unneeded_prefetch(orchestrator: TravelOrchestratorService):
+    """Test prefetches the chosen handler does not use are cancelled."""
+    cancelled: list[str] = []
+
+    async def slow_fetch(*args):
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.append("weather")
+            raise
+
+    async def slow_classify(message):
+        await asyncio.sleep(0.01)
+        return "currency"
+
+    ctx = ConversationContext(user_id="u1", destination="Tokyo")
+    with (
+        patch.object(orchestrator, "_classify_message", new=slow_classify),
+        patch.object(weather_service, "get_weather_data", new=slow_fetch),
+        patch.object(qloo_service, "get_cultural_insights", new=AsyncMock(return_value=None)),
+        patch.object(
+            orchestrator, "_handle_currency_request", new=AsyncMock(return_value="currency")
+        ),
+    ):
+        result = await orchestrator.route_message("What should I pack?", ctx, [], None)
+        await asyncio.sleep(0)
+
+    assert result == "currency"
+    assert cancelled == ["weather"]
+
+
+@pytest.mark.asyncio
+async def test_context_prefetch_claim_requires_matching_args():
+    """Test a prefetch started with different arguments is cancelled, not reused."""
+    fetch = AsyncMock(return_value={"description": "Mild"})
+    prefetch = ContextPrefetch()
+    prefetch.start("weather", fetch, "Paris", None)
+
+    assert prefetch.claim("weather", ("Paris", ["2025-01-01"])) is None
+    assert prefetch.claim("weather", ("Paris", None)) is None
+
+    prefetch.start("weather", fetch, "Paris", None)
+    task = prefetch.claim("weather", ("Paris", None))
+    assert await task == {"description": "Mild"}
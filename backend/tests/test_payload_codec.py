@@ -0,0 +1,72 @@
+# This file is part of TravelSytle AI.
+#
+# Copyright (C) 2025  Trailyn Ventures, LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Tests for the compact cache payload encoding.
+"""
+
+from unittest.mock import patch
+
+import pytest
+from app.services.cache.payload_codec import CODEC_KEY, decode_payload, encode_payload
+
+PAYLOAD = {"conversion_rates": {f"C{i:03d}": i / 7 for i in range(200)}, "base_code": "USD"}
+
+
+class TestPayloadCodec:
+    """Test encoding, decoding and pass-through of plain JSON."""
+
+    def test_zlib_round_trip(self):
+        """Test a compressed payload decodes to the original."""
+        encoded = encode_payload(PAYLOAD, "zlib", min_bytes=0)
+
+        assert encoded[CODEC_KEY] == "zlib"
+        assert encoded["v"] == 1
+        assert decode_payload(encoded) == PAYLOAD
+
+    def test_json_encoding_is_identity(self):
+        """Test the json encoding stores payloads unchanged."""
+        assert encode_payload(PAYLOAD, "json") is PAYLOAD
+
+    def test_small_payload_stays_plain(self):
+        """Test payloads under the threshold are not compressed."""
+        small = {"temp": 20}
+        assert encode_payload(small, "zlib", min_bytes=1024) is small
+
+    def test_default_encoding_from_settings(self):
+        """Test CACHE_PAYLOAD_ENCODING selects the encoding."""
+        with (
+            patch("app.services.cache.payload_codec.settings.CACHE_PAYLOAD_ENCODING", "zlib"),
+            patch("app.services.cache.payload_codec.settings.CACHE_PAYLOAD_COMPRESS_MIN_BYTES", 0),
+        ):
+            assert CODEC_KEY in encode_payload(PAYLOAD)
+
+    def test_plain_values_pass_through(self):
+        """Test rows written as plain JSONB are read unchanged."""
+        assert decode_payload(PAYLOAD) is PAYLOAD
+        assert decode_payload([1, 2]) == [1, 2]
+        assert decode_payload(None) is None
+
+    def test_unknown_encoding(self):
+        """Test an unknown configured encoding is rejected."""
+        with pytest.raises(ValueError):
+            encode_payload(PAYLOAD, "brotli")
+
+    def test_unknown_version(self):
+        """Test an envelope from a newer writer is rejected rather than misread."""
+        with pytest.raises(ValueError):
+            decode_payload({CODEC_KEY: "zlib", "v": 2, "data": ""})
@@ -17,10 +17,11 @@
 
 """Tests for recommendations API endpoints."""
 
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 from app.services.qloo import QlooService
+from app.services.qloo.qloo_service import style_cache_key, weather_band
 from fastapi import status
 
 
@@ -231,7 +232,13 @@ async def test_get_style_recommendations_success():
         "favorite_colors": ["blue", "black"],
         "budget_range": "mid-range",
     }
-    with patch("httpx.AsyncClient.get") as mock_get:
+    with (
+        patch(
+            "app.services.supabase.supabase_cache_v2.enhanced_supabase_cache.get_style_cache",
+            new=AsyncMock(return_value=None),
+        ),
+        patch("httpx.AsyncClient.get") as mock_get,
+    ):
         mock_response = MockAsyncResponse(
             {
                 "recommendations": {
@@ -255,7 +262,13 @@ async def test_get_style_recommendations_error():
     """Test style recommendations retrieval error handling."""
     service = QlooService()
     user_profile = {"style_preferences": ["casual"]}
-    with patch("httpx.AsyncClient.get") as mock_get:
+    with (
+        patch(
+            "app.services.supabase.supabase_cache_v2.enhanced_supabase_cache.get_style_cache",
+            new=AsyncMock(return_value=None),
+        ),
+        patch("httpx.AsyncClient.get") as mock_get,
+    ):
         mock_get.side_effect = Exception("API error")
         result = await service.get_style_recommendations("Paris", user_profile, "leisure")
         assert result is not None
@@ -264,6 +277,101 @@ async def test_get_style_recommendations_error():
         assert result["data_source"] == "fallback"
 
 
+@pytest.mark.asyncio
+async def test_get_style_recommendations_cached():
+    """Test Qloo results are cached and a repeated request skips the API."""
+    service = QlooService()
+    preferences = {"style": {"fit": "relaxed"}, "budget": "mid-range"}
+    response = MockAsyncResponse({"recommendations": {"styles": ["Modern"]}, "confidence": 0.9})
+    with (
+        patch(
+            "app.services.supabase.supabase_cache_v2.enhanced_supabase_cache.get_style_cache",
+            new=AsyncMock(side_effect=[None, {"cached": True}]),
+        ),
+        patch(
+            "app.services.supabase.supabase_cache_v2.enhanced_supabase_cache.set_style_cache",
+            new=AsyncMock(return_value=True),
+        ) as mock_set,
+        patch("app.services.http_clients.http_clients.session") as mock_session,
+    ):
+        mock_post = AsyncMock(return_value=response)
+        mock_session.return_value.__aenter__.return_value.post = mock_post
+
+        first = await service.get_style_recommendations("Paris", preferences, "dinner")
+        second = await service.get_style_recommendations("Paris", preferences, "dinner")
+
+    assert first["style_recommendations"]["recommended_styles"] == ["Modern"]
+    assert second == {"cached": True}
+    assert mock_post.await_count == 1
+    key = style_cache_key("Paris", preferences, "dinner")
+    mock_set.assert_awaited_once_with(key, "Paris", first, 12.0)
+
+
+@pytest.mark.asyncio
+async def test_get_style_recommendations_fallback_not_cached():
+    """Test fallback data is not cached."""
+    service = QlooService()
+    with (
+        patch(
+            "app.services.supabase.supabase_cache_v2.enhanced_supabase_cache.get_style_cache",
+            new=AsyncMock(return_value=None),
+        ),
+        patch(
+            "app.services.supabase.supabase_cache_v2.enhanced_supabase_cache.set_style_cache",
+            new=AsyncMock(),
+        ) as mock_set,
+        patch("app.services.http_clients.http_clients.session") as mock_session,
+    ):
+        mock_session.return_value.__aenter__.return_value.post = AsyncMock(
+            side_effect=Exception("API error")
+        )
+        result = await service.get_style_recommendations("Paris", {}, "leisure")
+
+    assert result["data_source"] == "fallback"
+    mock_set.assert_not_awaited()
+
+
+def test_style_cache_key_is_stable():
+    """Test equivalent requests share a key and differing inputs do not."""
+    preferences = {"style": {"fit": "relaxed", "colors": ["navy"]}, "budget": "mid-range"}
+    reordered = {"budget": "mid-range", "style": {"colors": ["navy"], "fit": "relaxed"}}
+
+    key = style_cache_key("Paris", preferences, "Dinner")
+
+    assert key == style_cache_key("paris, france", reordered, " dinner ")
+    assert key != style_cache_key("Paris", preferences, "hiking")
+    assert key != style_cache_key("Paris", {**preferences, "budget": "luxury"}, "Dinner")
+
+
+def test_style_cache_key_buckets_weather():
+    """Test small temperature changes share a key while band changes do not."""
+
+    def weather(temp, precipitation=10):
+        return {
+            "current": {"main": {"temp": temp}},
+            "forecast": {"precipitation_chance": precipitation},
+        }
+
+    key = style_cache_key("Paris", {}, "leisure", weather(71.2))
+
+    assert key == style_cache_key("Paris", {}, "leisure", weather(78.9))
+    assert key != style_cache_key("Paris", {}, "leisure", weather(81.0))
+    assert key != style_cache_key("Paris", {}, "leisure", weather(71.2, precipitation=80))
+
+
+def test_weather_band():
+    """Test weather bands from current conditions, forecast range and missing data."""
+    assert weather_band({"current": {"main": {"temp": 72.4}}}) == "70-80F/dry"
+    assert (
+        weather_band(
+            {"forecast": {"temp_range": {"min": 38, "max": 50}, "precipitation_chance": 60}}
+        )
+        == "40-50F/wet"
+    )
+    assert weather_band(None) == "none"
+    assert weather_band({"current": None, "forecast": None}) == "unknown"
+
+
 def test_process_cultural_data():
     """Test cultural data processing."""
     service = QlooService()
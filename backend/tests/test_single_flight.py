@@ -0,0 +1,150 @@
+# This file is part of TravelSytle AI.
+#
+# Copyright (C) 2025  Trailyn Ventures, LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Tests for single-flight request coalescing.
+"""
+
+import asyncio
+
+import pytest
+from app.utils.single_flight import SingleFlight
+
+
+class TestSingleFlight:
+    """Test SingleFlight coalescing and statistics."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_call(self):
+        """Test concurrent callers for one key await a single call."""
+        flight = SingleFlight[str]()
+        release = asyncio.Event()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return "rates"
+
+        waiters = [asyncio.create_task(flight.do("USD", fetch)) for _ in range(5)]
+        await asyncio.sleep(0)
+        assert flight.get_stats()["in_flight"] == 1
+
+        release.set()
+        assert await asyncio.gather(*waiters) == ["rates"] * 5
+        assert calls == 1
+        assert flight.get_stats() == {
+            "calls": 1,
+            "coalesced": 4,
+            "coalesced_rate": 0.8,
+            "abandoned": 0,
+            "in_flight": 0,
+        }
+
+    @pytest.mark.asyncio
+    async def test_different_keys_do_not_coalesce(self):
+        """Test calls for different keys run independently."""
+        flight = SingleFlight[str]()
+
+        async def fetch(value):
+            await asyncio.sleep(0)
+            return value
+
+        results = await asyncio.gather(
+            flight.do("Paris", lambda: fetch("Paris")), flight.do("Tokyo", lambda: fetch("Tokyo"))
+        )
+
+        assert results == ["Paris", "Tokyo"]
+        assert flight.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_completed_call_is_not_reused(self):
+        """Test a new call is made once the previous one has finished."""
+        flight = SingleFlight[int]()
+        counter = iter(range(10))
+
+        async def fetch():
+            return next(counter)
+
+        assert await flight.do("key", fetch) == 0
+        assert await flight.do("key", fetch) == 1
+
+    @pytest.mark.asyncio
+    async def test_exception_is_shared(self):
+        """Test every caller sees the shared call's exception."""
+        flight = SingleFlight[str]()
+
+        async def fetch():
+            await asyncio.sleep(0)
+            raise ValueError("upstream down")
+
+        results = await asyncio.gather(
+            flight.do("key", fetch), flight.do("key", fetch), return_exceptions=True
+        )
+
+        assert all(isinstance(result, ValueError) for result in results)
+        assert flight.get_stats()["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_shared_call(self):
+        """Test a caller timing out leaves the call running for the others."""
+        flight = SingleFlight[str]()
+        release = asyncio.Event()
+
+        async def fetch():
+            await release.wait()
+            return "done"
+
+        impatient = asyncio.create_task(flight.do("key", fetch))
+        patient = asyncio.create_task(flight.do("key", fetch))
+        await asyncio.sleep(0)
+
+        impatient.cancel()
+        release.set()
+
+        assert await patient == "done"
+        with pytest.raises(asyncio.CancelledError):
+            await impatient
+
+    @pytest.mark.asyncio
+    async def test_last_cancelled_caller_cancels_shared_call(self):
+        """Test the shared call is cancelled once no caller is waiting for it."""
+        flight = SingleFlight[str]()
+        cancelled = asyncio.Event()
+
+        async def fetch():
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return "done"
+
+        callers = [asyncio.create_task(flight.do("key", fetch)) for _ in range(2)]
+        await asyncio.sleep(0)
+
+        callers[0].cancel()
+        await asyncio.sleep(0)
+        assert not cancelled.is_set()
+
+        callers[1].cancel()
+        await asyncio.wait_for(cancelled.wait(), 1)
+        await asyncio.gather(*callers, return_exceptions=True)
+        await asyncio.sleep(0)
+        assert flight.get_stats()["abandoned"] == 1
+        assert flight.get_stats()["in_flight"] == 0
@@ -17,7 +17,7 @@
 
 """Tests for SupabaseBaseService."""
 
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
 from app.services.supabase import SupabaseBaseService
@@ -40,10 +40,10 @@ class TestSupabaseBaseService(SupabaseBaseService[MockRecord]):
 
 @pytest.fixture
 def mock_supabase_client():
-    """Mock Supabase client for testing."""
+    """Mock async PostgREST client for testing."""
     mock_client = MagicMock()
     with patch(
-        "app.services.supabase.supabase_client.get_supabase_client", return_value=mock_client
+        "app.services.supabase.supabase_base.get_supabase_data_client", return_value=mock_client
     ):
         yield mock_client
 
@@ -73,7 +73,7 @@ class TestSupabaseBaseServiceExecuteQuery:
         mock_response = Mock()
         mock_response.data = [{"id": "1", "name": "test"}]
 
-        query_func = Mock(return_value=mock_response)
+        query_func = AsyncMock(return_value=mock_response)
 
         result = await base_service._execute_query(query_func)
 
@@ -86,7 +86,7 @@ class TestSupabaseBaseServiceExecuteQuery:
         mock_response = Mock()
         mock_response.data = None
 
-        query_func = Mock(return_value=mock_response)
+        query_func = AsyncMock(return_value=mock_response)
 
         result = await base_service._execute_query(query_func)
 
@@ -96,7 +96,7 @@ class TestSupabaseBaseServiceExecuteQuery:
     @pytest.mark.asyncio
     async def test_execute_query_exception(self, base_service):
         """Test query execution with exception."""
-        query_func = Mock(side_effect=Exception("Database error"))
+        query_func = AsyncMock(side_effect=Exception("Database error"))
 
         result = await base_service._execute_query(query_func)
 
@@ -116,13 +116,11 @@ class TestSupabaseBaseServiceGetById:
         mock_table = Mock()
         mock_select = Mock()
         mock_eq = Mock()
-        mock_limit = Mock()
 
         mock_supabase_client.table.return_value = mock_table
         mock_table.select.return_value = mock_select
         mock_select.eq.return_value = mock_eq
-        mock_eq.limit.return_value = mock_limit
-        mock_limit.execute.return_value = mock_response
+        mock_eq.execute = AsyncMock(return_value=mock_response)
 
         result = await base_service.get_by_id("1")
 
@@ -139,13 +137,11 @@ class TestSupabaseBaseServiceGetById:
         mock_table = Mock()
         mock_select = Mock()
         mock_eq = Mock()
-        mock_limit = Mock()
 
         mock_supabase_client.table.return_value = mock_table
         mock_table.select.return_value = mock_select
         mock_select.eq.return_value = mock_eq
-        mock_eq.limit.return_value = mock_limit
-        mock_limit.execute.return_value = mock_response
+        mock_eq.execute = AsyncMock(return_value=mock_response)
 
         result = await base_service.get_by_id("1")
 
@@ -168,7 +164,7 @@ class TestSupabaseBaseServiceGetByField:
         mock_supabase_client.table.return_value = mock_table
         mock_table.select.return_value = mock_select
         mock_select.eq.return_value = mock_eq
-        mock_eq.execute.return_value = mock_response
+        mock_eq.execute = AsyncMock(return_value=mock_response)
 
         result = await base_service.get_by_field("name", "test")
 
@@ -189,13 +185,48 @@ class TestSupabaseBaseServiceGetByField:
         mock_supabase_client.table.return_value = mock_table
         mock_table.select.return_value = mock_select
         mock_select.eq.return_value = mock_eq
-        mock_eq.execute.return_value = mock_response
+        mock_eq.execute = AsyncMock(return_value=mock_response)
 
         result = await base_service.get_by_field("name", "nonexistent")
 
         assert result == []
 
 
+class TestSupabaseBaseServiceGetLatestUnexpired:
+    """Test get_latest_unexpired method."""
+
+    @staticmethod
+    def _chain(mock_supabase_client, data):
+        """Make every query builder method return the same mock."""
+        mock_query = Mock()
+        mock_supabase_client.table.return_value = mock_query
+        for method in ("select", "eq", "gt", "order", "limit"):
+            getattr(mock_query, method).return_value = mock_query
+        mock_query.execute = AsyncMock(return_value=Mock(data=data))
+        return mock_query
+
+    @pytest.mark.asyncio
+    async def test_get_latest_unexpired_success(self, base_service, mock_supabase_client):
+        """Test the freshness filter, ordering and limit are pushed into the query."""
+        mock_query = self._chain(mock_supabase_client, [{"id": "1", "payload": "x"}])
+
+        result = await base_service.get_latest_unexpired("key", "a", "payload,expires_at")
+
+        assert result.data["id"] == "1"
+        mock_query.select.assert_called_once_with("payload,expires_at")
+        mock_query.eq.assert_called_once_with("key", "a")
+        assert mock_query.gt.call_args.args[0] == "expires_at"
+        mock_query.order.assert_called_once_with("created_at", desc=True)
+        mock_query.limit.assert_called_once_with(1)
+
+    @pytest.mark.asyncio
+    async def test_get_latest_unexpired_no_result(self, base_service, mock_supabase_client):
+        """Test None is returned when no unexpired row matches."""
+        self._chain(mock_supabase_client, [])
+
+        assert await base_service.get_latest_unexpired("key", "a") is None
+
+
 class TestSupabaseBaseServiceGetAll:
     """Test get_all method."""
 
@@ -212,7 +243,7 @@ class TestSupabaseBaseServiceGetAll:
         mock_supabase_client.table.return_value = mock_table
         mock_table.select.return_value = mock_select
         mock_select.limit.return_value = mock_limit
-        mock_limit.execute.return_value = mock_response
+        mock_limit.execute = AsyncMock(return_value=mock_response)
 
         result = await base_service.get_all(limit=10)
 
@@ -233,7 +264,7 @@ class TestSupabaseBaseServiceGetAll:
         mock_supabase_client.table.return_value = mock_table
         mock_table.select.return_value = mock_select
         mock_select.limit.return_value = mock_limit
-        mock_limit.execute.return_value = mock_response
+        mock_limit.execute = AsyncMock(return_value=mock_response)
 
         result = await base_service.get_all()
 
@@ -255,7 +286,7 @@ class TestSupabaseBaseServiceCreate:
 
         mock_supabase_client.table.return_value = mock_table
         mock_table.insert.return_value = mock_insert
-        mock_insert.execute.return_value = mock_response
+        mock_insert.execute = AsyncMock(return_value=mock_response)
 
         data = {"name": "new_test"}
         result = await base_service.create(data)
@@ -275,7 +306,7 @@ class TestSupabaseBaseServiceCreate:
 
         mock_supabase_client.table.return_value = mock_table
         mock_table.insert.return_value = mock_insert
-        mock_insert.execute.return_value = mock_response
+        mock_insert.execute = AsyncMock(return_value=mock_response)
 
         data = {"name": "new_test"}
         result = await base_service.create(data)
@@ -290,7 +321,7 @@ class TestSupabaseBaseServiceCreate:
 
         mock_supabase_client.table.return_value = mock_table
         mock_table.insert.return_value = mock_insert
-        mock_insert.execute.side_effect = Exception("Database error")
+        mock_insert.execute = AsyncMock(side_effect=Exception("Database error"))
 
         data = {"name": "new_test"}
         result = await base_service.create(data)
@@ -314,7 +345,7 @@ class TestSupabaseBaseServiceUpdate:
         mock_supabase_client.table.return_value = mock_table
         mock_table.update.return_value = mock_update
         mock_update.eq.return_value = mock_eq
-        mock_eq.execute.return_value = mock_response
+        mock_eq.execute = AsyncMock(return_value=mock_response)
 
         data = {"name": "updated_test"}
         result = await base_service.update("1", data)
@@ -336,7 +367,7 @@ class TestSupabaseBaseServiceUpdate:
         mock_supabase_client.table.return_value = mock_table
         mock_table.update.return_value = mock_update
         mock_update.eq.return_value = mock_eq
-        mock_eq.execute.return_value = mock_response
+        mock_eq.execute = AsyncMock(return_value=mock_response)
 
         data = {"name": "updated_test"}
         result = await base_service.update("1", data)
@@ -353,7 +384,7 @@ class TestSupabaseBaseServiceUpdate:
         mock_supabase_client.table.return_value = mock_table
         mock_table.update.return_value = mock_update
         mock_update.eq.return_value = mock_eq
-        mock_eq.execute.side_effect = Exception("Database error")
+        mock_eq.execute = AsyncMock(side_effect=Exception("Database error"))
 
         data = {"name": "updated_test"}
         result = await base_service.update("1", data)
@@ -374,7 +405,7 @@ class TestSupabaseBaseServiceDelete:
         mock_supabase_client.table.return_value = mock_table
         mock_table.delete.return_value = mock_delete
         mock_delete.eq.return_value = mock_eq
-        mock_eq.execute.return_value = Mock()
+        mock_eq.execute = AsyncMock(return_value=Mock())
 
         result = await base_service.delete("1")
 
@@ -390,7 +421,7 @@ class TestSupabaseBaseServiceDelete:
         mock_supabase_client.table.return_value = mock_table
         mock_table.delete.return_value = mock_delete
         mock_delete.eq.return_value = mock_eq
-        mock_eq.execute.side_effect = Exception("Database error")
+        mock_eq.execute = AsyncMock(side_effect=Exception("Database error"))
 
         result = await base_service.delete("1")
 
@@ -398,78 +429,59 @@ class TestSupabaseBaseServiceDelete:
 
 
 class TestSupabaseBaseServiceUpsert:
-    """Test upsert method."""
-
-    @pytest.mark.asyncio
-    async def test_upsert_success_new_record(self, base_service, mock_supabase_client):
-        """Test successful record upsert for new record."""
-        mock_response = Mock()
-        mock_response.data = [{"id": "1", "name": "upserted_test"}]
+    """Test upsert and upsert_many methods."""
 
+    @staticmethod
+    def _mock_upsert(mock_supabase_client, data):
+        """Wire table().upsert().execute() to return data."""
         mock_table = Mock()
-        mock_select = Mock()
-        mock_match = Mock()
-        mock_insert = Mock()
-
+        mock_upsert = Mock()
         mock_supabase_client.table.return_value = mock_table
-        mock_table.select.return_value = mock_select
-        mock_select.match.return_value = mock_match
-        mock_match.execute.return_value = Mock(data=[])  # No existing record
-        mock_table.insert.return_value = mock_insert
-        mock_insert.execute.return_value = mock_response
+        mock_table.upsert.return_value = mock_upsert
+        mock_upsert.execute = AsyncMock(return_value=Mock(data=data))
+        return mock_table
 
-        data = {"id": "1", "name": "upserted_test"}
+    @pytest.mark.asyncio
+    async def test_upsert_success_new_record(self, base_service, mock_supabase_client):
+        """Test upsert runs as a single ON CONFLICT request."""
+        mock_table = self._mock_upsert(mock_supabase_client, [{"id": "1", "name": "upserted"}])
+
+        data = {"id": "1", "name": "upserted"}
         result = await base_service.upsert(data, ["id"])
 
         assert result is not None
         assert result.data["id"] == "1"
-        assert result.data["name"] == "upserted_test"
+        assert result.data["name"] == "upserted"
+        mock_table.upsert.assert_called_once_with(data, on_conflict="id")
+        mock_table.select.assert_not_called()
+        mock_table.insert.assert_not_called()
+        mock_table.update.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_upsert_success_existing_record(self, base_service, mock_supabase_client):
-        """Test successful record upsert for existing record."""
-        mock_response = Mock()
-        mock_response.data = [{"id": "1", "name": "updated_test"}]
+    async def test_upsert_uses_table_unique_constraints(self, mock_supabase_client):
+        """Test the conflict target defaults to the table's configured constraint."""
+        service = TestSupabaseBaseService("currency_rates_cache", client=mock_supabase_client)
+        mock_table = self._mock_upsert(mock_supabase_client, [{"id": "1"}])
 
-        mock_table = Mock()
-        mock_select = Mock()
-        mock_match = Mock()
-        mock_update = Mock()
+        await service.upsert({"base_currency": "USD", "api_source": "x"})
 
-        mock_supabase_client.table.return_value = mock_table
-        mock_table.select.return_value = mock_select
-        mock_select.match.return_value = mock_match
-        mock_match.execute.return_value = Mock(
-            data=[{"id": "1", "name": "old_test"}]
-        )  # Existing record
-        mock_table.update.return_value = mock_update
-        mock_update.eq.return_value = mock_update
-        mock_update.execute.return_value = mock_response
+        assert mock_table.upsert.call_args.kwargs["on_conflict"] == "base_currency,api_source"
 
-        data = {"id": "1", "name": "updated_test"}
-        result = await base_service.upsert(data, ["id"])
+    @pytest.mark.asyncio
+    async def test_upsert_unconfigured_table_uses_primary_key(
+        self, base_service, mock_supabase_client
+    ):
+        """Test tables without a configured constraint conflict on the primary key."""
+        mock_table = self._mock_upsert(mock_supabase_client, [{"id": "1"}])
 
-        assert result is not None
-        assert result.data["id"] == "1"
-        assert result.data["name"] == "updated_test"
+        await base_service.upsert({"id": "1"})
+
+        assert mock_table.upsert.call_args.kwargs["on_conflict"] == ""
 
     @pytest.mark.asyncio
     async def test_upsert_no_data_returned(self, base_service, mock_supabase_client):
         """Test upsert with no data returned."""
-        mock_response = Mock()
-        mock_response.data = []
-
-        mock_table = Mock()
-        mock_select = Mock()
-        mock_match = Mock()
-        mock_insert = Mock()
-
-        mock_supabase_client.table.return_value = mock_table
-        mock_table.select.return_value = mock_select
-        mock_select.match.return_value = mock_match
-        mock_match.execute.return_value = Mock(data=[])  # No existing record
-        mock_table.insert.return_value = mock_insert
-        mock_insert.execute.return_value = mock_response
+        self._mock_upsert(mock_supabase_client, [])
 
         data = {"id": "1", "name": "upserted_test"}
         result = await base_service.upsert(data, ["id"])
@@ -484,18 +496,44 @@ class TestSupabaseBaseServiceUpsert:
 
         mock_supabase_client.table.return_value = mock_table
         mock_table.upsert.return_value = mock_upsert
-        mock_upsert.execute.side_effect = Exception("Database error")
+        mock_upsert.execute = AsyncMock(side_effect=Exception("Database error"))
 
         data = {"id": "1", "name": "upserted_test"}
         result = await base_service.upsert(data, ["id"])
 
         assert result is None
 
+    @pytest.mark.asyncio
+    async def test_upsert_many(self, base_service, mock_supabase_client):
+        """Test bulk upsert sends every row in one request."""
+        rows = [{"id": "1"}, {"id": "2"}]
+        mock_table = self._mock_upsert(mock_supabase_client, rows)
+
+        result = await base_service.upsert_many(rows, ["id"])
+
+        assert [record.data["id"] for record in result] == ["1", "2"]
+        mock_table.upsert.assert_called_once_with(rows, on_conflict="id", default_to_null=False)
+
+    @pytest.mark.asyncio
+    async def test_upsert_many_empty(self, base_service, mock_supabase_client):
+        """Test bulk upsert of no rows skips the request."""
+        assert await base_service.upsert_many([]) == []
+        mock_supabase_client.table.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_upsert_many_exception(self, base_service, mock_supabase_client):
+        """Test bulk upsert failure returns an empty list."""
+        mock_table = self._mock_upsert(mock_supabase_client, [])
+        mock_table.upsert.return_value.execute = AsyncMock(side_effect=Exception("Database error"))
+
+        assert await base_service.upsert_many([{"id": "1"}]) == []
+
 
 class TestSupabaseBaseServiceValidateConnection:
     """Test _validate_connection method."""
 
-    def test_validate_connection_success(self, base_service, mock_supabase_client):
+    @pytest.mark.asyncio
+    async def test_validate_connection_success(self, base_service, mock_supabase_client):
         """Test successful connection validation."""
         mock_table = Mock()
         mock_select = Mock()
@@ -504,13 +542,14 @@ class TestSupabaseBaseServiceValidateConnection:
         mock_supabase_client.table.return_value = mock_table
         mock_table.select.return_value = mock_select
         mock_select.limit.return_value = mock_limit
-        mock_limit.execute.return_value = Mock()
+        mock_limit.execute = AsyncMock(return_value=Mock())
 
-        result = base_service._validate_connection()
+        result = await base_service._validate_connection()
 
         assert result is True
 
-    def test_validate_connection_failure(self, base_service, mock_supabase_client):
+    @pytest.mark.asyncio
+    async def test_validate_connection_failure(self, base_service, mock_supabase_client):
         """Test connection validation failure."""
         mock_table = Mock()
         mock_select = Mock()
@@ -519,9 +558,9 @@ class TestSupabaseBaseServiceValidateConnection:
         mock_supabase_client.table.return_value = mock_table
         mock_table.select.return_value = mock_select
         mock_select.limit.return_value = mock_limit
-        mock_limit.execute.side_effect = Exception("Connection failed")
+        mock_limit.execute = AsyncMock(side_effect=Exception("Connection failed"))
 
-        result = base_service._validate_connection()
+        result = await base_service._validate_connection()
 
         assert result is False
 
@@ -18,17 +18,27 @@
 """Tests for Enhanced Supabase Cache Service (v2)."""
 
 from datetime import UTC, datetime, timedelta
-from unittest.mock import MagicMock, patch
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
 import pytest
-from app.services.supabase import EnhancedSupabaseCacheService
+from app.services.cache.payload_codec import encode_payload
+from app.services.supabase import EnhancedSupabaseCacheService, SupabaseConfig
 from app.services.supabase.supabase_cache_v2 import (
     CacheEntry,
+    ClassificationCacheService,
     CulturalCacheService,
     CurrencyCacheService,
+    StyleCacheService,
     WeatherCacheService,
     enhanced_supabase_cache,
 )
+from app.utils.metrics import CacheMetrics
+
+
+def _fresh_entry(data):
+    """Build an unexpired cache entry wrapping data."""
+    now = datetime.now(UTC)
+    return CacheEntry(data, now + timedelta(hours=1), now)
 
 
 class TestCacheEntry:
@@ -74,6 +84,33 @@ class TestCacheEntry:
         assert entry.expires_at == datetime(2025, 1, 1, 12, 0, 0, tzinfo=UTC)
         assert entry.created_at == datetime(2025, 1, 1, 11, 0, 0, tzinfo=UTC)
 
+    def test_cache_entry_from_dict_decodes_compressed_payload(self):
+        """Test CacheEntry.from_dict reads compressed payloads transparently."""
+        data = {"temperature": 20, "description": "sunny"}
+        record = {
+            "data": encode_payload(data, "zlib", min_bytes=0),
+            "expires_at": "2025-01-01T12:00:00+00:00",
+            "created_at": "2025-01-01T11:00:00+00:00",
+        }
+
+        assert CacheEntry.from_dict(record).data == data
+
+    def test_cultural_record_decodes_each_column(self):
+        """Test multi-column payloads decode each compressed column."""
+        record = {
+            "cultural_data": encode_payload({"customs": "formal"}, "zlib", min_bytes=0),
+            "style_data": {"colors": ["navy"]},
+            "expires_at": "2025-01-01T12:00:00+00:00",
+            "created_at": "2025-01-01T11:00:00+00:00",
+        }
+
+        entry = CulturalCacheService()._parse_record(record)
+
+        assert entry.data == {
+            "cultural_data": {"customs": "formal"},
+            "style_data": {"colors": ["navy"]},
+        }
+
     def test_cache_entry_is_expired_future(self):
         """Test is_expired with future date."""
         data = {"temperature": 20}
@@ -108,6 +145,12 @@ class TestCacheEntry:
 class TestEnhancedSupabaseCacheService:
     """Test EnhancedSupabaseCacheService class."""
 
+    @pytest.fixture(autouse=True)
+    def direct_writes(self):
+        """Write straight to Supabase instead of through the write-behind queue."""
+        with patch.object(enhanced_supabase_cache, "write_behind_enabled", False):
+            yield
+
     def test_enhanced_supabase_cache_service_init(self):
         """Test EnhancedSupabaseCacheService initialization."""
         service = EnhancedSupabaseCacheService()
@@ -115,17 +158,18 @@ class TestEnhancedSupabaseCacheService:
         assert service.weather_service is not None
         assert service.cultural_service is not None
         assert service.currency_service is not None
+        assert service.classification_service is not None
 
     @pytest.mark.asyncio
     async def test_get_weather_cache_delegation(self):
         """Test get_weather_cache delegates to weather service."""
-        with patch.object(enhanced_supabase_cache.weather_service, "get_cache") as mock_get:
-            mock_get.return_value = {"temperature": 20}
+        with patch.object(enhanced_supabase_cache.weather_service, "get_entry") as mock_get:
+            mock_get.return_value = _fresh_entry({"temperature": 20})
 
             result = await enhanced_supabase_cache.get_weather_cache("Paris")
 
             assert result == {"temperature": 20}
-            mock_get.assert_called_once_with("Paris")
+            mock_get.assert_called_once_with("Paris", grace_seconds=ANY)
 
     @pytest.mark.asyncio
     async def test_set_weather_cache_delegation(self):
@@ -141,13 +185,13 @@ class TestEnhancedSupabaseCacheService:
     @pytest.mark.asyncio
     async def test_get_cultural_cache_delegation(self):
         """Test get_cultural_cache delegates to cultural service."""
-        with patch.object(enhanced_supabase_cache.cultural_service, "get_cache") as mock_get:
-            mock_get.return_value = {"cultural_data": {"customs": "formal"}}
+        with patch.object(enhanced_supabase_cache.cultural_service, "get_entry") as mock_get:
+            mock_get.return_value = _fresh_entry({"cultural_data": {"customs": "formal"}})
 
             result = await enhanced_supabase_cache.get_cultural_cache("Paris", "business")
 
             assert result == {"cultural_data": {"customs": "formal"}}
-            mock_get.assert_called_once_with("Paris", "business")
+            mock_get.assert_called_once_with("Paris", grace_seconds=ANY)
 
     @pytest.mark.asyncio
     async def test_set_cultural_cache_delegation(self):
@@ -160,18 +204,18 @@ class TestEnhancedSupabaseCacheService:
             )
 
             assert result is True
-            mock_set.assert_called_once_with("Paris", {"customs": "formal"}, 24, "business")
+            mock_set.assert_called_once_with("Paris", {"cultural_data": {}, "style_data": {}}, 24)
 
     @pytest.mark.asyncio
     async def test_get_currency_cache_delegation(self):
         """Test get_currency_cache delegates to currency service."""
-        with patch.object(enhanced_supabase_cache.currency_service, "get_cache") as mock_get:
-            mock_get.return_value = {"USD": 1.0, "EUR": 0.85}
+        with patch.object(enhanced_supabase_cache.currency_service, "get_entry") as mock_get:
+            mock_get.return_value = _fresh_entry({"USD": 1.0, "EUR": 0.85})
 
             result = await enhanced_supabase_cache.get_currency_cache("USD")
 
             assert result == {"USD": 1.0, "EUR": 0.85}
-            mock_get.assert_called_once_with("USD")
+            mock_get.assert_called_once_with("USD", grace_seconds=ANY)
 
     @pytest.mark.asyncio
     async def test_set_currency_cache_delegation(self):
@@ -185,6 +229,326 @@ class TestEnhancedSupabaseCacheService:
             mock_set.assert_called_once_with("USD", {"EUR": 0.85}, 1)
 
 
+class TestLocalCacheTier:
+    """Test the in-process tier in front of the Supabase cache tables."""
+
+    @pytest.fixture
+    def service(self):
+        """Fresh service so the shared singleton's tier is untouched."""
+        service = EnhancedSupabaseCacheService()
+        service.write_behind_enabled = False
+        return service
+
+    @pytest.mark.asyncio
+    async def test_hit_served_without_supabase(self, service):
+        """Test a second read is served from memory."""
+        with patch.object(service.weather_service, "get_entry") as mock_get:
+            mock_get.return_value = _fresh_entry({"temp": 20})
+
+            first = await service.get_weather_cache("Paris")
+            second = await service.get_weather_cache("Paris")
+
+        assert first == second == {"temp": 20}
+        mock_get.assert_called_once_with("Paris", grace_seconds=0.0)
+        assert service.get_stats()["local"]["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_destination_spellings_share_entries(self, service):
+        """Test spellings of one destination hit the same in-process entry."""
+        with patch.object(service.weather_service, "set_cache", return_value=True):
+            await service.set_weather_cache("Paris", {"temp": 20})
+        with patch.object(service.weather_service, "get_entry") as mock_get:
+            for spelling in ("paris ", "Paris, France", "PARÍS"):
+                assert await service.get_weather_cache(spelling) == {"temp": 20}
+
+        mock_get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_miss_is_not_cached(self, service):
+        """Test a Supabase miss is looked up again next time."""
+        with patch.object(service.currency_service, "get_entry", return_value=None) as mock_get:
+            assert await service.get_currency_cache("USD") is None
+            assert await service.get_currency_cache("USD") is None
+
+        assert mock_get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_local_entry_respects_row_expiry(self, service):
+        """Test an entry expiring before the L1 TTL is not stored past its expiry."""
+        now = datetime.now(UTC)
+        entry = CacheEntry({"temp": 20}, now + timedelta(seconds=30), now)
+        with (
+            patch.object(service.weather_service, "get_entry", return_value=entry),
+            patch.object(service.local, "set") as mock_local_set,
+        ):
+            await service.get_weather_cache("Paris")
+
+        ttl = mock_local_set.call_args.args[2]
+        assert 0 < ttl <= 30
+
+    @pytest.mark.asyncio
+    async def test_expired_row_is_not_stored(self, service):
+        """Test a row already past expires_at never reaches the in-process tier."""
+        now = datetime.now(UTC)
+        entry = CacheEntry({"temp": 20}, now - timedelta(seconds=1), now)
+        with patch.object(service.weather_service, "get_entry", return_value=entry):
+            await service.get_weather_cache("Paris")
+
+        assert len(service.local) == 0
+
+    @pytest.mark.asyncio
+    async def test_set_writes_through(self, service):
+        """Test set_*_cache fills both tiers."""
+        with (
+            patch.object(service.currency_service, "set_cache", return_value=True) as mock_set,
+            patch.object(service.currency_service, "get_entry") as mock_get,
+        ):
+            assert await service.set_currency_cache("USD", {"EUR": 0.85}, 1) is True
+            assert await service.get_currency_cache("USD") == {"EUR": 0.85}
+
+        mock_set.assert_called_once_with("USD", {"EUR": 0.85}, 1)
+        mock_get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_cultural_write_through_keeps_stored_columns(self, service):
+        """Test the in-process copy matches what a Supabase read returns."""
+        data = {"cultural_data": {"a": 1}, "style_data": {"b": 2}, "raw": "x"}
+        with patch.object(service.cultural_service, "set_cache", return_value=True):
+            await service.set_cultural_cache("Paris", "leisure", data, 24)
+
+        assert await service.get_cultural_cache("Paris") == {
+            "cultural_data": {"a": 1},
+            "style_data": {"b": 2},
+        }
+
+    @pytest.mark.asyncio
+    async def test_disabled_tier_always_reads_supabase(self, service):
+        """Test CACHE_L1_ENABLED=False bypasses the in-process tier."""
+        service.local_enabled = False
+        with patch.object(service.weather_service, "get_entry") as mock_get:
+            mock_get.return_value = _fresh_entry({"temp": 20})
+            await service.get_weather_cache("Paris")
+            await service.get_weather_cache("Paris")
+
+        assert mock_get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_clear_local(self, service):
+        """Test clear_local drops in-process entries."""
+        with patch.object(service.weather_service, "set_cache", return_value=True):
+            await service.set_weather_cache("Paris", {"temp": 20})
+        service.clear_local()
+
+        assert service.get_stats()["local"]["size"] == 0
+
+
+class TestStaleWhileRevalidate:
+    """Test serving stale entries and refreshing them in the background."""
+
+    @pytest.fixture
+    def service(self):
+        """Fresh service with a weather refresher registered."""
+        service = EnhancedSupabaseCacheService()
+        service.refresh = AsyncMock()
+        service.register_refresher("weather", service.refresh)
+        return service
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_served_and_refreshed(self, service):
+        """Test an entry inside the grace period is returned while it refreshes."""
+        now = datetime.now(UTC)
+        entry = CacheEntry({"temp": 20}, now - timedelta(seconds=10), now - timedelta(hours=1))
+        with patch.object(service.weather_service, "get_entry", return_value=entry) as mock_get:
+            assert await service.get_weather_cache("Paris") == {"temp": 20}
+            await service.drain_refreshes()
+
+        mock_get.assert_called_once_with("Paris", grace_seconds=service.stale_grace_seconds)
+        service.refresh.assert_awaited_once_with("Paris")
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_stays_in_local_tier(self, service):
+        """Test a stale entry is kept in memory for the grace period."""
+        now = datetime.now(UTC)
+        entry = CacheEntry({"temp": 20}, now - timedelta(seconds=10), now - timedelta(hours=1))
+        with patch.object(service.weather_service, "get_entry", return_value=entry) as mock_get:
+            await service.get_weather_cache("Paris")
+            await service.get_weather_cache("Paris")
+            await service.drain_refreshes()
+
+        assert mock_get.call_count == 1
+        assert service.get_stats()["refresh"]["scheduled"] == 1
+
+    @pytest.mark.asyncio
+    async def test_fresh_entry_not_refreshed(self, service):
+        """Test a fresh entry far from expiry triggers no refresh."""
+        with patch.object(service.weather_service, "get_entry") as mock_get:
+            mock_get.return_value = _fresh_entry({"temp": 20})
+            for _ in range(5):
+                await service.get_weather_cache("Paris")
+            await service.drain_refreshes()
+
+        service.refresh.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_refresh_ahead_for_popular_entries(self, service):
+        """Test an entry near expiry is refreshed once it has been read often enough."""
+        now = datetime.now(UTC)
+        entry = CacheEntry({"temp": 20}, now + timedelta(minutes=3), now - timedelta(minutes=57))
+        with patch.object(service.weather_service, "get_entry", return_value=entry):
+            for _ in range(service.refresh_ahead_min_reads - 1):
+                await service.get_weather_cache("Paris")
+            await service.drain_refreshes()
+            service.refresh.assert_not_awaited()
+
+            await service.get_weather_cache("Paris")
+            await service.drain_refreshes()
+
+        service.refresh.assert_awaited_once_with("Paris")
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_miss_without_refresher(self, service):
+        """Test cache types without a refresher never serve expired data."""
+        now = datetime.now(UTC)
+        entry = CacheEntry({"USD": 1.0}, now - timedelta(seconds=10), now - timedelta(hours=1))
+        with patch.object(service.currency_service, "get_entry", return_value=entry) as mock_get:
+            assert await service.get_currency_cache("USD") is None
+
+        mock_get.assert_called_once_with("USD", grace_seconds=0.0)
+
+
+class TestWriteBehind:
+    """Test cache writes queued and upserted in batches."""
+
+    @pytest.fixture
+    def service(self):
+        """Fresh service with write-behind enabled."""
+        service = EnhancedSupabaseCacheService()
+        service.write_behind_enabled = True
+        return service
+
+    @pytest.mark.asyncio
+    async def test_set_returns_before_supabase_write(self, service):
+        """Test set_*_cache queues the row instead of upserting it."""
+        with patch.object(service.weather_service, "set_cache") as mock_set:
+            assert await service.set_weather_cache("Paris", {"temp": 20}) is True
+
+        mock_set.assert_not_called()
+        assert service.writes.pending == 1
+        assert await service.get_weather_cache("Paris") == {"temp": 20}
+        service.writes.clear()
+
+    @pytest.mark.asyncio
+    async def test_flush_batches_per_table(self, service):
+        """Test queued rows are upserted with one request per table."""
+        with (
+            patch.object(service.weather_service, "upsert_many") as mock_weather,
+            patch.object(service.currency_service, "upsert_many") as mock_currency,
+        ):
+            mock_weather.side_effect = lambda rows: rows
+            mock_currency.side_effect = lambda rows: rows
+            await service.set_weather_cache("Paris", {"temp": 20})
+            await service.set_weather_cache("Tokyo", {"temp": 25})
+            await service.set_currency_cache("USD", {"EUR": 0.85})
+            await service.flush_writes()
+
+        rows = mock_weather.call_args.args[0]
+        assert [row["destination_normalized"] for row in rows] == ["paris, france", "tokyo, japan"]
+        assert mock_currency.call_args.args[0][0]["base_currency"] == "USD"
+        assert service.get_stats()["write_behind"]["written"] == 3
+
+    @pytest.mark.asyncio
+    async def test_repeated_key_coalesced(self, service):
+        """Test spellings of one destination become one row holding the newest data."""
+        with patch.object(service.weather_service, "upsert_many") as mock_upsert:
+            mock_upsert.side_effect = lambda rows: rows
+            await service.set_weather_cache("Paris", {"temp": 20})
+            await service.set_weather_cache("Paris, France", {"temp": 21})
+            await service.flush_writes()
+
+        (rows,) = mock_upsert.call_args.args
+        assert len(rows) == 1
+        assert rows[0]["weather_data"] == {"temp": 21}
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_batch_dropped(self, service):
+        """Test a batch is dropped, not retried, when the rate limiter refuses it."""
+        with (
+            patch(
+                "app.services.supabase.supabase_cache_v2.db_rate_limiter.acquire",
+                return_value=False,
+            ),
+            patch.object(service.weather_service, "upsert_many") as mock_upsert,
+        ):
+            await service.set_weather_cache("Paris", {"temp": 20})
+            await service.flush_writes()
+
+        mock_upsert.assert_not_called()
+        assert service.writes.get_stats()["failed"] == 1
+
+
+class TestLookupMetrics:
+    """Test lookup outcomes are recorded per cache type."""
+
+    @pytest.fixture
+    def metrics(self):
+        """Fresh metrics in place of the shared instance."""
+        metrics = CacheMetrics(log_interval_seconds=0)
+        with patch("app.services.supabase.supabase_cache_v2.cache_metrics", metrics):
+            yield metrics
+
+    @pytest.mark.asyncio
+    async def test_outcomes_by_tier(self, metrics):
+        """Test a miss, a Supabase hit and an in-process hit are told apart."""
+        service = EnhancedSupabaseCacheService()
+        with patch.object(service.weather_service, "get_entry") as mock_get:
+            mock_get.return_value = None
+            await service.get_weather_cache("Paris")
+            mock_get.return_value = _fresh_entry({"temp": 20})
+            await service.get_weather_cache("Paris")
+            await service.get_weather_cache("Paris")
+
+        stats = metrics.snapshot()["weather"]
+        assert stats["counters"] == {"misses": 1, "remote_hits": 1, "local_hits": 1}
+        assert stats["latency"]["remote"]["count"] == 2
+        assert stats["latency"]["lookup"]["count"] == 3
+
+    @pytest.mark.asyncio
+    async def test_classification_lookups_recorded(self, metrics):
+        """Test classification lookups are counted like the other cache types."""
+        service = EnhancedSupabaseCacheService()
+        with patch.object(service.classification_service, "get_entry") as mock_get:
+            mock_get.return_value = None
+            assert await service.get_classification_cache("abc") is None
+            mock_get.return_value = _fresh_entry({"category": "weather"})
+            assert await service.get_classification_cache("abc") == {"category": "weather"}
+
+        assert metrics.snapshot()["classification"]["counters"] == {
+            "misses": 1,
+            "remote_hits": 1,
+        }
+
+    @pytest.mark.asyncio
+    async def test_expired_without_refresher(self, metrics):
+        """Test an expired row is counted as expired rather than as a hit."""
+        service = EnhancedSupabaseCacheService()
+        now = datetime.now(UTC)
+        entry = CacheEntry({"USD": 1.0}, now - timedelta(seconds=1), now - timedelta(hours=1))
+        with patch.object(service.currency_service, "get_entry", return_value=entry):
+            await service.get_currency_cache("USD")
+
+        assert metrics.snapshot()["currency"]["counters"] == {"expired": 1}
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_reads(self, metrics):
+        """Test reads skipped by the database rate limiter are counted."""
+        with patch(
+            "app.services.supabase.supabase_cache_v2.db_rate_limiter.acquire", return_value=False
+        ):
+            assert await WeatherCacheService().get_entry("Paris") is None
+
+        assert metrics.snapshot()["weather"]["counters"] == {"rate_limited_reads": 1}
+
+
 class TestWeatherCacheServiceImplementation:
     """Test WeatherCacheService implementation details."""
 
@@ -273,9 +637,40 @@ class TestCurrencyCacheServiceImplementation:
         assert result.created_at == datetime(2025, 1, 1, 11, 0, 0, tzinfo=UTC)
 
 
+class TestStyleCacheServiceImplementation:
+    """Test StyleCacheService implementation details."""
+
+    @pytest.fixture
+    def style_service(self):
+        """Create a StyleCacheService instance."""
+        return StyleCacheService()
+
+    def test_style_service_init(self, style_service):
+        """Test StyleCacheService initialization."""
+        assert style_service.table_name == "style_recommendations_cache"
+
+    def test_style_service_row_round_trip(self, style_service):
+        """Test a built row parses back to the stored destination and style data."""
+        data = {"destination": "Paris", "style_data": {"confidence_score": 0.9}}
+
+        row = style_service.build_row("abc123", data, ttl_hours=12)
+        result = style_service._parse_record(row)
+
+        assert row["cache_key"] == "abc123"
+        assert row["api_source"] == "qloo"
+        assert result.data == data
+        assert timedelta(hours=11) < result.expires_at - datetime.now(UTC) <= timedelta(hours=12)
+
+
 class TestRateLimitingIntegration:
     """Test rate limiting integration."""
 
+    @pytest.fixture(autouse=True)
+    def direct_writes(self):
+        """Write straight to Supabase instead of through the write-behind queue."""
+        with patch.object(enhanced_supabase_cache, "write_behind_enabled", False):
+            yield
+
     @pytest.mark.asyncio
     async def test_rate_limiting_blocks_weather_cache_get(self):
         """Test rate limiting blocks weather cache get."""
@@ -353,8 +748,8 @@ class TestErrorHandling:
         """Test weather service get_cache exception handling."""
         weather_service = WeatherCacheService()
 
-        with patch.object(weather_service, "get_by_field") as mock_get_by_field:
-            mock_get_by_field.side_effect = Exception("Database error")
+        with patch.object(weather_service, "get_latest_unexpired") as mock_get_latest:
+            mock_get_latest.side_effect = Exception("Database error")
 
             with patch("app.services.rate_limiter.db_rate_limiter.acquire") as mock_acquire:
                 mock_acquire.return_value = True
@@ -383,8 +778,8 @@ class TestErrorHandling:
         """Test cultural service get_cache exception handling."""
         cultural_service = CulturalCacheService()
 
-        with patch.object(cultural_service, "get_by_field") as mock_get_by_field:
-            mock_get_by_field.side_effect = Exception("Database error")
+        with patch.object(cultural_service, "get_latest_unexpired") as mock_get_latest:
+            mock_get_latest.side_effect = Exception("Database error")
 
             with patch("app.services.rate_limiter.db_rate_limiter.acquire") as mock_acquire:
                 mock_acquire.return_value = True
@@ -415,8 +810,8 @@ class TestErrorHandling:
         """Test currency service get_cache exception handling."""
         currency_service = CurrencyCacheService()
 
-        with patch.object(currency_service, "get_by_field") as mock_get_by_field:
-            mock_get_by_field.side_effect = Exception("Database error")
+        with patch.object(currency_service, "get_latest_unexpired") as mock_get_latest:
+            mock_get_latest.side_effect = Exception("Database error")
 
             with patch("app.services.rate_limiter.db_rate_limiter.acquire") as mock_acquire:
                 mock_acquire.return_value = True
@@ -449,11 +844,10 @@ class TestServiceMethods:
         """Test WeatherCacheService.get_cache success."""
         weather_service = WeatherCacheService()
 
-        with patch.object(weather_service, "get_by_field") as mock_get_by_field:
+        with patch.object(weather_service, "get_latest_unexpired") as mock_get_latest:
             mock_entry = MagicMock()
-            mock_entry.is_expired.return_value = False
             mock_entry.data = {"temperature": 20, "description": "sunny"}
-            mock_get_by_field.return_value = [mock_entry]
+            mock_get_latest.return_value = mock_entry
 
             with patch("app.services.rate_limiter.db_rate_limiter.acquire") as mock_acquire:
                 mock_acquire.return_value = True
@@ -461,32 +855,46 @@ class TestServiceMethods:
                 result = await weather_service.get_cache("Paris")
 
                 assert result == {"temperature": 20, "description": "sunny"}
-                mock_get_by_field.assert_called_once_with("destination", "Paris")
+                mock_get_latest.assert_called_once_with(
+                    "destination_normalized",
+                    "paris, france",
+                    weather_service.CACHE_COLUMNS,
+                    grace_seconds=0.0,
+                )
 
     @pytest.mark.asyncio
-    async def test_weather_service_get_cache_expired(self):
-        """Test WeatherCacheService.get_cache with expired entry."""
+    async def test_weather_service_get_cache_filters_expired_rows(self):
+        """Test expired rows are filtered, ordered and limited in the query."""
         weather_service = WeatherCacheService()
+        weather_service.client = MagicMock()
+        query = weather_service.client.table.return_value
+        query.select.return_value = query
+        query.eq.return_value = query
+        query.gt.return_value = query
+        query.order.return_value = query
+        query.limit.return_value = query
+        query.execute = AsyncMock(return_value=MagicMock(data=[]))
 
-        with patch.object(weather_service, "get_by_field") as mock_get_by_field:
-            mock_entry = MagicMock()
-            mock_entry.is_expired.return_value = True
-            mock_get_by_field.return_value = [mock_entry]
-
-            with patch("app.services.rate_limiter.db_rate_limiter.acquire") as mock_acquire:
-                mock_acquire.return_value = True
+        with patch("app.services.rate_limiter.db_rate_limiter.acquire") as mock_acquire:
+            mock_acquire.return_value = True
 
-                result = await weather_service.get_cache("Paris")
+            result = await weather_service.get_cache("Paris")
 
-                assert result is None
+        assert result is None
+        weather_service.client.table.assert_called_once_with("weather_cache")
+        query.select.assert_called_once_with("weather_data,expires_at,created_at")
+        query.eq.assert_called_once_with("destination_normalized", "paris, france")
+        assert query.gt.call_args.args[0] == "expires_at"
+        query.order.assert_called_once_with("created_at", desc=True)
+        query.limit.assert_called_once_with(1)
 
     @pytest.mark.asyncio
     async def test_weather_service_get_cache_no_results(self):
         """Test WeatherCacheService.get_cache with no results."""
         weather_service = WeatherCacheService()
 
-        with patch.object(weather_service, "get_by_field") as mock_get_by_field:
-            mock_get_by_field.return_value = []
+        with patch.object(weather_service, "get_latest_unexpired") as mock_get_latest:
+            mock_get_latest.return_value = None
 
             with patch("app.services.rate_limiter.db_rate_limiter.acquire") as mock_acquire:
                 mock_acquire.return_value = True
@@ -531,14 +939,13 @@ class TestServiceMethods:
         """Test CulturalCacheService.get_cache success."""
         cultural_service = CulturalCacheService()
 
-        with patch.object(cultural_service, "get_by_field") as mock_get_by_field:
+        with patch.object(cultural_service, "get_latest_unexpired") as mock_get_latest:
             mock_entry = MagicMock()
-            mock_entry.is_expired.return_value = False
             mock_entry.data = {
                 "cultural_data": {"customs": "formal", "dress_code": "business"},
                 "style_data": {"recommendations": "business casual"},
             }
-            mock_get_by_field.return_value = [mock_entry]
+            mock_get_latest.return_value = mock_entry
 
             with patch("app.services.rate_limiter.db_rate_limiter.acquire") as mock_acquire:
                 mock_acquire.return_value = True
@@ -549,7 +956,12 @@ class TestServiceMethods:
                     "cultural_data": {"customs": "formal", "dress_code": "business"},
                     "style_data": {"recommendations": "business casual"},
                 }
-                mock_get_by_field.assert_called_once_with("destination", "Paris")
+                mock_get_latest.assert_called_once_with(
+                    "destination_normalized",
+                    "paris, france",
+                    cultural_service.CACHE_COLUMNS,
+                    grace_seconds=0.0,
+                )
 
     @pytest.mark.asyncio
     async def test_cultural_service_set_cache_success(self):
@@ -574,11 +986,10 @@ class TestServiceMethods:
         """Test CurrencyCacheService.get_cache success."""
         currency_service = CurrencyCacheService()
 
-        with patch.object(currency_service, "get_by_field") as mock_get_by_field:
+        with patch.object(currency_service, "get_latest_unexpired") as mock_get_latest:
             mock_entry = MagicMock()
-            mock_entry.is_expired.return_value = False
             mock_entry.data = {"USD": 1.0, "EUR": 0.85}
-            mock_get_by_field.return_value = [mock_entry]
+            mock_get_latest.return_value = mock_entry
 
             with patch("app.services.rate_limiter.db_rate_limiter.acquire") as mock_acquire:
                 mock_acquire.return_value = True
@@ -586,7 +997,12 @@ class TestServiceMethods:
                 result = await currency_service.get_cache("USD")
 
                 assert result == {"USD": 1.0, "EUR": 0.85}
-                mock_get_by_field.assert_called_once_with("base_currency", "USD")
+                mock_get_latest.assert_called_once_with(
+                    "base_currency",
+                    "USD",
+                    currency_service.CACHE_COLUMNS,
+                    grace_seconds=0.0,
+                )
 
     @pytest.mark.asyncio
     async def test_currency_service_set_cache_success(self):
@@ -604,6 +1020,51 @@ class TestServiceMethods:
                 assert result is True
                 mock_upsert.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_classification_service_get_cache_success(self):
+        """Test ClassificationCacheService.get_cache success."""
+        classification_service = ClassificationCacheService()
+
+        with patch.object(classification_service, "get_latest_unexpired") as mock_get_latest:
+            mock_entry = MagicMock()
+            mock_entry.data = {"category": "weather", "classifier_source": "llm"}
+            mock_get_latest.return_value = mock_entry
+
+            with patch("app.services.rate_limiter.db_rate_limiter.acquire") as mock_acquire:
+                mock_acquire.return_value = True
+
+                result = await classification_service.get_cache("abc123")
+
+                assert result["category"] == "weather"
+                mock_get_latest.assert_called_once_with(
+                    "message_hash",
+                    "abc123",
+                    classification_service.CACHE_COLUMNS,
+                    grace_seconds=0.0,
+                )
+
+    @pytest.mark.asyncio
+    async def test_classification_service_set_cache_success(self):
+        """Test ClassificationCacheService.set_cache success."""
+        classification_service = ClassificationCacheService()
+
+        with patch.object(classification_service, "upsert") as mock_upsert:
+            mock_upsert.return_value = MagicMock()
+
+            with patch("app.services.rate_limiter.db_rate_limiter.acquire") as mock_acquire:
+                mock_acquire.return_value = True
+
+                result = await classification_service.set_cache("abc123", "general")
+
+                assert result is True
+                upserted = mock_upsert.call_args[0][0]
+                assert upserted["category"] == "general"
+                assert "message_normalized" not in upserted
+                # The conflict target comes from the table configuration
+                assert len(mock_upsert.call_args[0]) == 1
+                table_config = SupabaseConfig.TABLES[classification_service.table_name]
+                assert table_config.unique_constraints == ["message_hash"]
+
     @pytest.mark.asyncio
     async def test_weather_service_rate_limiting_warning(self):
         """Test weather service rate limiting warning."""
@@ -648,8 +1109,8 @@ class TestServiceMethods:
         """Test weather service logger error statement."""
         weather_service = WeatherCacheService()
 
-        with patch.object(weather_service, "get_by_field") as mock_get_by_field:
-            mock_get_by_field.side_effect = Exception("Database connection failed")
+        with patch.object(weather_service, "get_latest_unexpired") as mock_get_latest:
+            mock_get_latest.side_effect = Exception("Database connection failed")
 
             with patch("app.services.rate_limiter.db_rate_limiter.acquire") as mock_acquire:
                 mock_acquire.return_value = True
@@ -663,8 +1124,8 @@ class TestServiceMethods:
         """Test cultural service logger error statement."""
         cultural_service = CulturalCacheService()
 
-        with patch.object(cultural_service, "get_by_field") as mock_get_by_field:
-            mock_get_by_field.side_effect = Exception("Database connection failed")
+        with patch.object(cultural_service, "get_latest_unexpired") as mock_get_latest:
+            mock_get_latest.side_effect = Exception("Database connection failed")
 
             with patch("app.services.rate_limiter.db_rate_limiter.acquire") as mock_acquire:
                 mock_acquire.return_value = True
@@ -678,8 +1139,8 @@ class TestServiceMethods:
         """Test currency service logger error statement."""
         currency_service = CurrencyCacheService()
 
-        with patch.object(currency_service, "get_by_field") as mock_get_by_field:
-            mock_get_by_field.side_effect = Exception("Database connection failed")
+        with patch.object(currency_service, "get_latest_unexpired") as mock_get_latest:
+            mock_get_latest.side_effect = Exception("Database connection failed")
 
             with patch("app.services.rate_limiter.db_rate_limiter.acquire") as mock_acquire:
                 mock_acquire.return_value = True
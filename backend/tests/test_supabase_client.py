@@ -17,17 +17,22 @@
 
 """Tests for SupabaseClientManager and helpers in supabase_client.py."""
 
-import time
+import asyncio
 from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
+from app.services.http_clients import http_clients
 from app.services.supabase.supabase_client import (
+    SUPABASE_REST_UPSTREAM,
     SupabaseClientManager,
     SupabaseConnectionError,
+    SupabaseDataClient,
     get_supabase_client,
     test_supabase_connection,
 )
+from app.services.supabase.supabase_config import SupabaseConfig
 
 
 @pytest.fixture(autouse=True)
@@ -97,42 +102,34 @@ class TestInitialization:
                 SupabaseClientManager._create_client()
 
 
-class TestHealthCheck:
-    def test_check_connection_health_success_updates_timestamp(self, mock_settings):
+class TestClientSwap:
+    def test_get_client_does_not_probe(self, mock_settings):
         with patch("app.services.supabase.supabase_client.create_client") as mock_create:
             mock_client = _make_table_chain(success=True)
             mock_create.return_value = mock_client
             SupabaseClientManager.get_client()
+            SupabaseClientManager.get_client()
 
-        # Force a health check to run by manipulating time
-        with patch("time.time", return_value=time.time() + 400):
-            last_before = SupabaseClientManager._last_health_check
-            SupabaseClientManager._check_connection_health()
-            assert SupabaseClientManager._last_health_check >= last_before
+        mock_client.table.assert_not_called()
 
-    def test_check_connection_health_missing_table_does_not_reset(self, mock_settings):
+    def test_swap_client_replaces_instance(self, mock_settings):
         with patch("app.services.supabase.supabase_client.create_client") as mock_create:
-            mock_client = _make_table_chain(
-                success=False, raise_msg='relation "users" does not exist'
-            )
-            mock_create.return_value = mock_client
-            SupabaseClientManager.get_client()
+            old, new = MagicMock(), MagicMock()
+            mock_create.side_effect = [old, new]
+            assert SupabaseClientManager.get_client() is old
 
-        with patch("time.time", return_value=time.time() + 400):
-            with patch.object(SupabaseClientManager, "reset_client") as mock_reset:
-                SupabaseClientManager._check_connection_health()
-                mock_reset.assert_not_called()
+            assert SupabaseClientManager.swap_client() is new
+            assert SupabaseClientManager.get_client() is new
 
-    def test_check_connection_health_other_error_resets(self, mock_settings):
+    def test_failed_swap_keeps_client(self, mock_settings):
         with patch("app.services.supabase.supabase_client.create_client") as mock_create:
-            mock_client = _make_table_chain(success=False, raise_msg="network unreachable")
-            mock_create.return_value = mock_client
+            old = MagicMock()
+            mock_create.side_effect = [old, Exception("boom")]
             SupabaseClientManager.get_client()
 
-        with patch("time.time", return_value=time.time() + 400):
-            with patch.object(SupabaseClientManager, "reset_client") as mock_reset:
-                SupabaseClientManager._check_connection_health()
-                mock_reset.assert_called_once()
+            with pytest.raises(SupabaseConnectionError):
+                SupabaseClientManager.swap_client()
+            assert SupabaseClientManager.get_client() is old
 
 
 class TestConnectionHelpers:
@@ -162,3 +159,59 @@ class TestConnectionHelpers:
             mock_create.return_value = mock_client
             client = get_supabase_client()
             assert client is mock_client
+
+
+class TestSupabaseDataClient:
+    """Test the async PostgREST client used for table queries."""
+
+    def test_pool_honours_supabase_config(self):
+        """Test the PostgREST pool is sized and timed out from SupabaseConfig."""
+        config = http_clients.upstreams[SUPABASE_REST_UPSTREAM]
+
+        assert config.max_connections == SupabaseConfig.MAX_CONNECTIONS
+        assert config.timeout == SupabaseConfig.CONNECTION_TIMEOUT
+
+    @pytest.mark.asyncio
+    async def test_query_is_sent_on_pooled_session(self, mock_settings):
+        """Test a query is awaited over the shared session with the service key."""
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json=[{"id": "user-1"}])
+
+        session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        data_client = SupabaseDataClient()
+        with patch.object(http_clients, "get", return_value=session):
+            response = await data_client.table("users").select("id").eq("id", "user-1").execute()
+            assert data_client.get_client() is data_client.get_client()
+        await session.aclose()
+
+        assert response.data == [{"id": "user-1"}]
+        request = requests[0]
+        assert request.url.path == "/rest/v1/users"
+        assert request.url.params["id"] == "eq.user-1"
+        assert request.headers["apikey"] == "test-key"
+        assert request.headers["authorization"] == "Bearer test-key"
+
+    def test_client_follows_event_loop(self, mock_settings):
+        """Test each event loop gets a client on its own connection pool."""
+        data_client = SupabaseDataClient()
+
+        async def get_client():
+            return data_client.get_client()
+
+        first = asyncio.run(get_client())
+        second = asyncio.run(get_client())
+
+        assert first is not second
+        assert first.session is not second.session
+
+    @pytest.mark.asyncio
+    async def test_missing_settings_raise(self):
+        """Test queries fail clearly without Supabase credentials."""
+        with patch("app.services.supabase.supabase_client.settings") as mock_settings:
+            mock_settings.SUPABASE_URL = ""
+            mock_settings.SUPABASE_KEY = ""
+            with pytest.raises(SupabaseConnectionError):
+                SupabaseDataClient().table("users")
@@ -4,6 +4,7 @@ Tests for app/services/supabase/supabase_config.py
 
 from unittest.mock import patch
 
+import pytest
 from app.services.supabase.supabase_config import (
     SupabaseConfig,
     SupabaseTableConfig,
@@ -170,8 +171,8 @@ class TestSupabaseConfig:
 
         assert isinstance(weather_config, SupabaseTableConfig)
         assert weather_config.name == "weather_cache"
-        assert "destination" in weather_config.unique_constraints
-        assert "destination" in weather_config.indexes
+        assert "destination_normalized" in weather_config.unique_constraints
+        assert "destination_normalized" in weather_config.indexes
         assert "expires_at" in weather_config.indexes
 
     def test_get_table_config_nonexistent_table(self):
@@ -304,3 +305,33 @@ class TestSupabaseConfigExport:
         assert hasattr(supabase_config, "validate_connection_settings")
         assert hasattr(supabase_config, "get_cache_ttl")
         assert hasattr(supabase_config, "get_rate_limit")
+
+
+class TestProjections:
+    """Test projections declared in SupabaseConfig."""
+
+    def test_columns_without_projection_selects_all(self):
+        """Test no projection selects every column."""
+        assert SupabaseConfig.columns("conversations") == "*"
+
+    def test_columns_of_declared_projection(self):
+        """Test a declared projection is joined into a select() column list."""
+        assert SupabaseConfig.columns("user_profile_view", "picture") == "id,profile_picture_url"
+
+    def test_columns_of_undeclared_projection(self):
+        """Test an unknown table or projection is rejected."""
+        with pytest.raises(ValueError, match="summary"):
+            SupabaseConfig.columns("user_preferences", "summary")
+        with pytest.raises(ValueError, match="missing_table"):
+            SupabaseConfig.columns("missing_table", "profile")
+
+    def test_cache_tables_declare_entry_projection(self):
+        """Test every cache table declares the entry projection its service reads."""
+        for table in (
+            "weather_cache",
+            "cultural_insights_cache",
+            "currency_rates_cache",
+            "message_classification_cache",
+            "style_recommendations_cache",
+        ):
+            assert "expires_at" in SupabaseConfig.TABLES[table].projections["entry"]
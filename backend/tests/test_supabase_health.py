@@ -0,0 +1,156 @@
+# This file is part of TravelSytle AI.
+#
+# Copyright (C) 2025  Trailyn Ventures, LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Tests for the background Supabase health monitor.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+from app.services.supabase.supabase_health import SupabaseHealthMonitor
+from postgrest import APIError
+
+
+def _data_client(*outcomes):
+    """Data client whose probe query returns or raises each outcome in turn."""
+    client = MagicMock()
+    client.table.return_value.select.return_value.limit.return_value.execute = AsyncMock(
+        side_effect=list(outcomes)
+    )
+    return client
+
+
+@pytest.fixture
+def manager():
+    """Patch the client manager the monitor swaps clients on."""
+    with patch("app.services.supabase.supabase_health.SupabaseClientManager") as manager:
+        manager.is_initialized.return_value = True
+        yield manager
+
+
+@pytest.fixture
+def reset_pool():
+    """Patch the connection pool reset the monitor recovers the data path with."""
+    with patch(
+        "app.services.supabase.supabase_health.http_clients.reset", new=AsyncMock()
+    ) as reset:
+        yield reset
+
+
+class TestProbe:
+    """Test probe outcomes and statistics."""
+
+    @pytest.mark.asyncio
+    async def test_success_records_latency(self, manager):
+        """Test a successful probe is counted and timed."""
+        monitor = SupabaseHealthMonitor(_data_client(MagicMock(data=[])))
+
+        assert await monitor.probe() is True
+
+        stats = monitor.get_stats()
+        assert stats["healthy"] is True
+        assert (stats["probes"], stats["failures"], stats["error_rate"]) == (1, 0, 0.0)
+        assert stats["latency"]["count"] == 1
+        manager.swap_client.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_api_error_counts_as_reachable(self, manager):
+        """Test an error response from PostgREST still proves connectivity."""
+        error = APIError({"message": 'relation "system_settings" does not exist'})
+        monitor = SupabaseHealthMonitor(_data_client(error))
+
+        assert await monitor.probe() is True
+        assert monitor.failures == 0
+
+    @pytest.mark.asyncio
+    async def test_repeated_failures_replace_clients(self, manager, reset_pool):
+        """Test the probed pool is replaced once failures reach the threshold, then recovers."""
+        client = _data_client(httpx.ConnectError("refused"), TimeoutError(), MagicMock(data=[]))
+        monitor = SupabaseHealthMonitor(client, failure_threshold=2)
+
+        assert await monitor.probe() is False
+        reset_pool.assert_not_called()
+        assert await monitor.probe() is False
+        reset_pool.assert_awaited_once_with("supabase_rest")
+        client.reset.assert_called_once()
+        manager.swap_client.assert_called_once()
+        stats = monitor.get_stats()
+        assert stats["healthy"] is False
+        assert stats["swaps"] == 1
+        assert stats["last_error"].startswith("TimeoutError")
+
+        assert await monitor.probe() is True
+        stats = monitor.get_stats()
+        assert stats["healthy"] is True
+        assert stats["error_rate"] == pytest.approx(2 / 3)
+
+    @pytest.mark.asyncio
+    async def test_slow_probe_times_out(self, manager):
+        """Test a probe slower than the timeout counts as failed."""
+
+        async def hang():
+            await asyncio.sleep(10)
+
+        client = _data_client()
+        client.table.return_value.select.return_value.limit.return_value.execute = hang
+        monitor = SupabaseHealthMonitor(client, timeout=0.05)
+
+        assert await monitor.probe() is False
+        assert monitor.consecutive_failures == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_swap_keeps_monitoring(self, manager, reset_pool):
+        """Test errors replacing the clients are logged, not raised."""
+        reset_pool.side_effect = Exception("closing failed")
+        manager.swap_client.side_effect = Exception("no settings")
+        monitor = SupabaseHealthMonitor(_data_client(OSError("down")), failure_threshold=1)
+
+        assert await monitor.probe() is False
+        assert monitor.swaps == 0
+
+
+class TestLifecycle:
+    """Test starting and stopping the background task."""
+
+    @pytest.mark.asyncio
+    async def test_probes_every_interval_until_stopped(self, manager):
+        """Test the task probes at start and after each interval, and stops cleanly."""
+        monitor = SupabaseHealthMonitor(_data_client(*[MagicMock(data=[])] * 100), interval=0.01)
+
+        monitor.start()
+        monitor.start()  # already running: no second task
+        await asyncio.sleep(0.1)
+        await monitor.stop()
+        probes = monitor.probes
+        await asyncio.sleep(0.05)
+
+        assert probes >= 2
+        assert monitor.probes == probes
+
+    @pytest.mark.asyncio
+    async def test_first_probe_runs_at_start(self, manager):
+        """Test a probe runs right away rather than after the first interval."""
+        monitor = SupabaseHealthMonitor(_data_client(MagicMock(data=[])), interval=60)
+
+        monitor.start()
+        await asyncio.sleep(0.01)
+        await monitor.stop()
+
+        assert monitor.probes == 1
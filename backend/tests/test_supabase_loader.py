@@ -0,0 +1,209 @@
+# This file is part of TravelSytle AI.
+#
+# Copyright (C) 2025  Trailyn Ventures, LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Tests for the batching point lookup loader.
+"""
+
+import asyncio
+from unittest.mock import patch
+
+import httpx
+import pytest
+from app.services.http_clients import http_clients
+from app.services.supabase import BatchLoader, SupabaseDataClient
+
+ROWS = [
+    {"id": "1", "setting_key": "a", "setting_value": 1},
+    {"id": "2", "setting_key": "b", "setting_value": 2},
+    {"id": "3", "setting_key": "b", "setting_value": 3},
+]
+
+
+class FakePostgREST:
+    """Answers eq. and in.() filters on one column of ROWS."""
+
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if self.fail:
+            return httpx.Response(500, json={"message": "boom", "code": "XX000"})
+        ((field, condition),) = [(k, v) for k, v in request.url.params.items() if k != "select"]
+        if condition.startswith("in.("):
+            values = condition[4:-1].split(",")
+        else:
+            values = [condition.removeprefix("eq.")]
+        columns = request.url.params["select"]
+        rows = [row for row in ROWS if str(row[field]) in values]
+        if columns != "*":
+            rows = [{c: row[c] for c in columns.split(",")} for row in rows]
+        return httpx.Response(200, json=rows)
+
+
+@pytest.fixture
+def postgrest():
+    """Route the supabase_rest session to a FakePostgREST."""
+    server = FakePostgREST()
+    session = httpx.AsyncClient(transport=httpx.MockTransport(server))
+    with (
+        patch("app.services.supabase.supabase_client.settings") as mock_settings,
+        patch.object(http_clients, "get", return_value=session),
+    ):
+        mock_settings.SUPABASE_URL = "https://example.supabase.co"
+        mock_settings.SUPABASE_KEY = "test-key"
+        yield server
+
+
+@pytest.fixture
+def loader(postgrest):
+    """Loader over the system_settings table."""
+    return BatchLoader(SupabaseDataClient(), "system_settings")
+
+
+class TestBatchLoader:
+    """Test coalescing, fan-out and failure handling."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_share_one_query(self, loader, postgrest):
+        """Test lookups in one window become one in_ query with deduplicated keys."""
+        a, b, again, missing = await asyncio.gather(
+            loader.load("setting_key", "a"),
+            loader.load("setting_key", "b"),
+            loader.load("setting_key", "a"),
+            loader.load("setting_key", "zzz"),
+        )
+
+        assert [row["id"] for row in a] == ["1"]
+        assert [row["id"] for row in b] == ["2", "3"]
+        assert again == a and again is not a
+        assert missing == []
+        assert len(postgrest.requests) == 1
+        assert postgrest.requests[0].url.params["setting_key"] == "in.(a,b,zzz)"
+        stats = loader.get_stats()
+        assert (stats["loads"], stats["deduplicated"], stats["queries"]) == (4, 1, 1)
+
+    @pytest.mark.asyncio
+    async def test_single_lookup_uses_eq(self, loader, postgrest):
+        """Test a lookup with nothing to batch with is sent as a plain eq query."""
+        rows = await loader.load("id", 1, "setting_value")
+
+        assert rows == [{"setting_value": 1}]
+        assert postgrest.requests[0].url.params["id"] == "eq.1"
+
+    @pytest.mark.asyncio
+    async def test_projection_includes_lookup_field(self, loader, postgrest):
+        """Test batched projections also fetch the field rows are grouped by."""
+        a, b = await asyncio.gather(
+            loader.load("setting_key", "a", "setting_value"),
+            loader.load("setting_key", "b", "setting_value"),
+        )
+
+        assert postgrest.requests[0].url.params["select"] == "setting_value,setting_key"
+        assert [row["setting_value"] for row in a + b] == [1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_lookups_after_window_are_separate(self, loader, postgrest):
+        """Test sequential lookups are not held back for each other."""
+        await loader.load("setting_key", "a")
+        await loader.load("setting_key", "a")
+
+        assert len(postgrest.requests) == 2
+
+    @pytest.mark.asyncio
+    async def test_isolated_lookup_skips_window(self, postgrest):
+        """Test a lookup with no query in flight is sent on the next tick, not after the window."""
+        loader = BatchLoader(SupabaseDataClient(), "system_settings", window=10)
+
+        rows = await asyncio.wait_for(loader.load("setting_key", "a"), 1)
+
+        assert [row["id"] for row in rows] == ["1"]
+
+    @pytest.mark.asyncio
+    async def test_overlapping_lookups_wait_window(self):
+        """Test lookups arriving while a query is in flight are held and coalesced."""
+        server = FakePostgREST()
+        release = asyncio.Event()
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            if len(server.requests) == 0:
+                await release.wait()
+            return server(request)
+
+        session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        with (
+            patch("app.services.supabase.supabase_client.settings") as mock_settings,
+            patch.object(http_clients, "get", return_value=session),
+        ):
+            mock_settings.SUPABASE_URL = "https://example.supabase.co"
+            mock_settings.SUPABASE_KEY = "test-key"
+            loader = BatchLoader(SupabaseDataClient(), "system_settings", window=0.05)
+
+            first = asyncio.create_task(loader.load("setting_key", "a"))
+            while not loader._in_flight:  # pylint: disable=protected-access
+                await asyncio.sleep(0)
+            second = asyncio.create_task(loader.load("setting_key", "b"))
+            await asyncio.sleep(0.01)
+            third = asyncio.create_task(loader.load("setting_key", "zzz"))
+            release.set()
+            await asyncio.gather(first, second, third)
+
+        assert [request.url.params["setting_key"] for request in server.requests] == [
+            "eq.a",
+            "in.(b,zzz)",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_full_batch_sent_immediately(self, postgrest):
+        """Test a batch is sent as soon as it reaches max_keys."""
+        loader = BatchLoader(SupabaseDataClient(), "system_settings", window=10, max_keys=2)
+
+        results = await asyncio.wait_for(
+            asyncio.gather(loader.load("id", "1"), loader.load("id", "2")), 1
+        )
+
+        assert [len(rows) for rows in results] == [1, 1]
+
+    @pytest.mark.asyncio
+    async def test_failure_reaches_every_caller(self, loader, postgrest):
+        """Test a failed batch query raises in each waiting caller."""
+        postgrest.fail = True
+
+        results = await asyncio.gather(
+            loader.load("setting_key", "a"),
+            loader.load("setting_key", "b"),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, Exception) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_others(self, loader, postgrest):
+        """Test cancelling one caller leaves the shared lookup running for the rest."""
+        first = asyncio.create_task(loader.load("setting_key", "a"))
+        second = asyncio.create_task(loader.load("setting_key", "a"))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert [row["id"] for row in await second] == ["1"]
+
+    def test_batches_are_per_event_loop(self, loader, postgrest):
+        """Test lookups on different event loops are not mixed in one batch."""
+        assert asyncio.run(loader.load("setting_key", "a"))[0]["id"] == "1"
+        assert asyncio.run(loader.load("setting_key", "b"))[0]["id"] == "2"
@@ -0,0 +1,138 @@
+# This file is part of TravelSytle AI.
+#
+# Copyright (C) 2025  Trailyn Ventures, LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Guards against select("*") on tables with declared projections.
+"""
+
+import ast
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from app.services.auth import constants as auth_constants
+from app.services.database.constants import DatabaseTables
+from app.services.supabase import select_projection
+from app.services.supabase.supabase_config import SupabaseConfig
+
+APP_DIR = Path(__file__).resolve().parent.parent / "app"
+
+# Tables and views whose rows carry JSONB columns most callers never read
+HOT_TABLES = {
+    name
+    for name, config in {**SupabaseConfig.TABLES, **SupabaseConfig.VIEWS}.items()
+    if config.projections
+}
+
+
+def resolve_table(node: ast.expr) -> str | None:
+    """Resolve a table() argument written as a literal or a table-name constant."""
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    if (
+        isinstance(node, ast.Attribute)
+        and isinstance(node.value, ast.Name)
+        and node.value.id == "DatabaseTables"
+    ):
+        return getattr(DatabaseTables, node.attr, None)
+    if isinstance(node, ast.Name):
+        return getattr(auth_constants, node.id, None)
+    return None
+
+
+def find_select_all(tree: ast.AST) -> list[tuple[int, str]]:
+    """Find .table(<hot table>).select("*") chains, returning (line, table) pairs."""
+    found = []
+    for node in ast.walk(tree):
+        if not (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Attribute)
+            and node.func.attr == "select"
+            and node.args
+            and isinstance(node.args[0], ast.Constant)
+            and node.args[0].value == "*"
+        ):
+            continue
+        query = node.func.value
+        if (
+            isinstance(query, ast.Call)
+            and isinstance(query.func, ast.Attribute)
+            and query.func.attr in ("table", "from_")
+            and query.args
+        ):
+            table = resolve_table(query.args[0])
+            if table in HOT_TABLES:
+                found.append((node.lineno, table))
+    return found
+
+
+class TestSelectAll:
+    """Test hot-path queries read through projections."""
+
+    def test_hot_tables_are_declared(self):
+        """Test the tables the guard covers include the profile and conversation reads."""
+        assert {"profiles", "user_preferences", "conversations", "user_profile_view"} <= HOT_TABLES
+
+    def test_guard_detects_select_all(self):
+        """Test the scanner flags literal and constant table names."""
+        source = (
+            'db.table("conversations").select("*").execute()\n'
+            'db.table(DatabaseTables.USER_PREFERENCES).select("*").execute()\n'
+            "db.table(USER_PROFILE_VIEW).select('*').execute()\n"
+            'db.table("conversation_messages").select("*").execute()\n'
+            'db.table("conversations").select("id").execute()\n'
+        )
+
+        assert find_select_all(ast.parse(source)) == [
+            (1, "conversations"),
+            (2, "user_preferences"),
+            (3, "user_profile_view"),
+        ]
+
+    def test_no_select_all_on_hot_tables(self):
+        """Test no app module selects every column of a table with projections."""
+        offenders = [
+            f"{path.relative_to(APP_DIR.parent)}:{line} ({table})"
+            for path in sorted(APP_DIR.rglob("*.py"))
+            for line, table in find_select_all(ast.parse(path.read_text(), str(path)))
+        ]
+
+        assert offenders == [], "Use select_projection() instead of select('*'): " + ", ".join(
+            offenders
+        )
+
+
+class TestSelectProjection:
+    """Test the select_projection query helper."""
+
+    def test_selects_projection_columns(self):
+        """Test the builder is started with the projection's column list."""
+        client = MagicMock()
+
+        select_projection(client, "conversations", "summary")
+
+        client.table.assert_called_once_with("conversations")
+        client.table.return_value.select.assert_called_once_with(
+            "id,type,title,destination,created_at,updated_at"
+        )
+
+    def test_no_projection_selects_all(self):
+        """Test omitting the projection keeps select('*') for cold callers."""
+        client = MagicMock()
+
+        select_projection(client, "conversation_messages")
+
+        client.table.return_value.select.assert_called_once_with("*")
@@ -17,7 +17,7 @@
 
 """Tests for SystemSettingsService."""
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from app.services.system_settings_service import SystemSettingsService
@@ -55,13 +55,13 @@ class TestGetAllSettings:
             {"setting_key": "a", "setting_value": 1, "is_public": True},
             {"setting_key": "b", "setting_value": 2, "is_public": False},
         ]
-        with patch("asyncio.to_thread", return_value=_make_query_response(data)):
-            # all
-            all_settings = await service.get_all_settings(public_only=False)
-            assert all_settings == {"a": 1, "b": 2}
-            # public only
-            public_settings = await service.get_all_settings(public_only=True)
-            assert public_settings == {"a": 1}
+        query.execute = AsyncMock(return_value=_make_query_response(data))
+        # all
+        all_settings = await service.get_all_settings(public_only=False)
+        assert all_settings == {"a": 1, "b": 2}
+        # public only
+        public_settings = await service.get_all_settings(public_only=True)
+        assert public_settings == {"a": 1}
 
     @pytest.mark.asyncio
     async def test_no_data_returns_empty(self, service):
@@ -70,9 +70,9 @@ class TestGetAllSettings:
         query = MagicMock()
         client.table.return_value = query
         query.select.return_value = query
-        with patch("asyncio.to_thread", return_value=_make_query_response([])):
-            result = await service.get_all_settings()
-            assert result == {}
+        query.execute = AsyncMock(return_value=_make_query_response([]))
+        result = await service.get_all_settings()
+        assert result == {}
 
     @pytest.mark.asyncio
     async def test_exception_returns_empty(self, service):
@@ -81,9 +81,9 @@ class TestGetAllSettings:
         query = MagicMock()
         client.table.return_value = query
         query.select.return_value = query
-        with patch("asyncio.to_thread", side_effect=Exception("db error")):
-            result = await service.get_all_settings()
-            assert result == {}
+        query.execute = AsyncMock(side_effect=Exception("db error"))
+        result = await service.get_all_settings()
+        assert result == {}
 
 
 class TestGetSetting:
@@ -98,29 +98,28 @@ class TestGetSetting:
     @pytest.mark.asyncio
     async def test_success_found_and_not_found(self, service):
         client = MagicMock()
-        service.client = client
+        service.client = service.loader.client = client
         query = MagicMock()
         eq = MagicMock()
         client.table.return_value = query
         query.select.return_value = query
         query.eq.return_value = eq
-        eq.execute.return_value = _make_query_response([{"setting_value": "x"}])
-        with patch("asyncio.to_thread", side_effect=lambda func: func()):
-            assert await service.get_setting("k") == "x"
-            # not found
-            eq.execute.return_value = _make_query_response([])
-            assert await service.get_setting("k") is None
+        eq.execute = AsyncMock(return_value=_make_query_response([{"setting_value": "x"}]))
+        assert await service.get_setting("k") == "x"
+        # not found
+        eq.execute.return_value = _make_query_response([])
+        assert await service.get_setting("k") is None
 
     @pytest.mark.asyncio
     async def test_exception_returns_none(self, service):
         client = MagicMock()
-        service.client = client
+        service.client = service.loader.client = client
         query = MagicMock()
         client.table.return_value = query
         query.select.return_value = query
         query.eq.return_value = MagicMock()
-        with patch("asyncio.to_thread", side_effect=Exception("db error")):
-            assert await service.get_setting("k") is None
+        query.eq.return_value.execute = AsyncMock(side_effect=Exception("db error"))
+        assert await service.get_setting("k") is None
 
 
 class TestGetPublicSettings:
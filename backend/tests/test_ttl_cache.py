@@ -0,0 +1,113 @@
+# This file is part of TravelSytle AI.
+#
+# Copyright (C) 2025  Trailyn Ventures, LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Tests for the in-process TTL/LRU cache.
+"""
+
+from unittest.mock import patch
+
+from app.utils.ttl_cache import TTLCache
+
+
+class TestTTLCache:
+    """Test TTLCache behaviour and statistics."""
+
+    def test_get_and_set(self):
+        """Test basic get/set and hit/miss counting."""
+        cache = TTLCache[str](maxsize=2)
+
+        assert cache.get("a") is None
+        cache.set("a", "1")
+        assert cache.get("a") == "1"
+        assert "a" in cache
+
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    def test_lru_eviction(self):
+        """Test the least recently used entry is evicted when full."""
+        cache = TTLCache[int](maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_expiration(self):
+        """Test entries expire after their TTL."""
+        cache = TTLCache[int](ttl_seconds=10)
+        with patch("app.utils.ttl_cache.time.monotonic", return_value=100.0):
+            cache.set("a", 1)
+            cache.set("b", 2, ttl_seconds=60)
+        with patch("app.utils.ttl_cache.time.monotonic", return_value=120.0):
+            assert cache.get("a") is None
+            assert cache.get("b") == 2
+
+        stats = cache.get_stats()
+        assert stats["expirations"] == 1
+        assert stats["size"] == 1
+
+    def test_non_positive_ttl_is_not_stored(self):
+        """Test a zero TTL skips storing the entry."""
+        cache = TTLCache[int]()
+        cache.set("a", 1, ttl_seconds=0)
+
+        assert len(cache) == 0
+
+    def test_delete_clear_and_reset(self):
+        """Test delete, clear and reset_stats."""
+        cache = TTLCache[int]()
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        assert cache.delete("a") is True
+        assert cache.delete("a") is False
+        cache.clear()
+        assert len(cache) == 0
+
+        cache.get("b")
+        cache.reset_stats()
+        assert cache.get_stats()["misses"] == 0
+
+    def test_byte_bound_eviction(self):
+        """Test entries are evicted once their summed size exceeds max_bytes."""
+        cache = TTLCache[str](maxsize=10, max_bytes=10, sizeof=len)
+        cache.set("a", "xxxx")
+        cache.set("b", "yyyy")
+        cache.set("c", "zzzz")
+
+        assert cache.get("a") is None
+        assert cache.get("c") == "zzzz"
+        stats = cache.get_stats()
+        assert stats["bytes"] == 8
+        assert stats["evictions"] == 1
+
+    def test_oversized_entry_is_not_stored(self):
+        """Test a value larger than max_bytes is skipped and replaces nothing."""
+        cache = TTLCache[str](max_bytes=4, sizeof=len)
+        cache.set("a", "xx")
+        cache.set("a", "too large")
+
+        assert cache.get("a") is None
+        assert cache.get_stats()["bytes"] == 0
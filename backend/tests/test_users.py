@@ -19,7 +19,7 @@
 Tests for UserOperations class.
 """
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from app.services.database.users import UserOperations
@@ -30,8 +30,13 @@ class TestUserOperations:
 
     @pytest.fixture
     def mock_client(self):
-        """Create a mock Supabase client."""
-        return MagicMock()
+        """Create a mock async PostgREST client whose queries share one execute mock."""
+        client = MagicMock()
+        query = client.table.return_value
+        for method in ("select", "insert", "update", "delete", "eq", "order", "limit"):
+            getattr(query, method).return_value = query
+        query.execute = AsyncMock()
+        return client
 
     @pytest.fixture
     def user_operations(self, mock_client):
@@ -47,12 +52,12 @@ class TestUserOperations:
         with patch("app.services.rate_limiter.db_rate_limiter.acquire") as mock_rate_limit:
             mock_rate_limit.return_value = True
 
-            with patch("asyncio.to_thread") as mock_to_thread:
-                mock_to_thread.return_value = mock_response
+            mock_execute = mock_client.table.return_value.execute
+            mock_execute.return_value = mock_response
 
-                result = await user_operations.get_user_profile("test-user")
+            result = await user_operations.get_user_profile("test-user")
 
-                assert result == {"user_id": "test-user", "name": "Test User"}
+            assert result == {"user_id": "test-user", "name": "Test User"}
 
     @pytest.mark.asyncio
     async def test_get_user_profile_invalid_user_id(self, user_operations):
@@ -78,11 +83,11 @@ class TestUserOperations:
         with patch("app.services.rate_limiter.db_rate_limiter.acquire") as mock_rate_limit:
             mock_rate_limit.return_value = True
 
-            with patch("asyncio.to_thread") as mock_to_thread:
-                mock_to_thread.return_value = mock_response
+            mock_execute = mock_client.table.return_value.execute
+            mock_execute.return_value = mock_response
 
-                result = await user_operations.get_user_profile("test-user")
-                assert result == {}
+            result = await user_operations.get_user_profile("test-user")
+            assert result == {}
 
     @pytest.mark.asyncio
     async def test_get_user_profile_exception(self, user_operations, mock_client):
@@ -90,11 +95,11 @@ class TestUserOperations:
         with patch("app.services.rate_limiter.db_rate_limiter.acquire") as mock_rate_limit:
             mock_rate_limit.return_value = True
 
-            with patch("asyncio.to_thread") as mock_to_thread:
-                mock_to_thread.side_effect = Exception("Database error")
+            mock_execute = mock_client.table.return_value.execute
+            mock_execute.side_effect = Exception("Database error")
 
-                result = await user_operations.get_user_profile("test-user")
-                assert result == {}
+            result = await user_operations.get_user_profile("test-user")
+            assert result == {}
 
     @pytest.mark.asyncio
     async def test_save_user_profile_success(self, user_operations, mock_client):
@@ -137,12 +142,18 @@ class TestUserOperations:
         mock_client.table.side_effect = table_side_effect
 
         # Configure the table mock methods
-        table_mock.select.return_value.eq.return_value.execute.return_value = users_response
-        table_mock.update.return_value.eq.return_value.execute.return_value = profiles_response
-        table_mock.insert.return_value.execute.return_value = prefs_insert_response
+        table_mock.select.return_value.eq.return_value.execute = AsyncMock(
+            return_value=users_response
+        )
+        table_mock.update.return_value.eq.return_value.execute = AsyncMock(
+            return_value=profiles_response
+        )
+        table_mock.insert.return_value.execute = AsyncMock(return_value=prefs_insert_response)
 
         # For the final profile view query
-        table_mock.select.return_value.eq.return_value.execute.return_value = profile_view_response
+        table_mock.select.return_value.eq.return_value.execute = AsyncMock(
+            return_value=profile_view_response
+        )
 
         with patch("app.services.rate_limiter.db_rate_limiter.acquire") as mock_rate_limit:
             mock_rate_limit.return_value = True
@@ -181,11 +192,11 @@ class TestUserOperations:
         with patch("app.services.rate_limiter.db_rate_limiter.acquire") as mock_rate_limit:
             mock_rate_limit.return_value = True
 
-            with patch("asyncio.to_thread") as mock_to_thread:
-                mock_to_thread.return_value = user_response
+            mock_execute = mock_client.table.return_value.execute
+            mock_execute.return_value = user_response
 
-                result = await user_operations.save_user_profile("test-user", {"name": "User"})
-                assert result is None
+            result = await user_operations.save_user_profile("test-user", {"name": "User"})
+            assert result is None
 
     @pytest.mark.asyncio
     async def test_save_user_profile_create_preferences(self, user_operations, mock_client):
@@ -228,12 +239,18 @@ class TestUserOperations:
         mock_client.table.side_effect = table_side_effect
 
         # Configure the table mock methods
-        table_mock.select.return_value.eq.return_value.execute.return_value = users_response
-        table_mock.update.return_value.eq.return_value.execute.return_value = profiles_response
-        table_mock.insert.return_value.execute.return_value = prefs_insert_response
+        table_mock.select.return_value.eq.return_value.execute = AsyncMock(
+            return_value=users_response
+        )
+        table_mock.update.return_value.eq.return_value.execute = AsyncMock(
+            return_value=profiles_response
+        )
+        table_mock.insert.return_value.execute = AsyncMock(return_value=prefs_insert_response)
 
         # For the final profile view query
-        table_mock.select.return_value.eq.return_value.execute.return_value = profile_view_response
+        table_mock.select.return_value.eq.return_value.execute = AsyncMock(
+            return_value=profile_view_response
+        )
 
         with patch("app.services.rate_limiter.db_rate_limiter.acquire") as mock_rate_limit:
             mock_rate_limit.return_value = True
@@ -254,13 +271,11 @@ class TestUserOperations:
         with patch("app.services.rate_limiter.db_rate_limiter.acquire") as mock_rate_limit:
             mock_rate_limit.return_value = True
 
-            with patch("asyncio.to_thread") as mock_to_thread:
-                mock_to_thread.side_effect = [user_response, update_response]
+            mock_execute = mock_client.table.return_value.execute
+            mock_execute.side_effect = [user_response, update_response]
 
-                result = await user_operations.save_user_profile(
-                    "test-user", {"name": "Updated User"}
-                )
-                assert result is None
+            result = await user_operations.save_user_profile("test-user", {"name": "Updated User"})
+            assert result is None
 
     @pytest.mark.asyncio
     async def test_save_user_profile_exception(self, user_operations, mock_client):
@@ -268,11 +283,11 @@ class TestUserOperations:
         with patch("app.services.rate_limiter.db_rate_limiter.acquire") as mock_rate_limit:
             mock_rate_limit.return_value = True
 
-            with patch("asyncio.to_thread") as mock_to_thread:
-                mock_to_thread.side_effect = Exception("Database error")
+            mock_execute = mock_client.table.return_value.execute
+            mock_execute.side_effect = Exception("Database error")
 
-                result = await user_operations.save_user_profile("test-user", {"name": "User"})
-                assert result is None
+            result = await user_operations.save_user_profile("test-user", {"name": "User"})
+            assert result is None
 
     @pytest.mark.asyncio
     async def test_update_user_preferences_success_existing(self, user_operations, mock_client):
@@ -283,13 +298,11 @@ class TestUserOperations:
         with patch("app.services.rate_limiter.db_rate_limiter.acquire") as mock_rate_limit:
             mock_rate_limit.return_value = True
 
-            with patch("asyncio.to_thread") as mock_to_thread:
-                mock_to_thread.side_effect = [existing_response, None]
+            mock_execute = mock_client.table.return_value.execute
+            mock_execute.side_effect = [existing_response, None]
 
-                result = await user_operations.update_user_preferences(
-                    "test-user", {"theme": "dark"}
-                )
-                assert result is True
+            result = await user_operations.update_user_preferences("test-user", {"theme": "dark"})
+            assert result is True
 
     @pytest.mark.asyncio
     async def test_update_user_preferences_success_new(self, user_operations, mock_client):
@@ -300,13 +313,11 @@ class TestUserOperations:
         with patch("app.services.rate_limiter.db_rate_limiter.acquire") as mock_rate_limit:
             mock_rate_limit.return_value = True
 
-            with patch("asyncio.to_thread") as mock_to_thread:
-                mock_to_thread.side_effect = [existing_response, None]
+            mock_execute = mock_client.table.return_value.execute
+            mock_execute.side_effect = [existing_response, None]
 
-                result = await user_operations.update_user_preferences(
-                    "test-user", {"theme": "dark"}
-                )
-                assert result is True
+            result = await user_operations.update_user_preferences("test-user", {"theme": "dark"})
+            assert result is True
 
     @pytest.mark.asyncio
     async def test_update_user_preferences_invalid_user_id(self, user_operations):
@@ -329,13 +340,11 @@ class TestUserOperations:
         with patch("app.services.rate_limiter.db_rate_limiter.acquire") as mock_rate_limit:
             mock_rate_limit.return_value = True
 
-            with patch("asyncio.to_thread") as mock_to_thread:
-                mock_to_thread.side_effect = Exception("Database error")
+            mock_execute = mock_client.table.return_value.execute
+            mock_execute.side_effect = Exception("Database error")
 
-                result = await user_operations.update_user_preferences(
-                    "test-user", {"theme": "dark"}
-                )
-                assert result is False
+            result = await user_operations.update_user_preferences("test-user", {"theme": "dark"})
+            assert result is False
 
     @pytest.mark.asyncio
     async def test_save_recommendation_feedback_success(self, user_operations, mock_client):
@@ -343,13 +352,13 @@ class TestUserOperations:
         with patch("app.services.rate_limiter.db_rate_limiter.acquire") as mock_rate_limit:
             mock_rate_limit.return_value = True
 
-            with patch("asyncio.to_thread") as mock_to_thread:
-                mock_to_thread.return_value = None
+            mock_execute = mock_client.table.return_value.execute
+            mock_execute.return_value = None
 
-                result = await user_operations.save_recommendation_feedback(
-                    "test-user", "conv-1", "msg-1", "positive", "Great!", "AI response"
-                )
-                assert result is True
+            result = await user_operations.save_recommendation_feedback(
+                "test-user", "conv-1", "msg-1", "positive", "Great!", "AI response"
+            )
+            assert result is True
 
     @pytest.mark.asyncio
     async def test_save_recommendation_feedback_invalid_user_id(self, user_operations):
@@ -376,13 +385,13 @@ class TestUserOperations:
         with patch("app.services.rate_limiter.db_rate_limiter.acquire") as mock_rate_limit:
             mock_rate_limit.return_value = True
 
-            with patch("asyncio.to_thread") as mock_to_thread:
-                mock_to_thread.side_effect = Exception("Database error")
+            mock_execute = mock_client.table.return_value.execute
+            mock_execute.side_effect = Exception("Database error")
 
-                result = await user_operations.save_recommendation_feedback(
-                    "test-user", "conv-1", "msg-1", "positive"
-                )
-                assert result is False
+            result = await user_operations.save_recommendation_feedback(
+                "test-user", "conv-1", "msg-1", "positive"
+            )
+            assert result is False
 
     @pytest.mark.asyncio
     async def test_save_destination_success_new(self, user_operations, mock_client):
@@ -393,13 +402,13 @@ class TestUserOperations:
         with patch("app.services.rate_limiter.db_rate_limiter.acquire") as mock_rate_limit:
             mock_rate_limit.return_value = True
 
-            with patch("asyncio.to_thread") as mock_to_thread:
-                mock_to_thread.side_effect = [existing_response, None]
+            mock_execute = mock_client.table.return_value.execute
+            mock_execute.side_effect = [existing_response, None]
 
-                result = await user_operations.save_destination(
-                    "test-user", "Paris", {"country": "France"}
-                )
-                assert result is True
+            result = await user_operations.save_destination(
+                "test-user", "Paris", {"country": "France"}
+            )
+            assert result is True
 
     @pytest.mark.asyncio
     async def test_save_destination_success_existing(self, user_operations, mock_client):
@@ -410,13 +419,13 @@ class TestUserOperations:
         with patch("app.services.rate_limiter.db_rate_limiter.acquire") as mock_rate_limit:
             mock_rate_limit.return_value = True
 
-            with patch("asyncio.to_thread") as mock_to_thread:
-                mock_to_thread.side_effect = [existing_response, None]
+            mock_execute = mock_client.table.return_value.execute
+            mock_execute.side_effect = [existing_response, None]
 
-                result = await user_operations.save_destination(
-                    "test-user", "Paris", {"country": "France"}
-                )
-                assert result is True
+            result = await user_operations.save_destination(
+                "test-user", "Paris", {"country": "France"}
+            )
+            assert result is True
 
     @pytest.mark.asyncio
     async def test_save_destination_invalid_user_id(self, user_operations):
@@ -443,13 +452,13 @@ class TestUserOperations:
         with patch("app.services.rate_limiter.db_rate_limiter.acquire") as mock_rate_limit:
             mock_rate_limit.return_value = True
 
-            with patch("asyncio.to_thread") as mock_to_thread:
-                mock_to_thread.side_effect = Exception("Database error")
+            mock_execute = mock_client.table.return_value.execute
+            mock_execute.side_effect = Exception("Database error")
 
-                result = await user_operations.save_destination(
-                    "test-user", "Paris", {"country": "France"}
-                )
-                assert result is False
+            result = await user_operations.save_destination(
+                "test-user", "Paris", {"country": "France"}
+            )
+            assert result is False
 
     @pytest.mark.asyncio
     async def test_update_user_profile_picture_url_success(self, user_operations, mock_client):
@@ -457,13 +466,13 @@ class TestUserOperations:
         with patch("app.services.rate_limiter.db_rate_limiter.acquire") as mock_rate_limit:
             mock_rate_limit.return_value = True
 
-            with patch("asyncio.to_thread") as mock_to_thread:
-                mock_to_thread.return_value = None
+            mock_execute = mock_client.table.return_value.execute
+            mock_execute.return_value = None
 
-                result = await user_operations.update_user_profile_picture_url(
-                    "test-user", "https://example.com/photo.jpg"
-                )
-                assert result is True
+            result = await user_operations.update_user_profile_picture_url(
+                "test-user", "https://example.com/photo.jpg"
+            )
+            assert result is True
 
     @pytest.mark.asyncio
     async def test_update_user_profile_picture_url_invalid_user_id(self, user_operations):
@@ -490,13 +499,13 @@ class TestUserOperations:
         with patch("app.services.rate_limiter.db_rate_limiter.acquire") as mock_rate_limit:
             mock_rate_limit.return_value = True
 
-            with patch("asyncio.to_thread") as mock_to_thread:
-                mock_to_thread.side_effect = Exception("Database error")
+            mock_execute = mock_client.table.return_value.execute
+            mock_execute.side_effect = Exception("Database error")
 
-                result = await user_operations.update_user_profile_picture_url(
-                    "test-user", "https://example.com/photo.jpg"
-                )
-                assert result is False
+            result = await user_operations.update_user_profile_picture_url(
+                "test-user", "https://example.com/photo.jpg"
+            )
+            assert result is False
 
     def test_user_operations_init(self, mock_client):
         """Test UserOperations initialization."""
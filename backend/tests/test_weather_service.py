@@ -15,9 +15,12 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
+from app.services.supabase import enhanced_supabase_cache
 from app.services.weather import WeatherService
 
 
@@ -46,6 +49,33 @@ async def test_get_weather_data_cache_hit(weather_service):
         mock_get_cache.assert_awaited_once_with("Paris")
 
 
+@pytest.mark.asyncio
+async def test_get_weather_data_coalesces_concurrent_requests(weather_service):
+    """Test concurrent requests for the same location, in any spelling, share one fetch."""
+    release = asyncio.Event()
+
+    async def slow_cache(destination):
+        await release.wait()
+        return {"destination": destination}
+
+    with patch(
+        "app.services.supabase.supabase_cache_v2.enhanced_supabase_cache.get_weather_cache",
+        new=AsyncMock(side_effect=slow_cache),
+    ) as mock_get_cache:
+        calls = [
+            asyncio.create_task(weather_service.get_weather_data("Paris")),
+            asyncio.create_task(weather_service.get_weather_data("paris, France")),
+            asyncio.create_task(weather_service.get_weather_data("Paris", ["2025-06-01"])),
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*calls)
+
+    assert results == [{"destination": "Paris"}] * 3
+    assert mock_get_cache.await_count == 2
+    assert weather_service._single_flight.get_stats()["coalesced"] == 1
+
+
 @pytest.mark.asyncio
 async def test_get_weather_data_cache_miss_success(weather_service):
     """Test get_weather_data with Visual Crossing API response (no dates)."""
@@ -88,7 +118,7 @@ async def test_get_weather_data_cache_miss_success(weather_service):
             "app.services.supabase.supabase_cache_v2.enhanced_supabase_cache.get_weather_cache",
             new=AsyncMock(return_value=None),
         ),
-        patch("httpx.AsyncClient") as mock_client,
+        patch("app.services.http_clients.http_clients.session") as mock_client,
         patch(
             "app.services.supabase.supabase_cache_v2.enhanced_supabase_cache.set_weather_cache",
             new=AsyncMock(),
@@ -122,7 +152,7 @@ async def test_get_weather_data_api_error(weather_service):
             "app.services.supabase.supabase_cache_v2.enhanced_supabase_cache.get_weather_cache",
             new=AsyncMock(return_value=None),
         ),
-        patch("httpx.AsyncClient") as mock_client,
+        patch("app.services.http_clients.http_clients.session") as mock_client,
     ):
         mock_client_instance = MagicMock()
         mock_client_instance.__aenter__.return_value.get = AsyncMock(
@@ -176,7 +206,7 @@ async def test_get_weather_data_with_single_date(weather_service):
             "app.services.supabase.supabase_cache_v2.enhanced_supabase_cache.get_weather_cache",
             new=AsyncMock(return_value=None),
         ),
-        patch("httpx.AsyncClient") as mock_client,
+        patch("app.services.http_clients.http_clients.session") as mock_client,
         patch(
             "app.services.supabase.supabase_cache_v2.enhanced_supabase_cache.set_weather_cache",
             new=AsyncMock(),
@@ -240,7 +270,7 @@ async def test_get_weather_data_with_date_range(weather_service):
             "app.services.supabase.supabase_cache_v2.enhanced_supabase_cache.get_weather_cache",
             new=AsyncMock(return_value=None),
         ),
-        patch("httpx.AsyncClient") as mock_client,
+        patch("app.services.http_clients.http_clients.session") as mock_client,
         patch(
             "app.services.supabase.supabase_cache_v2.enhanced_supabase_cache.set_weather_cache",
             new=AsyncMock(),
@@ -312,7 +342,7 @@ async def test_get_weather_data_empty_response(weather_service):
             "app.services.supabase.supabase_cache_v2.enhanced_supabase_cache.get_weather_cache",
             new=AsyncMock(return_value=None),
         ),
-        patch("httpx.AsyncClient") as mock_client,
+        patch("app.services.http_clients.http_clients.session") as mock_client,
     ):
         mock_client_instance = MagicMock()
         mock_client_instance.__aenter__.return_value.get = AsyncMock(return_value=mock_response)
@@ -330,7 +360,7 @@ async def test_get_weather_data_service_exception(weather_service):
             "app.services.supabase.supabase_cache_v2.enhanced_supabase_cache.get_weather_cache",
             new=AsyncMock(return_value=None),
         ),
-        patch("httpx.AsyncClient") as mock_client,
+        patch("app.services.http_clients.http_clients.session") as mock_client,
     ):
         mock_client_instance = MagicMock()
         mock_client_instance.__aenter__.return_value.get = AsyncMock(
@@ -384,7 +414,7 @@ async def test_get_weather_data_with_state_country(weather_service):
             "app.services.supabase.supabase_cache_v2.enhanced_supabase_cache.get_weather_cache",
             new=AsyncMock(return_value=None),
         ),
-        patch("httpx.AsyncClient") as mock_client,
+        patch("app.services.http_clients.http_clients.session") as mock_client,
         patch(
             "app.services.supabase.supabase_cache_v2.enhanced_supabase_cache.set_weather_cache",
             new=AsyncMock(),
@@ -451,7 +481,7 @@ async def test_get_weather_data_uvindex_missing_defaults_to_zero(weather_service
             "app.services.supabase.supabase_cache_v2.enhanced_supabase_cache.get_weather_cache",
             new=AsyncMock(return_value=None),
         ),
-        patch("httpx.AsyncClient") as mock_client,
+        patch("app.services.http_clients.http_clients.session") as mock_client,
         patch(
             "app.services.supabase.supabase_cache_v2.enhanced_supabase_cache.set_weather_cache",
             new=AsyncMock(),
@@ -519,7 +549,7 @@ async def test_get_weather_data_forecast_structure_no_hourly(weather_service):
             "app.services.supabase.supabase_cache_v2.enhanced_supabase_cache.get_weather_cache",
             new=AsyncMock(return_value=None),
         ),
-        patch("httpx.AsyncClient") as mock_client,
+        patch("app.services.http_clients.http_clients.session") as mock_client,
         patch(
             "app.services.supabase.supabase_cache_v2.enhanced_supabase_cache.set_weather_cache",
             new=AsyncMock(),
@@ -549,3 +579,27 @@ async def test_get_weather_data_forecast_structure_no_hourly(weather_service):
 
         # Verify current has uvindex
         assert result["current"]["main"]["uvindex"] == 4
+
+
+@pytest.mark.asyncio
+async def test_get_weather_data_failure_is_negatively_cached(weather_service):
+    """Test an unresolvable destination fails fast on retry without calling the API."""
+    request = httpx.Request("GET", "https://weather.example/timeline/Nowhere")
+    error = httpx.HTTPStatusError(
+        "Bad API Request", request=request, response=httpx.Response(400, request=request)
+    )
+    with (
+        patch(
+            "app.services.supabase.supabase_cache_v2.enhanced_supabase_cache.get_weather_cache",
+            new=AsyncMock(return_value=None),
+        ),
+        patch("app.services.http_clients.http_clients.session") as mock_client,
+    ):
+        mock_get = AsyncMock(side_effect=error)
+        mock_client.return_value.__aenter__.return_value.get = mock_get
+
+        assert await weather_service.get_weather_data("Nowhere") is None
+        assert await weather_service.get_weather_data("nowhere") is None
+
+        assert mock_get.await_count == 1
+        assert enhanced_supabase_cache.get_failure("weather", "Nowhere") == "not_found"
@@ -0,0 +1,138 @@
+# This file is part of TravelSytle AI.
+#
+# Copyright (C) 2025  Trailyn Ventures, LLC
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Tests for the write-behind queue.
+"""
+
+import asyncio
+
+import pytest
+from app.utils.write_behind import WriteBehindQueue
+
+
+class RecordingWriter:
+    """Batch writer that records what it was given."""
+
+    def __init__(self, fail: bool = False):
+        self.batches: list[tuple[str, list[dict]]] = []
+        self.fail = fail
+
+    async def __call__(self, table: str, rows: list[dict]) -> int:
+        self.batches.append((table, rows))
+        if self.fail:
+            raise RuntimeError("database unavailable")
+        return len(rows)
+
+
+class TestWriteBehindQueue:
+    """Test coalescing, bounds, batching and flushing."""
+
+    @pytest.mark.asyncio
+    async def test_coalesces_repeated_keys(self):
+        """Test only the newest row per key is written."""
+        writer = RecordingWriter()
+        queue = WriteBehindQueue(writer, flush_interval=60)
+        queue.put("t", "a", {"v": 1})
+        queue.put("t", "a", {"v": 2})
+        await queue.close()
+
+        assert writer.batches == [("t", [{"v": 2}])]
+        assert queue.get_stats()["coalesced"] == 1
+
+    @pytest.mark.asyncio
+    async def test_full_queue_drops(self):
+        """Test new keys are rejected once max_pending rows are held."""
+        writer = RecordingWriter()
+        queue = WriteBehindQueue(writer, max_pending=1, flush_interval=60)
+
+        assert queue.put("t", "a", {"v": 1}) is True
+        assert queue.put("t", "b", {"v": 2}) is False
+        assert queue.put("t", "a", {"v": 3}) is True
+        await queue.close()
+
+        assert queue.get_stats()["dropped"] == 1
+
+    @pytest.mark.asyncio
+    async def test_background_flush_after_interval(self):
+        """Test rows are written without an explicit flush."""
+        writer = RecordingWriter()
+        queue = WriteBehindQueue(writer, flush_interval=0.01)
+        queue.put("t", "a", {"v": 1})
+
+        for _ in range(100):
+            if writer.batches:
+                break
+            await asyncio.sleep(0.01)
+
+        assert writer.batches == [("t", [{"v": 1}])]
+        await queue.close()
+
+    @pytest.mark.asyncio
+    async def test_full_batch_flushes_immediately(self):
+        """Test reaching batch_size wakes the flusher before the interval."""
+        writer = RecordingWriter()
+        queue = WriteBehindQueue(writer, batch_size=2, flush_interval=60)
+        queue.put("t", "a", {"v": 1})
+        queue.put("t", "b", {"v": 2})
+
+        for _ in range(100):
+            if writer.batches:
+                break
+            await asyncio.sleep(0.01)
+
+        assert writer.batches == [("t", [{"v": 1}, {"v": 2}])]
+        await queue.close()
+
+    @pytest.mark.asyncio
+    async def test_batches_split_by_table_and_size(self):
+        """Test a flush writes batch_size rows at a time, grouped per table."""
+        writer = RecordingWriter()
+        queue = WriteBehindQueue(writer, batch_size=2, flush_interval=60)
+        for key in ("a", "b", "c"):
+            queue.put("t1", key, {"k": key})
+        queue.put("t2", "a", {"k": "a"})
+        written = await queue.flush()
+
+        assert written == 4
+        assert [(table, len(rows)) for table, rows in writer.batches] == [
+            ("t1", 2),
+            ("t1", 1),
+            ("t2", 1),
+        ]
+        await queue.close()
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_counted(self):
+        """Test a failing write is logged and counted, not raised."""
+        queue = WriteBehindQueue(RecordingWriter(fail=True), flush_interval=60)
+        queue.put("t", "a", {"v": 1})
+        await queue.close()
+
+        stats = queue.get_stats()
+        assert stats["failed"] == 1
+        assert stats["pending"] == 0
+
+    def test_put_without_loop_waits_for_flush(self):
+        """Test rows queued outside an event loop are written by a later flush."""
+        writer = RecordingWriter()
+        queue = WriteBehindQueue(writer)
+        queue.put("t", "a", {"v": 1})
+
+        asyncio.run(queue.close())
+
+        assert writer.batches == [("t", [{"v": 1}])]
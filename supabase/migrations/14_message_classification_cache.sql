@@ -0,0 +1,46 @@
+-- =============================================================================
+-- TravelStyle AI - Message Classification Cache
+-- =============================================================================
+-- This migration:
+-- 1. Creates the message_classification_cache table shared by all API instances
+--    (keyed on a hash only; message text is never stored)
+-- 2. Adds lookup and expiry indexes
+-- 3. Enables RLS (backend service role only, no public read access)
+-- 4. Extends cleanup_expired_cache() to purge expired classifications
+-- =============================================================================
+
+-- Cache orchestrator routing decisions keyed on a hash of the normalized message
+CREATE TABLE IF NOT EXISTS public.message_classification_cache (
+  id uuid NOT NULL DEFAULT uuid_generate_v4(),
+  message_hash character varying NOT NULL, -- SHA-256 of the normalized message text
+  category character varying NOT NULL, -- Routing category chosen for the message
+  classifier_source character varying DEFAULT 'llm'::character varying, -- Classifier that produced the category
+  expires_at timestamp with time zone NOT NULL, -- When the cache entry expires
+  created_at timestamp with time zone DEFAULT now(),
+  updated_at timestamp with time zone DEFAULT now(),
+  CONSTRAINT message_classification_cache_pkey PRIMARY KEY (id),
+  CONSTRAINT message_classification_cache_message_hash_key UNIQUE (message_hash)
+);
+
+-- Earlier versions of this migration stored the message text; drop it if present
+ALTER TABLE message_classification_cache DROP COLUMN IF EXISTS message_normalized;
+
+CREATE INDEX IF NOT EXISTS idx_message_classification_cache_expires_at
+  ON message_classification_cache(expires_at);
+
+-- Routing decisions are internal, so the table is not publicly readable;
+-- the backend service role bypasses RLS
+ALTER TABLE message_classification_cache ENABLE ROW LEVEL SECURITY;
+
+-- Include the classification cache in expired cache cleanup
+CREATE OR REPLACE FUNCTION cleanup_expired_cache()
+RETURNS void AS $$
+BEGIN
+    DELETE FROM weather_cache WHERE expires_at < NOW();
+    DELETE FROM currency_rates_cache WHERE expires_at < NOW();
+    DELETE FROM cultural_insights_cache WHERE expires_at < NOW();
+    DELETE FROM message_classification_cache WHERE expires_at < NOW();
+    DELETE FROM chat_sessions WHERE expires_at < NOW() AND is_active = false;
+    DELETE FROM user_auth_tokens WHERE expires_at < NOW() OR is_revoked = true;
+END;
+$$ LANGUAGE plpgsql;
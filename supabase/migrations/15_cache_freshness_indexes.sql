@@ -0,0 +1,18 @@
+-- =============================================================================
+-- TravelStyle AI - Cache Freshness Indexes
+-- =============================================================================
+-- This migration:
+-- 1. Adds composite indexes for the backend's cache reads, which filter on the
+--    lookup key and expires_at > now(), order by created_at DESC and LIMIT 1
+-- =============================================================================
+
+-- The newest row for a key is read straight off the index; expired rows are
+-- skipped without fetching their JSON payloads
+CREATE INDEX IF NOT EXISTS idx_weather_cache_destination_created_at
+  ON weather_cache(destination, created_at DESC);
+
+CREATE INDEX IF NOT EXISTS idx_cultural_insights_cache_destination_created_at
+  ON cultural_insights_cache(destination, created_at DESC);
+
+CREATE INDEX IF NOT EXISTS idx_currency_rates_cache_base_created_at
+  ON currency_rates_cache(base_currency, created_at DESC);
@@ -0,0 +1,76 @@
+-- =============================================================================
+-- TravelStyle AI - Cache Upsert Constraints
+-- =============================================================================
+-- This migration:
+-- 1. Removes duplicate weather and cultural cache rows, keeping the newest
+-- 2. Adds UNIQUE (destination, api_source) so the backend can write cache rows
+--    with a single INSERT ... ON CONFLICT DO UPDATE request
+-- =============================================================================
+
+-- =============================================================================
+-- WEATHER CACHE
+-- =============================================================================
+
+DELETE FROM weather_cache
+WHERE id NOT IN (
+    SELECT id
+    FROM (
+        SELECT id,
+               ROW_NUMBER() OVER (
+                   PARTITION BY destination, api_source ORDER BY created_at DESC, id
+               ) as rn
+        FROM weather_cache
+    ) t
+    WHERE t.rn = 1
+);
+
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1
+        FROM pg_catalog.pg_constraint con
+        INNER JOIN pg_catalog.pg_class rel ON rel.oid = con.conrelid
+        INNER JOIN pg_catalog.pg_namespace nsp ON nsp.oid = rel.relnamespace
+        WHERE nsp.nspname = 'public'
+          AND rel.relname = 'weather_cache'
+          AND con.conname = 'weather_cache_destination_api_source_key'
+    ) THEN
+        ALTER TABLE weather_cache
+        ADD CONSTRAINT weather_cache_destination_api_source_key
+        UNIQUE (destination, api_source);
+    END IF;
+END $$;
+
+-- =============================================================================
+-- CULTURAL INSIGHTS CACHE
+-- =============================================================================
+
+DELETE FROM cultural_insights_cache
+WHERE id NOT IN (
+    SELECT id
+    FROM (
+        SELECT id,
+               ROW_NUMBER() OVER (
+                   PARTITION BY destination, api_source ORDER BY created_at DESC, id
+               ) as rn
+        FROM cultural_insights_cache
+    ) t
+    WHERE t.rn = 1
+);
+
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1
+        FROM pg_catalog.pg_constraint con
+        INNER JOIN pg_catalog.pg_class rel ON rel.oid = con.conrelid
+        INNER JOIN pg_catalog.pg_namespace nsp ON nsp.oid = rel.relnamespace
+        WHERE nsp.nspname = 'public'
+          AND rel.relname = 'cultural_insights_cache'
+          AND con.conname = 'cultural_insights_cache_destination_api_source_key'
+    ) THEN
+        ALTER TABLE cultural_insights_cache
+        ADD CONSTRAINT cultural_insights_cache_destination_api_source_key
+        UNIQUE (destination, api_source);
+    END IF;
+END $$;
@@ -0,0 +1,96 @@
+-- =============================================================================
+-- TravelStyle AI - Canonical Destination Cache Keys
+-- =============================================================================
+-- This migration:
+-- 1. Makes destination_normalized the identity of weather and cultural cache
+--    rows. The backend writes a canonical key there ("paris, france") so that
+--    "Paris", "paris " and "Paris, France" share one row
+-- 2. Replaces the (destination, api_source) upsert constraints with
+--    (destination_normalized, api_source)
+-- 3. Replaces the freshness lookup indexes with destination_normalized ones
+--
+-- Rows written before this migration hold destination.lower() and simply stop
+-- being read; they age out through cleanup_expired_cache().
+-- =============================================================================
+
+-- =============================================================================
+-- WEATHER CACHE
+-- =============================================================================
+
+DELETE FROM weather_cache
+WHERE id NOT IN (
+    SELECT id
+    FROM (
+        SELECT id,
+               ROW_NUMBER() OVER (
+                   PARTITION BY destination_normalized, api_source ORDER BY created_at DESC, id
+               ) as rn
+        FROM weather_cache
+    ) t
+    WHERE t.rn = 1
+);
+
+ALTER TABLE weather_cache
+DROP CONSTRAINT IF EXISTS weather_cache_destination_api_source_key;
+
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1
+        FROM pg_catalog.pg_constraint con
+        INNER JOIN pg_catalog.pg_class rel ON rel.oid = con.conrelid
+        INNER JOIN pg_catalog.pg_namespace nsp ON nsp.oid = rel.relnamespace
+        WHERE nsp.nspname = 'public'
+          AND rel.relname = 'weather_cache'
+          AND con.conname = 'weather_cache_destination_normalized_api_source_key'
+    ) THEN
+        ALTER TABLE weather_cache
+        ADD CONSTRAINT weather_cache_destination_normalized_api_source_key
+        UNIQUE (destination_normalized, api_source);
+    END IF;
+END $$;
+
+DROP INDEX IF EXISTS idx_weather_cache_destination_created_at;
+CREATE INDEX IF NOT EXISTS idx_weather_cache_normalized_created_at
+  ON weather_cache(destination_normalized, created_at DESC);
+
+-- =============================================================================
+-- CULTURAL INSIGHTS CACHE
+-- =============================================================================
+
+DELETE FROM cultural_insights_cache
+WHERE id NOT IN (
+    SELECT id
+    FROM (
+        SELECT id,
+               ROW_NUMBER() OVER (
+                   PARTITION BY destination_normalized, api_source ORDER BY created_at DESC, id
+               ) as rn
+        FROM cultural_insights_cache
+    ) t
+    WHERE t.rn = 1
+);
+
+ALTER TABLE cultural_insights_cache
+DROP CONSTRAINT IF EXISTS cultural_insights_cache_destination_api_source_key;
+
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1
+        FROM pg_catalog.pg_constraint con
+        INNER JOIN pg_catalog.pg_class rel ON rel.oid = con.conrelid
+        INNER JOIN pg_catalog.pg_namespace nsp ON nsp.oid = rel.relnamespace
+        WHERE nsp.nspname = 'public'
+          AND rel.relname = 'cultural_insights_cache'
+          AND con.conname = 'cultural_insights_cache_destination_normalized_api_source_key'
+    ) THEN
+        ALTER TABLE cultural_insights_cache
+        ADD CONSTRAINT cultural_insights_cache_destination_normalized_api_source_key
+        UNIQUE (destination_normalized, api_source);
+    END IF;
+END $$;
+
+DROP INDEX IF EXISTS idx_cultural_insights_cache_destination_created_at;
+CREATE INDEX IF NOT EXISTS idx_cultural_insights_cache_normalized_created_at
+  ON cultural_insights_cache(destination_normalized, created_at DESC);
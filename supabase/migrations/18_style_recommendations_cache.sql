@@ -0,0 +1,48 @@
+-- =============================================================================
+-- TravelStyle AI - Style Recommendations Cache
+-- =============================================================================
+-- This migration:
+-- 1. Creates the style_recommendations_cache table for Qloo style
+--    recommendations, keyed on a hash of the request inputs (destination,
+--    occasion, style preference fields and a coarse weather band)
+-- 2. Adds lookup and expiry indexes
+-- 3. Enables RLS (backend service role only, no public read access)
+-- 4. Extends cleanup_expired_cache() to purge expired style recommendations
+-- =============================================================================
+
+CREATE TABLE IF NOT EXISTS public.style_recommendations_cache (
+  id uuid NOT NULL DEFAULT uuid_generate_v4(),
+  cache_key character varying NOT NULL, -- SHA-256 of the recommendation inputs
+  destination character varying NOT NULL, -- Destination as requested (for debugging and analysis)
+  style_data jsonb NOT NULL, -- Processed Qloo style recommendations
+  api_source character varying DEFAULT 'qloo'::character varying,
+  expires_at timestamp with time zone NOT NULL, -- When the cache entry expires
+  created_at timestamp with time zone DEFAULT now(),
+  updated_at timestamp with time zone DEFAULT now(),
+  CONSTRAINT style_recommendations_cache_pkey PRIMARY KEY (id),
+  CONSTRAINT style_recommendations_cache_cache_key_key UNIQUE (cache_key)
+);
+
+CREATE INDEX IF NOT EXISTS idx_style_recommendations_cache_key_created_at
+  ON style_recommendations_cache(cache_key, created_at DESC);
+
+CREATE INDEX IF NOT EXISTS idx_style_recommendations_cache_expires_at
+  ON style_recommendations_cache(expires_at);
+
+-- Keys derive from user style preferences, so the table is not publicly
+-- readable; the backend service role bypasses RLS
+ALTER TABLE style_recommendations_cache ENABLE ROW LEVEL SECURITY;
+
+-- Include the style cache in expired cache cleanup
+CREATE OR REPLACE FUNCTION cleanup_expired_cache()
+RETURNS void AS $$
+BEGIN
+    DELETE FROM weather_cache WHERE expires_at < NOW();
+    DELETE FROM currency_rates_cache WHERE expires_at < NOW();
+    DELETE FROM cultural_insights_cache WHERE expires_at < NOW();
+    DELETE FROM message_classification_cache WHERE expires_at < NOW();
+    DELETE FROM style_recommendations_cache WHERE expires_at < NOW();
+    DELETE FROM chat_sessions WHERE expires_at < NOW() AND is_active = false;
+    DELETE FROM user_auth_tokens WHERE expires_at < NOW() OR is_revoked = true;
+END;
+$$ LANGUAGE plpgsql;
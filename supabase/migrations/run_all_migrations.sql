@@ -93,6 +93,36 @@
 \echo 'Setting up subscription limits...'
 \i 10_subscription_limits.sql
 
+-- ============================================================================
+-- STEP 15: MESSAGE CLASSIFICATION CACHE (Shared orchestrator routing cache)
+-- ============================================================================
+\echo 'Creating message classification cache...'
+\i 14_message_classification_cache.sql
+
+-- ============================================================================
+-- STEP 16: CACHE FRESHNESS INDEXES (Single-row cache lookups)
+-- ============================================================================
+\echo 'Creating cache freshness indexes...'
+\i 15_cache_freshness_indexes.sql
+
+-- ============================================================================
+-- STEP 17: CACHE UPSERT CONSTRAINTS (Single-request ON CONFLICT cache writes)
+-- ============================================================================
+\echo 'Adding cache upsert constraints...'
+\i 16_cache_upsert_constraints.sql
+
+-- ============================================================================
+-- STEP 18: CANONICAL DESTINATION KEYS (Destination caches keyed on normalized names)
+-- ============================================================================
+\echo 'Switching destination caches to canonical keys...'
+\i 17_canonical_destination_keys.sql
+
+-- ============================================================================
+-- STEP 19: STYLE RECOMMENDATIONS CACHE (Cached Qloo style recommendations)
+-- ============================================================================
+\echo 'Creating style recommendations cache...'
+\i 18_style_recommendations_cache.sql
+
 -- ============================================================================
 -- COMPLETION
 -- ============================================================================